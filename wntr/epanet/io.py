@@ -845,7 +845,7 @@ class InpFile(object):
                 curve_points = []
                 for point in self.curves[curve_name]:
                     x = to_si(self.flow_units, point[0], HydParam.Flow)
-                    y = to_si(self.flow_units, point[1], HydParam.HeadLoss)
+                    y = to_si(self.flow_units, point[1], HydParam.HydraulicHead)
                     curve_points.append((x, y))
                 self.wn.add_curve(curve_name, 'HEADLOSS', curve_points)
                 valve_set = curve_name
@@ -962,7 +962,7 @@ class InpFile(object):
                 f.write(';HEADLOSS: {}\n'.format(curve_name).encode(sys_default_enc))
                 for point in curve.points:
                     x = from_si(self.flow_units, point[0], HydParam.Flow)
-                    y = from_si(self.flow_units, point[1], HydParam.HeadLoss)
+                    y = from_si(self.flow_units, point[1], HydParam.HydraulicHead)
                     f.write(_CURVE_ENTRY.format(name=curve_name, x=x, y=y, com=';').encode(sys_default_enc))
             else:
                 f.write(';UNKNOWN: {}\n'.format(curve_name).encode(sys_default_enc))
@@ -2585,8 +2585,106 @@ class BinFile(object):
         """
         pass
 
+    def _save_results(self, data, reporttimes, nodenames, linknames, linktype, darcy_weisbach, convert):
+        """Convert a block of reporting periods from the output file and save them in the results object
+
+        Parameters
+        ----------
+        data : numpy.array
+            Values for each reporting period (rows) in the order they are stored in the output file
+        reporttimes : numpy.array
+            Reporting times of the rows in data
+        nodenames : list of str
+            Node names
+        linknames : list of str
+            Link names
+        linktype : numpy.array
+            EPANET link types
+        darcy_weisbach : bool
+            True if the network uses the Darcy-Weisbach headloss formula
+        convert : bool
+            Convert the results to SI units
+        """
+        nnodes = len(nodenames)
+        nlinks = len(linknames)
+        valuetypes = ['demand', 'head', 'pressure', 'quality', 'flow', 'velocity', 'headloss', 'linkquality',
+                      'linkstatus', 'linksetting', 'reactionrate', 'frictionfactor']
+        df = {}
+        for i, valuetype in enumerate(valuetypes):
+            if i < 4:
+                columns = pd.Index(nodenames, name='name')
+                values = data[:, i*nnodes:(i+1)*nnodes]
+            else:
+                columns = pd.Index(linknames, name='name')
+                values = data[:, 4*nnodes+(i-4)*nlinks:4*nnodes+(i-3)*nlinks]
+            df[valuetype] = pd.DataFrame(values, index=reporttimes, columns=columns)
+
+        self.results.node = {}
+        self.results.link = {}
+
+        if convert:
+            # Node Results
+            self.results.node['demand'] = HydParam.Demand._to_si(self.flow_units, df['demand'])
+            self.results.node['head'] = HydParam.HydraulicHead._to_si(self.flow_units, df['head'])
+            self.results.node['pressure'] = HydParam.Pressure._to_si(self.flow_units, df['pressure'])
+    
+            # Water Quality Results (node and link)
+            if self.quality_type is QualType.Chem:
+                self.results.node['quality'] = QualParam.Concentration._to_si(self.flow_units, df['quality'], mass_units=self.mass_units)
+                self.results.link['quality'] = QualParam.Concentration._to_si(self.flow_units, df['linkquality'], mass_units=self.mass_units)
+            elif self.quality_type is QualType.Age:
+                self.results.node['quality'] = QualParam.WaterAge._to_si(self.flow_units, df['quality'], mass_units=self.mass_units)
+                self.results.link['quality'] = QualParam.WaterAge._to_si(self.flow_units, df['linkquality'], mass_units=self.mass_units)
+            else:
+                self.results.node['quality'] = df['quality']
+                self.results.link['quality'] = df['linkquality']
+    
+            # Link Results
+            self.results.link['flowrate'] = HydParam.Flow._to_si(self.flow_units, df['flow'])
+            self.results.link['velocity'] = HydParam.Velocity._to_si(self.flow_units, df['velocity'])
+            
+            headloss = np.array(df['headloss'])
+            headloss[:, linktype < 2] = to_si(self.flow_units, headloss[:, linktype < 2], HydParam.HeadLoss) # Pipe or CV
+            headloss[:, linktype >= 2] = to_si(self.flow_units, headloss[:, linktype >= 2], HydParam.Length) # Pump or Valve
+            self.results.link["headloss"] = pd.DataFrame(data=headloss, columns=linknames, index=reporttimes)
+    
+            status = np.array(df['linkstatus'])
+            if self.convert_status:
+                status[status <= 2] = 0
+                status[status == 3] = 1
+                status[status >= 5] = 1
+                status[status == 4] = 2
+            self.results.link['status'] = pd.DataFrame(data=status, columns=linknames, index=reporttimes)
+            
+            setting = np.array(df['linksetting'])
+            # pump setting is relative speed (unitless)
+            setting[:, linktype == EN.PIPE] = to_si(self.flow_units, setting[:, linktype == EN.PIPE], HydParam.RoughnessCoeff, 
+                                            darcy_weisbach=darcy_weisbach)
+            setting[:, linktype == EN.PRV] = to_si(self.flow_units, setting[:, linktype == EN.PRV], HydParam.Pressure)
+            setting[:, linktype == EN.PSV] = to_si(self.flow_units, setting[:, linktype == EN.PSV], HydParam.Pressure)
+            setting[:, linktype == EN.PBV] = to_si(self.flow_units, setting[:, linktype == EN.PBV], HydParam.Pressure)
+            setting[:, linktype == EN.FCV] = to_si(self.flow_units, setting[:, linktype == EN.FCV], HydParam.Flow)
+            self.results.link['setting'] = pd.DataFrame(data=setting, columns=linknames, index=reporttimes)
+            
+            self.results.link['friction_factor'] = df['frictionfactor']
+            self.results.link['reaction_rate'] = QualParam.ReactionRate._to_si(self.flow_units, df['reactionrate'],self.mass_units) 
+        else:
+            self.results.node['demand'] = df['demand']
+            self.results.node['head'] = df['head']
+            self.results.node['pressure'] = df['pressure']
+            self.results.node['quality'] = df['quality']
+            
+            self.results.link['flowrate'] = df['flow']
+            self.results.link['headloss'] = df['headloss']
+            self.results.link['velocity'] = df['velocity']
+            self.results.link['quality'] = df['linkquality']
+            self.results.link['status'] = df['linkstatus']
+            self.results.link['setting'] = df['linksetting']
+            self.results.link['friction_factor'] = df['frictionfactor']
+            self.results.link['reaction_rate'] = df['reactionrate']
+
 #    @run_lineprofile()
-    def read(self, filename, convergence_error=False, darcy_weisbach=False, convert=True):
+    def read(self, filename, convergence_error=False, darcy_weisbach=False, convert=True, results_store=None):
         """Read a binary file and create a results object.
 
         Parameters
@@ -2598,6 +2696,14 @@ class BinFile(object):
             simulation does not converge. If convergence_error is False, partial results are returned, 
             a warning will be issued, and results.error_code will be set to 0
             if the simulation does not converge.  Default = False.
+        darcy_weisbach : bool (optional)
+            True if the network uses the Darcy-Weisbach headloss formula. Default = False.
+        convert : bool (optional)
+            Convert the results to SI units. Default = True.
+        results_store : ResultsStore (optional)
+            If provided, results are converted and appended to the 
+            :class:`~wntr.sim.results.ResultsStore` one chunk at a time, and the
+            returned results are loaded from the store on demand.
 
         Returns
         -------
@@ -2749,103 +2855,47 @@ class BinFile(object):
             self.save_network_desc_line('link_end', pd.Series(data=names[linkend-1], index=linknames, copy=True))
             """
             
-#           type_list = 4*nnodes*['node'] + 8*nlinks*['link']
-            name_list = nodenames*4 + linknames*8
-            valuetype = nnodes*['demand']+nnodes*['head']+nnodes*['pressure']+nnodes*['quality'] + nlinks*['flow']+nlinks*['velocity']+nlinks*['headloss']+nlinks*['linkquality']+nlinks*['linkstatus']+nlinks*['linksetting']+nlinks*['reactionrate']+nlinks*['frictionfactor']
-            
-#           tuples = zip(type_list, valuetype, name_list)
-            tuples = list(zip(valuetype, name_list))
-#                tuples = [(valuetype[i], v) for i, v in enumerate(name_list)]
-            index = pd.MultiIndex.from_tuples(tuples, names=['value','name'])      
-            
-            try:
-                data = np.fromfile(fin, dtype = np.dtype(ftype), count = (4*nnodes+8*nlinks)*nrptsteps)
-            except Exception as e:
-                logger.exception('Failed to process file: %s', e)
+            self.results.network_name = self.inp_file
+            nvalues = 4*nnodes+8*nlinks
+
+            if results_store is None:
+                try:
+                    data = np.fromfile(fin, dtype = np.dtype(ftype), count = nvalues*nrptsteps)
+                except Exception as e:
+                    logger.exception('Failed to process file: %s', e)
+                N = int(np.floor(len(data)/nvalues))
+            else:
+                # Map the data instead of reading it, results are converted one chunk at a time
+                data_offset = fin.tell()
+                N = min(nrptsteps, int((os.path.getsize(filename) - data_offset)/(nvalues*np.dtype(ftype).itemsize)))
+                if N > 0:
+                    data = np.memmap(filename, dtype=np.dtype(ftype), mode='r', offset=data_offset, shape=(N, nvalues))
+                else:
+                    data = np.empty((0, nvalues), dtype=np.dtype(ftype))
+                fin.seek(data_offset + N*nvalues*np.dtype(ftype).itemsize)
                 
-            N = int(np.floor(len(data)/(4*nnodes+8*nlinks)))
             if N < nrptsteps:
                 t = reporttimes[N]
                 if convergence_error:
                     logger.error('Simulation did not converge at time ' + self._get_time(t) + '.')
                     raise RuntimeError('Simulation did not converge at time ' + self._get_time(t) + '.')
                 else:
-                    data = data[0:N*(4*nnodes+8*nlinks)]
-                    data = np.reshape(data, (N, (4*nnodes+8*nlinks)))
                     reporttimes = reporttimes[0:N]
                     warnings.warn('Simulation did not converge at time ' + self._get_time(t) + '.')
                     self.results.error_code = wntr.sim.results.ResultsStatus.error
             else:
-                data = np.reshape(data, (nrptsteps, (4*nnodes+8*nlinks)))
                 self.results.error_code = None
-
-            df = pd.DataFrame(data.transpose(), index =index, columns = reporttimes)
-            df = df.transpose()
+            data = np.reshape(data[0:N*nvalues], (N, nvalues))
             
-            self.results.node = {}
-            self.results.link = {}
-            self.results.network_name = self.inp_file
-            
-            if convert:
-                # Node Results
-                self.results.node['demand'] = HydParam.Demand._to_si(self.flow_units, df['demand'])
-                self.results.node['head'] = HydParam.HydraulicHead._to_si(self.flow_units, df['head'])
-                self.results.node['pressure'] = HydParam.Pressure._to_si(self.flow_units, df['pressure'])
-        
-                # Water Quality Results (node and link)
-                if self.quality_type is QualType.Chem:
-                    self.results.node['quality'] = QualParam.Concentration._to_si(self.flow_units, df['quality'], mass_units=self.mass_units)
-                    self.results.link['quality'] = QualParam.Concentration._to_si(self.flow_units, df['linkquality'], mass_units=self.mass_units)
-                elif self.quality_type is QualType.Age:
-                    self.results.node['quality'] = QualParam.WaterAge._to_si(self.flow_units, df['quality'], mass_units=self.mass_units)
-                    self.results.link['quality'] = QualParam.WaterAge._to_si(self.flow_units, df['linkquality'], mass_units=self.mass_units)
-                else:
-                    self.results.node['quality'] = df['quality']
-                    self.results.link['quality'] = df['linkquality']
-        
-                # Link Results
-                self.results.link['flowrate'] = HydParam.Flow._to_si(self.flow_units, df['flow'])
-                self.results.link['velocity'] = HydParam.Velocity._to_si(self.flow_units, df['velocity'])
-                
-                headloss = np.array(df['headloss'])
-                headloss[:, linktype < 2] = to_si(self.flow_units, headloss[:, linktype < 2], HydParam.HeadLoss) # Pipe or CV
-                headloss[:, linktype >= 2] = to_si(self.flow_units, headloss[:, linktype >= 2], HydParam.Length) # Pump or Valve
-                self.results.link["headloss"] = pd.DataFrame(data=headloss, columns=linknames, index=reporttimes)
-        
-                status = np.array(df['linkstatus'])
-                if self.convert_status:
-                    status[status <= 2] = 0
-                    status[status == 3] = 1
-                    status[status >= 5] = 1
-                    status[status == 4] = 2
-                self.results.link['status'] = pd.DataFrame(data=status, columns=linknames, index=reporttimes)
-                
-                setting = np.array(df['linksetting'])
-                # pump setting is relative speed (unitless)
-                setting[:, linktype == EN.PIPE] = to_si(self.flow_units, setting[:, linktype == EN.PIPE], HydParam.RoughnessCoeff, 
-                                                darcy_weisbach=darcy_weisbach)
-                setting[:, linktype == EN.PRV] = to_si(self.flow_units, setting[:, linktype == EN.PRV], HydParam.Pressure)
-                setting[:, linktype == EN.PSV] = to_si(self.flow_units, setting[:, linktype == EN.PSV], HydParam.Pressure)
-                setting[:, linktype == EN.PBV] = to_si(self.flow_units, setting[:, linktype == EN.PBV], HydParam.Pressure)
-                setting[:, linktype == EN.FCV] = to_si(self.flow_units, setting[:, linktype == EN.FCV], HydParam.Flow)
-                self.results.link['setting'] = pd.DataFrame(data=setting, columns=linknames, index=reporttimes)
-                
-                self.results.link['friction_factor'] = df['frictionfactor']
-                self.results.link['reaction_rate'] = QualParam.ReactionRate._to_si(self.flow_units, df['reactionrate'],self.mass_units) 
+            if results_store is None:
+                self._save_results(data, reporttimes, nodenames, linknames, linktype, darcy_weisbach, convert)
             else:
-                self.results.node['demand'] = df['demand']
-                self.results.node['head'] = df['head']
-                self.results.node['pressure'] = df['pressure']
-                self.results.node['quality'] = df['quality']
-                
-                self.results.link['flowrate'] = df['flow']
-                self.results.link['headloss'] = df['headloss']
-                self.results.link['velocity'] = df['velocity']
-                self.results.link['quality'] = df['linkquality']
-                self.results.link['status'] = df['linkstatus']
-                self.results.link['setting'] = df['linksetting']
-                self.results.link['friction_factor'] = df['frictionfactor']
-                self.results.link['reaction_rate'] = df['reactionrate']
+                for start in range(0, N, results_store.chunk_size):
+                    stop = min(start + results_store.chunk_size, N)
+                    self._save_results(np.array(data[start:stop]), reporttimes[start:stop], nodenames, 
+                                       linknames, linktype, darcy_weisbach, convert)
+                    results_store.append_results(self.results)
+                del data
             
             logger.debug('... read epilog ...')
             # Read the averages and then the number of periods for checks
@@ -2860,6 +2910,8 @@ class BinFile(object):
             if warnflag != 0:
                 logger.warning('Warnings were issued during simulation')
         self.finalize_save(magic1==magic2, warnflag)
+        if results_store is not None:
+            self.results = results_store.to_results()
         
         return self.results
 
@@ -863,8 +863,9 @@ def MsxBinFile(filename, wn, res = None):
         nspecies = prolog[4]
         reportstep = prolog[5]
         species_list = []
-        node_list = wn.node_name_list
-        link_list = wn.link_name_list
+        # The binary file is in toolkit index order, which follows the INP file sections
+        node_list = wn.junction_name_list + wn.reservoir_name_list + wn.tank_name_list
+        link_list = wn.pipe_name_list + wn.pump_name_list + wn.valve_name_list
         # print(magic1, version, nnodes, nlinks, nspecies, reportstep)
 
         species_mass = []
@@ -195,8 +195,8 @@ class MSXepanet(ENepanet):
         """Advances the water quality simulation one water quality time step.
         The time remaining in the overall simulation is returned as tleft, the
         current time as t."""
-        t = ctypes.c_long()
-        tleft = ctypes.c_long()
+        t = ctypes.c_double()
+        tleft = ctypes.c_double()
         ierr = self.ENlib.MSXstep(ctypes.byref(t), ctypes.byref(tleft))
         if ierr != 0:
             raise EpanetMsxException(ierr)
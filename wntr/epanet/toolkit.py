@@ -10,6 +10,7 @@ import platform
 import sys
 from ctypes import byref
 
+import numpy as np
 from pkg_resources import resource_filename
 
 from .exceptions import EN_ERROR_CODES, EpanetException
@@ -602,6 +603,27 @@ class ENepanet:
         self._error()
         return iIndex.value
 
+    def ENgetpatternindex(self, sId):
+        """Retrieves index of a time pattern with specific ID
+
+        Parameters
+        -------------
+        sId : str
+            Pattern ID
+
+        Returns
+        ---------
+        Index of pattern in list of patterns
+
+        """
+        iIndex = ctypes.c_int()
+        if self._project is not None:
+            self.errcode = self.ENlib.EN_getpatternindex(self._project, sId.encode("latin-1"), byref(iIndex))
+        else:
+            self.errcode = self.ENlib.ENgetpatternindex(sId.encode("latin-1"), byref(iIndex))
+        self._error()
+        return iIndex.value
+
     def ENgetlinkvalue(self, iIndex, iCode):
         """Retrieves parameter value for a link
 
@@ -667,6 +689,252 @@ class ENepanet:
             self.errcode = self.ENlib.ENsetnodevalue(ctypes.c_int(iIndex), ctypes.c_int(iCode), ctypes.c_float(fValue))
         self._error()
 
+    def _get_values(self, array_name, scalar_name, iCount, iCode, values):
+        """Fill a buffer with a parameter value for every node or link"""
+        if values is None:
+            values = np.empty(iCount, dtype=np.float64)
+        elif not isinstance(values, np.ndarray) or values.dtype != np.float64 or \
+                not values.flags.c_contiguous or values.shape != (iCount,):
+            raise ValueError("values must be a contiguous float64 array of length {}".format(iCount))
+        if self._project is not None and hasattr(self.ENlib, array_name):
+            self.errcode = getattr(self.ENlib, array_name)(
+                self._project, ctypes.c_int(iCode), values.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+            )
+            self._error()
+            return values
+        # Toolkit without array getters, loop using a single value buffer
+        if self._project is not None:
+            fValue = ctypes.c_double()
+            getvalue = getattr(self.ENlib, "EN_" + scalar_name)
+            args = (self._project,)
+        else:
+            fValue = ctypes.c_float()
+            getvalue = getattr(self.ENlib, "EN" + scalar_name)
+            args = ()
+        pValue = byref(fValue)
+        for i in range(iCount):
+            errcode = getvalue(*args, i + 1, iCode, pValue)
+            if errcode:
+                self.errcode = errcode
+                self._error()
+            values[i] = fValue.value
+        self.errcode = 0
+        return values
+
+    def _set_values(self, scalar_name, iCount, iCode, values, indices):
+        """Set a parameter value on many nodes or links"""
+        values = np.asarray(values, dtype=np.float64)
+        if indices is None:
+            indices = range(1, iCount + 1)
+        indices = np.asarray(indices, dtype=int)
+        if values.ndim == 0:
+            values = np.full(indices.shape, float(values))
+        if values.shape != indices.shape:
+            raise ValueError("values and indices must have the same length")
+        if self._project is not None:
+            setvalue = getattr(self.ENlib, "EN_" + scalar_name)
+            args = (self._project,)
+            ctype = ctypes.c_double
+        else:
+            setvalue = getattr(self.ENlib, "EN" + scalar_name)
+            args = ()
+            ctype = ctypes.c_float
+        cCode = ctypes.c_int(iCode)
+        for i, value in zip(indices.tolist(), values.tolist()):
+            errcode = setvalue(*args, ctypes.c_int(i), cCode, ctype(value))
+            if errcode:
+                self.errcode = errcode
+                self._error()
+        self.errcode = 0
+
+    def ENgetnodevalues(self, iCode, values=None):
+        """Retrieves a parameter value for all nodes
+
+        Uses the toolkit array getter when the library provides one, 
+        otherwise the values are retrieved node by node.
+
+        Parameters
+        -------------
+        iCode : int
+            Node parameter code (see toolkit.optNodeParams)
+        values : numpy array, optional
+            Contiguous float64 array with one entry per node that is filled 
+            with the values, to avoid allocating a new array
+
+        Returns
+        ---------
+        numpy array
+            Node values, ordered by node index
+
+        """
+        iCount = self.ENgetcount(0)  # NODECOUNT = 0
+        return self._get_values("EN_getnodevalues", "getnodevalue", iCount, iCode, values)
+
+    def ENgetlinkvalues(self, iCode, values=None):
+        """Retrieves a parameter value for all links
+
+        Uses the toolkit array getter when the library provides one, 
+        otherwise the values are retrieved link by link.
+
+        Parameters
+        -------------
+        iCode : int
+            Link parameter code (see toolkit.optLinkParams)
+        values : numpy array, optional
+            Contiguous float64 array with one entry per link that is filled 
+            with the values, to avoid allocating a new array
+
+        Returns
+        ---------
+        numpy array
+            Link values, ordered by link index
+
+        """
+        iCount = self.ENgetcount(2)  # LINKCOUNT = 2
+        return self._get_values("EN_getlinkvalues", "getlinkvalue", iCount, iCode, values)
+
+    def ENsetnodevalues(self, iCode, values, indices=None):
+        """
+        Set a parameter value on many nodes, for example base demands
+
+        Parameters
+        ----------
+        iCode : int
+            the parameter enum integer
+        values : float or array-like
+            the values to set, one per node index
+        indices : array-like, optional
+            the node indices, by default all nodes
+        """
+        iCount = self.ENgetcount(0)  # NODECOUNT = 0
+        self._set_values("setnodevalue", iCount, iCode, values, indices)
+
+    def ENsetlinkvalues(self, iCode, values, indices=None):
+        """
+        Set a parameter value on many links, for example settings or status
+
+        Parameters
+        ----------
+        iCode : int
+            the parameter enum integer
+        values : float or array-like
+            the values to set, one per link index
+        indices : array-like, optional
+            the link indices, by default all links
+        """
+        iCount = self.ENgetcount(2)  # LINKCOUNT = 2
+        self._set_values("setlinkvalue", iCount, iCode, values, indices)
+
+    def ENgetnumdemands(self, iIndex):
+        """Retrieves the number of demand categories for a junction
+
+        Parameters
+        -------------
+        iIndex : int
+            Node index
+
+        Returns
+        ---------
+        int
+            Number of demand categories
+
+        """
+        iNumDemands = ctypes.c_int()
+        if self._project is not None:
+            self.errcode = self.ENlib.EN_getnumdemands(self._project, iIndex, byref(iNumDemands))
+        else:
+            self.errcode = self.ENlib.ENgetnumdemands(iIndex, byref(iNumDemands))
+        self._error()
+        return iNumDemands.value
+
+    def ENgetbasedemand(self, iIndex, iDemand):
+        """Retrieves the base demand for one of a junction's demand categories
+
+        Parameters
+        -------------
+        iIndex : int
+            Node index
+        iDemand : int
+            Demand category index (starting at 1)
+
+        Returns
+        ---------
+        float
+            Base demand
+
+        """
+        fValue = ctypes.c_float()
+        if self._project is not None:
+            fValue = ctypes.c_double()
+            self.errcode = self.ENlib.EN_getbasedemand(self._project, iIndex, iDemand, byref(fValue))
+        else:
+            self.errcode = self.ENlib.ENgetbasedemand(iIndex, iDemand, byref(fValue))
+        self._error()
+        return fValue.value
+
+    def ENsetbasedemand(self, iIndex, iDemand, fValue):
+        """Sets the base demand for one of a junction's demand categories
+
+        Parameters
+        ----------
+        iIndex : int
+            the node index
+        iDemand : int
+            the demand category index (starting at 1)
+        fValue : float
+            the base demand
+        """
+        if self._project is not None:
+            self.errcode = self.ENlib.EN_setbasedemand(
+                self._project, ctypes.c_int(iIndex), ctypes.c_int(iDemand), ctypes.c_double(fValue)
+            )
+        else:
+            self.errcode = self.ENlib.ENsetbasedemand(ctypes.c_int(iIndex), ctypes.c_int(iDemand), ctypes.c_float(fValue))
+        self._error()
+
+    def ENgetdemandpattern(self, iIndex, iDemand):
+        """Retrieves the time pattern index for one of a junction's demand categories
+
+        Parameters
+        -------------
+        iIndex : int
+            Node index
+        iDemand : int
+            Demand category index (starting at 1)
+
+        Returns
+        ---------
+        int
+            Pattern index (0 if there is no pattern)
+
+        """
+        iPattern = ctypes.c_int()
+        if self._project is not None:
+            self.errcode = self.ENlib.EN_getdemandpattern(self._project, iIndex, iDemand, byref(iPattern))
+        else:
+            self.errcode = self.ENlib.ENgetdemandpattern(iIndex, iDemand, byref(iPattern))
+        self._error()
+        return iPattern.value
+
+    def ENsetdemandpattern(self, iIndex, iDemand, iPattern):
+        """Sets the time pattern for one of a junction's demand categories (EPANET 2.2 only)
+
+        Parameters
+        ----------
+        iIndex : int
+            the node index
+        iDemand : int
+            the demand category index (starting at 1)
+        iPattern : int
+            the pattern index, 0 for no pattern
+        """
+        if self._project is None:
+            raise NotImplementedError("ENsetdemandpattern requires EPANET version 2.2")
+        self.errcode = self.ENlib.EN_setdemandpattern(
+            self._project, ctypes.c_int(iIndex), ctypes.c_int(iDemand), ctypes.c_int(iPattern)
+        )
+        self._error()
+
     def ENsettimeparam(self, eParam, lValue):
         """Set a time parameter value
 
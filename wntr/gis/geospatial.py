@@ -7,10 +7,12 @@ import pandas as pd
 import numpy as np
 import matplotlib.pylab as plt
 from scipy.spatial.distance import cdist
-from scipy.spatial.distance import pdist, squareform
-from scipy.cluster.hierarchy import linkage, fcluster, dendrogram
+from scipy.spatial import cKDTree
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 try:
+    import shapely
     from shapely.geometry import MultiPoint, LineString, Point, shape
     has_shapely = True
 except ModuleNotFoundError:
@@ -31,13 +33,17 @@ except ModuleNotFoundError:
     has_rasterio = False
 
 
-def snap(A, B, tolerance):  
+def snap(A, B, tolerance, chunk_size=None):  
     """
     Snap Points in A to Points or Lines in B
 
     For each Point geometry in A, the function returns snapped Point geometry 
     and associated element in B. Note the CRS of A must equal the CRS of B.
     
+    The closest element in B is found using a nearest neighbor query on the 
+    spatial index of B, limited to the tolerance. Points in A are processed 
+    in chunks of `chunk_size` points to bound memory use for large datasets.
+    
     Parameters
     ----------
     A : geopandas GeoDataFrame
@@ -47,6 +53,9 @@ def snap(A, B, tolerance):
     tolerance : float
         Maximum allowable distance (in the coordinate reference system units) 
         between Points in A and Points or Lines in B.  
+    chunk_size : int or None (optional)
+        Number of Points in A that are snapped at a time. If None, all 
+        Points are snapped at once. Default is None.
     
     Returns
     -------
@@ -73,76 +82,87 @@ def snap(A, B, tolerance):
     assert isinstance(B, gpd.GeoDataFrame)
     assert (B['geometry'].geom_type).isin(['Point', 'LineString', 'MultiLineString']).all()
     assert A.crs == B.crs
-    
-    # Modify B to include "indexB" as a separate column
-    B = B.reset_index(names='indexB')
+    assert (chunk_size is None) or (isinstance(chunk_size, int) and chunk_size > 0)
     
     # Define the coordinate reference system, based on B
     crs = B.crs
     
-    # Determine which Bs are closest to each A
-    bbox = A.bounds + [-tolerance, -tolerance, tolerance, tolerance]       
-    hits = bbox.apply(lambda row: list(B.loc[list(B.sindex.intersection(row))]['indexB']), axis=1)        
-    closest = pd.DataFrame({
-        # index of points table
-        "point": np.repeat(hits.index, hits.apply(len)),
-        # name of link
-        "indexB": np.concatenate(hits.values)
-        })
-    
-    # Merge the closest dataframe with the lines dataframe on the line names
-    closest = pd.merge(closest, B, on="indexB")
-
-    # Join back to the original points to get their geometry
-    # rename the point geometry as "points"
-    closest = closest.join(A.geometry.rename("points"), on="point")
+    snap_to_points = B['geometry'].geom_type.isin(['Point']).all()
+    snap_to_lines = B['geometry'].geom_type.isin(['LineString', 'MultiLineString']).all()
+    include_node = ("start_node_name" in B.columns) and ("end_node_name" in B.columns)
     
-    # Convert back to a GeoDataFrame, so we can do spatial ops
-    closest = gpd.GeoDataFrame(closest, geometry="geometry", crs=crs)  
+    A_geom = A.geometry.values
+    B_geom = B.geometry.values
+    B_index = B.index.values
+    if chunk_size is None:
+        chunk_size = max(len(A), 1)
     
-    # Calculate distance between the point and nearby links
-    closest["snap_distance"] = closest.geometry.distance(gpd.GeoSeries(closest.points, crs=crs))
+    snapped_points = []
+    for start in range(0, len(A), chunk_size):
+        points = A_geom[start:start+chunk_size]
+        
+        # Determine which Bs are closest to each A, within the tolerance.
+        # All Bs at the same (closest) distance are returned
+        (point, indexB), _ = B.sindex.nearest(points, return_all=True, 
+                              max_distance=tolerance, return_distance=True)
+        points = points[point]
+        geometry = B_geom[indexB]
+        
+        # Calculate distance between the point and nearby elements
+        closest = pd.DataFrame({'point': start + point, 
+                                'indexB': B_index[indexB],
+                                'position': indexB,
+                                'snap_distance': np.asarray(geometry.distance(points))})
+        closest = closest[closest['snap_distance'] <= tolerance]
+        
+        # Sort on ascending snap distance and take the first for each point,
+        # ties are broken using the index of B
+        closest = closest.sort_values(by=["snap_distance", "indexB"]) 
+        closest = closest.drop_duplicates(subset="point", keep="first")
+        closest = closest.sort_values(by="point")
         
-    # Collect only point/link pairs within snap distance radius
-    # This is needed because B.sindex.intersection(row) above can return false positives
-    closest = closest[closest['snap_distance'] <= tolerance]
-    
-    # Sort on ascending snap distance, so that closest goes to top
-    closest = closest.sort_values(by=["snap_distance", "indexB"]) 
-       
-    # group by the index of the points and take the first, which is the closest line
-    closest = closest.groupby("point").first()      
-    
-    # construct a GeoDataFrame of the closest elements of B
-    closest = gpd.GeoDataFrame(closest, geometry="geometry", crs=crs)
-    
-    # Reset B index
-    B.set_index('indexB', inplace=True)
-    B.index.name = None
-    
-    # snap to points
-    if B['geometry'].geom_type.isin(['Point']).all():
-        snapped_points = closest.rename(columns={"indexB":"node"})
-        snapped_points = snapped_points[["node", "snap_distance", "geometry"]]
-        snapped_points.index.name = None      
+        points = A_geom[closest['point'].values]
+        geometry = B_geom[closest['position'].values]
+        index = A.index[closest['point'].values]
         
-    # snap to lines
-    if B['geometry'].geom_type.isin(['LineString', 'MultiLineString']).all():
-        closest = closest.rename(columns={"indexB":"link"})        
-        # position of nearest point from start of the line
-        pos = closest.geometry.project(gpd.GeoSeries(closest.points))        
-        # get new point location geometry
-        snapped_points = closest.geometry.interpolate(pos)
-        snapped_points = gpd.GeoDataFrame(data=closest ,geometry=snapped_points, crs=crs)
-        # determine whether the snapped point is closer to the start or end node
-        snapped_points["line_position"] = closest.geometry.project(snapped_points, normalized=True)
-        if ("start_node_name" in closest.columns) and ("end_node_name" in closest.columns):
-            snapped_points.loc[snapped_points["line_position"]<0.5, "node"] = closest["start_node_name"]
-            snapped_points.loc[snapped_points["line_position"]>=0.5, "node"] = closest["end_node_name"]
-            snapped_points = snapped_points[["link", "node", "snap_distance", "line_position", "geometry"]]
+        # snap to points
+        if snap_to_points:
+            data = pd.DataFrame({'node': closest['indexB'].values,
+                                 'snap_distance': closest['snap_distance'].values}, 
+                                index=index)
+            snapped_points.append(gpd.GeoDataFrame(data, geometry=geometry, crs=crs))
+        
+        # snap to lines
+        if snap_to_lines:
+            # position of nearest point from start of the line
+            pos = geometry.project(points)
+            # get new point location geometry
+            snapped = geometry.interpolate(pos)
+            data = pd.DataFrame({'link': closest['indexB'].values}, index=index)
+            # determine whether the snapped point is closer to the start or end node
+            line_position = np.asarray(geometry.project(snapped, normalized=True))
+            if include_node:
+                positions = closest['position'].values
+                data['node'] = np.where(line_position < 0.5, 
+                                        B['start_node_name'].values[positions],
+                                        B['end_node_name'].values[positions])
+            data['snap_distance'] = closest['snap_distance'].values
+            data['line_position'] = line_position
+            snapped_points.append(gpd.GeoDataFrame(data, geometry=snapped, crs=crs))
+    
+    if len(snapped_points) == 0:
+        if snap_to_points:
+            columns = ["node", "snap_distance"]
+        elif include_node:
+            columns = ["link", "node", "snap_distance", "line_position"]
         else:
-            snapped_points = snapped_points[["link", "snap_distance", "line_position", "geometry"]]
-        snapped_points.index.name = None
+            columns = ["link", "snap_distance", "line_position"]
+        snapped_points = [gpd.GeoDataFrame(pd.DataFrame(columns=columns), 
+                                           geometry=gpd.GeoSeries(crs=crs), crs=crs)]
+    
+    snapped_points = pd.concat(snapped_points)
+    snapped_points = snapped_points.sort_index()
+    snapped_points.index.name = None
         
     return snapped_points
 
@@ -159,7 +179,8 @@ def _backgound(A, B):
     return background
 
 
-def intersect(A, B, B_value=None, include_background=False, background_value=0):
+def intersect(A, B, B_value=None, include_background=False, background_value=0,
+              chunk_size=None):
     """
     Intersect Points, Lines or Polygons in A with Points, Lines, or Polygons in B.
     Return statistics on the intersection.
@@ -184,6 +205,10 @@ def intersect(A, B, B_value=None, include_background=False, background_value=0):
     background_value : int or float (optional)
         The value given to background space. This value is used in the intersection 
         statistics if a B_value column name is provided. Default is 0.
+    chunk_size : int or None (optional)
+        Number of intersecting geometry pairs that are clipped at a time 
+        when computing the weighted mean. If None, all pairs are clipped at 
+        once. Default is None.
       
     Returns
     -------
@@ -220,6 +245,7 @@ def intersect(A, B, B_value=None, include_background=False, background_value=0):
         assert B_value in B.columns
     assert isinstance(include_background, bool)
     assert isinstance(background_value, (int, float))
+    assert (chunk_size is None) or (isinstance(chunk_size, int) and chunk_size > 0)
     assert A.crs == B.crs, "A and B must have the same crs."
     
     if include_background:
@@ -260,30 +286,36 @@ def intersect(A, B, B_value=None, include_background=False, background_value=0):
             weighted_mean = True
             
     if weighted_mean and B_value is not None:
-        stats['weighted_mean'] = 0.0
-        A_length = A.length
-        covered_length = pd.Series(0.0, index = A.index)
+        A_length = A.length.values
+        B_val = B[B_value].values.astype(float)
         
-        for i in B.index:
-            B_geom = gpd.GeoDataFrame(B.loc[[i],:], crs=B.crs)
-            val = float(B_geom.iloc[0][B_value])
-            A_subset = A.loc[stats['intersections'].apply(lambda x: i in x),:]
-            #print(i, lines_subset)
-            A_clip = gpd.clip(A_subset, B_geom) 
-            A_clip_length = A_clip.length
-            A_clip_index = A_clip.index
-            
-            if A_clip_length.shape[0] > 0:
-                fraction_length = A_clip_length/A_length[A_clip_index]
-                covered_length[A_clip_index] = covered_length[A_clip_index] + fraction_length
-                weighed_val = fraction_length*val
-                stats.loc[A_clip_index, 'weighted_mean'] = stats.loc[A_clip_index, 'weighted_mean'] + weighed_val
+        # Intersecting pairs, sorted by B to accumulate values in B order
+        A_pos, B_pos = B.sindex.query(A.geometry.values, predicate='intersects')
+        order = np.argsort(B_pos, kind='stable')
+        A_pos = A_pos[order]
+        B_pos = B_pos[order]
         
-        # Normalize weighted mean by covered length (can be over 1 if polygons overlap)
-        # Can be less than 1 if there are gaps (when background is not used)
-        stats['weighted_mean'] = stats['weighted_mean']/covered_length
+        # Length of each line clipped by each intersecting polygon
+        A_geom = A.geometry.values
+        B_geom = B.geometry.values
+        if chunk_size is None:
+            chunk_size = max(len(A_pos), 1)
+        clip_length = np.empty(len(A_pos))
+        for start in range(0, len(A_pos), chunk_size):
+            pairs = slice(start, start+chunk_size)
+            clip_length[pairs] = A_geom[A_pos[pairs]].intersection(B_geom[B_pos[pairs]]).length
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction_length = clip_length/A_length[A_pos]
+            covered_length = np.bincount(A_pos, weights=fraction_length, minlength=len(A))
+            weighted_val = np.bincount(A_pos, weights=fraction_length*B_val[B_pos], minlength=len(A))
+            
+            # Normalize weighted mean by covered length (can be over 1 if polygons overlap)
+            # Can be less than 1 if there are gaps (when background is not used)
+            stats['weighted_mean'] = weighted_val/covered_length
         
         # Covered_length is NaN if length A is 0, set weighted mean to mean
+        covered_length = pd.Series(covered_length, index=stats.index)
         stats.loc[covered_length.isna(), 'weighted_mean'] = stats.loc[covered_length.isna(), 'mean']
         
         # No intersection, set weighted mean to NaN
@@ -345,15 +377,22 @@ def connect_lines(lines, threshold, plot=False):
     Connect lines by identifying start and end nodes that are within a 
     threshold distance
 
+    Line endpoints that are within the threshold distance of each other are 
+    connected, and groups of connected endpoints (including endpoints that 
+    are connected through other endpoints) are merged into a single node 
+    located at the centroid of the group. Endpoint pairs are found using a 
+    KD-tree, so memory use scales with the number of endpoint pairs instead 
+    of the square of the number of endpoints.
+
     Parameters
     ----------
     lines : gpd.GeoDataFrame
         GeoDataFrame with LineString geometry
-    tolerance : float
+    threshold : float
         Maximum distance between line endpoints, used to define connecting 
         Point geometry
     plot : bool
-        Boolean indicating if a plot is created for the dendogram, and original and connected lines
+        Boolean indicating if a plot is created for the original and connected lines
         
     Returns
     -------
@@ -367,107 +406,69 @@ def connect_lines(lines, threshold, plot=False):
     
     original_lines = lines
     lines = lines.copy()
-
-    # Create start and end node name and Point geometry for each line
-    nodes = []
-    geometry = []
-    lines['start_node_name'] = None #create new columns
-    lines['end_node_name'] = None
-    j = 0
-    for i, line in lines.iterrows(): # loop through every line
-        try:
-            geom = line.geometry.geoms[0]
-        except:
-            geom = line.geometry
-        
-        geometry.append(Point([geom.coords[0][0], geom.coords[0][1]])) 
-        nodes.append({'Line': i, 'Node': j}) #node list holds the line ID
-        #unique number for each start node and end node for each line 
-        lines.loc[i,'start_node_name'] = j
-        j = j+1
-            
-        geometry.append(Point([geom.coords[-1][0], geom.coords[-1][1]]))
-        nodes.append({'Line': i, 'Node': j})
-        lines.loc[i,'end_node_name'] = j
-        j = j+1
-            
-    nodes = gpd.GeoDataFrame(nodes, geometry=geometry)
-    nodes.set_crs(lines.crs, inplace=True)
-    
-    # Create a distance matrix
-    points = nodes['geometry']
-    coords = points.apply(lambda geom: (geom.x, geom.y)).tolist()
-    condensed = pdist(coords)
-    D = squareform(condensed)
-    D = pd.DataFrame(D, index=nodes.index, columns=nodes.index)
-    
-    # Several options exist for linkage and fcluster below 
-    # currently using ward/euclidean/distance
-    
-    # Compute a linkage model
-    Z = linkage(condensed, method='ward', metric='euclidean', optimal_ordering=True)
-    
-    # Form clusters
-    #clusters = fcluster(Z, threshold, criterion='inconsistent', depth=2)
-    clusters = fcluster(Z, threshold, criterion='distance')
-    #clusters = fcluster(Z, threshold, criterion='monocrit')
-    #clusters = fcluster(Z, threshold, criterion='maxclust')
-    #clusters = fcluster(Z, threshold, criterion='maxclust_monocrit')
-    clusters = pd.Series(clusters, index=nodes.index)
-    nodes['supernode'] = clusters.copy()
+    n = lines.shape[0]
+    
+    # Start and end Point coordinates for each line (first part of 
+    # MultiLineStrings). Node 2*i is the start node and node 2*i+1 is the end 
+    # node of line i
+    geom = shapely.get_geometry(np.asarray(lines.geometry), 0)
+    coords = np.empty((2*n, 2))
+    coords[0::2] = shapely.get_coordinates(shapely.get_point(geom, 0))
+    coords[1::2] = shapely.get_coordinates(shapely.get_point(geom, -1))
+    
+    # Connect nodes within the threshold distance and form clusters
+    pairs = cKDTree(coords).query_pairs(threshold, output_type='ndarray')
+    A = coo_matrix((np.ones(pairs.shape[0]), (pairs[:,0], pairs[:,1])), shape=(2*n, 2*n))
+    num_clusters, clusters = connected_components(A, directed=False)
+    clusters = clusters + 1 # supernode names start at 1
     
     # Update lines GeoDataFrame with start and end supernode names
-    map_node_to_supernode = nodes['supernode']
-    lines['start_node_name'] = map_node_to_supernode[lines['start_node_name']].values
-    lines['end_node_name'] = map_node_to_supernode[lines['end_node_name']].values
+    lines['start_node_name'] = clusters[0::2]
+    lines['end_node_name'] = clusters[1::2]
     
     # Remove lines with the same start and end node name
     lines = lines.loc[~(lines['start_node_name'] == lines['end_node_name']),:]
     
-    # Create a nodes GeoDataFrame with centroid of each supernode
-    supernode_name = []
-    supernode_geom = []
-    for name, group in nodes.groupby('supernode'):
-        supernode_name.append(name)
-        supernode_geom.append(group.dissolve().centroid[0])
-    nodes = gpd.GeoDataFrame({'Node': supernode_name}, geometry=supernode_geom)
+    # Create a nodes GeoDataFrame with centroid of each supernode (duplicate 
+    # points are only counted once)
+    supernodes = pd.DataFrame({'Node': clusters, 'x': coords[:,0], 'y': coords[:,1]})
+    supernodes = supernodes.drop_duplicates().groupby('Node').mean()
+    nodes = gpd.GeoDataFrame({'Node': supernodes.index}, 
+                             geometry=gpd.points_from_xy(supernodes['x'], supernodes['y']))
     nodes.set_index('Node', inplace=True)
     nodes.index.name = None
     nodes.crs = lines.crs
     
+    # Add start and end node Points to LineStrings, if they differ from the
+    # first and last coordinate
+    node_coords = supernodes[['x', 'y']].values
+    l_coords, l_index = shapely.get_coordinates(np.asarray(lines.geometry), return_index=True)
+    counts = np.bincount(l_index, minlength=lines.shape[0])
+    last = np.cumsum(counts)
+    first = last - counts
+    start_coords = node_coords[lines['start_node_name'].values - 1]
+    end_coords = node_coords[lines['end_node_name'].values - 1]
+    add_start = (start_coords != l_coords[first]).any(axis=1)
+    add_end = (end_coords != l_coords[last-1]).any(axis=1)
+    
+    # End points of a line are inserted before start points of the next line
+    position = np.concatenate([last[add_end], first[add_start]])
+    order = np.lexsort((np.concatenate([np.zeros(add_end.sum()), np.ones(add_start.sum())]), 
+                        position))
+    position = position[order]
+    values = np.concatenate([end_coords[add_end], start_coords[add_start]])[order]
+    index = np.concatenate([np.where(add_end)[0], np.where(add_start)[0]])[order]
+    l_coords = np.insert(l_coords, position, values, axis=0)
+    l_index = np.insert(l_index, position, index)
+    lines['geometry'] = gpd.GeoSeries(shapely.linestrings(l_coords, indices=l_index), 
+                                      index=lines.index, crs=lines.crs)
+    
     # Convert names to string
     nodes.index = nodes.index.astype(str)
     lines['start_node_name'] = lines['start_node_name'].astype(str)
     lines['end_node_name'] = lines['end_node_name'].astype(str)
     
-    # Add start and end node Points to LineStrings
-    start_coords = nodes.loc[lines['start_node_name']]
-    end_coords = nodes.loc[lines['end_node_name']]
-    for i, (line_name, row) in enumerate(lines.iterrows()):
-        line = row['geometry']
-        l_coords = list(line.coords)
-        start_point = nodes.loc[row['start_node_name'], 'geometry']
-        end_point = nodes.loc[row['end_node_name'], 'geometry']
-        if start_point.coords[0] != l_coords[0]:
-            l_coords.insert(0, start_point.coords[0])
-        if end_point.coords[0] != l_coords[-1]:
-            l_coords.append(end_point.coords[0])
-        lines.loc[line_name, 'geometry'] = LineString(l_coords)
-    
     if plot:
-  
-        plt.figure(figsize=(10, 5))
-        dendro = dendrogram(Z)
-
-        #unique_clusters = np.unique(clusters)
-        #colors = plt.cm.get_cmap('tab10', len(unique_clusters))  # Use a colormap with enough colors
-        #color_dict = {cluster: colors(i) for i, cluster in enumerate(unique_clusters)}
-        #dendro = dendrogram(Z, color_threshold=threshold, link_color_func=lambda k: color_dict[k])
-
-        plt.title('Hierarchical Cluster Dendrogram')
-        plt.xlabel('Data Point Indexes')
-        plt.ylabel('Distance')
-        
         plt.figure()
         ax = plt.gca()
         ax = original_lines.plot(ax=ax, color='r', label='Disconnected lines')
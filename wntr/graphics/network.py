@@ -3,10 +3,13 @@ The wntr.graphics.network module includes methods plot the
 water network model.
 """
 import logging
+import os
 import networkx as nx
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib import animation
+from matplotlib.collections import LineCollection
 
 try:
     import plotly
@@ -47,9 +50,12 @@ def plot_network(wn, node_attribute=None, link_attribute=None, title=None,
                node_size=20, node_range=[None,None], node_alpha=1, node_cmap=None, node_labels=False,
                link_width=1, link_range=[None,None], link_alpha=1, link_cmap=None, link_labels=False,
                add_colorbar=True, node_colorbar_label='Node', link_colorbar_label='Link', 
-               directed=False, ax=None, show_plot=True, filename=None):
+               directed=False, ax=None, show_plot=True, filename=None, decimate=None):
     """
     Plot network graphic
+    
+    Nodes and links are drawn using a single matplotlib PathCollection and 
+    LineCollection, respectively.
 	
     Parameters
     ----------
@@ -132,6 +138,14 @@ def plot_network(wn, node_attribute=None, link_attribute=None, title=None,
     
     filename : str, optional
         Filename used to save the figure
+    
+    decimate : int or None, optional
+        Level of detail used to plot large networks. If an int, node and link 
+        coordinates are binned on a grid with `decimate` cells across the 
+        network extent. Nodes and links that are plotted without an attribute 
+        value are only plotted once per grid cell (nodes) or pair of grid 
+        cells (links), and links within a single grid cell are not plotted. 
+        None indicates that all nodes and links are plotted.
         
     Returns
     -------
@@ -141,118 +155,280 @@ def plot_network(wn, node_attribute=None, link_attribute=None, title=None,
     if ax is None: # create a new figure
         plt.figure(facecolor='w', edgecolor='k')
         ax = plt.gca()
-        
-    # Graph
-    G = wn.to_graph()
-    if not directed:
-        G = G.to_undirected()
-
-    # Position
-    pos = nx.get_node_attributes(G,'pos')
-    if len(pos) == 0:
-        pos = None
+    
+    network = _NetworkRenderer(wn, decimate)
+    
+    if title is not None:
+        ax.set_title(title)
+    
+    nodes, edges = network.draw(ax, node_attribute, link_attribute, 
+            node_size, node_range, node_alpha, node_cmap, node_labels, 
+            link_width, link_range, link_alpha, link_cmap, link_labels, 
+            add_colorbar, node_colorbar_label, link_colorbar_label, directed)
+    
+    if filename:
+        plt.savefig(filename)
+    
+    if show_plot is True:
+        plt.show(block=False)
+    
+    return ax
 
-    # Define node properties
-    add_node_colorbar = add_colorbar
-    if node_attribute is not None:
-        
-        if isinstance(node_attribute, list):
-            if node_cmap is None:
-                node_cmap = ['red', 'red']
-            add_node_colorbar = False
-        
-        if node_cmap is None:
-            node_cmap = plt.get_cmap('Spectral_r')
-        elif isinstance(node_cmap, list):
-            if len(node_cmap) == 1:
-                node_cmap = node_cmap*2
-            node_cmap = custom_colormap(len(node_cmap), node_cmap)  
-         
-        node_attribute = _format_node_attribute(node_attribute, wn)
-        nodelist,nodecolor = zip(*node_attribute.items())
 
-    else:
-        nodelist = None
-        nodecolor = 'k'
+class _NetworkRenderer(object):
+    """
+    Draw a water network model using matplotlib collections.
     
-    add_link_colorbar = add_colorbar
-    if link_attribute is not None:
+    Node coordinates and link segments are stored in arrays when the 
+    renderer is created. Nodes are drawn as a single PathCollection and links 
+    are drawn as a single LineCollection, so node and link values can be 
+    updated by setting the collection arrays.
+    
+    Parameters
+    ----------
+    wn : wntr WaterNetworkModel
+        A WaterNetworkModel object
+    decimate : int or None, optional
+        If an int, node and link coordinates are binned on a grid with 
+        `decimate` cells across the network extent. Nodes and links that are 
+        drawn without an attribute value are only drawn once per grid cell 
+        (nodes) or pair of grid cells (links), and links within a single grid 
+        cell are not drawn.
+    """
+    def __init__(self, wn, decimate=None):
+        self._wn = wn
+        G = wn.to_sparse_graph()
+        self.node_names = G.node_names
+        self.link_names = G.link_names
+        self.node_index = G.node_index
+        self.link_index = G.link_index
+        self.node_xy = np.array([node.coordinates for name, node in wn.nodes()], 
+                                dtype=float).reshape(-1, 2)
+        self.start_node_index = G.start_node_index
+        self.end_node_index = G.end_node_index
+        self.segments = np.stack([self.node_xy[self.start_node_index], 
+                                  self.node_xy[self.end_node_index]], axis=1)
         
-        if isinstance(link_attribute, list):
-            if link_cmap is None:
-                link_cmap = ['red', 'red']
-            add_link_colorbar = False
-
-        if link_cmap is None:
-            link_cmap = plt.get_cmap('Spectral_r')
-        elif isinstance(link_cmap, list):
-            if len(link_cmap) == 1:
-                link_cmap = link_cmap*2
-            link_cmap = custom_colormap(len(link_cmap), link_cmap)  
-            
-        link_attribute = _format_link_attribute(link_attribute, wn)
+        self.node_mask = np.ones(len(self.node_names), dtype=bool)
+        self.link_mask = np.ones(len(self.link_names), dtype=bool)
+        if decimate is not None:
+            self._decimate(decimate)
+    
+    def _decimate(self, resolution):
+        if len(self.node_names) == 0:
+            return
+        xy_min = self.node_xy.min(axis=0)
+        extent = (self.node_xy.max(axis=0) - xy_min).max()
+        if extent == 0:
+            return
+        cell_size = extent/resolution
+        cell_xy = np.floor((self.node_xy - xy_min)/cell_size).astype(np.int64)
+        cell = cell_xy[:,0]*(resolution+1) + cell_xy[:,1]
         
-        # Replace link_attribute dictionary defined as
-        # {link_name: attr} with {(start_node, end_node, link_name): attr}
-        attr = {}
-        for link_name, value in link_attribute.items():
-            link = wn.get_link(link_name)
-            attr[(link.start_node_name, link.end_node_name, link_name)] = value
-        link_attribute = attr
+        # One node per cell
+        unique_cell, first = np.unique(cell, return_index=True)
+        self.node_mask = np.zeros(len(self.node_names), dtype=bool)
+        self.node_mask[first] = True
         
-        linklist,linkcolor = zip(*link_attribute.items())
-    else:
-        linklist = None
-        linkcolor = 'k'
+        # One link per pair of cells, no links within a cell
+        start_cell = cell[self.start_node_index]
+        end_cell = cell[self.end_node_index]
+        pair = np.minimum(start_cell, end_cell)*(resolution+1)**2 + np.maximum(start_cell, end_cell)
+        unique_pair, first = np.unique(pair, return_index=True)
+        self.link_mask = np.zeros(len(self.link_names), dtype=bool)
+        self.link_mask[first] = True
+        self.link_mask[start_cell == end_cell] = False
     
-    if title is not None:
-        ax.set_title(title)
-        
-    edge_background = nx.draw_networkx_edges(G, pos, edge_color='grey', 
-                                             width=0.5, ax=ax)
+    def _format_values(self, attribute, index, fmt):
+        """
+        Return element positions and values of a node or link attribute
+        """
+        attribute = fmt(attribute, self._wn)
+        names = list(attribute.keys())
+        pos = np.array([index[name] for name in names], dtype=int)
+        values = np.array(list(attribute.values()), dtype=float)
+        return pos, values
     
-    nodes = nx.draw_networkx_nodes(G, pos, 
-            nodelist=nodelist, node_color=nodecolor, node_size=node_size, 
-            alpha=node_alpha, cmap=node_cmap, vmin=node_range[0], vmax = node_range[1], 
-            linewidths=0, ax=ax)
-    edges = nx.draw_networkx_edges(G, pos, edgelist=linklist, arrows=directed,
-            edge_color=linkcolor, width=link_width, alpha=link_alpha, edge_cmap=link_cmap, 
-            edge_vmin=link_range[0], edge_vmax=link_range[1], ax=ax)
-    if node_labels:
-        labels = dict(zip(wn.node_name_list, wn.node_name_list))
-        nx.draw_networkx_labels(G, pos, labels, font_size=7, ax=ax)
-    if link_labels:
-        labels = {}
-        for link_name in wn.link_name_list:
-            link = wn.get_link(link_name)
-            labels[(link.start_node_name, link.end_node_name)] = link_name
-        nx.draw_networkx_edge_labels(G, pos, labels, font_size=7, ax=ax)
-    if add_node_colorbar and node_attribute:
-        clb = plt.colorbar(nodes, shrink=0.5, pad=0, ax=ax)
-        clb.ax.set_title(node_colorbar_label, fontsize=10)
-    if add_link_colorbar and link_attribute:
-        if link_range[0] is None:
-            vmin = min(link_attribute.values())
+    def _node_values(self, node_attribute):
+        return self._format_values(node_attribute, self.node_index, _format_node_attribute)
+    
+    def _link_values(self, link_attribute):
+        return self._format_values(link_attribute, self.link_index, _format_link_attribute)
+    
+    def draw_nodes(self, ax, pos=None, values=None, node_size=20, node_range=[None,None], 
+                   node_alpha=1, node_cmap=None):
+        """
+        Draw nodes as a PathCollection, nodes are colored by values if 
+        values are provided
+        """
+        if pos is None:
+            pos = np.where(self.node_mask)[0]
+        xy = self.node_xy[pos]
+        if values is None:
+            color = 'k'
         else:
-            vmin = link_range[0]
-        if link_range[1] is None:
-            vmax = max(link_attribute.values())
+            color = values
+        nodes = ax.scatter(xy[:,0], xy[:,1], s=node_size, c=color, 
+                           cmap=node_cmap, vmin=node_range[0], vmax=node_range[1], 
+                           alpha=node_alpha, linewidths=0)
+        nodes.set_zorder(2)
+        return nodes
+    
+    def draw_links(self, ax, pos=None, values=None, link_width=1, link_range=[None,None], 
+                   link_alpha=1, link_cmap=None, color='k', directed=False, zorder=1):
+        """
+        Draw links as a LineCollection, links are colored by values if 
+        values are provided
+        """
+        if pos is None:
+            pos = np.where(self.link_mask)[0]
+        segments = self.segments[pos]
+        edges = LineCollection(segments, linewidths=link_width, alpha=link_alpha, 
+                               antialiaseds=(1,))
+        if values is None:
+            edges.set_color(color)
         else:
-            vmax = link_range[1]
-        sm = plt.cm.ScalarMappable(cmap=link_cmap, norm=plt.Normalize(vmin=vmin, vmax=vmax))
-        sm.set_array([])
-        clb = plt.colorbar(sm, shrink=0.5, pad=0.05, ax=ax)
-        clb.ax.set_title(link_colorbar_label, fontsize=10)
+            vmin, vmax = _value_range(values, link_range)
+            edges.set_array(values)
+            edges.set_cmap(link_cmap)
+            edges.set_norm(plt.Normalize(vmin=vmin, vmax=vmax))
+        edges.set_zorder(zorder)
+        ax.add_collection(edges)
+        
+        self.arrows = None
+        if directed and len(pos) > 0:
+            # Arrow heads at the middle of each link, pointing from the 
+            # start node to the end node
+            mid = segments.mean(axis=1)
+            delta = segments[:,1,:] - segments[:,0,:]
+            length = np.hypot(delta[:,0], delta[:,1])
+            length[length == 0] = 1
+            arrow_length = 8*link_width # dots
+            self.arrows = ax.quiver(mid[:,0], mid[:,1], 
+                                    arrow_length*delta[:,0]/length, 
+                                    arrow_length*delta[:,1]/length, 
+                                    angles='xy', pivot='mid', units='dots', 
+                                    scale_units='dots', scale=1, width=link_width, 
+                                    headwidth=4, headlength=6, headaxislength=5, 
+                                    alpha=link_alpha)
+            if values is None:
+                self.arrows.set_color(color)
+            else:
+                self.arrows.set_array(values)
+                self.arrows.set_cmap(link_cmap)
+                self.arrows.set_norm(edges.norm)
+            self.arrows.set_zorder(zorder)
         
-    ax.axis('off')
+        return edges
     
-    if filename:
-        plt.savefig(filename)
+    def draw_node_labels(self, ax):
+        for name, (x, y) in zip(self.node_names, self.node_xy):
+            ax.text(x, y, name, size=7, horizontalalignment='center', 
+                    verticalalignment='center', clip_on=True, zorder=1)
     
-    if show_plot is True:
-        plt.show(block=False)
+    def draw_link_labels(self, ax):
+        mid = self.segments.mean(axis=1)
+        delta = self.segments[:,1,:] - self.segments[:,0,:]
+        angle = np.degrees(np.arctan2(delta[:,1], delta[:,0]))
+        # Keep labels upright
+        angle[angle > 90] -= 180
+        angle[angle < -90] += 180
+        bbox = dict(boxstyle='round', ec=(1.0, 1.0, 1.0), fc=(1.0, 1.0, 1.0))
+        for name, (x, y), a in zip(self.link_names, mid, angle):
+            ax.text(x, y, name, size=7, rotation=a, rotation_mode='anchor',
+                    horizontalalignment='center', verticalalignment='center', 
+                    bbox=bbox, clip_on=True, zorder=1)
     
-    return ax
+    def autoscale(self, ax):
+        if len(self.node_xy) > 0:
+            ax.update_datalim(self.node_xy)
+            ax.autoscale_view()
+    
+    def draw(self, ax, node_attribute=None, link_attribute=None,
+             node_size=20, node_range=[None,None], node_alpha=1, node_cmap=None, node_labels=False,
+             link_width=1, link_range=[None,None], link_alpha=1, link_cmap=None, link_labels=False,
+             add_colorbar=True, node_colorbar_label='Node', link_colorbar_label='Link', 
+             directed=False):
+        """
+        Draw the network, returns the node PathCollection and link 
+        LineCollection
+        """
+        # Define node properties
+        add_node_colorbar = add_colorbar
+        if node_attribute is not None:
+            
+            if isinstance(node_attribute, list):
+                if node_cmap is None:
+                    node_cmap = ['red', 'red']
+                add_node_colorbar = False
+            
+            if node_cmap is None:
+                node_cmap = plt.get_cmap('Spectral_r')
+            elif isinstance(node_cmap, list):
+                if len(node_cmap) == 1:
+                    node_cmap = node_cmap*2
+                node_cmap = custom_colormap(len(node_cmap), node_cmap)  
+             
+            node_pos, node_values = self._node_values(node_attribute)
+        else:
+            node_pos = None
+            node_values = None
+        
+        add_link_colorbar = add_colorbar
+        if link_attribute is not None:
+            
+            if isinstance(link_attribute, list):
+                if link_cmap is None:
+                    link_cmap = ['red', 'red']
+                add_link_colorbar = False
+    
+            if link_cmap is None:
+                link_cmap = plt.get_cmap('Spectral_r')
+            elif isinstance(link_cmap, list):
+                if len(link_cmap) == 1:
+                    link_cmap = link_cmap*2
+                link_cmap = custom_colormap(len(link_cmap), link_cmap)  
+                
+            link_pos, link_values = self._link_values(link_attribute)
+        else:
+            link_pos = None
+            link_values = None
+        
+        self.draw_links(ax, color='grey', link_width=0.5)
+        
+        nodes = self.draw_nodes(ax, node_pos, node_values, node_size, node_range, 
+                                node_alpha, node_cmap)
+        edges = self.draw_links(ax, link_pos, link_values, link_width, link_range, 
+                                link_alpha, link_cmap, directed=directed)
+        self.autoscale(ax)
+        
+        if node_labels:
+            self.draw_node_labels(ax)
+        if link_labels:
+            self.draw_link_labels(ax)
+        if add_node_colorbar and node_values is not None and len(node_values) > 0:
+            clb = plt.colorbar(nodes, shrink=0.5, pad=0, ax=ax)
+            clb.ax.set_title(node_colorbar_label, fontsize=10)
+        if add_link_colorbar and link_values is not None and len(link_values) > 0:
+            clb = plt.colorbar(edges, shrink=0.5, pad=0.05, ax=ax)
+            clb.ax.set_title(link_colorbar_label, fontsize=10)
+            
+        ax.axis('off')
+        
+        return nodes, edges
+
+
+def _value_range(values, value_range):
+    if value_range[0] is None:
+        vmin = np.nanmin(values) if len(values) > 0 else None
+    else:
+        vmin = value_range[0]
+    if value_range[1] is None:
+        vmax = np.nanmax(values) if len(values) > 0 else None
+    else:
+        vmax = value_range[1]
+    return vmin, vmax
+
 
 def plot_interactive_network(wn, node_attribute=None, node_attribute_name = 'Value', title=None,
                node_size=8, node_range=[None,None], node_cmap='Jet', node_labels=True,
@@ -673,18 +849,24 @@ def plot_leaflet_network(wn, node_attribute=None, link_attribute=None,
 def network_animation(wn, node_attribute=None, link_attribute=None, title=None,
                node_size=20, node_range=[None,None], node_alpha=1, node_cmap=None, node_labels=False,
                link_width=1, link_range=[None,None], link_alpha=1, link_cmap=None, link_labels=False,
-               add_colorbar=True, directed=False, ax=None, repeat=True):
+               add_colorbar=True, directed=False, ax=None, repeat=True, blit=True, 
+               interval=50, filename=None, fps=20, dpi=None, decimate=None):
     """
     Create a network animation
     
+    The network is drawn once and each frame only updates node and link 
+    colors. Node and link values are read one frame at a time, which allows 
+    the animation to use results stored on disk (see 
+    :class:`~wntr.sim.results.ResultsStore`).
+    
     Parameters
     ----------
     wn : wntr WaterNetworkModel
         A WaterNetworkModel object
-    node_attribute : pd.DataFrame, optional
+    node_attribute : pd.DataFrame or StoredResultsFrame, optional
         Node attributes stored in a pandas DataFrames, where the index is 
         time and columns are the node name 
-    link_attribute : pd.DataFrame, optional
+    link_attribute : pd.DataFrame or StoredResultsFrame, optional
         Link attributes stored in a pandas DataFrames, where the index is 
         time and columns are the link name 
     title : str, optional
@@ -723,6 +905,30 @@ def network_animation(wn, node_attribute=None, link_attribute=None, title=None,
     
     repeat : bool, optional
         If True, the animation will repeat
+    
+    blit : bool, optional
+        If True, only the node and link colors and the title are redrawn 
+        for each frame
+    
+    interval : int, optional
+        Delay between frames in milliseconds
+    
+    filename : str, optional
+        Filename used to save the animation. If the file extension is an 
+        image format (png, jpg, jpeg, tif, tiff, svg, or pdf), one image is saved per 
+        frame with the frame number appended to the filename. Otherwise, the 
+        animation is saved using a matplotlib animation writer (e.g., mp4 or 
+        gif), which writes one frame at a time.
+    
+    fps : int, optional
+        Frames per second used to save the animation
+    
+    dpi : int, optional
+        Resolution used to save the animation
+    
+    decimate : int or None, optional
+        Level of detail of the network background, see 
+        :class:`~wntr.graphics.network.plot_network`
         
     Returns
     -------
@@ -731,25 +937,15 @@ def network_animation(wn, node_attribute=None, link_attribute=None, title=None,
     
     if node_attribute is not None:
         node_index = node_attribute.index
-        initial_node_values = node_attribute.iloc[0, :]
-        if node_range[0] is None:
-            node_range[0] = node_attribute.min().min()
-        if node_range[1] is None:
-            node_range[1] = node_attribute.max().max()
+        node_range = _attribute_range(node_attribute, node_range)
     else:
         node_index = None
-        initial_node_values = None
         
     if link_attribute is not None:
         link_index = link_attribute.index
-        initial_link_values = link_attribute.iloc[0, :]
-        if link_range[0] is None:
-            link_range[0] = link_attribute.min().min()
-        if link_range[1] is None:
-            link_range[1] = link_attribute.max().max()
+        link_range = _attribute_range(link_attribute, link_range)
     else:
         link_index = None
-        initial_link_values = None
     
     if (node_index is not None) & (link_index is not None):
         if len(node_index.symmetric_difference(link_index)) > 0:
@@ -767,43 +963,84 @@ def network_animation(wn, node_attribute=None, link_attribute=None, title=None,
     if ax is None: # create a new figure
         fig = plt.figure(facecolor='w', edgecolor='k')
         ax = plt.gca()
-            
-    if title is not None:
-        title_name = title + ', ', str(index[0])
     else:
-        title_name = '0'
+        fig = ax.figure
     
-    ax = plot_network(wn, node_attribute=initial_node_values, link_attribute=initial_link_values, title=title_name,
-               node_size=node_size, node_range=node_range, node_alpha=node_alpha, node_cmap=node_cmap, node_labels=node_labels,
-               link_width=link_width, link_range=link_range, link_alpha=link_alpha, link_cmap=link_cmap, link_labels=link_labels,
-               add_colorbar=add_colorbar, directed=directed, ax=ax, show_plot=False)
-        
-    def update(n):
-        if node_attribute is not None:
-            node_values = node_attribute.iloc[n, :]
-        else:
-            node_values = None
-        
-        if link_attribute is not None:
-            link_values = link_attribute.iloc[n, :]
-        else:
-            link_values = None
-            
+    def frame_values(attribute, n):
+        if attribute is None:
+            return None
+        return attribute.iloc[n, :]
+    
+    def frame_title(n):
         if title is not None:
-            title_name = title + ', ' + str(index[n])
+            return title + ', ' + str(index[n])
         else:
-            title_name = str(n)
+            return str(n)
+    
+    # Draw the network once, using values from the first frame
+    network = _NetworkRenderer(wn, decimate)
+    nodes, edges = network.draw(ax, frame_values(node_attribute, 0), frame_values(link_attribute, 0), 
+            node_size, node_range, node_alpha, node_cmap, node_labels, 
+            link_width, link_range, link_alpha, link_cmap, link_labels, 
+            add_colorbar, 'Node', 'Link', directed)
+    arrows = network.arrows
+    # The title is drawn inside the axes so it is included in blitting
+    title_text = ax.text(0.5, 1.0, frame_title(0), transform=ax.transAxes, 
+                         horizontalalignment='center', verticalalignment='top')
+    
+    def update(n):
+        artists = [title_text]
+        title_text.set_text(frame_title(n))
         
-        fig.clf()  
-        ax = plt.gca()
+        if node_attribute is not None:
+            nodes.set_array(np.asarray(frame_values(node_attribute, n), dtype=float))
+            artists.append(nodes)
         
-        ax = plot_network(wn, node_attribute=node_values, link_attribute=link_values, title=title_name,
-               node_size=node_size, node_range=node_range, node_alpha=node_alpha, node_cmap=node_cmap, node_labels=node_labels,
-               link_width=link_width, link_range=link_range, link_alpha=link_alpha, link_cmap=link_cmap, link_labels=link_labels,
-               add_colorbar=add_colorbar, directed=directed, ax=ax, show_plot=False)
+        if link_attribute is not None:
+            link_values = np.asarray(frame_values(link_attribute, n), dtype=float)
+            edges.set_array(link_values)
+            artists.append(edges)
+            if arrows is not None:
+                arrows.set_array(link_values)
+                artists.append(arrows)
         
-        return ax
+        return artists
+    
+    anim = animation.FuncAnimation(fig, update, interval=interval, frames=len(index), 
+                                   blit=blit, repeat=repeat)
+    
+    if filename is not None:
+        root, ext = os.path.splitext(filename)
+        if ext.lower() in ['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.svg', '.pdf']:
+            for n in range(len(index)):
+                update(n)
+                fig.savefig('{0}_{1:06d}{2}'.format(root, n, ext), dpi=dpi)
+        else:
+            anim.save(filename, fps=fps, dpi=dpi)
+    
+    return anim
+
+
+def _attribute_range(attribute, value_range, block_size=96):
+    """
+    Return the [min, max] range of a node or link attribute over all times, 
+    values are read in blocks of time to bound memory
+    """
+    value_range = list(value_range)
+    if (value_range[0] is not None) and (value_range[1] is not None):
+        return value_range
+    
+    vmin = np.inf
+    vmax = -np.inf
+    for start in range(0, attribute.shape[0], block_size):
+        block = np.asarray(attribute.iloc[start:start+block_size, :], dtype=float)
+        if block.size > 0:
+            vmin = min(vmin, np.nanmin(block))
+            vmax = max(vmax, np.nanmax(block))
     
-    anim = animation.FuncAnimation(fig, update, interval=50, frames=len(index), blit=False, repeat=repeat)
+    if value_range[0] is None:
+        value_range[0] = vmin
+    if value_range[1] is None:
+        value_range[1] = vmax
     
-    return anim
\ No newline at end of file
+    return value_range
@@ -10,7 +10,7 @@ from wntr.metrics.hydraulic import expected_demand, average_expected_demand, \
     water_service_availability, todini_index, modified_resilience_index, \
     tank_capacity, entropy
 from wntr.metrics.water_security import mass_contaminant_consumed, \
-    volume_contaminant_consumed, extent_contaminant
+    volume_contaminant_consumed, extent_contaminant, ContaminantImpactCalculator
 from wntr.metrics.economic import annual_network_cost, annual_ghg_emissions, \
-    pump_power, pump_energy, pump_cost
+    pump_power, pump_energy, pump_cost, PumpEnergyCalculator
 from wntr.metrics.misc import query, population, population_impacted
@@ -1,11 +1,10 @@
 """
 The wntr.metrics.economic module contains economic metrics.
 """
-from wntr.network import Tank, Pipe, Pump, Valve
+from wntr.network import Tank, Pipe, Valve
 import numpy as np 
 import pandas as pd 
 import logging
-import scipy
 
 logger = logging.getLogger(__name__)
 
@@ -248,14 +247,229 @@ def annual_ghg_emissions(wn, pipe_ghg=None):
        
     return network_ghg    
 
+def _pattern_values(pattern, times):
+    """
+    Evaluate a pattern at an array of times, equivalent to calling 
+    ``pattern.at(time)`` for each time.
+    """
+    times = np.asarray(times, dtype=float)
+    multipliers = np.asarray(pattern.multipliers, dtype=float)
+    nmult = len(multipliers)
+    if nmult == 0:
+        return np.ones(times.shape)
+    if nmult == 1:
+        return np.full(times.shape, multipliers[0])
+    time_options = pattern.time_options
+    if time_options is None:
+        raise RuntimeError('Pattern->time_options cannot be None at runtime')
+    pattern_timestep = time_options.pattern_timestep
+    step = np.floor_divide(times, pattern_timestep).astype(int)
+    if pattern.wrap:
+        ndx = step % nmult
+        values = multipliers[ndx]
+        if time_options.pattern_interpolation:
+            next_values = multipliers[(ndx + 1) % nmult]
+            fraction = (times - step*pattern_timestep)/pattern_timestep
+            values = values + (next_values - values)*fraction
+        return values
+    values = np.zeros(times.shape)
+    mask = (step >= 0) & (step < nmult)
+    values[mask] = multipliers[step[mask]]
+    return values
+
+class PumpEnergyCalculator(object):
+    """
+    Pump energy and cost calculator.
+    
+    Pump efficiency curves, energy prices and price patterns are resolved 
+    once when the calculator is created.  Power, energy, and cost can then 
+    be evaluated on arrays of pump flowrate and node head, including a 
+    batch of candidate schedules stacked along leading dimensions.  The 
+    functions :class:`~wntr.metrics.economic.pump_power`, 
+    :class:`~wntr.metrics.economic.pump_energy`, and 
+    :class:`~wntr.metrics.economic.pump_cost` use this calculator.
+    
+    Array inputs are ordered by ``pump_names`` (flowrate, energy) and 
+    ``node_names`` (head), with time as the second to last dimension.
+    
+    Parameters
+    ----------
+    wn : wntr WaterNetworkModel
+        Water network model.  The water network model is needed to 
+        define pump efficiency, energy prices and price patterns.
+    """
+    def __init__(self, wn):
+        energy_options = wn.options.energy
+        
+        self.pump_names = wn.pump_name_list
+        self.node_names = wn.node_name_list
+        self.report_timestep = wn.options.time.report_timestep
+        
+        node_index = dict(zip(self.node_names, range(len(self.node_names))))
+        self._start_index = np.array([node_index[wn.get_link(name).start_node_name] 
+                                      for name in self.pump_names], dtype=int)
+        self._end_index = np.array([node_index[wn.get_link(name).end_node_name] 
+                                    for name in self.pump_names], dtype=int)
+        
+        # Efficiency, as a fraction.  Pumps without an efficiency curve 
+        # use the global efficiency
+        if energy_options.global_efficiency is None:
+            global_efficiency = np.nan
+        else:
+            global_efficiency = energy_options.global_efficiency/100.0
+        self._efficiency = np.full(len(self.pump_names), global_efficiency)
+        self._efficiency_curves = []
+        for i, name in enumerate(self.pump_names):
+            curve = wn.get_link(name).efficiency
+            if curve is None:
+                continue
+            if isinstance(curve, str):
+                curve = wn.get_curve(curve)
+            points = np.array(curve.points, dtype=float)
+            self._efficiency_curves.append((i, points[:,0], points[:,1]/100.0))
+        
+        # Energy price and price pattern
+        self._demand_charge = energy_options.demand_charge
+        self._price = np.zeros(len(self.pump_names))
+        self._price_patterns = []
+        for i, name in enumerate(self.pump_names):
+            pump = wn.get_link(name)
+            if pump.energy_price is None:
+                self._price[i] = energy_options.global_price
+            else:
+                self._price[i] = pump.energy_price
+            pattern = pump.energy_pattern
+            if pattern is None:
+                pattern = energy_options.global_pattern
+            if pattern is not None:
+                if isinstance(pattern, str):
+                    pattern = wn.get_pattern(pattern)
+                self._price_patterns.append((i, pattern))
+    
+    def headloss(self, head):
+        """
+        Compute pump head gain (end node head minus start node head).
+        
+        Parameters
+        ----------
+        head : numpy array
+            Node head (..., times, nodes), ordered by ``node_names``.
+        
+        Returns
+        -------
+        numpy array of pump head gain in m (..., times, pumps)
+        """
+        head = np.asarray(head, dtype=float)
+        return head[..., self._end_index] - head[..., self._start_index]
+    
+    def efficiency(self, flowrate):
+        """
+        Compute pump efficiency.
+        
+        Pumps with an efficiency curve are interpolated at the pump flowrate,
+        other pumps use the global efficiency.
+        
+        Parameters
+        ----------
+        flowrate : numpy array
+            Pump flowrate (..., times, pumps), ordered by ``pump_names``.
+            
+        Returns
+        -------
+        numpy array of pump efficiency as a fraction (..., times, pumps)
+        """
+        flowrate = np.asarray(flowrate, dtype=float)
+        efficiency = np.broadcast_to(self._efficiency, flowrate.shape).copy()
+        for i, x, y in self._efficiency_curves:
+            efficiency[..., i] = np.interp(flowrate[..., i], x, y)
+        return efficiency
+    
+    def power(self, flowrate, head):
+        """
+        Compute pump power.
+        
+        Parameters
+        ----------
+        flowrate : numpy array
+            Pump flowrate (..., times, pumps), ordered by ``pump_names``.
+        head : numpy array
+            Node head (..., times, nodes), ordered by ``node_names``.
+            
+        Returns
+        -------
+        numpy array of pump power in W (..., times, pumps)
+        """
+        flowrate = np.asarray(flowrate, dtype=float)
+        return 1000.0 * 9.81 * self.headloss(head) * flowrate / self.efficiency(flowrate) # Watts = J/s
+    
+    def energy(self, flowrate, head, timestep=None):
+        """
+        Compute pump energy.
+        
+        Parameters
+        ----------
+        flowrate : numpy array
+            Pump flowrate (..., times, pumps), ordered by ``pump_names``.
+        head : numpy array
+            Node head (..., times, nodes), ordered by ``node_names``.
+        timestep : int or float (optional)
+            Timestep in seconds, if None then the report timestep is used.
+            
+        Returns
+        -------
+        numpy array of pump energy in J (..., times, pumps)
+        """
+        if timestep is None:
+            timestep = self.report_timestep
+        return self.power(flowrate, head) * timestep # J = Ws
+    
+    def price(self, times):
+        """
+        Compute the energy price of each pump over time.
+        
+        Parameters
+        ----------
+        times : array-like
+            Times in seconds.
+            
+        Returns
+        -------
+        numpy array of energy price in $/J (times, pumps)
+        """
+        times = np.asarray(times, dtype=float)
+        price = np.tile(self._price, (len(times), 1))
+        for i, pattern in self._price_patterns:
+            price[:, i] = price[:, i] * _pattern_values(pattern, times)
+        return price
+    
+    def cost(self, energy, times):
+        """
+        Compute pump cost.
+        
+        Parameters
+        ----------
+        energy : numpy array
+            Pump energy in J (..., times, pumps), ordered by ``pump_names``.
+        times : array-like
+            Times in seconds.
+            
+        Returns
+        -------
+        numpy array of pump cost in $ (..., times, pumps)
+        """
+        if self._demand_charge is not None and self._demand_charge != 0:
+            # Additional energy charge per maximum kilowatt usage
+            raise ValueError('WNTR does not support demand charge yet.')
+        return np.asarray(energy, dtype=float) * self.price(times)
+
 def pump_power(flowrate, head, wn):
     """
     Compute pump power.
     
     The computation uses pump flow rate, node head (used to compute headloss at
     each pump), and pump efficiency. Pump efficiency is defined in
-    ``wn.options.energy.global_efficiency``. Pump efficiency curves are currently 
-    not supported.
+    ``wn.options.energy.global_efficiency`` or by a pump efficiency curve 
+    (``pump.efficiency``), which is interpolated at the pump flow rate.
 
         wn.options.energy.global_efficiency = 75 # This means 75% or 0.75
 
@@ -277,36 +491,16 @@ def pump_power(flowrate, head, wn):
     -------
     A DataFrame that contains pump power in W (index = times, columns = pump names).
     """
+    calc = PumpEnergyCalculator(wn)
+    Q = flowrate.loc[:, calc.pump_names].to_numpy(dtype=float)
+    # Only the pump start and end node heads are needed
+    pump_nodes = np.unique(np.concatenate([calc._start_index, calc._end_index]))
+    H = np.zeros((len(flowrate.index), len(calc.node_names)))
+    H[:, pump_nodes] = head.loc[flowrate.index, [calc.node_names[i] for i in pump_nodes]].to_numpy(dtype=float)
     
-    pumps = wn.pump_name_list
-    time = flowrate.index
+    power = calc.power(Q, H) # Watts = J/s
     
-    headloss = pd.DataFrame(data=None, index=time, columns=pumps)
-    for pump_name, pump in wn.pumps():
-        start_node = pump.start_node_name
-        end_node = pump.end_node_name
-        start_head = head.loc[:,start_node]
-        end_head = head.loc[:,end_node]
-        headloss.loc[:,pump_name] = end_head - start_head
-
-    efficiency_dict = {}
-    for pump_name, pump in wn.pumps():
-        if pump.efficiency is None:
-            efficiency_dict[pump_name] = [wn.options.energy.global_efficiency/100.0 for i in time]
-        else:
-            raise NotImplementedError('WNTR does not support pump efficiency curves yet.')
-            # TODO: WNTR does not support pump efficiency curves yet
-            # curve = wn.get_curve(pump.efficiency)
-            # x = [point[0] for point in curve.points]
-            # y = [point[1]/100.0 for point in curve.points]
-            # interp = scipy.interpolate.interp1d(x, y, kind='linear')
-            # efficiency_dict[pump_name] = interp(np.array(flowrate.loc[:, pump_name]))
-
-    efficiency = pd.DataFrame(data=efficiency_dict, index=time, columns=pumps)
-
-    power = 1000.0 * 9.81 * headloss * flowrate / efficiency # Watts = J/s
-
-    return power
+    return pd.DataFrame(power, index=flowrate.index, columns=calc.pump_names)
 
 def pump_energy(flowrate, head, wn):
     """
@@ -314,8 +508,8 @@ def pump_energy(flowrate, head, wn):
     
     The computation uses pump flow rate, node head (used to compute headloss at
     each pump), and pump efficiency. Pump efficiency is defined in
-    ``wn.options.energy.global_efficiency``. Pump efficiency curves are currently 
-    not supported.
+    ``wn.options.energy.global_efficiency`` or by a pump efficiency curve 
+    (``pump.efficiency``), which is interpolated at the pump flow rate.
 
         wn.options.energy.global_efficiency = 75 # This means 75% or 0.75
 
@@ -347,8 +541,10 @@ def pump_cost(energy, wn):
     """
     Compute the pump cost over time. 
     
-    Energy cost is defined in ``wn.options.energy.global_price``. Pump energy 
-    price and price patterns are currently not supported. 
+    Energy cost is defined in ``wn.options.energy.global_price`` or by the 
+    pump energy price (``pump.energy_price``).  The price is multiplied by 
+    the pump price pattern (``pump.energy_pattern``) or the global price 
+    pattern (``wn.options.energy.global_pattern``), if defined.
 
         wn.options.energy.global_price = 3.61e-8  # $/J; equal to $0.13/kW-h
         
@@ -367,32 +563,9 @@ def pump_cost(energy, wn):
     A DataFrame that contains pump cost in $ (index = times, columns = pump names).
     
     """
-    time = energy.index
-    pumps = wn.pump_name_list
-    
-    # TODO: Need to get this unit tested and not just functionally tested
-    if wn.options.energy.demand_charge is not None and wn.options.energy.demand_charge != 0:
-        # Additional energy charge per maximum kilowatt usage
-        raise ValueError('WNTR does not support demand charge yet.')
-        
-    price_dict = {}
-    for pump_name, pump in wn.pumps():
-        if pump.energy_price is None and pump.energy_pattern is None:
-            if wn.options.energy.global_pattern is None:
-                price_dict[pump_name] = [wn.options.energy.global_price for i in time]
-            else:
-                raise NotImplementedError('WNTR does not support price patterns yet.')
-        elif pump.energy_pattern is None:
-            if wn.options.energy.global_pattern is None:
-                price_dict[pump_name] = [pump.energy_price for i in time]
-            else:
-                raise NotImplementedError('WNTR does not support price patterns yet.')
-        else:
-            raise NotImplementedError('WNTR does not support price patterns yet.')
-            
-    price = pd.DataFrame(data=price_dict, index=time, columns=pumps)
-    
-    pump_cost = energy * price
+    calc = PumpEnergyCalculator(wn)
+    E = energy.loc[:, calc.pump_names].to_numpy(dtype=float)
     
-    return pump_cost
+    pump_cost = calc.cost(E, energy.index)
     
+    return pd.DataFrame(pump_cost, index=energy.index, columns=calc.pump_names)
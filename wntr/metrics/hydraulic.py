@@ -90,8 +90,27 @@ def average_expected_demand(wn, category=None):
     end_time = start_time+lcm
     timestep = wn.options.time.pattern_timestep
         
-    exp_demand = expected_demand(wn, start_time, end_time-timestep, timestep, category=category)
-    ave_exp_demand = exp_demand.mean(axis=0)
+    tsteps = np.arange(start_time, end_time, timestep)
+    multiplier = wn.options.hydraulic.demand_multiplier
+    
+    # The average of each pattern over the repeating period is computed once
+    pattern_mean = {}
+    ave_exp_demand = []
+    for name, junc in wn.junctions():
+        dem = 0.0
+        for ts in junc.demand_timeseries_list:
+            if category and ts.category != category:
+                continue
+            pattern = ts.pattern
+            if not pattern:
+                dem += ts.base_value
+                continue
+            if id(pattern) not in pattern_mean:
+                pattern_mean[id(pattern)] = np.mean([pattern.at(t) for t in tsteps])
+            dem += ts.base_value*pattern_mean[id(pattern)]
+        ave_exp_demand.append(dem*multiplier)
+    
+    ave_exp_demand = pd.Series(ave_exp_demand, index=wn.junction_name_list, dtype=float)
 
     return ave_exp_demand
 
@@ -166,6 +185,37 @@ def water_service_availability(expected_demand, demand):
     
     return wsa
 
+def _stack_scenarios(data):
+    """
+    Stack scenario results, given as a dictionary of DataFrames, into a
+    single DataFrame indexed by (scenario, time).
+    """
+    if isinstance(data, dict):
+        return pd.concat(data, names=['scenario', None])
+    return data
+
+def _align_index(df, index, name):
+    """
+    Reorder the rows of df to match index, raise ValueError if df does not
+    have the same (scenario, time) labels.
+    """
+    if df.index.equals(index):
+        return df
+    if len(df.index) != len(index) or not df.index.sort_values().equals(index.sort_values()):
+        raise ValueError('{} does not have the same index as head'.format(name))
+    return df.reindex(index)
+
+def _column_indexer(df, names):
+    """
+    Return the positions of the named columns, raise KeyError if a column
+    is missing.
+    """
+    idx = df.columns.get_indexer(names)
+    if (idx < 0).any():
+        missing = [name for name, i in zip(names, idx) if i < 0]
+        raise KeyError('{} not in columns'.format(missing))
+    return idx
+
 def todini_index(head, pressure, demand, flowrate, wn, Pstar):
     """
     Compute Todini index, equations from :cite:p:`todi00`.
@@ -174,22 +224,27 @@ def todini_index(head, pressure, demand, flowrate, wn, Pstar):
     failures while still meeting demands and pressures at the nodes. The
     Todini index defines resilience at a specific time as a measure of surplus
     power at each node and measures relative energy redundancy.
+    
+    The index is computed on arrays of node head, pressure and demand and on 
+    the pump start and end node positions. Results from several scenarios can 
+    be evaluated at once by passing a dictionary of DataFrames 
+    (key = scenario name) for head, pressure, demand, and flowrate.
 
     Parameters
     ----------
-    head : pandas DataFrame
+    head : pandas DataFrame or dict of pandas DataFrames
         A pandas DataFrame containing node head 
         (index = times, columns = node names).
         
-    pressure : pandas DataFrame
+    pressure : pandas DataFrame or dict of pandas DataFrames
         A pandas DataFrame containing node pressure 
         (index = times, columns = node names).
         
-    demand : pandas DataFrame
+    demand : pandas DataFrame or dict of pandas DataFrames
         A pandas DataFrame containing node demand 
         (index = times, columns = node names).
         
-    flowrate : pandas DataFrame
+    flowrate : pandas DataFrame or dict of pandas DataFrames
         A pandas DataFrame containing pump flowrates 
         (index = times, columns = pump names).
 
@@ -202,29 +257,50 @@ def todini_index(head, pressure, demand, flowrate, wn, Pstar):
 
     Returns
     -------
-    A pandas Series that contains a time-series of Todini indexes
+    A pandas Series that contains a time-series of Todini indexes.  If 
+    dictionaries of DataFrames are used, the Series is indexed by 
+    (scenario, time).
     """
-
-    Pout = demand.loc[:,wn.junction_name_list]*head.loc[:,wn.junction_name_list]
-    elevation = head.loc[:,wn.junction_name_list]-pressure.loc[:,wn.junction_name_list]
-    Pexp = demand.loc[:,wn.junction_name_list]*(Pstar+elevation)
-
-    Pin_res = -demand.loc[:,wn.reservoir_name_list]*head.loc[:,wn.reservoir_name_list]
-
-    headloss = pd.DataFrame()
-    for name, link in wn.pumps():
-        start_node = link.start_node_name
-        end_node = link.end_node_name
-        start_head = head.loc[:,start_node] # (m)
-        end_head = head.loc[:,end_node] # (m)
-        headloss[name] = end_head - start_head # (m)
-        
-    Pin_pump = flowrate.loc[:,wn.pump_name_list]*headloss.abs()
-
-    todini = (Pout.sum(axis=1) - Pexp.sum(axis=1))/  \
-        (Pin_res.sum(axis=1) + Pin_pump.sum(axis=1) - Pexp.sum(axis=1))
+    head = _stack_scenarios(head)
+    pressure = _stack_scenarios(pressure)
+    demand = _stack_scenarios(demand)
+    flowrate = _stack_scenarios(flowrate)
+    
+    # Rows are combined by position below, align them by label first
+    pressure = _align_index(pressure, head.index, 'pressure')
+    demand = _align_index(demand, head.index, 'demand')
+    flowrate = _align_index(flowrate, head.index, 'flowrate')
+    
+    junctions = wn.junction_name_list
+    reservoirs = wn.reservoir_name_list
+    pumps = wn.pump_name_list
+    start_nodes = [wn.get_link(name).start_node_name for name in pumps]
+    end_nodes = [wn.get_link(name).end_node_name for name in pumps]
+    
+    H = head.to_numpy(dtype=float)
+    P = pressure.to_numpy(dtype=float)
+    D = demand.to_numpy(dtype=float)
+    Q = flowrate.to_numpy(dtype=float)
+    
+    junction_head = H[:, _column_indexer(head, junctions)]
+    junction_demand = D[:, _column_indexer(demand, junctions)]
+    elevation = junction_head - P[:, _column_indexer(pressure, junctions)]
+    
+    Pout = np.nansum(junction_demand*junction_head, axis=1)
+    Pexp = np.nansum(junction_demand*(Pstar+elevation), axis=1)
     
-    return todini
+    Pin_res = np.nansum(-D[:, _column_indexer(demand, reservoirs)] * 
+                        H[:, _column_indexer(head, reservoirs)], axis=1)
+    
+    headloss = H[:, _column_indexer(head, end_nodes)] - \
+               H[:, _column_indexer(head, start_nodes)] # (m)
+    Pin_pump = np.nansum(Q[:, _column_indexer(flowrate, pumps)] * 
+                         np.abs(headloss), axis=1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        todini = (Pout - Pexp)/(Pin_res + Pin_pump - Pexp)
+    
+    return pd.Series(todini, index=head.index)
 
 def modified_resilience_index(pressure, elevation, Pstar, demand=None, per_junction=True):
     """
@@ -286,10 +362,15 @@ def tank_capacity(pressure, wn):
     """
     Compute tank capacity, the ratio of water volume stored in tanks to the 
     maximum volume of water that can be stored.
+    
+    Tank volume is computed for all tanks at once, tanks that share a 
+    volume curve are interpolated together.  Results from several scenarios 
+    can be evaluated at once by passing a dictionary of DataFrames 
+    (key = scenario name).
 
     Parameters
     ----------
-    pressure : pandas DataFrame
+    pressure : pandas DataFrame or dict of pandas DataFrames
         A pandas DataFrame containing tank water level (pressure) 
         (index = times, columns = tank names).
         
@@ -300,19 +381,44 @@ def tank_capacity(pressure, wn):
     Returns
     -------
     pandas DataFrame
-        Tank capacity (index = times, columns = tank names)
+        Tank capacity (index = times, columns = tank names).  If a 
+        dictionary of DataFrames is used, the DataFrame is indexed by 
+        (scenario, time).
     """
+    pressure = _stack_scenarios(pressure)
     
     assert isinstance(pressure, pd.DataFrame), "pressure must be a pandas DataFrame"
     assert isinstance(wn, wntr.network.WaterNetworkModel), "wn must be a wntr WaterNetworkModel"
-
-    tank_capacity = pd.DataFrame(index=pressure.index, columns=pressure.columns)
     
-    for name in wn.tank_name_list:
+    tanks = wn.tank_name_list
+    tank_idx = _column_indexer(pressure, tanks)
+    level = pressure.to_numpy(dtype=float)[:, tank_idx]
+    
+    # Group tanks by volume curve, None = cylindrical tank
+    groups = {}
+    for i, name in enumerate(tanks):
         tank = wn.get_node(name)
-        max_volume = tank.get_volume(tank.max_level)
-        tank_volume = tank.get_volume(pressure[name])
-        tank_capacity[name] = tank_volume/max_volume
+        key = None if tank.vol_curve is None else tank.vol_curve.name
+        groups.setdefault(key, []).append(i)
+    
+    volume = np.empty_like(level)
+    max_volume = np.empty(len(tanks))
+    for key, cols in groups.items():
+        cols = np.array(cols, dtype=int)
+        if key is None:
+            area = np.array([np.pi / 4.0 * wn.get_node(tanks[i]).diameter**2 for i in cols])
+            max_level = np.array([wn.get_node(tanks[i]).max_level for i in cols])
+            volume[:, cols] = area * level[:, cols]
+            max_volume[cols] = area * max_level
+        else:
+            curve = np.array(wn.get_curve(key).points)
+            max_level = np.array([wn.get_node(tanks[i]).max_level for i in cols])
+            volume[:, cols] = np.interp(level[:, cols], curve[:, 0], curve[:, 1])
+            max_volume[cols] = np.interp(max_level, curve[:, 0], curve[:, 1])
+    
+    data = np.full(pressure.shape, np.nan)
+    data[:, tank_idx] = volume/max_volume
+    tank_capacity = pd.DataFrame(data, index=pressure.index, columns=pressure.columns)
     
     return tank_capacity
     
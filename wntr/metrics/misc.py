@@ -3,6 +3,8 @@ The wntr.metrics.misc module contains metrics that do not fall into the
 topographic, hydraulic, water quality, water security, or economic categories.
 """
 from wntr.metrics.hydraulic import average_expected_demand
+import numpy as np
+import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
@@ -68,16 +70,21 @@ def population_impacted(pop, arg1, operation=None, arg2=None):
     Computes population impacted using comparison operators.
     For example, this can be used to find the population impacted when 
     demand < 90% expected.
+    
+    Population impacted can be computed for many scenarios at once using 
+    a DataFrame or numpy array with one row per scenario 
+    (scenario x node).
 
     Parameters
     -----------
     pop : pd.Series (index = node names)
          A pandas Series that contains population per node
 
-    arg1 : pd.DataFrame (columns = node names) or pd.Series (index = node names)
-        Argument 1
+    arg1 : pd.DataFrame (columns = node names), pd.Series (index = node names), or numpy array
+        Argument 1.  A numpy array is ordered by the ``pop`` index along 
+        the last dimension. If operation is None, arg1 is a boolean mask.
 
-    operation : numpy.ufunc
+    operation : numpy.ufunc (optional)
         Numpy universal comparison function, options = np.greater,
         np.greater_equal, np.less, np.less_equal, np.equal, np.not_equal
 
@@ -86,9 +93,17 @@ def population_impacted(pop, arg1, operation=None, arg2=None):
         
     Returns
     --------
-    A pandas Series that contains population impacted per node
+    A pandas Series, pandas DataFrame or numpy array (same type as arg1) 
+    that contains population impacted per node
     """
-    mask = query(arg1, operation, arg2)
-    pop_impacted = mask.multiply(pop)
+    if operation is None:
+        mask = arg1
+    else:
+        mask = query(arg1, operation, arg2)
+    
+    if isinstance(mask, (pd.DataFrame, pd.Series)):
+        pop_impacted = mask.multiply(pop)
+    else:
+        pop_impacted = np.asarray(mask, dtype=bool) * np.asarray(pop)
 
     return pop_impacted
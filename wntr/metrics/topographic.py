@@ -1,14 +1,22 @@
 """
 The wntr.metrics.topographic module contains topographic metrics that are not
 available directly with NetworkX.  Functions in this module operate on a 
-NetworkX MultiDiGraph, which can be created by calling ``G = wn.to_graph()``
+NetworkX MultiDiGraph, which can be created by calling ``G = wn.to_graph()``.
+Central point dominance, spectral gap, algebraic connectivity, and critical 
+ratio of defragmentation also accept a sparse graph, which can be created by 
+calling ``G = wn.to_sparse_graph()``, or a SciPy sparse adjacency matrix.
 """
 import networkx as nx
 import numpy as np
 import pandas as pd
+import scipy.sparse
+import scipy.sparse.linalg
+import scipy.sparse.csgraph
 import logging
 import warnings
 
+from wntr.network.io import SparseGraph
+
 logger = logging.getLogger(__name__)
 
 def terminal_nodes(G):
@@ -53,24 +61,121 @@ def bridges(G):
         
     return bridge_links
 
-def central_point_dominance(G):
+def _undirected_adjacency(G):
+    """
+    Undirected adjacency matrix, parallel links are summed (similar to 
+    ``nx.to_scipy_sparse_array(G.to_undirected())``)
+    """
+    if isinstance(G, SparseGraph):
+        return G.adjacency_matrix(multigraph=True)
+    if scipy.sparse.issparse(G):
+        return scipy.sparse.csr_matrix(G, dtype=float)
+    uG = G.to_undirected(as_view=True)
+    return scipy.sparse.csr_matrix(nx.to_scipy_sparse_array(uG, weight='weight', dtype=float))
+
+def _betweenness_centrality(A, sources, batch_size=64):
+    """
+    Betweenness centrality (not normalized) of an undirected, unweighted 
+    graph, accumulated over the given source nodes (Brandes, 2001).
+    
+    Shortest path distances are computed for a batch of sources at once. 
+    Path counts and dependencies are then accumulated level by level over 
+    the shortest path DAG edges of all sources in the batch.
+    """
+    n = A.shape[0]
+    # Simple graph, parallel links and self loops are removed
+    A = scipy.sparse.coo_matrix(A)
+    not_loop = A.row != A.col
+    A = scipy.sparse.csr_matrix((np.ones(not_loop.sum()), (A.row[not_loop], A.col[not_loop])), 
+                                shape=(n, n))
+    A.data[:] = 1
+    u, v = A.nonzero()
+    
+    betweenness = np.zeros(n)
+    for start in range(0, len(sources), batch_size):
+        batch = np.asarray(sources[start:start+batch_size], dtype=int)
+        b = len(batch)
+        dist = scipy.sparse.csgraph.shortest_path(A, directed=False, 
+                                                  unweighted=True, indices=batch)
+        # Shortest path DAG edges (u -> v) for each source
+        du = dist[:, u]
+        dv = dist[:, v]
+        s_ndx, e_ndx = np.nonzero(dv == du + 1)
+        level = dv[s_ndx, e_ndx].astype(int)
+        order = np.argsort(level, kind='stable')
+        level = level[order]
+        fu = s_ndx[order]*n + u[e_ndx[order]]
+        fv = s_ndx[order]*n + v[e_ndx[order]]
+        bounds = np.searchsorted(level, np.arange(1, level[-1] + 2)) if len(level) > 0 else [0]
+        
+        # Number of shortest paths
+        sigma = np.zeros(b*n)
+        sigma[np.arange(b)*n + batch] = 1
+        for i in range(len(bounds)-1):
+            lu = fu[bounds[i]:bounds[i+1]]
+            lv = fv[bounds[i]:bounds[i+1]]
+            np.add.at(sigma, lv, sigma[lu])
+        
+        # Dependencies
+        delta = np.zeros(b*n)
+        for i in range(len(bounds)-2, -1, -1):
+            lu = fu[bounds[i]:bounds[i+1]]
+            lv = fv[bounds[i]:bounds[i+1]]
+            np.add.at(delta, lu, sigma[lu]/sigma[lv]*(1 + delta[lv]))
+        
+        delta[np.arange(b)*n + batch] = 0
+        betweenness += delta.reshape(b, n).sum(axis=0)
+    
+    return betweenness
+
+def central_point_dominance(G, k=None, seed=None, batch_size=64):
     """
     Central point dominance
     
+    Betweenness centrality is computed on a sparse adjacency matrix using
+    shortest path distances from batches of source nodes.  For large 
+    networks, betweenness centrality can be estimated using a sample 
+    of k source nodes.
+    
     Parameters
     ----------
-    G: networkx MultiDiGraph
+    G: networkx MultiDiGraph, SparseGraph, or scipy sparse matrix
         Graph
+    
+    k: int (optional)
+        Number of source nodes sampled to estimate betweenness centrality.
+        If None, all nodes are used.
+    
+    seed: int (optional)
+        Random seed used to sample source nodes
+    
+    batch_size: int (optional)
+        Number of source nodes evaluated at once
         
     Returns
     -------
     Central point dominance (float)
     
     """
-    uG = G.to_undirected() # uses an undirected graph
-    bet_cen = nx.betweenness_centrality(nx.Graph(uG)) # not implemented for multigraph 
-    bet_cen = list(bet_cen.values())
-    cpd = sum(max(bet_cen) - np.array(bet_cen))/(len(bet_cen)-1)
+    A = _undirected_adjacency(G)
+    n = A.shape[0]
+    if k is None or k >= n:
+        sources = np.arange(n)
+    else:
+        rng = np.random.default_rng(seed)
+        sources = np.sort(rng.choice(n, size=k, replace=False))
+    
+    bet_cen = _betweenness_centrality(A, sources, batch_size)
+    
+    # Normalize, consistent with networkx.betweenness_centrality
+    if n > 2:
+        if len(sources) == n:
+            bet_cen = bet_cen/((n-1)*(n-2))
+        else:
+            scale = np.full(n, 1/(len(sources)*(n-2)))
+            scale[sources] = 1/((len(sources)-1)*(n-2)) if len(sources) > 1 else np.nan
+            bet_cen = bet_cen*scale
+    cpd = np.sum(np.max(bet_cen) - bet_cen)/(n-1)
 
     return cpd
 
@@ -78,11 +183,14 @@ def spectral_gap(G):
     """
     Spectral gap
     
-    Difference in the first and second eigenvalue of the adjacency matrix
+    Difference in the first and second eigenvalue of the adjacency matrix.
+    The two largest eigenvalues are computed using a sparse Lanczos solver 
+    in shift-invert mode, shifted just above the largest absolute row sum 
+    (an upper bound on the largest eigenvalue).
     
     Parameters
     ----------
-    G: networkx MultiDiGraph
+    G: networkx MultiDiGraph, SparseGraph, or scipy sparse matrix
         Graph
         
     Returns
@@ -90,21 +198,30 @@ def spectral_gap(G):
     Spectral gap (float)
     
     """
-    uG = G.to_undirected() # uses an undirected graph
-    eig = nx.adjacency_spectrum(uG)
+    A = _undirected_adjacency(G)
+    if A.shape[0] < 3:
+        eig = np.linalg.eigvalsh(A.toarray())
+    else:
+        sigma = np.abs(A).sum(axis=1).max()
+        sigma = sigma + 1e-6*(1 + sigma)
+        eig = scipy.sparse.linalg.eigsh(scipy.sparse.csc_matrix(A), k=2, sigma=sigma, 
+                                        which='LM', return_eigenvectors=False)
+    eig = np.sort(eig)[::-1]
     spectral_gap = abs(eig[0] - eig[1])
 
-    return spectral_gap.real
+    return spectral_gap
 
 def algebraic_connectivity(G):
     """
     Algebraic connectivity
     
-    Second smallest eigenvalue of the normalized Laplacian matrix of a network
+    Second smallest eigenvalue of the Laplacian matrix of a network.
+    The two smallest eigenvalues are computed using a sparse Lanczos solver 
+    in shift-invert mode, shifted just below zero.
 
     Parameters
     ----------
-    G: networkx MultiDiGraph
+    G: networkx MultiDiGraph, SparseGraph, or scipy sparse matrix
         Graph
         
     Returns
@@ -112,8 +229,13 @@ def algebraic_connectivity(G):
     Algebraic connectivity (float)
     
     """
-    uG = G.to_undirected() # uses an undirected graph
-    eig = nx.laplacian_spectrum(uG)
+    A = _undirected_adjacency(G)
+    L = scipy.sparse.diags(np.asarray(A.sum(axis=1)).flatten()) - A
+    if L.shape[0] < 3:
+        eig = np.linalg.eigvalsh(L.toarray())
+    else:
+        eig = scipy.sparse.linalg.eigsh(scipy.sparse.csc_matrix(L), k=2, sigma=-1e-6, 
+                                        which='LM', return_eigenvectors=False)
     eig = np.sort(eig)
     alg_con = eig[1]
 
@@ -125,7 +247,7 @@ def critical_ratio_defrag(G):
 
     Parameters
     ----------
-    G: networkx MultiDiGraph
+    G: networkx MultiDiGraph, SparseGraph, or scipy sparse matrix
         Graph
         
     Returns
@@ -133,9 +255,13 @@ def critical_ratio_defrag(G):
     Critical ratio of defragmentation (float)
     
     """
-    node_degree = dict(G.degree())
-    tmp = np.mean(pow(np.array(list(node_degree.values())),2))
-    fc = 1-(1/((tmp/np.mean(list(node_degree.values())))-1))
+    if isinstance(G, nx.Graph):
+        node_degree = np.fromiter((d for n, d in G.degree()), dtype=float)
+    else:
+        A = _undirected_adjacency(G)
+        node_degree = np.asarray(A.sum(axis=1)).flatten() + A.diagonal()
+    tmp = np.mean(pow(node_degree,2))
+    fc = 1-(1/((tmp/np.mean(node_degree))-1))
 
     return fc
 
@@ -90,33 +90,188 @@ def extent_contaminant(quality, flowrate, wn, detection_limit=0):
     A pandas Series with extent of contamination (m)
     """
     pipe_names = wn.pipe_name_list
-    link_length = []
-    link_start_node = []
-    link_end_node = []
-    for name in pipe_names:
-        link = wn.get_link(name)
-        link_start_node.append(link.start_node_name)
-        link_end_node.append(link.end_node_name)
-        link_length.append(link.length)
-    link_start_node = pd.Series(index=pipe_names, data=link_start_node)
-    link_end_node = pd.Series(index=pipe_names, data=link_end_node)
-    link_length = pd.Series(index=pipe_names, data=link_length)
-    
-    # flow_dir, pos_flow, neg_flow, link_contam are indexed by pipe names (col) 
-    # and times (rows)
-    flow_dir = np.sign(flowrate.loc[:,pipe_names])
-    node_contam = quality > detection_limit
-    pos_flow = np.array(node_contam.loc[:,link_start_node])
-    neg_flow = np.array(node_contam.loc[:,link_end_node])
+    link_length = np.array([wn.get_link(name).length for name in pipe_names])
+    start_idx = quality.columns.get_indexer(
+        [wn.get_link(name).start_node_name for name in pipe_names])
+    end_idx = quality.columns.get_indexer(
+        [wn.get_link(name).end_node_name for name in pipe_names])
+    if (start_idx < 0).any() or (end_idx < 0).any():
+        raise KeyError('quality must include the start and end node of each pipe')
+    
+    # flow_dir, pos_flow, neg_flow, link_contam are indexed by times (rows) 
+    # and pipes (col)
+    flow_dir = np.sign(flowrate.loc[:,pipe_names].to_numpy(dtype=float))
+    node_contam = quality.to_numpy(dtype=float) > detection_limit
+    pos_flow = node_contam[:, start_idx]
+    neg_flow = node_contam[:, end_idx]
     link_contam = ((flow_dir>0)&pos_flow) | ((flow_dir<0)&neg_flow)
     
     # contam_len is cummax over time (has the node ever been contaminated)
-    contam_len = (link_contam * link_length).cummax()
+    contam_len = np.maximum.accumulate(link_contam * link_length, axis=0)
     
     # EC is a time series with the sum across nodes
-    EC = contam_len.sum(axis=1)
+    EC = pd.Series(contam_len.sum(axis=1), index=flowrate.index)
     
     return EC
+
+class ContaminantImpactCalculator(object):
+    """
+    Contaminant impact calculator for contamination scenario ensembles.
+    
+    Junction and pipe positions, pipe start and end nodes, and pipe 
+    lengths are resolved once when the calculator is created.  Mass consumed, 
+    volume consumed, and extent of contamination :cite:p:`usepa15` are then 
+    computed for a batch of scenarios in one pass, and reported as 
+    totals over the simulation (mass and volume consumed per scenario and 
+    junction, extent of contamination per scenario).
+    
+    Array inputs are ordered by ``node_names`` (demand, quality) and 
+    ``pipe_names`` (flowrate), with time as the second to last dimension 
+    and scenarios as the first dimension.
+    
+    Parameters
+    ----------
+    wn : wntr WaterNetworkModel
+        Water network model.  The water network model is needed to 
+        get junction names, pipe length, and pipe start and end node.
+        
+    detection_limit : float
+        Contaminant detection limit.
+    """
+    def __init__(self, wn, detection_limit=0):
+        self.detection_limit = detection_limit
+        self.report_timestep = wn.options.time.report_timestep
+        
+        self.node_names = wn.node_name_list
+        self.junction_names = wn.junction_name_list
+        self.pipe_names = wn.pipe_name_list
+        
+        node_index = dict(zip(self.node_names, range(len(self.node_names))))
+        self._junction_index = np.array([node_index[name] for name in self.junction_names], dtype=int)
+        pipes = [wn.get_link(name) for name in self.pipe_names]
+        self._start_index = np.array([node_index[pipe.start_node_name] for pipe in pipes], dtype=int)
+        self._end_index = np.array([node_index[pipe.end_node_name] for pipe in pipes], dtype=int)
+        self._length = np.array([pipe.length for pipe in pipes], dtype=float)
+    
+    def _initialize(self, num_scenarios):
+        return {'mass_consumed': np.zeros((num_scenarios, len(self.junction_names))),
+                'volume_consumed': np.zeros((num_scenarios, len(self.junction_names))),
+                'contaminated_pipes': np.zeros((num_scenarios, len(self.pipe_names)), dtype=bool)}
+    
+    def _accumulate(self, state, demand, quality, flowrate, timestep):
+        # demand and quality are (scenarios, times, nodes), flowrate is
+        # (scenarios, times, pipes) or None
+        node_contam = quality > self.detection_limit
+        
+        D = demand[..., self._junction_index]
+        contam = node_contam[..., self._junction_index] & (D > 0)
+        V = np.where(contam, D*timestep, 0) # m3/s * s -> m3
+        state['volume_consumed'] += V.sum(axis=-2)
+        state['mass_consumed'] += np.where(contam, V*quality[..., self._junction_index], 0).sum(axis=-2) # kg
+        
+        if flowrate is not None:
+            link_contam = ((flowrate > 0) & node_contam[..., self._start_index]) | \
+                          ((flowrate < 0) & node_contam[..., self._end_index])
+            state['contaminated_pipes'] |= link_contam.any(axis=-2)
+    
+    def _finalize(self, state, include_extent):
+        impact = {'mass_consumed': state['mass_consumed'],
+                  'volume_consumed': state['volume_consumed']}
+        if include_extent:
+            impact['extent'] = state['contaminated_pipes'].astype(float) @ self._length
+        return impact
+    
+    def impact(self, demand, quality, flowrate=None, timestep=None):
+        """
+        Compute contaminant impact for a batch of scenarios.
+        
+        Parameters
+        ----------
+        demand : numpy array
+            Node demand (scenarios, times, nodes), ordered by ``node_names``.
+        quality : numpy array
+            Node water quality (scenarios, times, nodes), ordered by ``node_names``.
+        flowrate : numpy array (optional)
+            Pipe flowrate (scenarios, times, pipes), ordered by ``pipe_names``.
+            If None, extent of contamination is not computed.
+        timestep : int or float (optional)
+            Timestep in seconds, if None then the report timestep is used.
+            
+        Returns
+        -------
+        dict of numpy arrays
+            'mass_consumed' and 'volume_consumed' (scenarios, junctions), 
+            and 'extent' (scenarios) if flowrate is given
+        """
+        if timestep is None:
+            timestep = self.report_timestep
+        demand = np.asarray(demand, dtype=float)
+        quality = np.asarray(quality, dtype=float)
+        if flowrate is not None:
+            flowrate = np.asarray(flowrate, dtype=float)
+        
+        state = self._initialize(demand.shape[0])
+        self._accumulate(state, demand, quality, flowrate, timestep)
+        
+        return self._finalize(state, flowrate is not None)
+    
+    def impact_results(self, results, extent=True, chunk_size=None):
+        """
+        Compute contaminant impact from scenario simulation results.
+        
+        Results can be held in memory or in a 
+        :class:`~wntr.sim.results.ResultsStore`, in which case only 
+        ``chunk_size`` times are read at once.
+        
+        Parameters
+        ----------
+        results : dict of SimulationResults
+            Simulation results for each scenario (key = scenario name).  
+            Results must include node demand and quality, and link 
+            flowrate if extent is True.
+        extent : bool (optional)
+            Compute the extent of contamination, default = True.
+        chunk_size : int (optional)
+            Number of times read at once, if None then all times are read 
+            at once.
+            
+        Returns
+        -------
+        dict
+            'mass_consumed' and 'volume_consumed' pandas DataFrames 
+            (index = scenario names, columns = junction names), and 'extent'
+            pandas Series (index = scenario names) if extent is True
+        """
+        scenarios = list(results.keys())
+        state = self._initialize(len(scenarios))
+        
+        for i, name in enumerate(scenarios):
+            demand = results[name].node['demand']
+            quality = results[name].node['quality']
+            flowrate = results[name].link['flowrate'] if extent else None
+            timestep = quality.index[1] - quality.index[0] if len(quality.index) > 1 \
+                else self.report_timestep
+            num_times = demand.shape[0]
+            step = num_times if chunk_size is None else chunk_size
+            scenario_state = {key: value[i:i+1] for key, value in state.items()}
+            for start in range(0, num_times, max(step, 1)):
+                stop = min(start + step, num_times)
+                D = demand.iloc[start:stop, :].loc[:, self.node_names].to_numpy(dtype=float)
+                Q = quality.iloc[start:stop, :].loc[:, self.node_names].to_numpy(dtype=float)
+                F = None
+                if extent:
+                    F = flowrate.iloc[start:stop, :].loc[:, self.pipe_names].to_numpy(dtype=float)[np.newaxis]
+                self._accumulate(scenario_state, D[np.newaxis], Q[np.newaxis], F, timestep)
+        
+        impact = self._finalize(state, extent)
+        impact['mass_consumed'] = pd.DataFrame(impact['mass_consumed'], 
+                                               index=scenarios, columns=self.junction_names)
+        impact['volume_consumed'] = pd.DataFrame(impact['volume_consumed'], 
+                                                 index=scenarios, columns=self.junction_names)
+        if extent:
+            impact['extent'] = pd.Series(impact['extent'], index=scenarios)
+        
+        return impact
     
 #def cumulative_dose():
 #    """
@@ -4,8 +4,10 @@ network models.
 """
 import logging
 import copy
+import heapq
 import itertools
-import networkx as nx
+from collections import OrderedDict
+import numpy as np
     
 from wntr.network.elements import Pipe, Junction
 from wntr.sim.core import WNTRSimulator
@@ -82,6 +84,20 @@ def skeletonize(wn, pipe_diameter_threshold, branch_trim=True, series_pipe_merge
 
 		
 class _Skeletonize(object):
+    """
+    Skeletonization engine.
+    
+    Branch trim, series pipe merge, and parallel pipe merge operations are 
+    run on node and link indices from 
+    :meth:`~wntr.network.model.WaterNetworkModel.to_sparse_graph` and on 
+    arrays of pipe properties. Each operation selects the candidate junctions 
+    for the whole network with array operations (node degree and parallel 
+    link counts) and only visits those junctions, in model order. Junctions 
+    that become candidates because of a merge earlier in the same operation 
+    are added to the queue, so the result is the same as visiting every 
+    junction. The WaterNetworkModel is only modified once, after all cycles 
+    are complete.
+    """
     
     def __init__(self, wn, use_epanet, return_copy, pipes_to_exclude, junctions_to_exclude):
         
@@ -91,16 +107,18 @@ class _Skeletonize(object):
         else:
             self.wn = wn
         
-        # Get the WaterNetworkModel graph
-        G = self.wn.to_graph()
-        G = G.to_undirected()
-        self.G = G
+        graph = self.wn.to_sparse_graph()
+        self._node_names = graph.node_names
+        self._link_names = graph.link_names
+        num_nodes = graph.num_nodes
+        num_links = graph.num_links
+        start_node_index = graph.start_node_index
+        end_node_index = graph.end_node_index
         
-        # Create a map of original nodes to skeletonized nodes
-        skel_map = {}
-        for node_name in self.wn.node_name_list:
-            skel_map[node_name] = [node_name]
-        self.skeleton_map = skel_map
+        # Create a map of original nodes to skeletonized nodes. The lists are
+        # shared with self._map, which is indexed by node
+        self.skeleton_map = {node_name: [node_name] for node_name in self._node_names}
+        self._map = list(self.skeleton_map.values())
 
         # Get a list of junction and pipe names that are associated with controls
         # Add them to junctions and pipes to exclude
@@ -112,10 +130,10 @@ class _Skeletonize(object):
                     junc_with_controls.append(req.name)
                 elif isinstance(req, Pipe):
                     pipe_with_controls.append(req.name)
-        self.junc_to_exclude = list(set(junc_with_controls))
-        self.junc_to_exclude.extend(junctions_to_exclude)
-        self.pipe_to_exclude = list(set(pipe_with_controls))
-        self.pipe_to_exclude.extend(pipes_to_exclude)
+        self.junc_to_exclude = set(junc_with_controls)
+        self.junc_to_exclude.update(junctions_to_exclude)
+        self.pipe_to_exclude = set(pipe_with_controls)
+        self.pipe_to_exclude.update(pipes_to_exclude)
         
         # Calculate pipe headloss using a single period EPANET simulation
         duration = self.wn.options.time.duration
@@ -125,13 +143,58 @@ class _Skeletonize(object):
             sim = WNTRSimulator(self.wn)
         self.wn.options.time.duration = 0
         results = sim.run_sim()
-        head = results.node['head']
-        headloss = {}
-        for link_name, link in self.wn.links():
-            headloss[link_name] = float(abs(head.loc[0,link.start_node_name] - 
-                                            head.loc[0,link.end_node_name]))
-        self.headloss = headloss
+        head = results.node['head'].loc[0, self._node_names].values
+        headloss = np.abs(head[start_node_index] - head[end_node_index])
+        self.headloss = dict(zip(self._link_names, headloss.astype(float)))
         self.wn.options.time.duration = duration
+        
+        # Node state. Junctions that can be visited are junctions that have 
+        # not been removed and are not excluded
+        self._is_junction = graph.node_type == 'Junction'
+        self._visit = self._is_junction.copy()
+        self._visit[[graph.node_index[name] for name in self.junc_to_exclude]] = False
+        self._removed_node = np.zeros(num_nodes, dtype=bool)
+        self._num_junctions = int(self._is_junction.sum())
+        self._demands = {}
+        
+        # Link state. Merged pipes are added back to the model in the order 
+        # they were last merged
+        self._is_pipe = graph.link_type == 'Pipe'
+        self._exclude_pipe = np.zeros(num_links, dtype=bool)
+        self._exclude_pipe[[graph.link_index[name] for name in self.pipe_to_exclude]] = True
+        self._start_node = start_node_index.tolist()
+        self._end_node = end_node_index.tolist()
+        length, diameter, roughness, minor_loss, status = [], [], [], [], []
+        for link_name, link in self.wn.links():
+            is_pipe = isinstance(link, Pipe)
+            length.append(link.length if is_pipe else 0.0)
+            diameter.append(link.diameter if is_pipe else 0.0)
+            roughness.append(link.roughness if is_pipe else 0.0)
+            minor_loss.append(link.minor_loss if is_pipe else 0.0)
+            status.append(link.status)
+        self._length = np.array(length, dtype=float)
+        self._diameter = np.array(diameter, dtype=float)
+        self._roughness = np.array(roughness, dtype=float)
+        self._minor_loss = np.array(minor_loss, dtype=float)
+        self._status = status
+        self._removed = np.zeros(num_links, dtype=bool)
+        self._merged_pipes = OrderedDict()
+        
+        # Undirected adjacency, self._adj[i][j] is the list of links between 
+        # nodes i and j (shared by both nodes). Neighbors and links are 
+        # ordered as in the undirected networkx graph from wn.to_graph(), 
+        # links are swept by start node, then by the first link to each end 
+        # node, then by link order
+        first_link = {}
+        for i, key in enumerate(zip(self._start_node, self._end_node)):
+            first_link.setdefault(key, i)
+        first_link = np.array([first_link[key] for key in zip(self._start_node, self._end_node)], dtype=int)
+        sweep = np.lexsort((np.arange(num_links), first_link, start_node_index))
+        adj = [{} for i in range(num_nodes)]
+        for i in sweep.tolist():
+            self._add_edge(adj, self._start_node[i], self._end_node[i], i)
+        self._adj = adj
+        self._degree = np.array([len(neighbors) for neighbors in adj], dtype=int)
     
         self.num_branch_trim = 0
         self.num_series_merge = 0
@@ -144,7 +207,7 @@ class _Skeletonize(object):
         Run iterative branch trim, series pipe merge, and parallel pipe merge 
         operations based on a pipe diameter threshold.  
         """
-        num_junctions = self.wn.num_junctions
+        num_junctions = self._num_junctions
         iteration = 0
         flag = True
         
@@ -160,10 +223,12 @@ class _Skeletonize(object):
             
             if (max_cycles is not None) and (iteration > max_cycles):
                 flag = False
-            if num_junctions == self.wn.num_junctions:
+            if num_junctions == self._num_junctions:
                 flag = False
             else:
-                num_junctions = self.wn.num_junctions
+                num_junctions = self._num_junctions
+        
+        self._update_model()
 
         return self.wn, self.skeleton_map
     
@@ -175,48 +240,34 @@ class _Skeletonize(object):
         diameter threshold and redistributes demands (and associated demand 
         patterns) to the neighboring junction.
         """
-        for junc_name in self.wn.junction_name_list:
-            if junc_name in self.junc_to_exclude:
-                continue
-            neighbors = list(nx.neighbors(self.G,junc_name))
-            if len(neighbors) > 1:
-                continue
-            if len(neighbors) == 0:
+        candidate = self._candidate_pipes(pipe_threshold)
+        queue = np.flatnonzero(self._visit & (self._degree == 1)).tolist()
+        
+        while queue:
+            junc = heapq.heappop(queue)
+            if len(self._adj[junc]) != 1:
                 continue
-            neigh_junc_name = neighbors[0] # only one neighbor
-            nPipes = len(self.G.adj[junc_name][neigh_junc_name])
-            if nPipes > 1:
+            (neigh_junc, links), = self._adj[junc].items() # only one neighbor
+            if len(links) > 1:
                 continue
-            neigh_junc = self.wn.get_node(neigh_junc_name)
-            if not (isinstance(neigh_junc, Junction)):
+            if not self._is_junction[neigh_junc]:
                 continue
-            pipe_name = list(self.G.adj[junc_name][neigh_junc_name].keys())[0] # only one pipe
-            pipe = self.wn.get_link(pipe_name)
-            if not ((isinstance(pipe, Pipe)) and \
-                (pipe.diameter <= pipe_threshold) and \
-                pipe_name not in self.pipe_to_exclude):
+            link = links[0] # only one pipe
+            if not candidate[link]:
                 continue
             
-            logger.info('Branch trim: '+ str(junc_name) + str(neighbors))
+            logger.info('Branch trim: %s%s', self._node_names[junc], [self._node_names[neigh_junc]])
             
-            # Update skeleton map        
-            self.skeleton_map[neigh_junc_name].extend(self.skeleton_map[junc_name])
-            self.skeleton_map[junc_name] = []
+            self._merge_junction(junc, neigh_junc)
+            self._remove_link(link)
+            self._remove_node(junc)
             
-            # Move demand
-            junc = self.wn.get_node(junc_name)
-            for demand in junc.demand_timeseries_list:
-                neigh_junc.demand_timeseries_list.append(demand)
-            junc.demand_timeseries_list.clear()
-
-            # Remove node and links from wn and G
-            self.wn.remove_link(pipe_name, force=True)
-            self.wn.remove_node(junc_name, force=True)
-            self.G.remove_node(junc_name)
+            # The neighbor is visited later in this operation if it is now a 
+            # dead end
+            if neigh_junc > junc and self._visit[neigh_junc] and self._degree[neigh_junc] == 1:
+                heapq.heappush(queue, neigh_junc)
                     
             self.num_branch_trim +=1
-            
-        return self.wn, self.skeleton_map
     
 	
     def series_pipe_merge(self, pipe_threshold):
@@ -227,86 +278,58 @@ class _Skeletonize(object):
         retained, demands (and associated demand patterns) are redistributed 
         to the nearest junction.
         """
-        for junc_name in self.wn.junction_name_list:
-            if junc_name in self.junc_to_exclude:
+        candidate = self._candidate_pipes(pipe_threshold)
+        queue = np.flatnonzero(self._visit & (self._degree == 2)).tolist()
+        last = -1
+        
+        while queue:
+            junc = heapq.heappop(queue)
+            if junc == last:
                 continue
-            neighbors = list(nx.neighbors(self.G,junc_name))
-            if not (len(neighbors) == 2):
+            last = junc
+            if len(self._adj[junc]) != 2:
                 continue
-            neigh_junc_name0 = neighbors[0]
-            neigh_junc_name1 = neighbors[1]
-            neigh_junc0 = self.wn.get_node(neigh_junc_name0)
-            neigh_junc1 = self.wn.get_node(neigh_junc_name1)
-            if not ((isinstance(neigh_junc0, Junction)) or \
-               (isinstance(neigh_junc1, Junction))):
+            (neigh_junc0, links0), (neigh_junc1, links1) = self._adj[junc].items()
+            is_junc0 = self._is_junction[neigh_junc0]
+            is_junc1 = self._is_junction[neigh_junc1]
+            if not (is_junc0 or is_junc1):
                 continue
-            pipe_name0 = list(self.G.adj[junc_name][neigh_junc_name0].keys())
-            pipe_name1 = list(self.G.adj[junc_name][neigh_junc_name1].keys())
-            if (len(pipe_name0) > 1) or (len(pipe_name1) > 1):
+            if (len(links0) > 1) or (len(links1) > 1):
                 continue
-            pipe_name0 = pipe_name0[0] # only one pipe
-            pipe_name1 = pipe_name1[0] # only one pipe
-            pipe0 = self.wn.get_link(pipe_name0)
-            pipe1 = self.wn.get_link(pipe_name1)
-            if not ((isinstance(pipe0, Pipe)) and \
-                (isinstance(pipe1, Pipe)) and \
-                ((pipe0.diameter <= pipe_threshold) and \
-                (pipe1.diameter <= pipe_threshold)) and \
-                pipe_name0 not in self.pipe_to_exclude and \
-                pipe_name1 not in self.pipe_to_exclude):
+            i0 = links0[0] # only one pipe
+            i1 = links1[0] # only one pipe
+            if not (candidate[i0] and candidate[i1]):
                 continue
             # Find closest neighbor junction
-            if (isinstance(neigh_junc0, Junction)) and \
-               (isinstance(neigh_junc1, Junction)):
-                if pipe0.length < pipe1.length:
+            if is_junc0 and is_junc1:
+                if self._length[i0] < self._length[i1]:
                     closest_junc = neigh_junc0
                 else:
                     closest_junc = neigh_junc1
-            elif (isinstance(neigh_junc0, Junction)):
+            elif is_junc0:
                 closest_junc = neigh_junc0
-            elif (isinstance(neigh_junc1, Junction)):
-                closest_junc = neigh_junc1
             else:
-                continue
+                closest_junc = neigh_junc1
             
-            logger.info('Series pipe merge: ' + str(junc_name) + str(neighbors))
-                
-            # Update skeleton map    
-            self.skeleton_map[closest_junc.name].extend(self.skeleton_map[junc_name])
-            self.skeleton_map[junc_name] = []
-                
-            # Move demand
-            junc = self.wn.get_node(junc_name)
-            for demand in junc.demand_timeseries_list:
-                closest_junc.demand_timeseries_list.append(demand)
-            junc.demand_timeseries_list.clear()
-
-            # Remove node and links from wn and G
-            self.wn.remove_link(pipe_name0, force=True)
-            self.wn.remove_link(pipe_name1, force=True)
-            self.wn.remove_node(junc_name, force=True)
-            self.G.remove_node(junc_name)
+            logger.info('Series pipe merge: %s%s', self._node_names[junc], 
+                        [self._node_names[neigh_junc0], self._node_names[neigh_junc1]])
             
-            # Compute new pipe properties
-            props = self._series_merge_properties(pipe0, pipe1)
+            self._merge_junction(junc, closest_junc)
+            self._remove_node(junc)
             
-            # Add new pipe to wn and G
-            dominant_pipe = self._select_dominant_pipe(pipe0, pipe1)
-            self.wn.add_pipe(dominant_pipe.name, 
-                             start_node_name=neigh_junc_name0, 
-                             end_node_name=neigh_junc_name1, 
-                             length=props['length'], 
-                             diameter=props['diameter'], 
-                             roughness=props['roughness'], 
-                             minor_loss=props['minorloss'],
-                             initial_status=props['status']) 
-            self.G.add_edge(neigh_junc_name0, 
-                            neigh_junc_name1, 
-                            dominant_pipe.name)
+            # Replace the pipes with the dominant pipe
+            dominant = self._select_dominant_pipe(i0, i1)
+            length, diameter, roughness, minor_loss, status = self._series_merge_properties(i0, i1)
+            self._merge_pipes(i0, i1, dominant, neigh_junc0, neigh_junc1, 
+                              length, diameter, roughness, minor_loss, status)
             
-            self.num_series_merge +=1
+            # Neighbors with two remaining neighbors are visited later in 
+            # this operation
+            for neigh_junc in (neigh_junc0, neigh_junc1):
+                if neigh_junc > junc and self._visit[neigh_junc] and self._degree[neigh_junc] == 2:
+                    heapq.heappush(queue, neigh_junc)
             
-        return self.wn, self.skeleton_map
+            self.num_series_merge +=1
         
 		
     def parallel_pipe_merge(self, pipe_threshold):
@@ -316,100 +339,200 @@ class _Skeletonize(object):
         smaller than the pipe diameter threshold. The larger diameter pipe is 
         retained.
         """
+        candidate = self._candidate_pipes(pipe_threshold)
         
-        for junc_name in self.wn.junction_name_list:
-            if junc_name in self.junc_to_exclude:
-                continue
-            neighbors = nx.neighbors(self.G,junc_name)
-            for neighbor in [n for n in neighbors]:
-                parallel_pipe_names = list(self.G.adj[junc_name][neighbor].keys())
-                if len(parallel_pipe_names) == 1:
+        # Junctions connected to a neighbor by more than one link. Parallel 
+        # merges do not create new parallel links.
+        active = np.flatnonzero(~self._removed)
+        start = np.asarray(self._start_node)[active]
+        end = np.asarray(self._end_node)[active]
+        pair = np.minimum(start, end) * len(self._node_names) + np.maximum(start, end)
+        pair, inverse, count = np.unique(pair, return_inverse=True, return_counts=True)
+        parallel = count[inverse] > 1
+        visit = np.zeros(len(self._node_names), dtype=bool)
+        visit[start[parallel]] = True
+        visit[end[parallel]] = True
+        visit &= self._visit
+        
+        for junc in np.flatnonzero(visit).tolist():
+            for neighbor in list(self._adj[junc]):
+                parallel_links = list(self._adj[junc][neighbor])
+                if len(parallel_links) == 1:
                     continue
-                for (pipe_name0, pipe_name1) in itertools.combinations(parallel_pipe_names, 2):
-                    try:
-                        pipe0 = self.wn.get_link(pipe_name0)
-                        pipe1 = self.wn.get_link(pipe_name1)
-                    except:
+                for (i0, i1) in itertools.combinations(parallel_links, 2):
+                    if self._removed[i0] or self._removed[i1]:
                         continue # one of the pipes removed in previous loop
-                    if not ((isinstance(pipe0, Pipe)) and \
-                       (isinstance(pipe1, Pipe)) and \
-                        ((pipe0.diameter <= pipe_threshold) and \
-                        (pipe1.diameter <= pipe_threshold)) and \
-                        pipe_name0 not in self.pipe_to_exclude and \
-                        pipe_name1 not in self.pipe_to_exclude):
+                    if not (candidate[i0] and candidate[i1]):
                         continue
                     
-                    logger.info('Parallel pipe merge: '+ str(junc_name) + str((pipe_name0, pipe_name1)))
-
-                    # Remove links from wn and G   
-                    self.wn.remove_link(pipe_name0, force=True)
-                    self.wn.remove_link(pipe_name1, force=True)
-                    self.G.remove_edge(neighbor, junc_name, pipe_name0) 
-                    self.G.remove_edge(junc_name, neighbor, pipe_name1)
+                    logger.info('Parallel pipe merge: %s%s', self._node_names[junc], 
+                                (self._link_names[i0], self._link_names[i1]))
             
-                    # Compute new pipe properties
-                    props = self._parallel_merge_properties(pipe0, pipe1)
-
-                    # Add a new pipe to wn and G
-                    dominant_pipe = self._select_dominant_pipe(pipe0, pipe1)
-                    self.wn.add_pipe(dominant_pipe.name, 
-                                     start_node_name=dominant_pipe.start_node_name, 
-                                     end_node_name=dominant_pipe.end_node_name,
-                                     length=props['length'], 
-                                     diameter=props['diameter'], 
-                                     roughness=props['roughness'], 
-                                     minor_loss=props['minorloss'],
-                                     initial_status=props['status']) 
-                    self.G.add_edge(dominant_pipe.start_node_name, 
-                                    dominant_pipe.end_node_name, 
-                                    dominant_pipe.name)
+                    # Replace the pipes with the dominant pipe
+                    dominant = self._select_dominant_pipe(i0, i1)
+                    start_node = self._start_node[dominant]
+                    end_node = self._end_node[dominant]
+                    length, diameter, roughness, minor_loss, status = self._parallel_merge_properties(i0, i1)
+                    self._merge_pipes(i0, i1, dominant, start_node, end_node,
+                                      length, diameter, roughness, minor_loss, status)
                      
                     self.num_parallel_merge +=1
-                    
-        return self.wn, self.skeleton_map
+    
+    
+    def _candidate_pipes(self, pipe_threshold):
+        # Merged pipes keep the diameter of the dominant pipe, so candidates
+        # do not change during an operation
+        return self._is_pipe & (self._diameter <= pipe_threshold) & ~self._exclude_pipe
+    
+    
+    def _get_demands(self, junc):
+        if junc not in self._demands:
+            self._demands[junc] = list(self.wn.get_node(self._node_names[junc]).demand_timeseries_list)
+        return self._demands[junc]
+    
+    
+    def _merge_junction(self, junc, target_junc):
+        # Update skeleton map
+        self._map[target_junc].extend(self._map[junc])
+        self._map[junc].clear()
+        
+        # Move demand
+        self._get_demands(target_junc).extend(self._get_demands(junc))
+        self._demands[junc] = []
+    
+    
+    @staticmethod
+    def _add_edge(adj, node0, node1, link):
+        links = adj[node0].get(node1)
+        if links is None:
+            links = []
+            adj[node0][node1] = links
+            adj[node1][node0] = links
+        links.append(link)
+    
+    
+    def _remove_node(self, junc):
+        for neighbor in self._adj[junc]:
+            if neighbor != junc:
+                del self._adj[neighbor][junc]
+                self._degree[neighbor] -= 1
+        self._adj[junc] = {}
+        self._degree[junc] = 0
+        self._visit[junc] = False
+        self._removed_node[junc] = True
+        self._num_junctions -= 1
+    
+    
+    def _remove_link(self, link):
+        self._removed[link] = True
+        self._merged_pipes.pop(link, None)
+        node0 = self._start_node[link]
+        node1 = self._end_node[link]
+        links = self._adj[node0].get(node1)
+        if links is not None and link in links:
+            links.remove(link)
+            if len(links) == 0:
+                del self._adj[node0][node1]
+                self._degree[node0] -= 1
+                if node0 != node1:
+                    del self._adj[node1][node0]
+                    self._degree[node1] -= 1
+    
+    
+    def _merge_pipes(self, i0, i1, dominant, start_node, end_node, 
+                     length, diameter, roughness, minor_loss, status):
+        self._remove_link(i0)
+        self._remove_link(i1)
+        self._start_node[dominant] = start_node
+        self._end_node[dominant] = end_node
+        self._length[dominant] = length
+        self._diameter[dominant] = diameter
+        self._roughness[dominant] = roughness
+        self._minor_loss[dominant] = minor_loss
+        self._status[dominant] = status
+        self._removed[dominant] = False
+        self._merged_pipes[dominant] = None
+        self._add_edge(self._adj, start_node, end_node, dominant)
+        if len(self._adj[start_node][end_node]) == 1:
+            self._degree[start_node] += 1
+            if start_node != end_node:
+                self._degree[end_node] += 1
+    
+    
+    def _update_model(self):
+        """
+        Update the WaterNetworkModel with the result of the skeletonization
+        """
+        for junc, demands in self._demands.items():
+            demand_list = self.wn.get_node(self._node_names[junc]).demand_timeseries_list
+            demand_list.clear()
+            demand_list.extend(demands)
+        
+        removed_links = self._removed.copy()
+        removed_links[list(self._merged_pipes)] = True
+        for i in np.flatnonzero(removed_links):
+            self.wn.remove_link(self._link_names[i], force=True)
+        for i in np.flatnonzero(self._removed_node):
+            self.wn.remove_node(self._node_names[i], force=True)
+        
+        for i in self._merged_pipes:
+            self.wn.add_pipe(self._link_names[i], 
+                             start_node_name=self._node_names[self._start_node[i]], 
+                             end_node_name=self._node_names[self._end_node[i]], 
+                             length=float(self._length[i]), 
+                             diameter=float(self._diameter[i]), 
+                             roughness=float(self._roughness[i]), 
+                             minor_loss=float(self._minor_loss[i]),
+                             initial_status=self._status[i]) 
+        
+        self._merged_pipes.clear()
+        self._demands.clear()
     
 	
-    def _select_dominant_pipe(self, pipe0, pipe1):
+    def _select_dominant_pipe(self, i0, i1):
 	
         # Dominant pipe = larger diameter
-        if pipe0.diameter >= pipe1.diameter:
-            dominant_pipe = pipe0
+        if self._diameter[i0] >= self._diameter[i1]:
+            dominant = i0
         else:
-            dominant_pipe = pipe1
+            dominant = i1
             
-        return dominant_pipe
+        return dominant
 
 		
-    def _series_merge_properties(self, pipe0, pipe1):
+    def _series_merge_properties(self, i0, i1):
         
-        props = {}
-        dominant_pipe = self._select_dominant_pipe(pipe0, pipe1)
+        dominant = self._select_dominant_pipe(i0, i1)
+        L = self._length
+        D = self._diameter
+        C = self._roughness
             
-        props['length'] = pipe0.length + pipe1.length
-        props['diameter'] = dominant_pipe.diameter
-        props['minorloss'] = dominant_pipe.minor_loss
-        props['status'] = dominant_pipe.status
+        length = L[i0] + L[i1]
+        diameter = D[dominant]
+        minor_loss = self._minor_loss[dominant]
+        status = self._status[dominant]
         
-        props['roughness'] = (props['length']/(props['diameter']**4.87))**0.54 * \
-            ((pipe0.length/((pipe0.diameter**4.87)*(pipe0.roughness**1.85))) + \
-             (pipe1.length/((pipe1.diameter**4.87)*(pipe1.roughness**1.85))))**-0.54
+        roughness = (length/(diameter**4.87))**0.54 * \
+            ((L[i0]/((D[i0]**4.87)*(C[i0]**1.85))) + \
+             (L[i1]/((D[i1]**4.87)*(C[i1]**1.85))))**-0.54
         
-        return props
+        return length, diameter, roughness, minor_loss, status
          
 		 
-    def _parallel_merge_properties(self, pipe0, pipe1):
+    def _parallel_merge_properties(self, i0, i1):
         
-        props = {}
-        dominant_pipe = self._select_dominant_pipe(pipe0, pipe1)
+        dominant = self._select_dominant_pipe(i0, i1)
+        L = self._length
+        D = self._diameter
+        C = self._roughness
             
-        props['length'] = dominant_pipe.length
-        props['diameter'] = dominant_pipe.diameter
-        props['minorloss'] = dominant_pipe.minor_loss
-        props['status'] = dominant_pipe.status
+        length = L[dominant]
+        diameter = D[dominant]
+        minor_loss = self._minor_loss[dominant]
+        status = self._status[dominant]
         
-        props['roughness'] = ((props['length']**0.54)/(props['diameter']**2.63)) * \
-            ((pipe0.roughness*(pipe0.diameter**2.63))/(pipe0.length**0.54) + \
-             (pipe1.roughness*(pipe1.diameter**2.63))/(pipe1.length**0.54))
+        roughness = ((length**0.54)/(diameter**2.63)) * \
+            ((C[i0]*(D[i0]**2.63))/(L[i0]**0.54) + \
+             (C[i1]*(D[i1]**2.63))/(L[i1]**0.54))
         
-        return props
-
+        return length, diameter, roughness, minor_loss, status
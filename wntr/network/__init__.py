@@ -13,6 +13,7 @@ from .controls import Comparison, ControlPriority, TimeOfDayCondition, \
     OrCondition, AndCondition, ControlAction, Control, ControlChecker, \
     ControlChangeTracker, Rule
 from .io import to_dict, from_dict, to_gis, from_gis, to_graph, \
+    to_sparse_graph, SparseGraph, \
     read_inpfile, write_inpfile, \
     read_json, write_json, \
     read_geojson, write_geojson, \
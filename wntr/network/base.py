@@ -355,6 +355,7 @@ class Link(six.with_metaclass(abc.ABCMeta, object)):
         # Set and register the ending node
         self._end_node = self._node_reg[end_node_name]
         self._node_reg.add_usage(end_node_name, (link_name, self.link_type))
+        self._node_reg._add_link_adjacency(link_name, start_node_name, end_node_name)
         # Set up other metadata fields
         self._initial_status = LinkStatus.Opened
         self._initial_setting = None
@@ -441,6 +442,8 @@ class Link(six.with_metaclass(abc.ABCMeta, object)):
     def start_node(self, node):
         self._node_reg.remove_usage(self.start_node_name, (self._link_name, self.link_type))
         self._node_reg.add_usage(node.name, (self._link_name, self.link_type))
+        self._node_reg._remove_link_adjacency(self._link_name, start_node_name=self.start_node_name)
+        self._node_reg._add_link_adjacency(self._link_name, start_node_name=node.name)
         self._start_node = self._node_reg[node.name]
 
     @property
@@ -451,6 +454,8 @@ class Link(six.with_metaclass(abc.ABCMeta, object)):
     def end_node(self, node):
         self._node_reg.remove_usage(self.end_node_name, (self._link_name, self.link_type))
         self._node_reg.add_usage(node.name, (self._link_name, self.link_type))
+        self._node_reg._remove_link_adjacency(self._link_name, end_node_name=self.end_node_name)
+        self._node_reg._add_link_adjacency(self._link_name, end_node_name=node.name)
         self._end_node = self._node_reg[node.name]
 
     @property
@@ -2249,29 +2249,44 @@ class Control(Rule):
 
 
 class ControlChangeTracker(Observer):
+    """
+    Tracks the (object, attribute) pairs modified by control actions relative to one or more reference points.
+
+    The value of each tracked attribute is recorded when the first reference point is set, and is then only updated
+    when a control action notifies the tracker. Each reference point stores the reference values of the attributes
+    modified since it was set, so setting, resetting, and removing reference points does not depend on the number of
+    registered actions.
+    """
     def __init__(self):
         self._actions = dict()
-        self._previous_values: Dict[Any, Dict[Tuple[Any, str], Any]] = dict()  # {key: {(obj, attr): value}}
+        self._values: Dict[Tuple[Any, str], Any] = dict()  # {(obj, attr): last known value}
+        self._previous_values: Dict[Any, Dict[Tuple[Any, str], Any]] = dict()  # {key: {(obj, attr): value}} for (obj, attr) modified since key was set
         self._changed: Dict[Any, MutableSet[Tuple[Any, str]]] = dict()  # {key: set of (obj, attr) that has been changed from _previous_values}
 
     def clear_all_reference_points(self):
         self._previous_values = dict()
         self._changed = dict()
 
+    def _update_values(self):
+        self._values = dict()
+        for action in self._actions.keys():
+            obj, attr = action.target()
+            self._values[(obj, attr)] = getattr(obj, attr)
+
     def _set_reference_point(self, key):
+        if len(self._previous_values) == 0:
+            # attributes may have been modified outside of control actions while no reference points were set
+            self._update_values()
         self._previous_values[key] = dict()
         self._changed[key] = OrderedSet()
 
-        for action in self._actions.keys():
-            obj, attr = action.target()
-            self._previous_values[key][(obj, attr)] = getattr(obj, attr)
-
     def set_reference_point(self, key):
         if key in self._previous_values:
             raise ValueError(f'The ControlChangeTracker already has reference point {key}')
         self._set_reference_point(key)
 
     def reset_reference_point(self, key):
+        self._previous_values.pop(key, None)
         self._set_reference_point(key)
 
     def remove_reference_point(self, key):
@@ -2288,11 +2303,14 @@ class ControlChangeTracker(Observer):
         """
         obj_attr = subject.target()
         val = getattr(*obj_attr)
-        for ref_point in self._previous_values.keys():
-            if val == self._previous_values[ref_point][obj_attr]:
+        old_val = self._values[obj_attr]
+        for ref_point, previous_values in self._previous_values.items():
+            ref_val = previous_values.setdefault(obj_attr, old_val)
+            if val == ref_val:
                 self._changed[ref_point].discard(obj_attr)
             else:
                 self._changed[ref_point].add(obj_attr)
+        self._values[obj_attr] = val
 
     def register_control(self, control):
         """
@@ -2348,7 +2366,7 @@ class ControlChangeTracker(Observer):
 
                 obj_attr = action.target()
                 for ref_point in self._previous_values.keys():
-                    self._previous_values[ref_point].pop(obj_attr)
+                    self._previous_values[ref_point].pop(obj_attr, None)
                     self._changed[ref_point].discard(obj_attr)
 
 
@@ -7,7 +7,11 @@ the water network model to a file.
 """
 import logging
 import json
+from collections.abc import Mapping
 import networkx as nx
+import numpy as np
+import pandas as pd
+import scipy.sparse
 
 import wntr.epanet
 from wntr.epanet.util import FlowUnits
@@ -383,41 +387,188 @@ def to_graph(wn, node_weight=None, link_weight=None, modify_direction=False):
     --------
     networkx MultiDiGraph
     """
-    G = nx.MultiDiGraph()
-
+    if isinstance(node_weight, pd.Series):
+        node_weight = node_weight.to_dict()
+    if isinstance(link_weight, pd.Series):
+        link_weight = link_weight.to_dict()
+    if node_weight is not None and not isinstance(node_weight, Mapping):
+        raise TypeError("node_weight must be a dict or pandas Series, not " + type(node_weight).__name__)
+    if link_weight is not None and not isinstance(link_weight, Mapping):
+        raise TypeError("link_weight must be a dict or pandas Series, not " + type(link_weight).__name__)
+
+    nodes = []
     for name, node in wn.nodes():
-        G.add_node(name)
-        nx.set_node_attributes(G, name="pos", values={name: node.coordinates})
-        nx.set_node_attributes(G, name="type", values={name: node.node_type})
-
-        if node_weight is not None:
-            try:  # weight nodes
-                value = node_weight[name]
-                nx.set_node_attributes(G, name="weight", values={name: value})
-            except:
-                pass
+        attr = {"pos": node.coordinates, "type": node.node_type}
+        if node_weight is not None and name in node_weight:
+            attr["weight"] = node_weight[name]
+        nodes.append((name, attr))
 
+    edges = []
     for name, link in wn.links():
         start_node = link.start_node_name
         end_node = link.end_node_name
-        G.add_edge(start_node, end_node, key=name)
-        nx.set_edge_attributes(G, name="type", values={(start_node, end_node, name): link.link_type})
-
-        if link_weight is not None:
-            try:  # weight links
-                value = link_weight[name]
-                if modify_direction and value < 0:  # change the direction of the link and value
-                    G.remove_edge(start_node, end_node, name)
-                    G.add_edge(end_node, start_node, name)
-                    nx.set_edge_attributes(G, name="type", values={(end_node, start_node, name): link.link_type})
-                    nx.set_edge_attributes(G, name="weight", values={(end_node, start_node, name): -value})
-                else:
-                    nx.set_edge_attributes(G, name="weight", values={(start_node, end_node, name): value})
-            except:
-                pass
-    
+        attr = {"type": link.link_type}
+        if link_weight is not None and name in link_weight:
+            value = link_weight[name]
+            if modify_direction and value < 0:  # change the direction of the link and value
+                start_node, end_node = end_node, start_node
+                value = -value
+            attr["weight"] = value
+        edges.append((start_node, end_node, name, attr))
+
+    G = nx.MultiDiGraph()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+
     return G
 
+
+def to_sparse_graph(wn):
+    """
+    Convert a WaterNetworkModel into an array-based graph
+    
+    The result only depends on the network structure, so it is cached on the
+    water network model and rebuilt only after nodes or links are added, 
+    removed, or reconnected.
+    
+    Parameters
+    ----------
+    wn : WaterNetworkModel
+        Water network model
+        
+    Returns
+    --------
+    SparseGraph
+    """
+    cache = getattr(wn, "_sparse_graph_cache", None)
+    if cache is not None and cache[0] == wn._structure_version:
+        return cache[1]
+    
+    sparse_graph = SparseGraph(wn)
+    wn._sparse_graph_cache = (wn._structure_version, sparse_graph)
+    
+    return sparse_graph
+
+
+class SparseGraph(object):
+    """
+    Array-based representation of the water network graph.
+    
+    Nodes are ordered as in ``wn.node_name_list`` and links are ordered as in 
+    ``wn.link_name_list``. Each link connects the node at index
+    ``start_node_index`` to the node at index ``end_node_index``.
+    
+    Parameters
+    ----------
+    wn : WaterNetworkModel
+        Water network model
+    """
+    def __init__(self, wn):
+        self.node_names = wn.node_name_list
+        self.link_names = wn.link_name_list
+        self.node_index = {name: i for i, name in enumerate(self.node_names)}
+        self.link_index = {name: i for i, name in enumerate(self.link_names)}
+        
+        start_node_index = np.empty(len(self.link_names), dtype=np.int64)
+        end_node_index = np.empty(len(self.link_names), dtype=np.int64)
+        link_type = []
+        for i, (name, link) in enumerate(wn.links()):
+            start_node_index[i] = self.node_index[link.start_node_name]
+            end_node_index[i] = self.node_index[link.end_node_name]
+            link_type.append(link.link_type)
+        self.start_node_index = start_node_index
+        self.end_node_index = end_node_index
+        self.link_type = np.array(link_type, dtype=object)
+        self.node_type = np.array([node.node_type for name, node in wn.nodes()], dtype=object)
+        
+    @property
+    def num_nodes(self):
+        """int: Number of nodes"""
+        return len(self.node_names)
+    
+    @property
+    def num_links(self):
+        """int: Number of links"""
+        return len(self.link_names)
+    
+    def _link_weight_array(self, link_weight):
+        if link_weight is None:
+            return np.ones(self.num_links)
+        if isinstance(link_weight, (pd.Series, dict)):
+            # Links without a weight use the networkx default weight of 1
+            link_weight = pd.Series(link_weight, dtype=float).reindex(self.link_names, fill_value=1.0)
+        return np.asarray(link_weight, dtype=float)
+    
+    def adjacency_matrix(self, link_weight=None, directed=False, multigraph=False):
+        """
+        Node adjacency matrix
+        
+        Parameters
+        ----------
+        link_weight : dict, pandas Series, or array (optional)
+            Link weights, indexed by link name or ordered as ``link_names``.
+            If None, or if a link is missing from a dict or Series, the link
+            has a weight of 1.
+        directed : bool (optional)
+            If True, entry (i, j) is the weight of links from node i to node j.
+            If False, the matrix is symmetric.
+        multigraph : bool (optional)
+            If True, the weights of parallel links are summed. If False, 
+            parallel links are collapsed into a single edge with the 
+            weight of the last link (similar to ``networkx.Graph(G)``).
+            
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+        """
+        weight = self._link_weight_array(link_weight)
+        row = self.start_node_index
+        col = self.end_node_index
+        if not directed:
+            not_loop = row != col
+            row, col = np.concatenate([row, col[not_loop]]), np.concatenate([col, row[not_loop]])
+            weight = np.concatenate([weight, weight[not_loop]])
+        
+        shape = (self.num_nodes, self.num_nodes)
+        if multigraph:
+            A = scipy.sparse.coo_matrix((weight, (row, col)), shape=shape).tocsr()
+        else:
+            # Keep the last weight assigned to each (row, col) pair
+            key = row * self.num_nodes + col
+            key, last = np.unique(key[::-1], return_index=True)
+            last = len(weight) - 1 - last
+            A = scipy.sparse.csr_matrix((weight[last], (row[last], col[last])), shape=shape)
+        
+        return A
+    
+    def incidence_matrix(self, link_weight=None):
+        """
+        Node-link incidence matrix
+        
+        Entry (i, k) is -1 if node i is the start node of link k and +1 if 
+        node i is the end node of link k, multiplied by the link weight.
+        
+        Parameters
+        ----------
+        link_weight : dict, pandas Series, or array (optional)
+            Link weights, indexed by link name or ordered as ``link_names``.
+            If None, or if a link is missing from a dict or Series, the link
+            has a weight of 1.
+            
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+        """
+        weight = self._link_weight_array(link_weight)
+        link_ndx = np.arange(self.num_links)
+        row = np.concatenate([self.start_node_index, self.end_node_index])
+        col = np.concatenate([link_ndx, link_ndx])
+        data = np.concatenate([-weight, weight])
+        A = scipy.sparse.coo_matrix((data, (row, col)), shape=(self.num_nodes, self.num_links))
+        
+        return A.tocsr()
+    
+
 def write_json(wn, path_or_buf, **kw_json,):
     """
     Write the WaterNetworkModel to a JSON file
@@ -10,6 +10,7 @@ from warnings import warn
 import networkx as nx
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import six
 import wntr.epanet
 import wntr.network.io
@@ -166,6 +167,11 @@ class WaterNetworkModel(AbstractModel):
         """Return the clock-time day of the simulation"""
         return int(self._shifted_time / 86400)
 
+    @property
+    def _structure_version(self):
+        """int: Counter that changes whenever nodes or links are added, removed or reconnected"""
+        return self._node_reg._structure_version
+
     ### #
     ### Iteratable attributes
     @property
@@ -1282,7 +1288,19 @@ class WaterNetworkModel(AbstractModel):
         """
         return wntr.network.io.to_graph(self, node_weight, link_weight, 
                                         modify_direction)
-                                        
+    
+    def to_sparse_graph(self):
+        """
+        Convert a WaterNetworkModel into an array-based graph
+        
+        The result is cached and rebuilt only after nodes or links are added,
+        removed, or reconnected.
+        
+        Returns
+        --------
+        :class:`~wntr.network.io.SparseGraph`
+        """
+        return wntr.network.io.to_sparse_graph(self)
                                
     def get_graph(self, node_weight=None, link_weight=None, modify_direction=False):
         """
@@ -1372,33 +1390,68 @@ class WaterNetworkModel(AbstractModel):
         -------
         A list of link names connected to the node
         """
-        link_types = {"Pipe", "Pump", "Valve"}
-        link_data = self._node_reg.get_usage(node_name)
-        if link_data is None:
-            return []
+        flag = flag.upper()
+        if flag == "ALL":
+            link_data = self._node_reg.get_usage(node_name)
+            if link_data is None:
+                return []
+            link_types = {"Pipe", "Pump", "Valve"}
+            return [link_name for link_name, link_type in link_data if link_type in link_types]
+        elif flag == "INLET":
+            return self._node_reg.inlet_links(node_name)
+        elif flag == "OUTLET":
+            return self._node_reg.outlet_links(node_name)
         else:
-            if flag.upper() == "ALL":
-                return [
-                    link_name
-                    for link_name, link_type in link_data
-                    if link_type in link_types
-                    and node_name in {self.get_link(link_name).start_node_name, self.get_link(link_name).end_node_name}
-                ]
-            elif flag.upper() == "INLET":
-                return [
-                    link_name
-                    for link_name, link_type in link_data
-                    if link_type in link_types and node_name == self.get_link(link_name).end_node_name
-                ]
-            elif flag.upper() == "OUTLET":
-                return [
-                    link_name
-                    for link_name, link_type in link_data
-                    if link_type in link_types and node_name == self.get_link(link_name).start_node_name
-                ]
-            else:
-                logger.error("Unrecognized flag: {0}".format(flag))
-                raise ValueError("Unrecognized flag: {0}".format(flag))
+            logger.error("Unrecognized flag: {0}".format(flag))
+            raise ValueError("Unrecognized flag: {0}".format(flag))
+
+    def get_node_link_incidence(self, flag="ALL"):
+        """
+        Returns the node-link incidence matrix of the network in CSR format
+
+        Rows are ordered as in ``node_name_list`` and columns as in
+        ``link_name_list``. An entry is +1 if the node is the end node of the
+        link (inlet), -1 if the node is the start node of the link (outlet),
+        and 0 for a link that starts and ends at the same node. Within each
+        row, entries are stored in the order returned by
+        :meth:`get_links_for_node`, so ``indptr`` and ``indices`` of the
+        result can be used directly as an array-based adjacency list.
+
+        Parameters
+        ----------
+        flag : str
+            Options are 'ALL', 'INLET', 'OUTLET' (see :meth:`get_links_for_node`).
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Incidence matrix with shape (num_nodes, num_links)
+        """
+        flag = flag.upper()
+        if flag not in {"ALL", "INLET", "OUTLET"}:
+            logger.error("Unrecognized flag: {0}".format(flag))
+            raise ValueError("Unrecognized flag: {0}".format(flag))
+
+        link_ndx = {link_name: i for i, link_name in enumerate(self._link_reg.keys())}
+        inlet_links = self._node_reg._inlet_links
+        outlet_links = self._node_reg._outlet_links
+        empty = OrderedSet()
+
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        indices = []
+        data = []
+        for i, node_name in enumerate(self._node_reg.keys()):
+            inlets = inlet_links.get(node_name, empty)
+            outlets = outlet_links.get(node_name, empty)
+            for link_name in self.get_links_for_node(node_name, flag):
+                indices.append(link_ndx[link_name])
+                data.append(float(link_name in inlets) - float(link_name in outlets))
+            indptr[i + 1] = len(indices)
+
+        return scipy.sparse.csr_matrix(
+            (np.array(data, dtype=float), np.array(indices, dtype=np.int64), indptr),
+            shape=(self.num_nodes, self.num_links),
+        )
 
     def query_node_attribute(self, attribute, operation=None, value=None, node_type=None):
         """
@@ -1869,6 +1922,11 @@ class NodeRegistry(Registry):
         self._junctions = OrderedSet()
         self._reservoirs = OrderedSet()
         self._tanks = OrderedSet()
+        # Node-to-link adjacency, kept in sync by the links
+        self._inlet_links = OrderedDict()
+        self._outlet_links = OrderedDict()
+        # Incremented whenever nodes or links are added, removed or reconnected
+        self._structure_version = 0
 
     def _finalize_(self, model):
         super()._finalize_(model)
@@ -1878,6 +1936,7 @@ class NodeRegistry(Registry):
         if not isinstance(key, six.string_types):
             raise ValueError("Registry keys must be strings")
         self._data[key] = value
+        self._structure_version += 1
         if isinstance(value, Junction):
             self._junctions.add(key)
         elif isinstance(value, Tank):
@@ -1894,6 +1953,9 @@ class NodeRegistry(Registry):
             elif key in self._usage:
                 self._usage.pop(key)
             node = self._data.pop(key)
+            self._structure_version += 1
+            self._inlet_links.pop(key, None)
+            self._outlet_links.pop(key, None)
             self._junctions.discard(key)
             self._reservoirs.discard(key)
             self._tanks.discard(key)
@@ -1909,6 +1971,59 @@ class NodeRegistry(Registry):
         except KeyError:
             return
 
+    def _add_link_adjacency(self, link_name, start_node_name=None, end_node_name=None):
+        """Register a link as an outlet of its start node and an inlet of its end node"""
+        self._structure_version += 1
+        if start_node_name:
+            if start_node_name not in self._outlet_links:
+                self._outlet_links[start_node_name] = OrderedSet()
+            self._outlet_links[start_node_name].add(link_name)
+        if end_node_name:
+            if end_node_name not in self._inlet_links:
+                self._inlet_links[end_node_name] = OrderedSet()
+            self._inlet_links[end_node_name].add(link_name)
+
+    def _remove_link_adjacency(self, link_name, start_node_name=None, end_node_name=None):
+        """Remove a link from the outlets of its start node and the inlets of its end node"""
+        self._structure_version += 1
+        for node_name, adjacency in [(start_node_name, self._outlet_links), (end_node_name, self._inlet_links)]:
+            if node_name and node_name in adjacency:
+                adjacency[node_name].discard(link_name)
+                if len(adjacency[node_name]) < 1:
+                    adjacency.pop(node_name)
+
+    def inlet_links(self, node_name):
+        """
+        Names of the links that have the specified node as an end node
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node
+
+        Returns
+        -------
+        list of str
+        """
+        adjacency = self._inlet_links.get(node_name)
+        return [] if adjacency is None else list(adjacency)
+
+    def outlet_links(self, node_name):
+        """
+        Names of the links that have the specified node as a start node
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node
+
+        Returns
+        -------
+        list of str
+        """
+        adjacency = self._outlet_links.get(node_name)
+        return [] if adjacency is None else list(adjacency)
+
     def __call__(self, node_type=None):
         """
         Returns a generator to iterate over all nodes of a specific node type.
@@ -2247,6 +2362,7 @@ class LinkRegistry(Registry):
         if not isinstance(key, six.string_types):
             raise ValueError("Registry keys must be strings")
         self._data[key] = value
+        self._node_reg._structure_version += 1
         if isinstance(value, Pipe):
             self._pipes.add(key)
         elif isinstance(value, Pump):
@@ -2281,6 +2397,7 @@ class LinkRegistry(Registry):
             link = self._data.pop(key)
             self._node_reg.remove_usage(link.start_node_name, (link.name, link.link_type))
             self._node_reg.remove_usage(link.end_node_name, (link.name, link.link_type))
+            self._node_reg._remove_link_adjacency(link.name, link.start_node_name, link.end_node_name)
             if isinstance(link, GPValve):
                 self._curve_reg.remove_usage(link.headloss_curve_name, (link.name, "Valve"))
             if isinstance(link, Pump):
@@ -6,7 +6,6 @@ compute PGA, PGV, and repair rate.
 import wntr
 import numpy as np
 import pandas as pd
-from scipy.spatial import distance
 
 class Earthquake(object):
     """
@@ -36,23 +35,32 @@ class Earthquake(object):
         A pandas Series with distance to epicenter (m)
         """
 
-        R = pd.Series()
-
         if element_type in [wntr.network.Link, wntr.network.Pipe, wntr.network.Pump, wntr.network.Valve]:
             # Compute pipe center position
-            link_pos = {}
-            for name, link in wn.links(element_type):
-                start_point = link.start_node.coordinates
-                end_point = link.end_node.coordinates
-                link_pos[name] = ((end_point[0] + start_point[0])/2,
-                                  (end_point[1] + start_point[1])/2)
-
+            names = []
+            start_point = []
+            end_point = []
             for name, link in wn.links(element_type):
-                R[name] = distance.euclidean(self.epicenter, link_pos[name]) # m
+                names.append(name)
+                start_point.append(link.start_node.coordinates)
+                end_point.append(link.end_node.coordinates)
+            start_point = np.array(start_point, dtype=float).reshape(-1, 2)
+            end_point = np.array(end_point, dtype=float).reshape(-1, 2)
+            pos = (end_point + start_point)/2
 
         elif element_type in [wntr.network.Node, wntr.network.Junction, wntr.network.Tank, wntr.network.Reservoir]:
+            names = []
+            pos = []
             for name, node in wn.nodes(element_type):
-                R[name] = distance.euclidean(self.epicenter, node.coordinates) # m
+                names.append(name)
+                pos.append(node.coordinates)
+            pos = np.array(pos, dtype=float).reshape(-1, 2)
+            
+        else:
+            return pd.Series(dtype=float)
+
+        R = np.hypot(pos[:,0] - self.epicenter[0], pos[:,1] - self.epicenter[1]) # m
+        R = pd.Series(R, index=names)
 
         return R
 
@@ -63,6 +63,9 @@ class FragilityCurve(object):
         """
         Return the CDF probability for each state, based on the value of x
         
+        The CDF of each distribution is evaluated once for all elements 
+        that use that distribution.
+        
         Parameters
         -----------
         x : pandas.Series
@@ -76,15 +79,27 @@ class FragilityCurve(object):
         """
         state_names = [name for name, state in self.states()]
         
-        Pr = pd.DataFrame(index = x.index, columns=state_names)
-
-        for element in Pr.index:
-            for state_name, state in self.states():
-                try:
-                    dist=state.distribution[element]
-                except:
-                    dist=state.distribution['Default']
-                Pr.loc[element, state_name] = dist.cdf(x[element])
+        Pr = pd.DataFrame(index = x.index, columns=state_names, dtype=float)
+        x_values = np.asarray(x, dtype=float)
+        
+        for state_name, state in self.states():
+            # Group elements by distribution
+            groups = {}
+            default = []
+            for i, element in enumerate(x.index):
+                if element in state.distribution:
+                    dist = state.distribution[element]
+                    groups.setdefault(id(dist), (dist, []))[1].append(i)
+                else:
+                    default.append(i)
+            if len(default) > 0:
+                groups.setdefault(id(state.distribution['Default']), 
+                                  (state.distribution['Default'], []))[1].extend(default)
+            
+            values = np.empty(len(x_values))
+            for dist, i in groups.values():
+                values[i] = dist.cdf(x_values[i])
+            Pr[state_name] = values
             
         return Pr
     
@@ -108,12 +123,59 @@ class FragilityCurve(object):
         if seed is not None:
             np.random.seed(seed)
             
-        p = pd.Series(data = np.random.uniform(size=Pr.shape[0]), index=Pr.index)
+        p = np.random.uniform(size=Pr.shape[0])
         
-        damage_state = pd.Series(data=[None]* Pr.shape[0], index=Pr.index)
+        damage_state = np.full(Pr.shape[0], None, dtype=object)
         
         for DS_names in Pr.columns:
-            damage_state[p < Pr[DS_names]] = DS_names
+            damage_state[p < Pr[DS_names].values] = DS_names
+        
+        damage_state = pd.Series(data=damage_state, index=Pr.index)
+        
+        return damage_state
+    
+    def sample_damage_states(self, Pr, realizations, seed=None):
+        """
+        Sample the damage state for multiple realizations using uniform 
+        random variables
+        
+        Each realization uses its own random number generator, created from 
+        the seed and the realization number, so a realization returns the 
+        same damage states regardless of the total number of realizations.
+        
+        Parameters
+        -----------
+        Pr : pandas.DataFrame
+            Probability of exceeding a damage state
+        
+        realizations : int
+            Number of realizations
+            
+        seed : int or None
+            Random seed
+        
+        Returns
+        -------
+        damage_state : pandas.DataFrame
+            Damage state priority of each element (index = realization, 
+            columns = elements). No damage is given a value of 0, see 
+            :meth:`get_priority_map`.
+        """
+        priority_map = self.get_priority_map()
+        priority = np.array([priority_map[DS_names] for DS_names in Pr.columns])
+        dtype = np.result_type(priority.dtype, np.int8)
+        
+        probability = Pr.values.astype(float).T
+        damage_state = np.zeros((realizations, Pr.shape[0]), dtype=dtype)
+        
+        seeds = np.random.SeedSequence(seed).spawn(realizations)
+        for r in range(realizations):
+            p = np.random.default_rng(seeds[r]).uniform(size=Pr.shape[0])
+            for i in range(len(priority)):
+                damage_state[r, p < probability[i]] = priority[i]
+        
+        damage_state = pd.DataFrame(damage_state, index=range(realizations), 
+                                    columns=Pr.index)
         
         return damage_state
         
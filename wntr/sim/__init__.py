@@ -3,6 +3,8 @@ The wntr.sim package contains methods to run hydraulic and water quality
 simulations using the water network model.
 """
 from wntr.sim.core import WaterNetworkSimulator, WNTRSimulator
-from wntr.sim.results import SimulationResults
+from wntr.sim.results import SimulationResults, ResultsStore
 from wntr.sim.solvers import NewtonSolver
-from wntr.sim.epanet import EpanetSimulator
\ No newline at end of file
+from wntr.sim.epanet import EpanetSimulator
+from wntr.sim.quality import WaterQualitySimulator
+from wntr.sim.session import SimulationSession, WNTRSimulatorSession, EpanetSimulatorSession
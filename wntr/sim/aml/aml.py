@@ -1,6 +1,7 @@
 """WNTR AML base classes."""
 
 import sys
+import itertools
 import scipy
 from .evaluator import Evaluator
 from .expr import Var, Param, native_numeric_types, Float, ConditionalExpression
@@ -41,6 +42,107 @@ class Constraint(object):
         return self.expr.reverse_ad()
 
 
+class ConstraintFamily(object):
+    """
+    A family of constraints with the same expression.
+
+    The expression is written in terms of template leaves. Each member of the
+    family replaces the template leaves with its own variables and parameters.
+    The expression is only differentiated once for the whole family, and the
+    evaluator evaluates all members with the same rpn.
+
+    Parameters
+    ----------
+    expr: wntr.sim.aml.expr.ExpressionBase or wntr.sim.aml.expr.ConditionalExpression
+        Expression in terms of the template leaves
+    leaves: list of wntr.sim.aml.expr.Var or wntr.sim.aml.expr.Param
+        Template leaves. A member can use a variable in place of a template
+        Var and a parameter in place of any template leaf.
+    """
+    def __init__(self, expr, leaves):
+        leaves = list(leaves)
+        for leaf in leaves:
+            if type(leaf) not in {Var, Param}:
+                raise ValueError('The template leaves of a ConstraintFamily must be Vars or Params.')
+        if type(expr) == ConditionalExpression:
+            exprs = expr._conditions + expr._exprs
+        else:
+            exprs = [expr]
+        template_leaves = set(leaves)
+        for e in exprs:
+            for leaf in itertools.chain(e.get_vars(), e.get_params()):
+                if leaf not in template_leaves:
+                    raise ValueError('The expression of a ConstraintFamily can only use the template leaves.')
+        self._expr = expr
+        self._leaves = leaves
+
+    @property
+    def expr(self):
+        return self._expr
+
+    @property
+    def leaves(self):
+        return self._leaves
+
+    def member(self, leaves):
+        """
+        Create a constraint that is a member of the family
+
+        Parameters
+        ----------
+        leaves: list of wntr.sim.aml.expr.Var or wntr.sim.aml.expr.Param
+            Leaves of the member, in the same order as the template leaves
+
+        Returns
+        -------
+        Constraint
+        """
+        return Constraint(ConstraintFamilyMember(self, leaves))
+
+
+class ConstraintFamilyMember(object):
+    __slots__ = ('family', 'leaves')
+
+    def __init__(self, family, leaves):
+        """
+
+        Parameters
+        ----------
+        family: ConstraintFamily
+        leaves: list of wntr.sim.aml.expr.Var or wntr.sim.aml.expr.Param
+        """
+        if len(leaves) != len(family.leaves):
+            raise ValueError('The number of leaves must be equal to the number of template leaves of the family.')
+        for template, leaf in zip(family.leaves, leaves):
+            if type(leaf) == Var:
+                if type(template) != Var:
+                    raise ValueError('A ConstraintFamily member can only use a Var in place of a template Var.')
+            elif type(leaf) != Param:
+                raise ValueError('The leaves of a ConstraintFamily member must be Vars or Params.')
+        self.family = family
+        self.leaves = list(leaves)
+
+    def _set_template_values(self):
+        for template, leaf in zip(self.family.leaves, self.leaves):
+            template.value = leaf.value
+
+    def evaluate(self):
+        self._set_template_values()
+        return self.family.expr.evaluate()
+
+    def reverse_ad(self):
+        self._set_template_values()
+        template_ders = self.family.expr.reverse_ad()
+        ders = OrderedDict()
+        for template, leaf in zip(self.family.leaves, self.leaves):
+            if template in template_ders:
+                ders[leaf] = ders.get(leaf, 0) + template_ders[template]
+        return ders
+
+    def __str__(self):
+        return str(self.family.expr) + ' with ' + str([str(leaf) for leaf in self.leaves])
+
+
 class Model(object):
     """
     A class for creating algebraic models.
@@ -55,6 +157,7 @@ class Model(object):
         self._vars_referenced_by_con = OrderedDict()
         self._params_referenced_by_con = OrderedDict()
         self._floats_referenced_by_con = OrderedDict()
+        self._family_cfamily_map = OrderedDict()
 
     def __setattr__(self, name, val):
         """
@@ -242,10 +345,82 @@ class Model(object):
         self._params_referenced_by_con[con] = referenced_params
         self._floats_referenced_by_con[con] = referenced_floats
 
+    def _register_constraint_family(self, family):
+        cfamily = self._evaluator.add_constraint_family(len(family.leaves))
+        self._family_cfamily_map[family] = cfamily
+        leaf_ndx_map = OrderedDict()
+        for leaf in family.leaves:
+            leaf_ndx_map[leaf] = len(leaf_ndx_map)
+        template_vars = [leaf for leaf in family.leaves if type(leaf) == Var]
+        if type(family.expr) == ConditionalExpression:
+            conditions = family.expr._conditions
+            exprs = family.expr._exprs
+        else:
+            conditions = [None]
+            exprs = [family.expr]
+
+        referenced_floats = OrderedSet()
+        for expr in conditions + exprs:
+            if expr is not None:
+                referenced_floats.update(expr.get_floats())
+        derivs = list()
+        for expr in exprs:
+            _deriv = expr.reverse_sd()
+            derivs.append(_deriv)
+            for v in template_vars:
+                if v not in _deriv:
+                    _deriv[v] = Float(0)
+                elif type(_deriv[v]) in native_numeric_types:
+                    _deriv[v] = Float(_deriv[v])
+                referenced_floats.update(_deriv[v].get_floats())
+
+        for f in referenced_floats:
+            leaf_ndx_map[f] = len(leaf_ndx_map)
+            cfloat = self._increment_float(f)
+            cfamily.add_leaf(cfloat)
+
+        for i in range(len(exprs)):
+            if conditions[i] is not None:
+                for term in conditions[i].get_rpn(leaf_ndx_map):
+                    cfamily.add_condition_rpn_term(term)
+            for term in exprs[i].get_rpn(leaf_ndx_map):
+                cfamily.add_fn_rpn_term(term)
+            for v in template_vars:
+                for term in derivs[i][v].get_rpn(leaf_ndx_map):
+                    cfamily.add_jac_rpn_term(leaf_ndx_map[v], term)
+            cfamily.end_condition()
+
+        return cfamily
+
+    def _register_constraint_family_member(self, con):
+        family = con.expr.family
+        cfamily = self._family_cfamily_map.get(family, None)
+        if cfamily is None:
+            cfamily = self._register_constraint_family(family)
+        cmember = self._evaluator.add_constraint_family_member(cfamily)
+        con._c_obj = cmember
+        self._con_ccon_map[con] = cmember
+        # A leaf can be used more than once by a member, so the references are lists
+        referenced_vars = list()
+        referenced_params = list()
+        for leaf in con.expr.leaves:
+            if type(leaf) == Var:
+                cmember.add_leaf(self._increment_var(leaf))
+                referenced_vars.append(leaf)
+            else:
+                cmember.add_leaf(self._increment_param(leaf))
+                referenced_params.append(leaf)
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._params_referenced_by_con[con] = referenced_params
+        self._floats_referenced_by_con[con] = list()
+
     def _register_constraint(self, con):
         if type(con.expr) == ConditionalExpression:
             self._register_conditional_constraint(con)
             return None
+        if type(con.expr) == ConstraintFamilyMember:
+            self._register_constraint_family_member(con)
+            return None
         ccon = self._evaluator.add_constraint()
         con._c_obj = ccon
         self._con_ccon_map[con] = ccon
@@ -312,7 +487,11 @@ class Model(object):
         if type(con.expr) == ConditionalExpression:
             self._remove_conditional_constraint(con)
             return None
-        self._evaluator.remove_constraint(self._con_ccon_map[con])
+        if type(con.expr) == ConstraintFamilyMember:
+            cfamily = self._family_cfamily_map[con.expr.family]
+            self._evaluator.remove_constraint_family_member(cfamily, self._con_ccon_map[con])
+        else:
+            self._evaluator.remove_constraint(self._con_ccon_map[con])
         del self._con_ccon_map[con]
         for v in self._vars_referenced_by_con[con]:
             self._decrement_var(v)
@@ -60,6 +60,70 @@ void IfElseConstraint::add_jac_rpn_term(Var* v, int term)
 }
 
 
+void ConstraintFamilyMember::add_leaf(Leaf* leaf)
+{
+  leaves.push_back(leaf);
+}
+
+
+ConstraintFamily::~ConstraintFamily()
+{
+  std::set<ConstraintFamilyMember*>::iterator member_iter;
+  for (member_iter = members.begin(); member_iter != members.end(); ++member_iter)
+    {
+      delete (*member_iter);
+    }
+}
+
+
+void ConstraintFamily::add_leaf(Leaf* leaf)
+{
+  leaves.push_back(leaf);
+}
+
+
+void ConstraintFamily::end_condition()
+{
+  condition_rpn.push_back(current_condition_rpn);
+  fn_rpn.push_back(current_fn_rpn);
+
+  // The derivative with respect to each member leaf (empty if the leaf cannot be a variable)
+  std::vector<std::vector<int> > _jac_rpn(num_member_leaves);
+  std::map<int, std::vector<int> >::iterator jac_rpn_iter;
+  for (jac_rpn_iter=current_jac_rpn.begin(); jac_rpn_iter!=current_jac_rpn.end(); ++jac_rpn_iter)
+    {
+      if (jac_rpn_iter->first < 0 || jac_rpn_iter->first >= num_member_leaves)
+	{
+	  throw StructureException("The jac_rpn of a ConstraintFamily must refer to a member leaf.");
+	}
+      _jac_rpn[jac_rpn_iter->first] = jac_rpn_iter->second;
+    }
+  jac_rpn.push_back(_jac_rpn);
+
+  current_condition_rpn.clear();
+  current_fn_rpn.clear();
+  current_jac_rpn.clear();
+}
+
+
+void ConstraintFamily::add_condition_rpn_term(int term)
+{
+  current_condition_rpn.push_back(term);
+}
+
+
+void ConstraintFamily::add_fn_rpn_term(int term)
+{
+  current_fn_rpn.push_back(term);
+}
+
+
+void ConstraintFamily::add_jac_rpn_term(int member_leaf, int term)
+{
+  current_jac_rpn[member_leaf].push_back(term);
+}
+
+
 double _evaluate(double* stack, std::vector<int>* rpn, std::vector<Leaf*>* values)
 {
   double arg1;
@@ -230,6 +294,24 @@ double _evaluate(double* stack, std::vector<int>* rpn, std::vector<Leaf*>* value
 }
 
 
+int _find_condition(double* stack, ConstraintFamily* family, std::vector<Leaf*>* values)
+{
+  int _n_conditions = family->condition_rpn.size();
+  for (int i=0; i<_n_conditions; ++i)
+    {
+      if (family->condition_rpn[i].size() == 0)
+	{
+	  return i;
+	}
+      if (_evaluate(stack, &(family->condition_rpn[i]), values) == 1)
+	{
+	  return i;
+	}
+    }
+  throw StructureException("None of the conditions of a ConstraintFamily are satisfied.");
+}
+
+
 Evaluator::~Evaluator()
 {
   if (is_structure_set)
@@ -249,6 +331,12 @@ Evaluator::~Evaluator()
       delete (*if_else_con_iter);
     }
 
+  std::set<ConstraintFamily*>::iterator family_iter;
+  for (family_iter = family_set.begin(); family_iter != family_set.end(); ++family_iter)
+    {
+      delete (*family_iter);
+    }
+
   std::set<Var*>::iterator var_iter;
   for (var_iter = var_set.begin(); var_iter != var_set.end(); ++var_iter)
     {
@@ -329,6 +417,30 @@ IfElseConstraint* Evaluator::add_if_else_constraint()
 }
 
 
+ConstraintFamily* Evaluator::add_constraint_family(int num_member_leaves)
+{
+  if (is_structure_set)
+    {
+      remove_structure();
+    }
+  ConstraintFamily* family = new ConstraintFamily(num_member_leaves);
+  family_set.insert(family);
+  return family;
+}
+
+
+ConstraintFamilyMember* Evaluator::add_constraint_family_member(ConstraintFamily* family)
+{
+  if (is_structure_set)
+    {
+      remove_structure();
+    }
+  ConstraintFamilyMember* member = new ConstraintFamilyMember();
+  family->members.insert(member);
+  return member;
+}
+
+
 void Evaluator::remove_var(Var* v)
 {
   if (is_structure_set)
@@ -384,6 +496,17 @@ void Evaluator::remove_if_else_constraint(IfElseConstraint* c)
 }
 
 
+void Evaluator::remove_constraint_family_member(ConstraintFamily* family, ConstraintFamilyMember* member)
+{
+  if (is_structure_set)
+    {
+      remove_structure();
+    }
+  family->members.erase(member);
+  delete member;
+}
+
+
 void Evaluator::set_structure()
 {
   if (is_structure_set)
@@ -404,6 +527,9 @@ void Evaluator::set_structure()
   if_else_fn_rpn.clear();
   if_else_jac_rpn.clear();
 
+  family_row.clear();
+  family_jac_leaves.clear();
+
   int max_rpn_size = 0;
 
   //******************************************
@@ -482,6 +608,72 @@ void Evaluator::set_structure()
 	}
       ++ndx;
     }
+
+  //******************************************
+  // ConstraintFamilies
+  //******************************************
+  // The rpn of each family is shared by all members. Each member only
+  // stores its own leaves, which are followed by the leaves of the family.
+  num_family_members = 0;
+  std::set<ConstraintFamily*>::iterator family_iter;
+  for (family_iter = family_set.begin(); family_iter != family_set.end(); ++family_iter)
+    {
+      ConstraintFamily* family = *family_iter;
+      int _n_conditions = family->condition_rpn.size();
+      for (int i=0; i<_n_conditions; ++i)
+	{
+	  if (family->condition_rpn[i].size() > max_rpn_size)
+	    max_rpn_size = family->condition_rpn[i].size();
+	  if (family->fn_rpn[i].size() > max_rpn_size)
+	    max_rpn_size = family->fn_rpn[i].size();
+	  for (int j=0; j<family->num_member_leaves; ++j)
+	    {
+	      if (family->jac_rpn[i][j].size() > max_rpn_size)
+		max_rpn_size = family->jac_rpn[i][j].size();
+	    }
+	}
+
+      std::set<ConstraintFamilyMember*>::iterator member_iter;
+      for (member_iter = family->members.begin(); member_iter != family->members.end(); ++member_iter)
+	{
+	  ConstraintFamilyMember* member = *member_iter;
+	  if (((int) member->leaves.size()) != family->num_member_leaves)
+	    {
+	      throw StructureException("The number of leaves of a ConstraintFamilyMember must be equal to num_member_leaves of the ConstraintFamily.");
+	    }
+	  member->index = ndx;
+	  std::vector<Leaf*> _leaves(member->leaves);
+	  _leaves.insert(_leaves.end(), family->leaves.begin(), family->leaves.end());
+	  leaves.push_back(_leaves);
+	  family_row.push_back(family);
+
+	  // Member leaves that refer to the same variable share a column of the jacobian
+	  std::map<Var*, std::vector<int> > var_leaves;
+	  for (int j=0; j<family->num_member_leaves; ++j)
+	    {
+	      Var* v = dynamic_cast<Var*>(member->leaves[j]);
+	      if (v == NULL)
+		continue;
+	      for (int i=0; i<_n_conditions; ++i)
+		{
+		  if (family->jac_rpn[i][j].size() == 0)
+		    {
+		      throw StructureException("A ConstraintFamilyMember has a variable where the ConstraintFamily does not have a derivative.");
+		    }
+		}
+	      var_leaves[v].push_back(j);
+	    }
+	  row_nnz.push_back(row_nnz[ndx] + var_leaves.size());
+	  std::map<Var*, std::vector<int> >::iterator var_leaves_iter;
+	  for (var_leaves_iter = var_leaves.begin(); var_leaves_iter != var_leaves.end(); ++var_leaves_iter)
+	    {
+	      col_ndx.push_back(var_leaves_iter->first->index);
+	      family_jac_leaves.push_back(var_leaves_iter->second);
+	    }
+	  ++num_family_members;
+	  ++ndx;
+	}
+    }
   
   nnz = row_nnz.back();
   stack = new double[max_rpn_size];
@@ -548,6 +740,16 @@ void Evaluator::evaluate(double* array_out, int array_length_out)
       ++c;
       ++con_ndx;
     }
+
+  int family_ndx = 0;
+  while (family_ndx < num_family_members)
+    {
+      ConstraintFamily* family = family_row[family_ndx];
+      i = _find_condition(stack, family, &(leaves[con_ndx]));
+      array_out[con_ndx] = _evaluate(stack, &(family->fn_rpn[i]), &(leaves[con_ndx]));
+      ++family_ndx;
+      ++con_ndx;
+    }
 }
 
 
@@ -623,6 +825,32 @@ void Evaluator::evaluate_csr_jacobian(double* values_array_out, int values_array
       ++con_ndx;
       ++c;
     }
+
+  int family_ndx = 0;
+  int family_nnz_ndx = 0;
+  double value;
+  while (family_ndx < num_family_members)
+    {
+      ConstraintFamily* family = family_row[family_ndx];
+      row_nnz_array_out[con_ndx+1] = row_nnz[con_ndx+1];
+      nnz = row_nnz[con_ndx+1] - row_nnz[con_ndx];
+      i = _find_condition(stack, family, &(leaves[con_ndx]));
+      for (int j=0; j<nnz; ++j)
+	{
+	  value = 0.0;
+	  std::vector<int>* jac_leaves = &(family_jac_leaves[family_nnz_ndx]);
+	  for (int k=0; k<((int) jac_leaves->size()); ++k)
+	    {
+	      value += _evaluate(stack, &(family->jac_rpn[i][(*jac_leaves)[k]]), &(leaves[con_ndx]));
+	    }
+	  values_array_out[nnz_ndx] = value;
+	  col_ndx_array_out[nnz_ndx] = col_ndx[nnz_ndx];
+	  ++nnz_ndx;
+	  ++family_nnz_ndx;
+	}
+      ++family_ndx;
+      ++con_ndx;
+    }
 }
 
 
@@ -125,6 +125,47 @@ public:
 };
 
 
+class ConstraintFamilyMember
+{
+public:
+  ConstraintFamilyMember(){}
+  ~ConstraintFamilyMember(){}
+
+  void add_leaf(Leaf* leaf);
+
+  std::vector<Leaf*> leaves;
+
+  int index;
+};
+
+
+class ConstraintFamily
+{
+public:
+  ConstraintFamily(int n_member_leaves): num_member_leaves(n_member_leaves) {}
+  ~ConstraintFamily();
+
+  void add_leaf(Leaf* leaf);
+  void end_condition();
+  void add_condition_rpn_term(int term);
+  void add_fn_rpn_term(int term);
+  void add_jac_rpn_term(int member_leaf, int term);
+
+  int num_member_leaves;
+
+  std::vector<int> current_condition_rpn;
+  std::vector<int> current_fn_rpn;
+  std::map<int, std::vector<int> > current_jac_rpn;
+
+  std::vector<std::vector<int> > condition_rpn;
+  std::vector<std::vector<int> > fn_rpn;
+  std::vector<std::vector<std::vector<int> > > jac_rpn;
+
+  std::vector<Leaf*> leaves;
+  std::set<ConstraintFamilyMember*> members;
+};
+
+
 class Evaluator
 {
 public:
@@ -139,12 +180,15 @@ public:
   Float* add_float(double value);
   Constraint* add_constraint();
   IfElseConstraint* add_if_else_constraint();
+  ConstraintFamily* add_constraint_family(int num_member_leaves);
+  ConstraintFamilyMember* add_constraint_family_member(ConstraintFamily* family);
 
   void remove_var(Var* v);
   void remove_param(Param* p);
   void remove_float(Float* f);
   void remove_constraint(Constraint* c);
   void remove_if_else_constraint(IfElseConstraint* c);
+  void remove_constraint_family_member(ConstraintFamily* family, ConstraintFamilyMember* member);
 
   void set_structure();
   void remove_structure();
@@ -163,6 +207,7 @@ private:
   std::set<Float*> float_set;
   std::set<Constraint*> con_set;
   std::set<IfElseConstraint*> if_else_con_set;
+  std::set<ConstraintFamily*> family_set;
 
   std::vector<Var*> var_vector;
   std::vector<std::vector<Leaf*> > leaves;
@@ -176,7 +221,12 @@ private:
   std::vector<std::vector<int> > if_else_condition_rpn;
   std::vector<std::vector<int> > if_else_fn_rpn;
   std::vector<std::vector<int> > if_else_jac_rpn;
+
+  int num_family_members;
+  std::vector<ConstraintFamily*> family_row;
+  std::vector<std::vector<int> > family_jac_leaves;
 };
 
 
 double _evaluate(double* stack, std::vector<int>* rpn, std::vector<Leaf*>* values);
+int _find_condition(double* stack, ConstraintFamily* family, std::vector<Leaf*>* values);
@@ -71,3 +71,5 @@ class _SwigNonDynamicMeta(type):
 
 
 
+
+
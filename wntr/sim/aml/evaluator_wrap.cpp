@@ -3447,25 +3447,30 @@ SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyO
 /* -------- TYPES TABLE (BEGIN) -------- */
 
 #define SWIGTYPE_p_Constraint swig_types[0]
-#define SWIGTYPE_p_Evaluator swig_types[1]
-#define SWIGTYPE_p_Float swig_types[2]
-#define SWIGTYPE_p_IfElseConstraint swig_types[3]
-#define SWIGTYPE_p_Leaf swig_types[4]
-#define SWIGTYPE_p_Param swig_types[5]
-#define SWIGTYPE_p_StructureException swig_types[6]
-#define SWIGTYPE_p_SwigPyObject swig_types[7]
-#define SWIGTYPE_p_Var swig_types[8]
-#define SWIGTYPE_p_char swig_types[9]
-#define SWIGTYPE_p_double swig_types[10]
-#define SWIGTYPE_p_int swig_types[11]
-#define SWIGTYPE_p_std__mapT_Var_p_std__vectorT_int_t_t swig_types[12]
-#define SWIGTYPE_p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t swig_types[13]
-#define SWIGTYPE_p_std__string swig_types[14]
-#define SWIGTYPE_p_std__vectorT_Leaf_p_t swig_types[15]
-#define SWIGTYPE_p_std__vectorT_int_t swig_types[16]
-#define SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t swig_types[17]
-static swig_type_info *swig_types[19];
-static swig_module_info swig_module = {swig_types, 18, 0, 0, 0, 0};
+#define SWIGTYPE_p_ConstraintFamily swig_types[1]
+#define SWIGTYPE_p_ConstraintFamilyMember swig_types[2]
+#define SWIGTYPE_p_Evaluator swig_types[3]
+#define SWIGTYPE_p_Float swig_types[4]
+#define SWIGTYPE_p_IfElseConstraint swig_types[5]
+#define SWIGTYPE_p_Leaf swig_types[6]
+#define SWIGTYPE_p_Param swig_types[7]
+#define SWIGTYPE_p_StructureException swig_types[8]
+#define SWIGTYPE_p_SwigPyObject swig_types[9]
+#define SWIGTYPE_p_Var swig_types[10]
+#define SWIGTYPE_p_char swig_types[11]
+#define SWIGTYPE_p_double swig_types[12]
+#define SWIGTYPE_p_int swig_types[13]
+#define SWIGTYPE_p_std__mapT_Var_p_std__vectorT_int_t_t swig_types[14]
+#define SWIGTYPE_p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t swig_types[15]
+#define SWIGTYPE_p_std__mapT_int_std__vectorT_int_t_t swig_types[16]
+#define SWIGTYPE_p_std__setT_ConstraintFamilyMember_p_t swig_types[17]
+#define SWIGTYPE_p_std__string swig_types[18]
+#define SWIGTYPE_p_std__vectorT_Leaf_p_t swig_types[19]
+#define SWIGTYPE_p_std__vectorT_int_t swig_types[20]
+#define SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t swig_types[21]
+#define SWIGTYPE_p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t swig_types[22]
+static swig_type_info *swig_types[24];
+static swig_module_info swig_module = {swig_types, 23, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -6560,16 +6565,16 @@ fail:
 
 SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_IfElseConstraint) /* defines _wrap_delete_IfElseConstraint_destructor_closure */
 
-SWIGINTERN int _wrap_new_Evaluator(PyObject *self, PyObject *args, PyObject *kwargs) {
+SWIGINTERN int _wrap_new_ConstraintFamilyMember(PyObject *self, PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0;
-  Evaluator *result = 0 ;
+  ConstraintFamilyMember *result = 0 ;
   
-  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Evaluator")) SWIG_fail;
-  if (!SWIG_Python_UnpackTuple(args, "new_Evaluator", 0, 0, 0)) SWIG_fail;
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_ConstraintFamilyMember")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_ConstraintFamilyMember", 0, 0, 0)) SWIG_fail;
   {
     try
     {
-      result = (Evaluator *)new Evaluator();
+      result = (ConstraintFamilyMember *)new ConstraintFamilyMember();
     }
     catch (StructureException &e)
     {
@@ -6582,26 +6587,26 @@ SWIGINTERN int _wrap_new_Evaluator(PyObject *self, PyObject *args, PyObject *kwa
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Evaluator, SWIG_BUILTIN_INIT |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ConstraintFamilyMember, SWIG_BUILTIN_INIT |  0 );
   return resultobj == Py_None ? -1 : 0;
 fail:
   return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_Evaluator(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_ConstraintFamilyMember(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "delete_Evaluator", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_ConstraintFamilyMember", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Evaluator" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_ConstraintFamilyMember" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
   {
     try
     {
@@ -6625,62 +6630,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_nnz_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamilyMember_add_leaf(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  int arg2 ;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
+  Leaf *arg2 = (Leaf *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_nnz_set" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamilyMember_add_leaf" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_nnz_set" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
-  if (arg1) (arg1)->nnz = arg2;
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Evaluator_nnz_get(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  int result;
-  
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_nnz_get", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_nnz_get" "', argument " "1"" of type '" "Evaluator *""'"); 
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Leaf, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamilyMember_add_leaf" "', argument " "2"" of type '" "Leaf *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  result = (int) ((arg1)->nnz);
-  resultobj = SWIG_From_int(static_cast< int >(result));
+  arg2 = reinterpret_cast< Leaf * >(argp2);
+  {
+    try
+    {
+      (arg1)->add_leaf(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_stack_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamilyMember_leaves_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double *arg2 = (double *) 0 ;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
+  std::vector< Leaf * > *arg2 = (std::vector< Leaf * > *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
@@ -6689,17 +6687,17 @@ SWIGINTERN PyObject *_wrap_Evaluator_stack_set(PyObject *self, PyObject *args) {
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_stack_set" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamilyMember_leaves_set" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_stack_set" "', argument " "2"" of type '" "double *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamilyMember_leaves_set" "', argument " "2"" of type '" "std::vector< Leaf * > *""'"); 
   }
-  arg2 = reinterpret_cast< double * >(argp2);
-  if (arg1) (arg1)->stack = arg2;
+  arg2 = reinterpret_cast< std::vector< Leaf * > * >(argp2);
+  if (arg1) (arg1)->leaves = *arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6707,55 +6705,101 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_stack_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamilyMember_leaves_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  double *result = 0 ;
+  std::vector< Leaf * > *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_stack_get", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamilyMember_leaves_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_stack_get" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamilyMember_leaves_get" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  result = (double *) ((arg1)->stack);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
+  result = (std::vector< Leaf * > *)& ((arg1)->leaves);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_add_var(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamilyMember_index_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double arg2 ;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
+  int val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  Var *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_var" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamilyMember_index_set" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_var" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstraintFamilyMember_index_set" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = static_cast< double >(val2);
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->index = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamilyMember_index_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamilyMember *arg1 = (ConstraintFamilyMember *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamilyMember_index_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamilyMember_index_get" "', argument " "1"" of type '" "ConstraintFamilyMember *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamilyMember * >(argp1);
+  result = (int) ((arg1)->index);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_ConstraintFamilyMember) /* defines _wrap_delete_ConstraintFamilyMember_destructor_closure */
+
+SWIGINTERN int _wrap_new_ConstraintFamily(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  ConstraintFamily *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_ConstraintFamily")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_ConstraintFamily", 1, 1, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_ConstraintFamily" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = static_cast< int >(val1);
   {
     try
     {
-      result = (Var *)(arg1)->add_var(arg2);
+      result = (ConstraintFamily *)new ConstraintFamily(arg1);
     }
     catch (StructureException &e)
     {
@@ -6768,40 +6812,30 @@ SWIGINTERN PyObject *_wrap_Evaluator_add_var(PyObject *self, PyObject *args) {
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Var, 0 |  0 );
-  return resultobj;
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ConstraintFamily, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
 fail:
-  return NULL;
+  return -1;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_add_param(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_ConstraintFamily(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double arg2 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  Param *result = 0 ;
+  PyObject *swig_obj[1] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "delete_ConstraintFamily", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_param" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_ConstraintFamily" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_param" "', argument " "2"" of type '" "double""'");
-  } 
-  arg2 = static_cast< double >(val2);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
     try
     {
-      result = (Param *)(arg1)->add_param(arg2);
+      delete arg1;
     }
     catch (StructureException &e)
     {
@@ -6814,40 +6848,39 @@ SWIGINTERN PyObject *_wrap_Evaluator_add_param(PyObject *self, PyObject *args) {
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Param, 0 |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_add_float(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_add_leaf(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double arg2 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  Leaf *arg2 = (Leaf *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
-  Float *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_float" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_add_leaf" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_float" "', argument " "2"" of type '" "double""'");
-  } 
-  arg2 = static_cast< double >(val2);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Leaf, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_add_leaf" "', argument " "2"" of type '" "Leaf *""'"); 
+  }
+  arg2 = reinterpret_cast< Leaf * >(argp2);
   {
     try
     {
-      result = (Float *)(arg1)->add_float(arg2);
+      (arg1)->add_leaf(arg2);
     }
     catch (StructureException &e)
     {
@@ -6860,31 +6893,30 @@ SWIGINTERN PyObject *_wrap_Evaluator_add_float(PyObject *self, PyObject *args) {
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Float, 0 |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_add_constraint(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_end_condition(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  Constraint *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_add_constraint", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_end_condition", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_end_condition" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
     try
     {
-      result = (Constraint *)(arg1)->add_constraint();
+      (arg1)->end_condition();
     }
     catch (StructureException &e)
     {
@@ -6897,31 +6929,39 @@ SWIGINTERN PyObject *_wrap_Evaluator_add_constraint(PyObject *self, PyObject *ar
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Constraint, 0 |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_add_if_else_constraint(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_add_condition_rpn_term(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  IfElseConstraint *result = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_add_if_else_constraint", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_if_else_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_add_condition_rpn_term" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstraintFamily_add_condition_rpn_term" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   {
     try
     {
-      result = (IfElseConstraint *)(arg1)->add_if_else_constraint();
+      (arg1)->add_condition_rpn_term(arg2);
     }
     catch (StructureException &e)
     {
@@ -6934,39 +6974,39 @@ SWIGINTERN PyObject *_wrap_Evaluator_add_if_else_constraint(PyObject *self, PyOb
       SWIG_exception(SWIG_RuntimeError, "unkown exception");
     }
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_IfElseConstraint, 0 |  0 );
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_var(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_add_fn_rpn_term(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  Var *arg2 = (Var *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_var" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Var, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_var" "', argument " "2"" of type '" "Var *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_add_fn_rpn_term" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg2 = reinterpret_cast< Var * >(argp2);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstraintFamily_add_fn_rpn_term" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   {
     try
     {
-      (arg1)->remove_var(arg2);
+      (arg1)->add_fn_rpn_term(arg2);
     }
     catch (StructureException &e)
     {
@@ -6986,32 +7026,39 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_param(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_add_jac_rpn_term(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  Param *arg2 = (Param *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  int arg2 ;
+  int arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_add_jac_rpn_term", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_param" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Param, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_param" "', argument " "2"" of type '" "Param *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_add_jac_rpn_term" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg2 = reinterpret_cast< Param * >(argp2);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstraintFamily_add_jac_rpn_term" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[1], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ConstraintFamily_add_jac_rpn_term" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
   {
     try
     {
-      (arg1)->remove_param(arg2);
+      (arg1)->add_jac_rpn_term(arg2,arg3);
     }
     catch (StructureException &e)
     {
@@ -7031,44 +7078,29 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_float(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_num_member_leaves_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  Float *arg2 = (Float *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_float" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Float, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_float" "', argument " "2"" of type '" "Float *""'"); 
-  }
-  arg2 = reinterpret_cast< Float * >(argp2);
-  {
-    try
-    {
-      (arg1)->remove_float(arg2);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_num_member_leaves_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstraintFamily_num_member_leaves_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->num_member_leaves = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -7076,89 +7108,59 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_constraint(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_num_member_leaves_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  Constraint *arg2 = (Constraint *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[1] ;
+  int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_num_member_leaves_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Constraint, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_constraint" "', argument " "2"" of type '" "Constraint *""'"); 
-  }
-  arg2 = reinterpret_cast< Constraint * >(argp2);
-  {
-    try
-    {
-      (arg1)->remove_constraint(arg2);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_num_member_leaves_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  resultobj = SWIG_Py_Void();
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result = (int) ((arg1)->num_member_leaves);
+  resultobj = SWIG_From_int(static_cast< int >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_if_else_constraint(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_condition_rpn_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  IfElseConstraint *arg2 = (IfElseConstraint *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< int > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
+  void *argp2 ;
   int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_if_else_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_IfElseConstraint, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_if_else_constraint" "', argument " "2"" of type '" "IfElseConstraint *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_condition_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg2 = reinterpret_cast< IfElseConstraint * >(argp2);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    try
-    {
-      (arg1)->remove_if_else_constraint(arg2);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__vectorT_int_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_current_condition_rpn_set" "', argument " "2"" of type '" "std::vector< int >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_current_condition_rpn_set" "', argument " "2"" of type '" "std::vector< int >""'");
+    } else {
+      std::vector< int > * temp = reinterpret_cast< std::vector< int > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
+  if (arg1) (arg1)->current_condition_rpn = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -7166,71 +7168,59 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_set_structure(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_condition_rpn_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  std::vector< int > result;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_set_structure", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_current_condition_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_set_structure" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  {
-    try
-    {
-      (arg1)->set_structure();
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
-    }
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_condition_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  resultobj = SWIG_Py_Void();
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->current_condition_rpn);
+  resultobj = SWIG_NewPointerObj((new std::vector< int >(static_cast< const std::vector< int >& >(result))), SWIGTYPE_p_std__vectorT_int_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_remove_structure(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_fn_rpn_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< int > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_remove_structure", 0, 0, 0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_structure" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_fn_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    try
-    {
-      (arg1)->remove_structure();
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__vectorT_int_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_current_fn_rpn_set" "', argument " "2"" of type '" "std::vector< int >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_current_fn_rpn_set" "', argument " "2"" of type '" "std::vector< int >""'");
+    } else {
+      std::vector< int > * temp = reinterpret_cast< std::vector< int > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
+  if (arg1) (arg1)->current_fn_rpn = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -7238,364 +7228,2037 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_get_x(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_fn_rpn_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double *arg2 = (double *) 0 ;
-  int arg3 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *array2 = NULL ;
-  PyObject *swig_obj[2] ;
+  PyObject *swig_obj[1] ;
+  std::vector< int > result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_current_fn_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_get_x" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  {
-    npy_intp dims[1];
-    if (!PyInt_Check(swig_obj[0]))
-    {
-      const char* typestring = pytype_string(swig_obj[0]);
-      PyErr_Format(PyExc_TypeError,
-        "Int dimension expected.  '%s' given.",
-        typestring);
-      SWIG_fail;
-    }
-    arg3 = (int) PyInt_AsLong(swig_obj[0]);
-    dims[0] = (npy_intp) arg3;
-    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
-    if (!array2) SWIG_fail;
-    arg2 = (double*) array_data(array2);
-  }
-  {
-    try
-    {
-      (arg1)->get_x(arg2,arg3);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
-    }
-  }
-  resultobj = SWIG_Py_Void();
-  {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_fn_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->current_fn_rpn);
+  resultobj = SWIG_NewPointerObj((new std::vector< int >(static_cast< const std::vector< int >& >(result))), SWIGTYPE_p_std__vectorT_int_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_load_var_values_from_x(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_jac_rpn_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double *arg2 = (double *) 0 ;
-  int arg3 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::map< int,std::vector< int > > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyArrayObject *array2 = NULL ;
-  int is_new_object2 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_load_var_values_from_x" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  {
-    npy_intp size[1] = {
-      -1 
-    };
-    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
-      NPY_DOUBLE,
-      &is_new_object2);
-    if (!array2 || !require_dimensions(array2, 1) ||
-      !require_size(array2, size, 1)) SWIG_fail;
-    arg2 = (double*) array_data(array2);
-    arg3 = (int) array_size(array2,0);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_jac_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    try
-    {
-      (arg1)->load_var_values_from_x(arg2,arg3);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__mapT_int_std__vectorT_int_t_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_current_jac_rpn_set" "', argument " "2"" of type '" "std::map< int,std::vector< int > >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_current_jac_rpn_set" "', argument " "2"" of type '" "std::map< int,std::vector< int > >""'");
+    } else {
+      std::map< int,std::vector< int > > * temp = reinterpret_cast< std::map< int,std::vector< int > > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
+  if (arg1) (arg1)->current_jac_rpn = arg2;
   resultobj = SWIG_Py_Void();
-  {
-    if (is_new_object2 && array2)
-    {
-      Py_DECREF(array2); 
-    }
-  }
   return resultobj;
 fail:
-  {
-    if (is_new_object2 && array2)
-    {
-      Py_DECREF(array2); 
-    }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_current_jac_rpn_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::map< int,std::vector< int > > result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_current_jac_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_current_jac_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->current_jac_rpn);
+  resultobj = SWIG_NewPointerObj((new std::map< int,std::vector< int > >(static_cast< const std::map< int,std::vector< int > >& >(result))), SWIGTYPE_p_std__mapT_int_std__vectorT_int_t_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_evaluate(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_condition_rpn_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double *arg2 = (double *) 0 ;
-  int arg3 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< std::vector< int > > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *array2 = NULL ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject *swig_obj[2] ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_evaluate" "', argument " "1"" of type '" "Evaluator *""'"); 
-  }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
-  {
-    npy_intp dims[1];
-    if (!PyInt_Check(swig_obj[0]))
-    {
-      const char* typestring = pytype_string(swig_obj[0]);
-      PyErr_Format(PyExc_TypeError,
-        "Int dimension expected.  '%s' given.",
-        typestring);
-      SWIG_fail;
-    }
-    arg3 = (int) PyInt_AsLong(swig_obj[0]);
-    dims[0] = (npy_intp) arg3;
-    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
-    if (!array2) SWIG_fail;
-    arg2 = (double*) array_data(array2);
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_condition_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    try
-    {
-      (arg1)->evaluate(arg2,arg3);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_condition_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< int > >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_condition_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< int > >""'");
+    } else {
+      std::vector< std::vector< int > > * temp = reinterpret_cast< std::vector< std::vector< int > > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
+  if (arg1) (arg1)->condition_rpn = arg2;
   resultobj = SWIG_Py_Void();
-  {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_condition_rpn_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< std::vector< int > > result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_condition_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_condition_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->condition_rpn);
+  resultobj = SWIG_NewPointerObj((new std::vector< std::vector< int > >(static_cast< const std::vector< std::vector< int > >& >(result))), SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Evaluator_evaluate_csr_jacobian(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_ConstraintFamily_fn_rpn_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  Evaluator *arg1 = (Evaluator *) 0 ;
-  double *arg2 = (double *) 0 ;
-  int arg3 ;
-  int *arg4 = (int *) 0 ;
-  int arg5 ;
-  int *arg6 = (int *) 0 ;
-  int arg7 ;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< std::vector< int > > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *array2 = NULL ;
-  PyObject *array4 = NULL ;
-  PyObject *array6 = NULL ;
-  PyObject *swig_obj[4] ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "Evaluator_evaluate_csr_jacobian", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_evaluate_csr_jacobian" "', argument " "1"" of type '" "Evaluator *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_fn_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    npy_intp dims[1];
-    if (!PyInt_Check(swig_obj[0]))
-    {
-      const char* typestring = pytype_string(swig_obj[0]);
-      PyErr_Format(PyExc_TypeError,
-        "Int dimension expected.  '%s' given.",
-        typestring);
-      SWIG_fail;
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_fn_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< int > >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_fn_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< int > >""'");
+    } else {
+      std::vector< std::vector< int > > * temp = reinterpret_cast< std::vector< std::vector< int > > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
-    arg3 = (int) PyInt_AsLong(swig_obj[0]);
-    dims[0] = (npy_intp) arg3;
-    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
-    if (!array2) SWIG_fail;
-    arg2 = (double*) array_data(array2);
   }
-  {
-    npy_intp dims[1];
-    if (!PyInt_Check(swig_obj[1]))
-    {
-      const char* typestring = pytype_string(swig_obj[1]);
-      PyErr_Format(PyExc_TypeError,
-        "Int dimension expected.  '%s' given.",
-        typestring);
-      SWIG_fail;
-    }
-    arg5 = (int) PyInt_AsLong(swig_obj[1]);
-    dims[0] = (npy_intp) arg5;
-    array4 = PyArray_SimpleNew(1, dims, NPY_INT);
-    if (!array4) SWIG_fail;
-    arg4 = (int*) array_data(array4);
+  if (arg1) (arg1)->fn_rpn = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_fn_rpn_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< std::vector< int > > result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_fn_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_fn_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
-  {
-    npy_intp dims[1];
-    if (!PyInt_Check(swig_obj[2]))
-    {
-      const char* typestring = pytype_string(swig_obj[2]);
-      PyErr_Format(PyExc_TypeError,
-        "Int dimension expected.  '%s' given.",
-        typestring);
-      SWIG_fail;
-    }
-    arg7 = (int) PyInt_AsLong(swig_obj[2]);
-    dims[0] = (npy_intp) arg7;
-    array6 = PyArray_SimpleNew(1, dims, NPY_INT);
-    if (!array6) SWIG_fail;
-    arg6 = (int*) array_data(array6);
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->fn_rpn);
+  resultobj = SWIG_NewPointerObj((new std::vector< std::vector< int > >(static_cast< const std::vector< std::vector< int > >& >(result))), SWIGTYPE_p_std__vectorT_std__vectorT_int_t_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_jac_rpn_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< std::vector< std::vector< int > > > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_jac_rpn_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
   }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
   {
-    try
-    {
-      (arg1)->evaluate_csr_jacobian(arg2,arg3,arg4,arg5,arg6,arg7);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    res2 = SWIG_ConvertPtr(swig_obj[0], &argp2, SWIGTYPE_p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_jac_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< std::vector< int > > >""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ConstraintFamily_jac_rpn_set" "', argument " "2"" of type '" "std::vector< std::vector< std::vector< int > > >""'");
+    } else {
+      std::vector< std::vector< std::vector< int > > > * temp = reinterpret_cast< std::vector< std::vector< std::vector< int > > > * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
+  if (arg1) (arg1)->jac_rpn = arg2;
   resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_jac_rpn_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< std::vector< std::vector< int > > > result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_jac_rpn_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_jac_rpn_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result =  ((arg1)->jac_rpn);
+  resultobj = SWIG_NewPointerObj((new std::vector< std::vector< std::vector< int > > >(static_cast< const std::vector< std::vector< std::vector< int > > >& >(result))), SWIGTYPE_p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_leaves_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::vector< Leaf * > *arg2 = (std::vector< Leaf * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_leaves_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_leaves_set" "', argument " "2"" of type '" "std::vector< Leaf * > *""'"); 
+  }
+  arg2 = reinterpret_cast< std::vector< Leaf * > * >(argp2);
+  if (arg1) (arg1)->leaves = *arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_leaves_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< Leaf * > *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_leaves_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_leaves_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result = (std::vector< Leaf * > *)& ((arg1)->leaves);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_members_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  std::set< ConstraintFamilyMember * > *arg2 = (std::set< ConstraintFamilyMember * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_members_set" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_std__setT_ConstraintFamilyMember_p_t, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ConstraintFamily_members_set" "', argument " "2"" of type '" "std::set< ConstraintFamilyMember * > *""'"); 
+  }
+  arg2 = reinterpret_cast< std::set< ConstraintFamilyMember * > * >(argp2);
+  if (arg1) (arg1)->members = *arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstraintFamily_members_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ConstraintFamily *arg1 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::set< ConstraintFamilyMember * > *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ConstraintFamily_members_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstraintFamily_members_get" "', argument " "1"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg1 = reinterpret_cast< ConstraintFamily * >(argp1);
+  result = (std::set< ConstraintFamilyMember * > *)& ((arg1)->members);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__setT_ConstraintFamilyMember_p_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_ConstraintFamily) /* defines _wrap_delete_ConstraintFamily_destructor_closure */
+
+SWIGINTERN int _wrap_new_Evaluator(PyObject *self, PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0;
+  Evaluator *result = 0 ;
+  
+  if (!SWIG_Python_CheckNoKeywords(kwargs, "new_Evaluator")) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "new_Evaluator", 0, 0, 0)) SWIG_fail;
+  {
+    try
+    {
+      result = (Evaluator *)new Evaluator();
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Evaluator, SWIG_BUILTIN_INIT |  0 );
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_Evaluator(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "delete_Evaluator", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Evaluator" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    try
+    {
+      delete arg1;
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_nnz_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_nnz_set" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_nnz_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  if (arg1) (arg1)->nnz = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_nnz_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_nnz_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_nnz_get" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  result = (int) ((arg1)->nnz);
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_stack_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_stack_set" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_stack_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = reinterpret_cast< double * >(argp2);
+  if (arg1) (arg1)->stack = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_stack_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_stack_get", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_stack_get" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  result = (double *) ((arg1)->stack);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_var(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Var *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_var" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_var" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = static_cast< double >(val2);
+  {
+    try
+    {
+      result = (Var *)(arg1)->add_var(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Var, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_param(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Param *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_param" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_param" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = static_cast< double >(val2);
+  {
+    try
+    {
+      result = (Param *)(arg1)->add_param(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Param, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_float(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  Float *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_float" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_float" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = static_cast< double >(val2);
+  {
+    try
+    {
+      result = (Float *)(arg1)->add_float(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Float, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_constraint(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  Constraint *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_add_constraint", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    try
+    {
+      result = (Constraint *)(arg1)->add_constraint();
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Constraint, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_if_else_constraint(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  IfElseConstraint *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_add_if_else_constraint", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_if_else_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    try
+    {
+      result = (IfElseConstraint *)(arg1)->add_if_else_constraint();
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_IfElseConstraint, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_constraint_family(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  ConstraintFamily *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_constraint_family" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[0], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Evaluator_add_constraint_family" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  {
+    try
+    {
+      result = (ConstraintFamily *)(arg1)->add_constraint_family(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_add_constraint_family_member(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg2 = (ConstraintFamily *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  ConstraintFamilyMember *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_add_constraint_family_member" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_add_constraint_family_member" "', argument " "2"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg2 = reinterpret_cast< ConstraintFamily * >(argp2);
+  {
+    try
+    {
+      result = (ConstraintFamilyMember *)(arg1)->add_constraint_family_member(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_var(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  Var *arg2 = (Var *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_var" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Var, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_var" "', argument " "2"" of type '" "Var *""'"); 
+  }
+  arg2 = reinterpret_cast< Var * >(argp2);
+  {
+    try
+    {
+      (arg1)->remove_var(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_param(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  Param *arg2 = (Param *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_param" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Param, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_param" "', argument " "2"" of type '" "Param *""'"); 
+  }
+  arg2 = reinterpret_cast< Param * >(argp2);
+  {
+    try
+    {
+      (arg1)->remove_param(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_float(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  Float *arg2 = (Float *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_float" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Float, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_float" "', argument " "2"" of type '" "Float *""'"); 
+  }
+  arg2 = reinterpret_cast< Float * >(argp2);
+  {
+    try
+    {
+      (arg1)->remove_float(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_constraint(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  Constraint *arg2 = (Constraint *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_Constraint, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_constraint" "', argument " "2"" of type '" "Constraint *""'"); 
+  }
+  arg2 = reinterpret_cast< Constraint * >(argp2);
+  {
+    try
+    {
+      (arg1)->remove_constraint(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_if_else_constraint(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  IfElseConstraint *arg2 = (IfElseConstraint *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_if_else_constraint" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_IfElseConstraint, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_if_else_constraint" "', argument " "2"" of type '" "IfElseConstraint *""'"); 
+  }
+  arg2 = reinterpret_cast< IfElseConstraint * >(argp2);
+  {
+    try
+    {
+      (arg1)->remove_if_else_constraint(arg2);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_constraint_family_member(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  ConstraintFamily *arg2 = (ConstraintFamily *) 0 ;
+  ConstraintFamilyMember *arg3 = (ConstraintFamilyMember *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_remove_constraint_family_member", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_constraint_family_member" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[0], &argp2,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Evaluator_remove_constraint_family_member" "', argument " "2"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg2 = reinterpret_cast< ConstraintFamily * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[1], &argp3,SWIGTYPE_p_ConstraintFamilyMember, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Evaluator_remove_constraint_family_member" "', argument " "3"" of type '" "ConstraintFamilyMember *""'"); 
+  }
+  arg3 = reinterpret_cast< ConstraintFamilyMember * >(argp3);
+  {
+    try
+    {
+      (arg1)->remove_constraint_family_member(arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_set_structure(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_set_structure", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_set_structure" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    try
+    {
+      (arg1)->set_structure();
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_remove_structure(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_remove_structure", 0, 0, 0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_remove_structure" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    try
+    {
+      (arg1)->remove_structure();
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_get_x(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double *arg2 = (double *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *array2 = NULL ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_get_x" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    npy_intp dims[1];
+    if (!PyInt_Check(swig_obj[0]))
+    {
+      const char* typestring = pytype_string(swig_obj[0]);
+      PyErr_Format(PyExc_TypeError,
+        "Int dimension expected.  '%s' given.",
+        typestring);
+      SWIG_fail;
+    }
+    arg3 = (int) PyInt_AsLong(swig_obj[0]);
+    dims[0] = (npy_intp) arg3;
+    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (!array2) SWIG_fail;
+    arg2 = (double*) array_data(array2);
+  }
+  {
+    try
+    {
+      (arg1)->get_x(arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_load_var_values_from_x(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double *arg2 = (double *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_load_var_values_from_x" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[0],
+      NPY_DOUBLE,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    arg2 = (double*) array_data(array2);
+    arg3 = (int) array_size(array2,0);
+  }
+  {
+    try
+    {
+      (arg1)->load_var_values_from_x(arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_evaluate(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double *arg2 = (double *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *array2 = NULL ;
+  PyObject *swig_obj[2] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_evaluate" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    npy_intp dims[1];
+    if (!PyInt_Check(swig_obj[0]))
+    {
+      const char* typestring = pytype_string(swig_obj[0]);
+      PyErr_Format(PyExc_TypeError,
+        "Int dimension expected.  '%s' given.",
+        typestring);
+      SWIG_fail;
+    }
+    arg3 = (int) PyInt_AsLong(swig_obj[0]);
+    dims[0] = (npy_intp) arg3;
+    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (!array2) SWIG_fail;
+    arg2 = (double*) array_data(array2);
+  }
+  {
+    try
+    {
+      (arg1)->evaluate(arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Evaluator_evaluate_csr_jacobian(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Evaluator *arg1 = (Evaluator *) 0 ;
+  double *arg2 = (double *) 0 ;
+  int arg3 ;
+  int *arg4 = (int *) 0 ;
+  int arg5 ;
+  int *arg6 = (int *) 0 ;
+  int arg7 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *array2 = NULL ;
+  PyObject *array4 = NULL ;
+  PyObject *array6 = NULL ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "Evaluator_evaluate_csr_jacobian", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_Evaluator, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Evaluator_evaluate_csr_jacobian" "', argument " "1"" of type '" "Evaluator *""'"); 
+  }
+  arg1 = reinterpret_cast< Evaluator * >(argp1);
+  {
+    npy_intp dims[1];
+    if (!PyInt_Check(swig_obj[0]))
+    {
+      const char* typestring = pytype_string(swig_obj[0]);
+      PyErr_Format(PyExc_TypeError,
+        "Int dimension expected.  '%s' given.",
+        typestring);
+      SWIG_fail;
+    }
+    arg3 = (int) PyInt_AsLong(swig_obj[0]);
+    dims[0] = (npy_intp) arg3;
+    array2 = PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (!array2) SWIG_fail;
+    arg2 = (double*) array_data(array2);
+  }
+  {
+    npy_intp dims[1];
+    if (!PyInt_Check(swig_obj[1]))
+    {
+      const char* typestring = pytype_string(swig_obj[1]);
+      PyErr_Format(PyExc_TypeError,
+        "Int dimension expected.  '%s' given.",
+        typestring);
+      SWIG_fail;
+    }
+    arg5 = (int) PyInt_AsLong(swig_obj[1]);
+    dims[0] = (npy_intp) arg5;
+    array4 = PyArray_SimpleNew(1, dims, NPY_INT);
+    if (!array4) SWIG_fail;
+    arg4 = (int*) array_data(array4);
+  }
+  {
+    npy_intp dims[1];
+    if (!PyInt_Check(swig_obj[2]))
+    {
+      const char* typestring = pytype_string(swig_obj[2]);
+      PyErr_Format(PyExc_TypeError,
+        "Int dimension expected.  '%s' given.",
+        typestring);
+      SWIG_fail;
+    }
+    arg7 = (int) PyInt_AsLong(swig_obj[2]);
+    dims[0] = (npy_intp) arg7;
+    array6 = PyArray_SimpleNew(1, dims, NPY_INT);
+    if (!array6) SWIG_fail;
+    arg6 = (int*) array_data(array6);
+  }
+  {
+    try
+    {
+      (arg1)->evaluate_csr_jacobian(arg2,arg3,arg4,arg5,arg6,arg7);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
+  }
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array4);
+  }
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array6);
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Evaluator) /* defines _wrap_delete_Evaluator_destructor_closure */
+
+SWIGINTERN PyObject *_wrap__evaluate(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double *arg1 = (double *) 0 ;
+  std::vector< int > *arg2 = (std::vector< int > *) 0 ;
+  std::vector< Leaf * > *arg3 = (std::vector< Leaf * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "_evaluate", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "_evaluate" "', argument " "1"" of type '" "double *""'"); 
+  }
+  arg1 = reinterpret_cast< double * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_std__vectorT_int_t, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "_evaluate" "', argument " "2"" of type '" "std::vector< int > *""'"); 
+  }
+  arg2 = reinterpret_cast< std::vector< int > * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "_evaluate" "', argument " "3"" of type '" "std::vector< Leaf * > *""'"); 
+  }
+  arg3 = reinterpret_cast< std::vector< Leaf * > * >(argp3);
+  {
+    try
+    {
+      result = (double)_evaluate(arg1,arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_From_double(static_cast< double >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap__find_condition(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double *arg1 = (double *) 0 ;
+  ConstraintFamily *arg2 = (ConstraintFamily *) 0 ;
+  std::vector< Leaf * > *arg3 = (std::vector< Leaf * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "_find_condition", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "_find_condition" "', argument " "1"" of type '" "double *""'"); 
+  }
+  arg1 = reinterpret_cast< double * >(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_ConstraintFamily, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "_find_condition" "', argument " "2"" of type '" "ConstraintFamily *""'"); 
+  }
+  arg2 = reinterpret_cast< ConstraintFamily * >(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "_find_condition" "', argument " "3"" of type '" "std::vector< Leaf * > *""'"); 
+  }
+  arg3 = reinterpret_cast< std::vector< Leaf * > * >(argp3);
+  {
+    try
+    {
+      result = (int)_find_condition(arg1,arg2,arg3);
+    }
+    catch (StructureException &e)
+    {
+      std::string s("Evaluator error: "), s2(e.what());
+      s = s + s2;
+      SWIG_exception(SWIG_RuntimeError, s.c_str());
+    }
+    catch (...)
+    {
+      SWIG_exception(SWIG_RuntimeError, "unkown exception");
+    }
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+static PyMethodDef SwigMethods[] = {
+	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { "_evaluate", _wrap__evaluate, METH_VARARGS, NULL},
+	 { "_find_condition", _wrap__find_condition, METH_VARARGS, NULL},
+	 { NULL, NULL, 0, NULL }
+};
+
+static PyMethodDef SwigMethods_proxydocs[] = {
+	 { NULL, NULL, 0, NULL }
+};
+
+static SwigPyGetSet StructureException___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__StructureException_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &StructureException___dict___getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__StructureException_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__StructureException_methods[] = {
+  { "what", _wrap_StructureException_what, METH_NOARGS, "" },
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__StructureException_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "evaluator.StructureException",           /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_StructureException_destructor_closure,           /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__StructureException_type.as_number,            /* tp_as_number */
+    &SwigPyBuiltin__StructureException_type.as_sequence,          /* tp_as_sequence */
+    &SwigPyBuiltin__StructureException_type.as_mapping,           /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__StructureException_type.as_buffer,            /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::StructureException",                   /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__StructureException_richcompare,                /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__StructureException_methods,/* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__StructureException_getset, /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_StructureException,             /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__StructureException_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__StructureException_type};
+
+static SwigPyGetSet Leaf___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet Leaf_value_getset = { _wrap_Leaf_value_get, _wrap_Leaf_value_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Leaf_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Leaf___dict___getset },
+    { (char *)"value", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Leaf_value_getset },
+    { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__Leaf_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__Leaf_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__Leaf_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "evaluator.Leaf",                         /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    _wrap_delete_Leaf_destructor_closure,     /* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__Leaf_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Leaf_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Leaf_type.as_mapping,     /* tp_as_mapping */
+    SwigPyObject_hash,                        /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__Leaf_type.as_buffer,      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::Leaf",                                 /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    SwigPyBuiltin__Leaf_richcompare,          /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__Leaf_methods,              /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__Leaf_getset,               /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    offsetof(SwigPyObject, dict),             /* tp_dictoffset */
+    _wrap_new_Leaf,                           /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+    (int) 0,                                  /* tp_version_tag */
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#if PY_VERSION_HEX >= 0x03080000
+    (vectorcallfunc) 0,                       /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+    0,                                        /* tp_print */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+    0,                                        /* tp_prev */
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array2);
-  }
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array4);
-  }
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+    (unaryfunc) 0,                            /* nb_index */
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)array6);
-  }
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Evaluator) /* defines _wrap_delete_Evaluator_destructor_closure */
-
-SWIGINTERN PyObject *_wrap__evaluate(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  double *arg1 = (double *) 0 ;
-  std::vector< int > *arg2 = (std::vector< int > *) 0 ;
-  std::vector< Leaf * > *arg3 = (std::vector< Leaf * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  PyObject *swig_obj[3] ;
-  double result;
-  
-  if (!SWIG_Python_UnpackTuple(args, "_evaluate", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_double, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "_evaluate" "', argument " "1"" of type '" "double *""'"); 
-  }
-  arg1 = reinterpret_cast< double * >(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_std__vectorT_int_t, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "_evaluate" "', argument " "2"" of type '" "std::vector< int > *""'"); 
-  }
-  arg2 = reinterpret_cast< std::vector< int > * >(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_std__vectorT_Leaf_p_t, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "_evaluate" "', argument " "3"" of type '" "std::vector< Leaf * > *""'"); 
-  }
-  arg3 = reinterpret_cast< std::vector< Leaf * > * >(argp3);
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
   {
-    try
-    {
-      result = (double)_evaluate(arg1,arg2,arg3);
-    }
-    catch (StructureException &e)
-    {
-      std::string s("Evaluator error: "), s2(e.what());
-      s = s + s2;
-      SWIG_exception(SWIG_RuntimeError, s.c_str());
-    }
-    catch (...)
-    {
-      SWIG_exception(SWIG_RuntimeError, "unkown exception");
-    }
-  }
-  resultobj = SWIG_From_double(static_cast< double >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-static PyMethodDef SwigMethods[] = {
-	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
-	 { "_evaluate", _wrap__evaluate, METH_VARARGS, NULL},
-	 { NULL, NULL, 0, NULL }
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
 };
 
-static PyMethodDef SwigMethods_proxydocs[] = {
-	 { NULL, NULL, 0, NULL }
-};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Leaf_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Leaf_type};
 
-static SwigPyGetSet StructureException___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__StructureException_getset[] = {
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &StructureException___dict___getset },
+static SwigPyGetSet Var_index_getset = { _wrap_Var_index_get, _wrap_Var_index_set };
+static SwigPyGetSet Var___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Var_getset[] = {
+    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Var_index_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Var___dict___getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__StructureException_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Var_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -7608,12 +9271,11 @@ SwigPyBuiltin__StructureException_richcompare(PyObject *self, PyObject *other, i
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__StructureException_methods[] = {
-  { "what", _wrap_StructureException_what, METH_NOARGS, "" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__Var_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__StructureException_type = {
+static PyHeapTypeObject SwigPyBuiltin__Var_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -7621,10 +9283,10 @@ static PyHeapTypeObject SwigPyBuiltin__StructureException_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.StructureException",           /* tp_name */
+    "evaluator.Var",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_StructureException_destructor_closure,           /* tp_dealloc */
+    _wrap_delete_Var_destructor_closure,      /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -7634,36 +9296,36 @@ static PyHeapTypeObject SwigPyBuiltin__StructureException_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__StructureException_type.as_number,            /* tp_as_number */
-    &SwigPyBuiltin__StructureException_type.as_sequence,          /* tp_as_sequence */
-    &SwigPyBuiltin__StructureException_type.as_mapping,           /* tp_as_mapping */
+    &SwigPyBuiltin__Var_type.as_number,       /* tp_as_number */
+    &SwigPyBuiltin__Var_type.as_sequence,     /* tp_as_sequence */
+    &SwigPyBuiltin__Var_type.as_mapping,      /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__StructureException_type.as_buffer,            /* tp_as_buffer */
+    &SwigPyBuiltin__Var_type.as_buffer,       /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::StructureException",                   /* tp_doc */
+    "::Var",                                  /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__StructureException_richcompare,                /* tp_richcompare */
+    SwigPyBuiltin__Var_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__StructureException_methods,/* tp_methods */
+    SwigPyBuiltin__Var_methods,               /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__StructureException_getset, /* tp_getset */
+    SwigPyBuiltin__Var_getset,                /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_StructureException,             /* tp_init */
+    _wrap_new_Var,                            /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -7799,18 +9461,16 @@ static PyHeapTypeObject SwigPyBuiltin__StructureException_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__StructureException_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__StructureException_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Var_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Var_type};
 
-static SwigPyGetSet Leaf___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet Leaf_value_getset = { _wrap_Leaf_value_get, _wrap_Leaf_value_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Leaf_getset[] = {
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Leaf___dict___getset },
-    { (char *)"value", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Leaf_value_getset },
+static SwigPyGetSet Param___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Param_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Param___dict___getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Leaf_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Param_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -7823,11 +9483,11 @@ SwigPyBuiltin__Leaf_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Leaf_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Param_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Leaf_type = {
+static PyHeapTypeObject SwigPyBuiltin__Param_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -7835,10 +9495,10 @@ static PyHeapTypeObject SwigPyBuiltin__Leaf_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.Leaf",                         /* tp_name */
+    "evaluator.Param",                        /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_Leaf_destructor_closure,     /* tp_dealloc */
+    _wrap_delete_Param_destructor_closure,    /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -7848,36 +9508,36 @@ static PyHeapTypeObject SwigPyBuiltin__Leaf_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Leaf_type.as_number,      /* tp_as_number */
-    &SwigPyBuiltin__Leaf_type.as_sequence,    /* tp_as_sequence */
-    &SwigPyBuiltin__Leaf_type.as_mapping,     /* tp_as_mapping */
+    &SwigPyBuiltin__Param_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin__Param_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin__Param_type.as_mapping,    /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Leaf_type.as_buffer,      /* tp_as_buffer */
+    &SwigPyBuiltin__Param_type.as_buffer,     /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Leaf",                                 /* tp_doc */
+    "::Param",                                /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__Leaf_richcompare,          /* tp_richcompare */
+    SwigPyBuiltin__Param_richcompare,         /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Leaf_methods,              /* tp_methods */
+    SwigPyBuiltin__Param_methods,             /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Leaf_getset,               /* tp_getset */
+    SwigPyBuiltin__Param_getset,              /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_Leaf,                           /* tp_init */
+    _wrap_new_Param,                          /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -8013,18 +9673,16 @@ static PyHeapTypeObject SwigPyBuiltin__Leaf_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Leaf_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Leaf_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Param_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Param_type};
 
-static SwigPyGetSet Var_index_getset = { _wrap_Var_index_get, _wrap_Var_index_set };
-static SwigPyGetSet Var___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Var_getset[] = {
-    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Var_index_getset },
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Var___dict___getset },
+static SwigPyGetSet Float___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Float_getset[] = {
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Float___dict___getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Var_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Float_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -8037,11 +9695,11 @@ SwigPyBuiltin__Var_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Var_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Float_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Var_type = {
+static PyHeapTypeObject SwigPyBuiltin__Float_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -8049,10 +9707,10 @@ static PyHeapTypeObject SwigPyBuiltin__Var_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.Var",                          /* tp_name */
+    "evaluator.Float",                        /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_Var_destructor_closure,      /* tp_dealloc */
+    _wrap_delete_Float_destructor_closure,    /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -8062,36 +9720,36 @@ static PyHeapTypeObject SwigPyBuiltin__Var_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Var_type.as_number,       /* tp_as_number */
-    &SwigPyBuiltin__Var_type.as_sequence,     /* tp_as_sequence */
-    &SwigPyBuiltin__Var_type.as_mapping,      /* tp_as_mapping */
+    &SwigPyBuiltin__Float_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin__Float_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin__Float_type.as_mapping,    /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Var_type.as_buffer,       /* tp_as_buffer */
+    &SwigPyBuiltin__Float_type.as_buffer,     /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Var",                                  /* tp_doc */
+    "::Float",                                /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__Var_richcompare,           /* tp_richcompare */
+    SwigPyBuiltin__Float_richcompare,         /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Var_methods,               /* tp_methods */
+    SwigPyBuiltin__Float_methods,             /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Var_getset,                /* tp_getset */
+    SwigPyBuiltin__Float_getset,              /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_Var,                            /* tp_init */
+    _wrap_new_Float,                          /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -8227,16 +9885,24 @@ static PyHeapTypeObject SwigPyBuiltin__Var_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Var_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Var_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Float_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Float_type};
 
-static SwigPyGetSet Param___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Param_getset[] = {
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Param___dict___getset },
+static SwigPyGetSet Constraint_leaves_getset = { _wrap_Constraint_leaves_get, _wrap_Constraint_leaves_set };
+static SwigPyGetSet Constraint_index_getset = { _wrap_Constraint_index_get, _wrap_Constraint_index_set };
+static SwigPyGetSet Constraint___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet Constraint_fn_rpn_getset = { _wrap_Constraint_fn_rpn_get, _wrap_Constraint_fn_rpn_set };
+static SwigPyGetSet Constraint_jac_rpn_getset = { _wrap_Constraint_jac_rpn_get, _wrap_Constraint_jac_rpn_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Constraint_getset[] = {
+    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_leaves_getset },
+    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_index_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Constraint___dict___getset },
+    { (char *)"fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_fn_rpn_getset },
+    { (char *)"jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_jac_rpn_getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Param_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Constraint_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -8249,11 +9915,14 @@ SwigPyBuiltin__Param_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Param_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Constraint_methods[] = {
+  { "add_leaf", _wrap_Constraint_add_leaf, METH_O, "" },
+  { "add_fn_rpn_term", _wrap_Constraint_add_fn_rpn_term, METH_O, "" },
+  { "add_jac_rpn_term", _wrap_Constraint_add_jac_rpn_term, METH_VARARGS, "" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Param_type = {
+static PyHeapTypeObject SwigPyBuiltin__Constraint_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -8261,10 +9930,10 @@ static PyHeapTypeObject SwigPyBuiltin__Param_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.Param",                        /* tp_name */
+    "evaluator.Constraint",                   /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_Param_destructor_closure,    /* tp_dealloc */
+    _wrap_delete_Constraint_destructor_closure,                   /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -8274,36 +9943,36 @@ static PyHeapTypeObject SwigPyBuiltin__Param_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Param_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin__Param_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin__Param_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin__Constraint_type.as_number,/* tp_as_number */
+    &SwigPyBuiltin__Constraint_type.as_sequence,                  /* tp_as_sequence */
+    &SwigPyBuiltin__Constraint_type.as_mapping,                   /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Param_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin__Constraint_type.as_buffer,/* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Param",                                /* tp_doc */
+    "::Constraint",                           /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__Param_richcompare,         /* tp_richcompare */
+    SwigPyBuiltin__Constraint_richcompare,    /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Param_methods,             /* tp_methods */
+    SwigPyBuiltin__Constraint_methods,        /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Param_getset,              /* tp_getset */
+    SwigPyBuiltin__Constraint_getset,         /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_Param,                          /* tp_init */
+    _wrap_new_Constraint,                     /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -8439,16 +10108,32 @@ static PyHeapTypeObject SwigPyBuiltin__Param_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Param_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Param_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Constraint_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Constraint_type};
 
-static SwigPyGetSet Float___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Float_getset[] = {
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Float___dict___getset },
+static SwigPyGetSet IfElseConstraint_current_condition_rpn_getset = { _wrap_IfElseConstraint_current_condition_rpn_get, _wrap_IfElseConstraint_current_condition_rpn_set };
+static SwigPyGetSet IfElseConstraint_condition_rpn_getset = { _wrap_IfElseConstraint_condition_rpn_get, _wrap_IfElseConstraint_condition_rpn_set };
+static SwigPyGetSet IfElseConstraint_leaves_getset = { _wrap_IfElseConstraint_leaves_get, _wrap_IfElseConstraint_leaves_set };
+static SwigPyGetSet IfElseConstraint_index_getset = { _wrap_IfElseConstraint_index_get, _wrap_IfElseConstraint_index_set };
+static SwigPyGetSet IfElseConstraint___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet IfElseConstraint_current_fn_rpn_getset = { _wrap_IfElseConstraint_current_fn_rpn_get, _wrap_IfElseConstraint_current_fn_rpn_set };
+static SwigPyGetSet IfElseConstraint_fn_rpn_getset = { _wrap_IfElseConstraint_fn_rpn_get, _wrap_IfElseConstraint_fn_rpn_set };
+static SwigPyGetSet IfElseConstraint_current_jac_rpn_getset = { _wrap_IfElseConstraint_current_jac_rpn_get, _wrap_IfElseConstraint_current_jac_rpn_set };
+static SwigPyGetSet IfElseConstraint_jac_rpn_getset = { _wrap_IfElseConstraint_jac_rpn_get, _wrap_IfElseConstraint_jac_rpn_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__IfElseConstraint_getset[] = {
+    { (char *)"current_condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_condition_rpn_getset },
+    { (char *)"condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_condition_rpn_getset },
+    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_leaves_getset },
+    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_index_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &IfElseConstraint___dict___getset },
+    { (char *)"current_fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_fn_rpn_getset },
+    { (char *)"fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_fn_rpn_getset },
+    { (char *)"current_jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_jac_rpn_getset },
+    { (char *)"jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_jac_rpn_getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Float_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__IfElseConstraint_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -8461,11 +10146,16 @@ SwigPyBuiltin__Float_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Float_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__IfElseConstraint_methods[] = {
+  { "add_leaf", _wrap_IfElseConstraint_add_leaf, METH_O, "" },
+  { "end_condition", _wrap_IfElseConstraint_end_condition, METH_NOARGS, "" },
+  { "add_condition_rpn_term", _wrap_IfElseConstraint_add_condition_rpn_term, METH_O, "" },
+  { "add_fn_rpn_term", _wrap_IfElseConstraint_add_fn_rpn_term, METH_O, "" },
+  { "add_jac_rpn_term", _wrap_IfElseConstraint_add_jac_rpn_term, METH_VARARGS, "" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Float_type = {
+static PyHeapTypeObject SwigPyBuiltin__IfElseConstraint_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -8473,10 +10163,10 @@ static PyHeapTypeObject SwigPyBuiltin__Float_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.Float",                        /* tp_name */
+    "evaluator.IfElseConstraint",             /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_Float_destructor_closure,    /* tp_dealloc */
+    _wrap_delete_IfElseConstraint_destructor_closure,             /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -8486,36 +10176,36 @@ static PyHeapTypeObject SwigPyBuiltin__Float_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Float_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin__Float_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin__Float_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin__IfElseConstraint_type.as_number,              /* tp_as_number */
+    &SwigPyBuiltin__IfElseConstraint_type.as_sequence,            /* tp_as_sequence */
+    &SwigPyBuiltin__IfElseConstraint_type.as_mapping,             /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Float_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin__IfElseConstraint_type.as_buffer,              /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Float",                                /* tp_doc */
+    "::IfElseConstraint",                     /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__Float_richcompare,         /* tp_richcompare */
+    SwigPyBuiltin__IfElseConstraint_richcompare,                  /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Float_methods,             /* tp_methods */
+    SwigPyBuiltin__IfElseConstraint_methods,  /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Float_getset,              /* tp_getset */
+    SwigPyBuiltin__IfElseConstraint_getset,   /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_Float,                          /* tp_init */
+    _wrap_new_IfElseConstraint,               /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -8651,24 +10341,20 @@ static PyHeapTypeObject SwigPyBuiltin__Float_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Float_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Float_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__IfElseConstraint_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__IfElseConstraint_type};
 
-static SwigPyGetSet Constraint_leaves_getset = { _wrap_Constraint_leaves_get, _wrap_Constraint_leaves_set };
-static SwigPyGetSet Constraint_index_getset = { _wrap_Constraint_index_get, _wrap_Constraint_index_set };
-static SwigPyGetSet Constraint___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet Constraint_fn_rpn_getset = { _wrap_Constraint_fn_rpn_get, _wrap_Constraint_fn_rpn_set };
-static SwigPyGetSet Constraint_jac_rpn_getset = { _wrap_Constraint_jac_rpn_get, _wrap_Constraint_jac_rpn_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Constraint_getset[] = {
-    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_leaves_getset },
-    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_index_getset },
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &Constraint___dict___getset },
-    { (char *)"fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_fn_rpn_getset },
-    { (char *)"jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &Constraint_jac_rpn_getset },
+static SwigPyGetSet ConstraintFamilyMember_leaves_getset = { _wrap_ConstraintFamilyMember_leaves_get, _wrap_ConstraintFamilyMember_leaves_set };
+static SwigPyGetSet ConstraintFamilyMember_index_getset = { _wrap_ConstraintFamilyMember_index_get, _wrap_ConstraintFamilyMember_index_set };
+static SwigPyGetSet ConstraintFamilyMember___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__ConstraintFamilyMember_getset[] = {
+    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamilyMember_leaves_getset },
+    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamilyMember_index_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &ConstraintFamilyMember___dict___getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Constraint_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__ConstraintFamilyMember_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -8681,14 +10367,12 @@ SwigPyBuiltin__Constraint_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Constraint_methods[] = {
-  { "add_leaf", _wrap_Constraint_add_leaf, METH_O, "" },
-  { "add_fn_rpn_term", _wrap_Constraint_add_fn_rpn_term, METH_O, "" },
-  { "add_jac_rpn_term", _wrap_Constraint_add_jac_rpn_term, METH_VARARGS, "" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__ConstraintFamilyMember_methods[] = {
+  { "add_leaf", _wrap_ConstraintFamilyMember_add_leaf, METH_O, "" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Constraint_type = {
+static PyHeapTypeObject SwigPyBuiltin__ConstraintFamilyMember_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -8696,10 +10380,10 @@ static PyHeapTypeObject SwigPyBuiltin__Constraint_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.Constraint",                   /* tp_name */
+    "evaluator.ConstraintFamilyMember",       /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_Constraint_destructor_closure,                   /* tp_dealloc */
+    _wrap_delete_ConstraintFamilyMember_destructor_closure,       /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -8709,36 +10393,36 @@ static PyHeapTypeObject SwigPyBuiltin__Constraint_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Constraint_type.as_number,/* tp_as_number */
-    &SwigPyBuiltin__Constraint_type.as_sequence,                  /* tp_as_sequence */
-    &SwigPyBuiltin__Constraint_type.as_mapping,                   /* tp_as_mapping */
+    &SwigPyBuiltin__ConstraintFamilyMember_type.as_number,        /* tp_as_number */
+    &SwigPyBuiltin__ConstraintFamilyMember_type.as_sequence,      /* tp_as_sequence */
+    &SwigPyBuiltin__ConstraintFamilyMember_type.as_mapping,       /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Constraint_type.as_buffer,/* tp_as_buffer */
+    &SwigPyBuiltin__ConstraintFamilyMember_type.as_buffer,        /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Constraint",                           /* tp_doc */
+    "::ConstraintFamilyMember",               /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__Constraint_richcompare,    /* tp_richcompare */
+    SwigPyBuiltin__ConstraintFamilyMember_richcompare,            /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Constraint_methods,        /* tp_methods */
+    SwigPyBuiltin__ConstraintFamilyMember_methods,                /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Constraint_getset,         /* tp_getset */
+    SwigPyBuiltin__ConstraintFamilyMember_getset,                 /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_Constraint,                     /* tp_init */
+    _wrap_new_ConstraintFamilyMember,         /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -8874,32 +10558,34 @@ static PyHeapTypeObject SwigPyBuiltin__Constraint_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Constraint_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Constraint_type};
-
-static SwigPyGetSet IfElseConstraint_current_condition_rpn_getset = { _wrap_IfElseConstraint_current_condition_rpn_get, _wrap_IfElseConstraint_current_condition_rpn_set };
-static SwigPyGetSet IfElseConstraint_condition_rpn_getset = { _wrap_IfElseConstraint_condition_rpn_get, _wrap_IfElseConstraint_condition_rpn_set };
-static SwigPyGetSet IfElseConstraint_leaves_getset = { _wrap_IfElseConstraint_leaves_get, _wrap_IfElseConstraint_leaves_set };
-static SwigPyGetSet IfElseConstraint_index_getset = { _wrap_IfElseConstraint_index_get, _wrap_IfElseConstraint_index_set };
-static SwigPyGetSet IfElseConstraint___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet IfElseConstraint_current_fn_rpn_getset = { _wrap_IfElseConstraint_current_fn_rpn_get, _wrap_IfElseConstraint_current_fn_rpn_set };
-static SwigPyGetSet IfElseConstraint_fn_rpn_getset = { _wrap_IfElseConstraint_fn_rpn_get, _wrap_IfElseConstraint_fn_rpn_set };
-static SwigPyGetSet IfElseConstraint_current_jac_rpn_getset = { _wrap_IfElseConstraint_current_jac_rpn_get, _wrap_IfElseConstraint_current_jac_rpn_set };
-static SwigPyGetSet IfElseConstraint_jac_rpn_getset = { _wrap_IfElseConstraint_jac_rpn_get, _wrap_IfElseConstraint_jac_rpn_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__IfElseConstraint_getset[] = {
-    { (char *)"current_condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_condition_rpn_getset },
-    { (char *)"condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_condition_rpn_getset },
-    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_leaves_getset },
-    { (char *)"index", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_index_getset },
-    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &IfElseConstraint___dict___getset },
-    { (char *)"current_fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_fn_rpn_getset },
-    { (char *)"fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_fn_rpn_getset },
-    { (char *)"current_jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_current_jac_rpn_getset },
-    { (char *)"jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &IfElseConstraint_jac_rpn_getset },
+SWIGINTERN SwigPyClientData SwigPyBuiltin__ConstraintFamilyMember_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__ConstraintFamilyMember_type};
+
+static SwigPyGetSet ConstraintFamily_current_condition_rpn_getset = { _wrap_ConstraintFamily_current_condition_rpn_get, _wrap_ConstraintFamily_current_condition_rpn_set };
+static SwigPyGetSet ConstraintFamily_condition_rpn_getset = { _wrap_ConstraintFamily_condition_rpn_get, _wrap_ConstraintFamily_condition_rpn_set };
+static SwigPyGetSet ConstraintFamily_leaves_getset = { _wrap_ConstraintFamily_leaves_get, _wrap_ConstraintFamily_leaves_set };
+static SwigPyGetSet ConstraintFamily_members_getset = { _wrap_ConstraintFamily_members_get, _wrap_ConstraintFamily_members_set };
+static SwigPyGetSet ConstraintFamily___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet ConstraintFamily_current_fn_rpn_getset = { _wrap_ConstraintFamily_current_fn_rpn_get, _wrap_ConstraintFamily_current_fn_rpn_set };
+static SwigPyGetSet ConstraintFamily_fn_rpn_getset = { _wrap_ConstraintFamily_fn_rpn_get, _wrap_ConstraintFamily_fn_rpn_set };
+static SwigPyGetSet ConstraintFamily_num_member_leaves_getset = { _wrap_ConstraintFamily_num_member_leaves_get, _wrap_ConstraintFamily_num_member_leaves_set };
+static SwigPyGetSet ConstraintFamily_current_jac_rpn_getset = { _wrap_ConstraintFamily_current_jac_rpn_get, _wrap_ConstraintFamily_current_jac_rpn_set };
+static SwigPyGetSet ConstraintFamily_jac_rpn_getset = { _wrap_ConstraintFamily_jac_rpn_get, _wrap_ConstraintFamily_jac_rpn_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__ConstraintFamily_getset[] = {
+    { (char *)"current_condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_current_condition_rpn_getset },
+    { (char *)"condition_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_condition_rpn_getset },
+    { (char *)"leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_leaves_getset },
+    { (char *)"members", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_members_getset },
+    { (char *)"__dict__", SwigPyBuiltin_FunpackGetterClosure, 0, (char *)"", &ConstraintFamily___dict___getset },
+    { (char *)"current_fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_current_fn_rpn_getset },
+    { (char *)"fn_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_fn_rpn_getset },
+    { (char *)"num_member_leaves", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_num_member_leaves_getset },
+    { (char *)"current_jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_current_jac_rpn_getset },
+    { (char *)"jac_rpn", SwigPyBuiltin_FunpackGetterClosure, SwigPyBuiltin_FunpackSetterClosure, (char *)"", &ConstraintFamily_jac_rpn_getset },
     { NULL, NULL, NULL, NULL, NULL } /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__IfElseConstraint_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__ConstraintFamily_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   if (!result) {
     if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
@@ -8912,16 +10598,16 @@ SwigPyBuiltin__IfElseConstraint_richcompare(PyObject *self, PyObject *other, int
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__IfElseConstraint_methods[] = {
-  { "add_leaf", _wrap_IfElseConstraint_add_leaf, METH_O, "" },
-  { "end_condition", _wrap_IfElseConstraint_end_condition, METH_NOARGS, "" },
-  { "add_condition_rpn_term", _wrap_IfElseConstraint_add_condition_rpn_term, METH_O, "" },
-  { "add_fn_rpn_term", _wrap_IfElseConstraint_add_fn_rpn_term, METH_O, "" },
-  { "add_jac_rpn_term", _wrap_IfElseConstraint_add_jac_rpn_term, METH_VARARGS, "" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__ConstraintFamily_methods[] = {
+  { "add_leaf", _wrap_ConstraintFamily_add_leaf, METH_O, "" },
+  { "end_condition", _wrap_ConstraintFamily_end_condition, METH_NOARGS, "" },
+  { "add_condition_rpn_term", _wrap_ConstraintFamily_add_condition_rpn_term, METH_O, "" },
+  { "add_fn_rpn_term", _wrap_ConstraintFamily_add_fn_rpn_term, METH_O, "" },
+  { "add_jac_rpn_term", _wrap_ConstraintFamily_add_jac_rpn_term, METH_VARARGS, "" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__IfElseConstraint_type = {
+static PyHeapTypeObject SwigPyBuiltin__ConstraintFamily_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -8929,10 +10615,10 @@ static PyHeapTypeObject SwigPyBuiltin__IfElseConstraint_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "evaluator.IfElseConstraint",             /* tp_name */
+    "evaluator.ConstraintFamily",             /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    _wrap_delete_IfElseConstraint_destructor_closure,             /* tp_dealloc */
+    _wrap_delete_ConstraintFamily_destructor_closure,             /* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -8942,36 +10628,36 @@ static PyHeapTypeObject SwigPyBuiltin__IfElseConstraint_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__IfElseConstraint_type.as_number,              /* tp_as_number */
-    &SwigPyBuiltin__IfElseConstraint_type.as_sequence,            /* tp_as_sequence */
-    &SwigPyBuiltin__IfElseConstraint_type.as_mapping,             /* tp_as_mapping */
+    &SwigPyBuiltin__ConstraintFamily_type.as_number,              /* tp_as_number */
+    &SwigPyBuiltin__ConstraintFamily_type.as_sequence,            /* tp_as_sequence */
+    &SwigPyBuiltin__ConstraintFamily_type.as_mapping,             /* tp_as_mapping */
     SwigPyObject_hash,                        /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__IfElseConstraint_type.as_buffer,              /* tp_as_buffer */
+    &SwigPyBuiltin__ConstraintFamily_type.as_buffer,              /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::IfElseConstraint",                     /* tp_doc */
+    "::ConstraintFamily",                     /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    SwigPyBuiltin__IfElseConstraint_richcompare,                  /* tp_richcompare */
+    SwigPyBuiltin__ConstraintFamily_richcompare,                  /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__IfElseConstraint_methods,  /* tp_methods */
+    SwigPyBuiltin__ConstraintFamily_methods,  /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__IfElseConstraint_getset,   /* tp_getset */
+    SwigPyBuiltin__ConstraintFamily_getset,   /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     offsetof(SwigPyObject, dict),             /* tp_dictoffset */
-    _wrap_new_IfElseConstraint,               /* tp_init */
+    _wrap_new_ConstraintFamily,               /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -9107,7 +10793,7 @@ static PyHeapTypeObject SwigPyBuiltin__IfElseConstraint_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__IfElseConstraint_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__IfElseConstraint_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__ConstraintFamily_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__ConstraintFamily_type};
 
 static SwigPyGetSet Evaluator___dict___getset = { SwigPyObject_get___dict__, 0 };
 static SwigPyGetSet Evaluator_nnz_getset = { _wrap_Evaluator_nnz_get, _wrap_Evaluator_nnz_set };
@@ -9139,11 +10825,14 @@ SWIGINTERN PyMethodDef SwigPyBuiltin__Evaluator_methods[] = {
   { "add_float", _wrap_Evaluator_add_float, METH_O, "" },
   { "add_constraint", _wrap_Evaluator_add_constraint, METH_NOARGS, "" },
   { "add_if_else_constraint", _wrap_Evaluator_add_if_else_constraint, METH_NOARGS, "" },
+  { "add_constraint_family", _wrap_Evaluator_add_constraint_family, METH_O, "" },
+  { "add_constraint_family_member", _wrap_Evaluator_add_constraint_family_member, METH_O, "" },
   { "remove_var", _wrap_Evaluator_remove_var, METH_O, "" },
   { "remove_param", _wrap_Evaluator_remove_param, METH_O, "" },
   { "remove_float", _wrap_Evaluator_remove_float, METH_O, "" },
   { "remove_constraint", _wrap_Evaluator_remove_constraint, METH_O, "" },
   { "remove_if_else_constraint", _wrap_Evaluator_remove_if_else_constraint, METH_O, "" },
+  { "remove_constraint_family_member", _wrap_Evaluator_remove_constraint_family_member, METH_VARARGS, "" },
   { "set_structure", _wrap_Evaluator_set_structure, METH_NOARGS, "" },
   { "remove_structure", _wrap_Evaluator_remove_structure, METH_NOARGS, "" },
   { "get_x", _wrap_Evaluator_get_x, METH_O, "" },
@@ -9354,6 +11043,8 @@ static void *_p_VarTo_p_Leaf(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((Leaf *)  ((Var *) x));
 }
 static swig_type_info _swigt__p_Constraint = {"_p_Constraint", "Constraint *", 0, 0, (void*)&SwigPyBuiltin__Constraint_clientdata, 0};
+static swig_type_info _swigt__p_ConstraintFamily = {"_p_ConstraintFamily", "ConstraintFamily *", 0, 0, (void*)&SwigPyBuiltin__ConstraintFamily_clientdata, 0};
+static swig_type_info _swigt__p_ConstraintFamilyMember = {"_p_ConstraintFamilyMember", "ConstraintFamilyMember *", 0, 0, (void*)&SwigPyBuiltin__ConstraintFamilyMember_clientdata, 0};
 static swig_type_info _swigt__p_Evaluator = {"_p_Evaluator", "Evaluator *", 0, 0, (void*)&SwigPyBuiltin__Evaluator_clientdata, 0};
 static swig_type_info _swigt__p_Float = {"_p_Float", "Float *", 0, 0, (void*)&SwigPyBuiltin__Float_clientdata, 0};
 static swig_type_info _swigt__p_IfElseConstraint = {"_p_IfElseConstraint", "IfElseConstraint *", 0, 0, (void*)&SwigPyBuiltin__IfElseConstraint_clientdata, 0};
@@ -9367,13 +11058,18 @@ static swig_type_info _swigt__p_double = {"_p_double", "double *", 0, 0, (void*)
 static swig_type_info _swigt__p_int = {"_p_int", "int *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__mapT_Var_p_std__vectorT_int_t_t = {"_p_std__mapT_Var_p_std__vectorT_int_t_t", "std::map< Var *,std::vector< int > > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t = {"_p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t", "std::map< Var *,std::vector< std::vector< int > > > *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_std__mapT_int_std__vectorT_int_t_t = {"_p_std__mapT_int_std__vectorT_int_t_t", "std::map< int,std::vector< int > > *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_std__setT_ConstraintFamilyMember_p_t = {"_p_std__setT_ConstraintFamilyMember_p_t", "std::set< ConstraintFamilyMember * > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__string = {"_p_std__string", "std::string *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_Leaf_p_t = {"_p_std__vectorT_Leaf_p_t", "std::vector< Leaf * > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_int_t = {"_p_std__vectorT_int_t", "std::vector< int > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_std__vectorT_int_t_t = {"_p_std__vectorT_std__vectorT_int_t_t", "std::vector< std::vector< int > > *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t = {"_p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t", "std::vector< std::vector< std::vector< int > > > *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_Constraint,
+  &_swigt__p_ConstraintFamily,
+  &_swigt__p_ConstraintFamilyMember,
   &_swigt__p_Evaluator,
   &_swigt__p_Float,
   &_swigt__p_IfElseConstraint,
@@ -9387,13 +11083,18 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_int,
   &_swigt__p_std__mapT_Var_p_std__vectorT_int_t_t,
   &_swigt__p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t,
+  &_swigt__p_std__mapT_int_std__vectorT_int_t_t,
+  &_swigt__p_std__setT_ConstraintFamilyMember_p_t,
   &_swigt__p_std__string,
   &_swigt__p_std__vectorT_Leaf_p_t,
   &_swigt__p_std__vectorT_int_t,
   &_swigt__p_std__vectorT_std__vectorT_int_t_t,
+  &_swigt__p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t,
 };
 
 static swig_cast_info _swigc__p_Constraint[] = {  {&_swigt__p_Constraint, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ConstraintFamily[] = {  {&_swigt__p_ConstraintFamily, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_ConstraintFamilyMember[] = {  {&_swigt__p_ConstraintFamilyMember, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Evaluator[] = {  {&_swigt__p_Evaluator, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Float[] = {  {&_swigt__p_Float, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_IfElseConstraint[] = {  {&_swigt__p_IfElseConstraint, 0, 0, 0},{0, 0, 0, 0}};
@@ -9407,13 +11108,18 @@ static swig_cast_info _swigc__p_double[] = {  {&_swigt__p_double, 0, 0, 0},{0, 0
 static swig_cast_info _swigc__p_int[] = {  {&_swigt__p_int, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__mapT_Var_p_std__vectorT_int_t_t[] = {  {&_swigt__p_std__mapT_Var_p_std__vectorT_int_t_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t[] = {  {&_swigt__p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_std__mapT_int_std__vectorT_int_t_t[] = {  {&_swigt__p_std__mapT_int_std__vectorT_int_t_t, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_std__setT_ConstraintFamilyMember_p_t[] = {  {&_swigt__p_std__setT_ConstraintFamilyMember_p_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__string[] = {  {&_swigt__p_std__string, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_Leaf_p_t[] = {  {&_swigt__p_std__vectorT_Leaf_p_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_int_t[] = {  {&_swigt__p_std__vectorT_int_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_std__vectorT_int_t_t[] = {  {&_swigt__p_std__vectorT_std__vectorT_int_t_t, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t[] = {  {&_swigt__p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t, 0, 0, 0},{0, 0, 0, 0}};
 
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_Constraint,
+  _swigc__p_ConstraintFamily,
+  _swigc__p_ConstraintFamilyMember,
   _swigc__p_Evaluator,
   _swigc__p_Float,
   _swigc__p_IfElseConstraint,
@@ -9427,10 +11133,13 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_int,
   _swigc__p_std__mapT_Var_p_std__vectorT_int_t_t,
   _swigc__p_std__mapT_Var_p_std__vectorT_std__vectorT_int_t_t_t,
+  _swigc__p_std__mapT_int_std__vectorT_int_t_t,
+  _swigc__p_std__setT_ConstraintFamilyMember_p_t,
   _swigc__p_std__string,
   _swigc__p_std__vectorT_Leaf_p_t,
   _swigc__p_std__vectorT_int_t,
   _swigc__p_std__vectorT_std__vectorT_int_t_t,
+  _swigc__p_std__vectorT_std__vectorT_std__vectorT_int_t_t_t,
 };
 
 
@@ -10432,6 +12141,52 @@ SWIG_init(void) {
   SwigPyBuiltin_AddPublicSymbol(public_interface, "IfElseConstraint");
   d = md;
   
+  /* type '::ConstraintFamilyMember' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__ConstraintFamilyMember_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'ConstraintFamilyMember'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "ConstraintFamilyMember", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "ConstraintFamilyMember");
+  d = md;
+  
+  /* type '::ConstraintFamily' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__ConstraintFamily_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'ConstraintFamily'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "ConstraintFamily", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "ConstraintFamily");
+  d = md;
+  
   /* type '::Evaluator' */
   builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__Evaluator_type;
   builtin_pytype->tp_dict = d = PyDict_New();
@@ -7,6 +7,7 @@ import wntr.sim.results
 import numpy as np
 import warnings
 import time
+import math
 import sys
 import logging
 import scipy.optimize
@@ -23,14 +24,7 @@ from wntr.network.controls import (AndCondition, Comparison, Control, ControlAct
                                    ControlChangeTracker, ControlChecker, ControlPriority, OrCondition,
                                    RelativeCondition, Rule, SimTimeCondition,
                                    TankLevelCondition, TimeOfDayCondition, ValueCondition,
-                                   _ActiveFCVCondition, _ActivePRVCondition,
-                                   _ActivePSVCondition, _CloseCVCondition,
-                                   _CloseHeadPumpCondition, _ClosePowerPumpCondition,
-                                   _ClosePRVCondition, _ClosePSVCondition, _ControlType,
-                                   _InternalControlAction, _OpenCVCondition,
-                                   _OpenFCVCondition, _OpenHeadPumpCondition,
-                                   _OpenPowerPumpCondition, _OpenPRVCondition,
-                                   _OpenPSVCondition, FunctionCondition, Observer,
+                                   _ControlType, _InternalControlAction, FunctionCondition, Observer,
                                    ControlBase, BaseControlAction)
 from typing import Optional
 import networkx as nx
@@ -590,6 +584,209 @@ class _ValveSourceChecker(Observer):
         return self._cached_results[valve]
 
 
+class _InternalStatusEngine(object):
+    """
+    Evaluates the internal status rules for check valves, pumps, PRVs, PSVs, and FCVs on arrays of heads, flows,
+    and settings. This replaces the individual postsolve controls built from _CloseCVCondition, _OpenPRVCondition,
+    etc., but uses the same logic. Rules that open or activate a link have very low priority (they run before any
+    other postsolve control), and rules that close a link have very high priority (they run after all other
+    postsolve controls). Only the links whose internal status changes are updated.
+
+    The engine can be registered with the ControlChangeTracker and _ValveSourceChecker like a control.
+
+    Parameters
+    ----------
+    wn: wntr.network.WaterNetworkModel
+    """
+    _Htol = 0.0001524  # Head tolerance in meters.
+    _Qtol = 2.83168e-6  # Flow tolerance in m^3/s.
+
+    def __init__(self, wn):
+        self._wn = wn
+
+        cvs = [pipe for pipe_name, pipe in wn.pipes() if pipe.check_valve]
+        head_pumps = []
+        power_pumps = []
+        for pump_name, pump in wn.pumps():
+            if pump.pump_type == 'HEAD':
+                head_pumps.append(pump)
+            elif pump.pump_type == 'POWER':
+                power_pumps.append(pump)
+            else:
+                raise ValueError('Unrecognized pump pump_type: {0}'.format(pump.pump_type))
+        prvs = [valve for valve_name, valve in wn.prvs()]
+        psvs = [valve for valve_name, valve in wn.psvs()]
+        fcvs = [valve for valve_name, valve in wn.fcvs()]
+
+        self._links = cvs + head_pumps + power_pumps + prvs + psvs + fcvs
+        bounds = np.cumsum([0, len(cvs), len(head_pumps), len(power_pumps), len(prvs), len(psvs), len(fcvs)])
+        self._cv = slice(bounds[0], bounds[1])
+        self._pump = slice(bounds[1], bounds[3])
+        self._prv = slice(bounds[3], bounds[4])
+        self._psv = slice(bounds[4], bounds[5])
+        self._fcv = slice(bounds[5], bounds[6])
+        self._valve = slice(bounds[3], bounds[6])
+        self._head_pumps = head_pumps
+        self._valves = prvs + psvs + fcvs
+
+        node_ids = OrderedDict()
+        for link in self._links:
+            node_ids.setdefault(link.start_node, len(node_ids))
+            node_ids.setdefault(link.end_node, len(node_ids))
+        self._nodes = list(node_ids.keys())
+        self._start_index = np.array([node_ids[link.start_node] for link in self._links], dtype=int)
+        self._end_index = np.array([node_ids[link.end_node] for link in self._links], dtype=int)
+        self._tank_link = np.array([isinstance(link.start_node, Tank) or isinstance(link.end_node, Tank)
+                                    for link in self._links], dtype=bool)
+
+        # the PRV setting is relative to the end node elevation; the PSV setting is relative to the start node
+        self._pressure_ref_nodes = [valve.end_node for valve in prvs] + [valve.start_node for valve in psvs]
+        self._r = np.array([8.0 * valve.minor_loss / (9.81 * math.pi**2 * valve.diameter**4) for valve in prvs + psvs],
+                           dtype=float)
+
+        # FCVs are never closed and only valves can be active
+        self._actions = dict()
+        self._actions[int(LinkStatus.Open)] = [
+            _InternalControlAction(link, '_internal_status', LinkStatus.Open, 'status') for link in self._links]
+        self._actions[int(LinkStatus.Closed)] = [
+            _InternalControlAction(link, '_internal_status', LinkStatus.Closed, 'status')
+            for link in self._links[:self._fcv.start]]
+        self._actions[int(LinkStatus.Active)] = [None] * self._valve.start + [
+            _InternalControlAction(link, '_internal_status', LinkStatus.Active, 'status') for link in self._valves]
+
+    def actions(self):
+        """
+        Returns a list of all of the actions the engine may run.
+
+        Returns
+        -------
+        actions: list of _InternalControlAction
+        """
+        return [action for actions in self._actions.values() for action in actions if action is not None]
+
+    def _get_state(self):
+        n = len(self._links)
+        head = np.fromiter((node.head for node in self._nodes), dtype=float, count=len(self._nodes))
+        flow = np.fromiter((link.flow for link in self._links), dtype=float, count=n)
+        status = np.fromiter((link._internal_status for link in self._links), dtype=int, count=n)
+        return head[self._start_index], head[self._end_index], flow, status
+
+    def _pump_max_head(self):
+        hmax = np.full(self._pump.stop - self._pump.start, 1e10)
+        for i, pump in enumerate(self._head_pumps):
+            a, b, c = pump.get_head_curve_coefficients()
+            if pump.speed_timeseries.at(self._wn.sim_time) != 1.0:
+                raise NotImplementedError('Pump speeds other than 1.0 are not yet supported.')
+            hmax[i] = a
+        return hmax
+
+    def _check_valve_status(self, status):
+        bad = np.flatnonzero((status < LinkStatus.Closed) | (status > LinkStatus.Active))
+        if len(bad) > 0:
+            valve = self._valves[bad[0]]
+            raise RuntimeError('Unexpected {0} _internal_status for valve {1}: {2}.'.format(valve.valve_type, valve,
+                                                                                            valve._internal_status))
+
+    def check(self):
+        """
+        Evaluate all of the internal status rules using the current heads, flows, settings, and internal statuses.
+
+        Returns
+        -------
+        open_changes: tuple of (np.ndarray, np.ndarray)
+            The indices of the links that need to be opened or activated (very low priority) and the new internal
+            statuses. Only links whose internal status changes are included.
+        close_links: np.ndarray
+            The indices of the links that need to be closed (very high priority).
+        """
+        Htol = self._Htol
+        Qtol = self._Qtol
+        hs, he, q, status = self._get_state()
+        target = np.full(len(self._links), -1, dtype=int)
+        close = np.zeros(len(self._links), dtype=bool)
+        reverse = q < -Qtol
+
+        # check valves
+        sl = self._cv
+        dh = hs[sl] - he[sl]
+        close[sl] = (dh < -Htol) | reverse[sl]
+        target[sl][(dh > Htol) & ~reverse[sl]] = LinkStatus.Open
+
+        # pumps
+        sl = self._pump
+        dh = he[sl] - hs[sl]
+        hmax = self._pump_max_head() + Htol
+        close[sl] = dh > hmax
+        target[sl][dh <= hmax] = LinkStatus.Open
+
+        if self._valve.stop > self._valve.start:
+            self._check_valve_status(status[self._prv.start:self._psv.stop])
+            setting = np.fromiter((valve.setting for valve in self._valves), dtype=float, count=len(self._valves))
+            elevation = np.fromiter((node.elevation for node in self._pressure_ref_nodes), dtype=float,
+                                    count=len(self._pressure_ref_nodes))
+            n_prv = self._prv.stop - self._prv.start
+            n_psv = self._psv.stop - self._psv.start
+            r = self._r
+
+            # PRVs
+            sl = self._prv
+            h1, h2, flow, s, rev = hs[sl], he[sl], q[sl], status[sl], reverse[sl]
+            p = setting[:n_prv] + elevation[:n_prv]
+            closed = s == LinkStatus.Closed
+            closed_active = closed & (h1 >= p + Htol) & (h2 < p - Htol)
+            close[sl] = ~closed & rev
+            to_open = (((s == LinkStatus.Active) & ~rev & (h1 < p + r[:n_prv] * np.abs(flow)**2 - Htol)) |
+                       (closed & ~closed_active & (h1 < p - Htol) & (h1 > h2 + Htol)))
+            to_active = ((s == LinkStatus.Open) & ~rev & (h2 >= p + Htol)) | closed_active
+            target[sl][to_open] = LinkStatus.Open
+            target[sl][to_active] = LinkStatus.Active
+
+            # PSVs
+            sl = self._psv
+            h1, h2, flow, s, rev = hs[sl], he[sl], q[sl], status[sl], reverse[sl]
+            p = setting[n_prv:n_prv + n_psv] + elevation[n_prv:n_prv + n_psv]
+            closed = s == LinkStatus.Closed
+            closed_open = closed & (h2 > p + Htol) & (h1 > h2 + Htol)
+            close[sl] = ~closed & rev
+            to_open = ((s == LinkStatus.Active) & ~rev & (h2 + r[n_prv:] * np.abs(flow)**2 > p + Htol)) | closed_open
+            to_active = (((s == LinkStatus.Open) & ~rev & (h1 < p - Htol)) |
+                         (closed & ~closed_open & (h1 >= p + Htol) & (h1 > h2 + Htol)))
+            target[sl][to_open] = LinkStatus.Open
+            target[sl][to_active] = LinkStatus.Active
+
+            # FCVs
+            sl = self._fcv
+            to_open = (hs[sl] - he[sl] < -Htol) | reverse[sl]
+            to_active = ~to_open & (status[sl] == LinkStatus.Open) & (q[sl] >= setting[n_prv + n_psv:] + Qtol)
+            target[sl][to_open] = LinkStatus.Open
+            target[sl][to_active] = LinkStatus.Active
+
+        open_links = np.flatnonzero((target >= 0) & (target != status))
+        # links connected to tanks may be opened by the tank controls before the close rules run
+        close_links = np.flatnonzero(close & ((status != LinkStatus.Closed) | self._tank_link))
+        return (open_links, target[open_links]), close_links
+
+    def run_control_actions(self, link_indices, new_status):
+        """
+        Set the internal status of the specified links. Only links whose internal status changes are updated.
+
+        Parameters
+        ----------
+        link_indices: np.ndarray
+            The indices of the links (as returned by check)
+        new_status: LinkStatus or np.ndarray
+            The new internal status for each link
+        """
+        new_status = np.broadcast_to(new_status, np.shape(link_indices))
+        for i, s in zip(link_indices, new_status):
+            i, s = int(i), int(s)
+            link = self._links[i]
+            if link._internal_status != s:
+                if logger.getEffectiveLevel() <= 1:
+                    logger.log(1, '\tsetting {0} _internal_status to {1}'.format(link, LinkStatus(s)))
+                self._actions[s][i].run_control_action()
+
+
 class WNTRSimulator(WaterNetworkSimulator):
     """
     WNTR simulator class.
@@ -627,9 +824,11 @@ class WNTRSimulator(WaterNetworkSimulator):
         self._rules = ControlChecker()
         self._postsolve_controls = ControlChecker()
         self._feasibility_controls = ControlChecker()
+        self._internal_status_engine: Optional[_InternalStatusEngine] = None
         self._change_tracker = ControlChangeTracker()
         self._model_updater = None
         self._rule_iter = 0
+        self._user_control = None  # control actions run between timesteps by a simulation session
 
         # attributes needed for solver
         self._model = None
@@ -642,6 +841,8 @@ class WNTRSimulator(WaterNetworkSimulator):
         # other attributes
         self._hydraulic_timestep = None
         self._report_timestep = None
+        self._first_step = True
+        self._diagnostics = None
 
         self._Htol = 0.0001524  # Head tolerance in meters.
         self._Qtol = 2.83168e-6  # Flow tolerance in m^3/s.
@@ -820,25 +1021,6 @@ class WNTRSimulator(WaterNetworkSimulator):
 
         return tank_controls
 
-    def _get_cv_controls(self):
-        cv_controls = []
-        for pipe_name, pipe in self._wn.pipes():
-            if pipe.check_valve:
-                pipe = self._wn.get_link(pipe_name)
-                open_condition = _OpenCVCondition(self._wn, pipe)
-                close_condition = _CloseCVCondition(self._wn, pipe)
-                open_action = _InternalControlAction(pipe, '_internal_status', LinkStatus.Open, 'status')
-                close_action = _InternalControlAction(pipe, '_internal_status', LinkStatus.Closed, 'status')
-                open_control = Control(condition=open_condition, then_action=open_action, priority=ControlPriority.very_low)
-                close_control = Control(condition=close_condition, then_action=close_action,
-                                        priority=ControlPriority.very_high)
-                open_control._control_type = _ControlType.postsolve
-                close_control._control_type = _ControlType.postsolve
-                cv_controls.append(open_control)
-                cv_controls.append(close_control)
-
-        return cv_controls
-
     def _get_pump_controls(self):
         pump_controls = []
 
@@ -854,30 +1036,6 @@ class WNTRSimulator(WaterNetworkSimulator):
                     new_control = type(control)(condition, new_action, priority=control.priority)
                     pump_controls.append(new_control)
 
-        for pump_name, pump in self._wn.pumps():
-            close_control_action = _InternalControlAction(pump, '_internal_status', LinkStatus.Closed, 'status')
-            open_control_action = _InternalControlAction(pump, '_internal_status', LinkStatus.Open, 'status')
-
-            if pump.pump_type == 'HEAD':
-                close_condition = _CloseHeadPumpCondition(self._wn, pump)
-                open_condition = _OpenHeadPumpCondition(self._wn, pump)
-            elif pump.pump_type == 'POWER':
-                close_condition = _ClosePowerPumpCondition(self._wn, pump)
-                open_condition = _OpenPowerPumpCondition(self._wn, pump)
-            else:
-                raise ValueError('Unrecognized pump pump_type: {0}'.format(pump.pump_type))
-
-            close_control = Control(condition=close_condition, then_action=close_control_action,
-                                    priority=ControlPriority.very_high)
-            open_control = Control(condition=open_condition, then_action=open_control_action,
-                                   priority=ControlPriority.very_low)
-
-            close_control._control_type = _ControlType.postsolve
-            open_control._control_type = _ControlType.postsolve
-
-            pump_controls.append(close_control)
-            pump_controls.append(open_control)
-
         return pump_controls
 
     def _get_valve_controls(self):
@@ -899,61 +1057,6 @@ class WNTRSimulator(WaterNetworkSimulator):
                     valve_controls.append(new_control)
 
         for valve_name, valve in self._wn.valves():
-
-            if valve.valve_type == 'PRV':
-                close_condition = _ClosePRVCondition(self._wn, valve)
-                open_condition = _OpenPRVCondition(self._wn, valve)
-                active_condition = _ActivePRVCondition(self._wn, valve)
-                close_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Closed, 'status')
-                open_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Open, 'status')
-                active_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Active, 'status')
-                close_control = Control(condition=close_condition, then_action=close_action,
-                                        priority=ControlPriority.very_high)
-                open_control = Control(condition=open_condition, then_action=open_action,
-                                       priority=ControlPriority.very_low)
-                active_control = Control(condition=active_condition, then_action=active_action,
-                                         priority=ControlPriority.very_low)
-                close_control._control_type = _ControlType.postsolve
-                open_control._control_type = _ControlType.postsolve
-                active_control._control_type = _ControlType.postsolve
-                valve_controls.append(close_control)
-                valve_controls.append(open_control)
-                valve_controls.append(active_control)
-
-            elif valve.valve_type == 'PSV':
-                close_condition = _ClosePSVCondition(self._wn, valve)
-                open_condition = _OpenPSVCondition(self._wn, valve)
-                active_condition = _ActivePSVCondition(self._wn, valve)
-                close_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Closed, 'status')
-                open_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Open, 'status')
-                active_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Active, 'status')
-                close_control = Control(condition=close_condition, then_action=close_action,
-                                        priority=ControlPriority.very_high)
-                open_control = Control(condition=open_condition, then_action=open_action,
-                                       priority=ControlPriority.very_low)
-                active_control = Control(condition=active_condition, then_action=active_action,
-                                         priority=ControlPriority.very_low)
-                close_control._control_type = _ControlType.postsolve
-                open_control._control_type = _ControlType.postsolve
-                active_control._control_type = _ControlType.postsolve
-                valve_controls.append(close_control)
-                valve_controls.append(open_control)
-                valve_controls.append(active_control)
-
-            elif valve.valve_type == 'FCV':
-                open_condition = _OpenFCVCondition(self._wn, valve)
-                active_condition = _ActiveFCVCondition(self._wn, valve)
-                open_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Open, 'status')
-                active_action = _InternalControlAction(valve, '_internal_status', LinkStatus.Active, 'status')
-                open_control = Control(condition=open_condition, then_action=open_action,
-                                       priority=ControlPriority.very_low)
-                active_control = Control(condition=active_condition, then_action=active_action,
-                                         priority=ControlPriority.very_low)
-                open_control._control_type = _ControlType.postsolve
-                active_control._control_type = _ControlType.postsolve
-                valve_controls.append(open_control)
-                valve_controls.append(active_control)
-
             if valve.valve_type in {'PSV', 'PRV', 'FCV'}:
                 active_condition = ValueCondition(source_obj=valve, source_attr='status', relation=Comparison.eq,
                                                   threshold=LinkStatus.Active)
@@ -973,6 +1076,11 @@ class WNTRSimulator(WaterNetworkSimulator):
             for control in mgr._controls:
                 self._valve_source_checker.register_control(control)
                 self._change_tracker.register_control(control)
+        self._valve_source_checker.register_control(self._internal_status_engine)
+        self._change_tracker.register_control(self._internal_status_engine)
+        if self._user_control is not None:
+            self._valve_source_checker.register_control(self._user_control)
+            self._change_tracker.register_control(self._user_control)
 
     def _get_control_managers(self):
         self._presolve_controls = ControlChecker()
@@ -995,8 +1103,7 @@ class WNTRSimulator(WaterNetworkSimulator):
             categorize_control(c)
         for c in self._get_all_tank_controls():
             categorize_control(c)
-        for c in self._get_cv_controls():
-            categorize_control(c)
+        self._internal_status_engine = _InternalStatusEngine(self._wn)
         for c in self._get_pump_controls():
             categorize_control(c)
         for c in self._get_valve_controls():
@@ -1177,10 +1284,14 @@ class WNTRSimulator(WaterNetworkSimulator):
         logger.debug('checking postsolve controls')
         postsolve_controls_to_run = self._postsolve_controls.check()
         postsolve_controls_to_run.sort(key=lambda i: i[0]._priority)
+        # all conditions are evaluated before any actions are run
+        (open_links, open_status), close_links = self._internal_status_engine.check()
+        self._internal_status_engine.run_control_actions(open_links, open_status)
         for control, unused in postsolve_controls_to_run:
             if logger.getEffectiveLevel() <= 1:
                 logger.log(1, '\tactivating control {0}'.format(control))
             control.run_control_action()
+        self._internal_status_engine.run_control_actions(close_links, LinkStatus.Closed)
         if logger.getEffectiveLevel() <= logging.DEBUG:
             logger.debug('postsolve controls made changes:')
             for obj, attr in self._change_tracker.get_changes(ref_point='postsolve'):
@@ -1189,7 +1300,7 @@ class WNTRSimulator(WaterNetworkSimulator):
 
     def run_sim(self, solver=NewtonSolver, backup_solver=None, solver_options=None,
                 backup_solver_options=None, convergence_error=False, HW_approx='default',
-                diagnostics=False):
+                diagnostics=False, results_store=None):
 
         """
         Run an extended period simulation (hydraulics only).
@@ -1213,15 +1324,78 @@ class WNTRSimulator(WaterNetworkSimulator):
             see the WNTR documentation on hydraulics for details.
         diagnostics: bool
             If True, then run with diagnostics on
+        results_store: ResultsStore (optional)
+            If provided, results are written to the 
+            :class:`~wntr.sim.results.ResultsStore` in chunks while the 
+            simulation runs, and the returned results are loaded from the store 
+            on demand
+        """
+        self._initialize_simulation(solver=solver, backup_solver=backup_solver, solver_options=solver_options,
+                                    backup_solver_options=backup_solver_options, convergence_error=convergence_error,
+                                    HW_approx=HW_approx, diagnostics=diagnostics)
+
+        node_res, link_res = wntr.sim.hydraulics.initialize_results_dict(self._wn)
+        results = wntr.sim.results.SimulationResults()
+        results.error_code = None
+        results.time = []
+        results.network_name = self._wn.name
+        num_stored = 0
+
+        logger.debug('starting simulation')
+
+        logger.info('{0:<10}{1:<10}{2:<10}{3:<15}{4:<15}'.format('Sim Time', 'Trial', 'Solver', '# isolated', '# isolated'))
+        logger.info('{0:<10}{1:<10}{2:<10}{3:<15}{4:<15}'.format('', '', '# iter', 'junctions', 'links'))
+        while True:
+            if not self._solve_timestep():
+                results.error_code = wntr.sim.results.ResultsStatus.error
+                break
+
+            if isinstance(self._report_timestep, (float, int)):
+                if self._wn.sim_time % self._report_timestep == 0:
+                    wntr.sim.hydraulics.save_results(self._wn, node_res, link_res)
+                    if len(results.time) > 0 and int(self._wn.sim_time) == results.time[-1]:
+                        if int(self._wn.sim_time) != self._wn.sim_time:
+                            raise RuntimeError('Time steps increments smaller than 1 second are forbidden.'+
+                                               ' Keep time steps as an integer number of seconds.')
+                        else:
+                            raise RuntimeError('Simulation already solved this timestep')
+                    results.time.append(int(self._wn.sim_time))
+            elif self._report_timestep.upper() == 'ALL':
+                wntr.sim.hydraulics.save_results(self._wn, node_res, link_res)
+                if len(results.time) > 0 and int(self._wn.sim_time) == results.time[-1]:
+                    raise RuntimeError('Simulation already solved this timestep')
+                results.time.append(int(self._wn.sim_time))
+            if results_store is not None and len(results.time) - num_stored >= results_store.chunk_size:
+                self._append_to_results_store(results_store, results.time[num_stored:], node_res, link_res)
+                num_stored = len(results.time)
+            self._advance_time()
+
+            if self._wn.sim_time > self._wn.options.time.duration:
+                break
+
+        if results_store is None:
+            wntr.sim.hydraulics.get_results(self._wn, results, node_res, link_res)
+        else:
+            self._append_to_results_store(results_store, results.time[num_stored:], node_res, link_res)
+            results_store.set_info(network_name=results.network_name, error_code=results.error_code)
+            results = results_store.to_results()
+        
+        return results
+
+    def _initialize_simulation(self, solver=NewtonSolver, backup_solver=None, solver_options=None,
+                               backup_solver_options=None, convergence_error=False, HW_approx='default',
+                               diagnostics=False):
+        """
+        Build the hydraulic model and controls and prepare the network for the first timestep.
         """
         logger.debug('creating hydraulic model')
         self.mode = self._wn.options.hydraulic.demand_model
         self._model, self._model_updater = wntr.sim.hydraulics.create_hydraulic_model(wn=self._wn, HW_approx=HW_approx)
 
         if diagnostics:
-            diagnostics = _Diagnostics(self._wn, self._model, self.mode, enable=True)
+            self._diagnostics = _Diagnostics(self._wn, self._model, self.mode, enable=True)
         else:
-            diagnostics = _Diagnostics(self._wn, self._model, self.mode, enable=False)
+            self._diagnostics = _Diagnostics(self._wn, self._model, self.mode, enable=False)
 
         self._setup_sim_options(solver=solver, backup_solver=backup_solver, solver_options=solver_options,
                                 backup_solver_options=backup_solver_options, convergence_error=convergence_error)
@@ -1230,53 +1404,53 @@ class WNTRSimulator(WaterNetworkSimulator):
         self._get_control_managers()
         self._register_controls_with_observers()
 
-        node_res, link_res = wntr.sim.hydraulics.initialize_results_dict(self._wn)
-        results = wntr.sim.results.SimulationResults()
-        results.error_code = None
-        results.time = []
-        results.network_name = self._wn.name
-
         self._initialize_internal_graph()
         self._change_tracker.set_reference_point('graph')
         self._change_tracker.set_reference_point('model')
 
         if self._wn.sim_time == 0:
-            first_step = True
+            self._first_step = True
         else:
-            first_step = False
-        trial = -1
-        max_trials = self._wn.options.hydraulic.trials
-        resolve = False
+            self._first_step = False
         self._rule_iter = 0  # this is used to determine the rule timestep
 
-        if first_step:
+        if self._first_step:
             wntr.sim.hydraulics.update_network_previous_values(self._wn)
             self._wn._prev_sim_time = -1
 
-        logger.debug('starting simulation')
+    def _solve_timestep(self):
+        """
+        Run the controls and rules and solve the hydraulics at the next timestep, resolving until 
+        the postsolve controls make no more changes. The results are stored in the network.
 
-        logger.info('{0:<10}{1:<10}{2:<10}{3:<15}{4:<15}'.format('Sim Time', 'Trial', 'Solver', '# isolated', '# isolated'))
-        logger.info('{0:<10}{1:<10}{2:<10}{3:<15}{4:<15}'.format('', '', '# iter', 'junctions', 'links'))
+        Returns
+        -------
+        bool
+            False if the solver did not converge or the maximum number of trials was exceeded
+        """
+        diagnostics = self._diagnostics
+        max_trials = self._wn.options.hydraulic.trials
+        resolve = False
         while True:
             if logger.getEffectiveLevel() <= logging.DEBUG:
                 logger.debug('\n\n')
 
             if not resolve:
-                if not first_step:
+                if not self._first_step:
                     """
                     The tank levels/heads must be done before checking the controls because the TankLevelControls
                     depend on the tank levels. These will be updated again after we determine the next actual timestep.
                     """
                     wntr.sim.hydraulics.update_tank_heads(self._wn)
                 trial = 0
-                self._compute_next_timestep_and_run_presolve_controls_and_rules(first_step)
+                self._compute_next_timestep_and_run_presolve_controls_and_rules(self._first_step)
 
             self._run_feasibility_controls()
 
             # Prepare for solve
             self._update_internal_graph()
             num_isolated_junctions, num_isolated_links = self._get_isolated_junctions_and_links()
-            if not first_step and not resolve:
+            if not self._first_step and not resolve:
                 wntr.sim.hydraulics.update_tank_heads(self._wn)
             wntr.sim.hydraulics.update_model_for_controls(self._model, self._wn, self._model_updater, self._change_tracker)
             wntr.sim.models.param.source_head_param(self._model, self._wn)
@@ -1293,9 +1467,8 @@ class WNTRSimulator(WaterNetworkSimulator):
                     raise RuntimeError('Simulation did not converge at time ' + self._get_time() + '. ' + mesg)
                 warnings.warn('Simulation did not converge at time ' + self._get_time() + '. ' + mesg)
                 logger.warning('Simulation did not converge at time ' + self._get_time() + '. ' + mesg)
-                results.error_code = wntr.sim.results.ResultsStatus.error
                 diagnostics.run(last_step='solve', next_step='break')
-                break
+                return False
 
             logger.info('{0:<10}{1:<10}{2:<10}{3:<15}{4:<15}'.format(self._get_time(), trial, iter_count, num_isolated_junctions, num_isolated_links))
 
@@ -1314,47 +1487,32 @@ class WNTRSimulator(WaterNetworkSimulator):
                 diagnostics.run(last_step='postsolve controls and model updates', next_step='solve next trial')
                 trial += 1
                 if trial > max_trials:
-                    if convergence_error:
+                    if self._convergence_error:
                         logger.error('Exceeded maximum number of trials at time ' + self._get_time() + '. ') 
                         raise RuntimeError('Exceeded maximum number of trials at time ' + self._get_time() + '. ' ) 
-                    results.error_code = wntr.sim.results.ResultsStatus.error
                     warnings.warn('Exceeded maximum number of trials at time ' + self._get_time() + '. ') 
                     logger.warning('Exceeded maximum number of trials at time ' + self._get_time() + '. ' ) 
-                    break
+                    return False
                 continue
 
             diagnostics.run(last_step='postsolve controls and model updates', next_step='advance time')
 
             logger.debug('no changes made by postsolve controls; moving to next timestep')
+            return True
 
-            resolve = False
-            if isinstance(self._report_timestep, (float, int)):
-                if self._wn.sim_time % self._report_timestep == 0:
-                    wntr.sim.hydraulics.save_results(self._wn, node_res, link_res)
-                    if len(results.time) > 0 and int(self._wn.sim_time) == results.time[-1]:
-                        if int(self._wn.sim_time) != self._wn.sim_time:
-                            raise RuntimeError('Time steps increments smaller than 1 second are forbidden.'+
-                                               ' Keep time steps as an integer number of seconds.')
-                        else:
-                            raise RuntimeError('Simulation already solved this timestep')
-                    results.time.append(int(self._wn.sim_time))
-            elif self._report_timestep.upper() == 'ALL':
-                wntr.sim.hydraulics.save_results(self._wn, node_res, link_res)
-                if len(results.time) > 0 and int(self._wn.sim_time) == results.time[-1]:
-                    raise RuntimeError('Simulation already solved this timestep')
-                results.time.append(int(self._wn.sim_time))
-            wntr.sim.hydraulics.update_network_previous_values(self._wn)
-            first_step = False
-            self._wn.sim_time += self._hydraulic_timestep
-            overstep = float(self._wn.sim_time) % self._hydraulic_timestep
-            self._wn.sim_time -= overstep
-
-            if self._wn.sim_time > self._wn.options.time.duration:
-                break
-
-        wntr.sim.hydraulics.get_results(self._wn, results, node_res, link_res)
-        
-        return results
+    def _advance_time(self):
+        """
+        Update the previous values in the network and move the simulation time to the next hydraulic timestep.
+        """
+        wntr.sim.hydraulics.update_network_previous_values(self._wn)
+        self._first_step = False
+        self._wn.sim_time += self._hydraulic_timestep
+        overstep = float(self._wn.sim_time) % self._hydraulic_timestep
+        self._wn.sim_time -= overstep
+
+    def _append_to_results_store(self, results_store, time, node_res, link_res):
+        node_names, node_arrays, link_names, link_arrays = wntr.sim.hydraulics.get_results_arrays(self._wn, node_res, link_res)
+        results_store.append(time, node_arrays, link_arrays, node_names=node_names, link_names=link_names)
 
     def _initialize_name_id_maps(self):
         n = 0
@@ -1,9 +1,16 @@
 """The EPANET simulator.
 """
 
-from wntr.sim.core import WaterNetworkSimulator
+from wntr.sim.core import WaterNetworkSimulator, WNTRSimulator
 from wntr.network.io import write_inpfile
 import wntr.epanet
+from wntr.epanet.util import EN, FlowUnits, HydParam, MassUnits, QualParam, from_si, to_si
+from wntr.network.controls import Comparison, SimTimeCondition
+from wntr.network.elements import Junction
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import numpy as np
+import pandas as pd
 import warnings
 import logging
 
@@ -65,7 +72,7 @@ class EpanetSimulator(WaterNetworkSimulator):
             self.reader = wntr.epanet.io.BinFile(result_types=result_types)
 
     def run_sim(self, file_prefix='temp', save_hyd=False, use_hyd=False, hydfile=None, 
-                version=2.2, convergence_error=False):
+                version=2.2, convergence_error=False, results_store=None):
 
         """
         Run the EPANET simulator.
@@ -73,6 +80,12 @@ class EpanetSimulator(WaterNetworkSimulator):
         Runs the EPANET simulator through the compiled toolkit DLL. Can use/save hydraulics
         to allow for separate WQ runs. 
 
+        Junction leaks are modeled as emitters, see :func:`leak_emitters`. 
+        The hydraulics are then solved one timestep at a time so that emitters 
+        change when leaks start and end, and the results include leak demand.
+        Leaks that cannot be translated to emitters, and all leaks when a 
+        results store is used, are not modeled and a warning is issued.
+
         .. note:: 
 
             By default, WNTR now uses the EPANET 2.2 toolkit as the engine for the EpanetSimulator.
@@ -99,9 +112,22 @@ class EpanetSimulator(WaterNetworkSimulator):
             simulation does not converge. If convergence_error is False, partial results are returned, 
             a warning will be issued, and results.error_code will be set to 0
             if the simulation does not converge.  Default = False.
+        results_store: ResultsStore (optional)
+            If provided, results are read from the EPANET binary output file
+            in chunks and written to the :class:`~wntr.sim.results.ResultsStore`, 
+            and the returned results are loaded from the store on demand. 
+            Not supported for models that include MSX.
         """
+        if results_store is not None and self._wn._msx is not None:
+            raise NotImplementedError('A results store cannot be used with MSX models')
         if isinstance(version, str):
             version = float(version)
+        leaks = leak_emitters(self._wn, errors='warn')
+        if results_store is not None and len(leaks) > 0:
+            msg = 'Leaks are not modeled by the EpanetSimulator when a results store is used'
+            logger.warning(msg)
+            warnings.warn(msg)
+            leaks = leaks.iloc[0:0]
         inpfile = file_prefix + '.inp'
         write_inpfile(self._wn, inpfile, units=self._wn.options.hydraulic.inpfile_units, version=version)
         enData = wntr.epanet.toolkit.ENepanet(version=version)
@@ -116,6 +142,10 @@ class EpanetSimulator(WaterNetworkSimulator):
         if use_hyd:
             enData.ENusehydfile(hydfile)
             logger.debug('Loaded hydraulics')
+        elif len(leaks) > 0:
+            flow_units = FlowUnits[self._wn.options.hydraulic.inpfile_units.upper()]
+            _LeakEmitterSchedule(enData, self._wn, leaks, flow_units).solve_hydraulics(enData)
+            logger.debug('Solved hydraulics with leak emitters')
         else:
             enData.ENsolveH()
             logger.debug('Solved hydraulics')
@@ -130,7 +160,17 @@ class EpanetSimulator(WaterNetworkSimulator):
         logger.debug('Completed run')
         #os.sys.stderr.write('Finished Closing\n')
         
-        results = self.reader.read(outfile, convergence_error, self._wn.options.hydraulic.headloss=='D-W')
+        if results_store is None:
+            results = self.reader.read(outfile, convergence_error, self._wn.options.hydraulic.headloss=='D-W')
+        else:
+            results = self.reader.read(outfile, convergence_error, self._wn.options.hydraulic.headloss=='D-W',
+                                       results_store=results_store)
+        if len(leaks) > 0:
+            leak_demand = pd.DataFrame(0.0, index=results.node['pressure'].index,
+                                       columns=results.node['pressure'].columns)
+            leak_demand[leaks.index] = _leak_demand(leaks, leak_demand.index, results.node['pressure'][leaks.index])
+            results.node['demand'] = results.node['demand'] - leak_demand
+            results.node['leak_demand'] = leak_demand
 
         if self._wn._msx is not None:
             # Attributed to Matthew's package
@@ -155,3 +195,517 @@ class EpanetSimulator(WaterNetworkSimulator):
 
         return results
 
+    def run_quality_ensemble(self, scenarios, file_prefix='temp', use_hyd=False, hydfile=None,
+                             version=2.2, num_workers=1):
+        """
+        Run an ensemble of water quality simulations that share the same hydraulics.
+
+        The INP file is written and the hydraulics are solved (or loaded from 
+        a hydraulics file) once. Each scenario then changes sources through 
+        the EPANET toolkit and reruns the water quality simulation, 
+        without writing or reading files.  Scenarios can be split between 
+        worker processes which load the same hydraulics file.
+
+        The water quality parameter must be CHEMICAL. Sources in the water 
+        network model are included in every scenario, a scenario source 
+        at the same node replaces the model source for that scenario.
+
+        Parameters
+        ----------
+        scenarios : list of lists
+            Sources for each scenario. Each source is a tuple of 
+            (node_name, source_type, strength) or (node_name, source_type, 
+            strength, pattern_name), with the same arguments and units as 
+            :class:`~wntr.network.model.WaterNetworkModel.add_source`. 
+            The pattern must be defined in the water network model.
+        file_prefix : str
+            Default prefix is "temp". The .inp, .hyd and .rpt files use this prefix
+        use_hyd : bool
+            Load hydraulics from ``file_prefix + '.hyd'`` or from `hydfile`, 
+            for example, saved by :meth:`run_sim` with ``save_hyd=True``
+        hydfile : str
+            Optionally specify a filename for the hydraulics file other than the `file_prefix`
+        version : float
+            {2.0, **2.2**} Optionally change the version of the EPANET toolkit libraries.
+        num_workers : int
+            Number of worker processes, by default 1 (no worker processes)
+
+        Returns
+        -------
+        numpy array
+            Node quality (kg/m3) with shape (scenarios, report times, nodes).
+            Report times start at ``wn.options.time.report_start`` and nodes 
+            are ordered by ``wn.node_name_list``.
+        """
+        if str(self._wn.options.quality.parameter).upper() != 'CHEMICAL':
+            raise ValueError('The quality parameter must be CHEMICAL to run a quality ensemble')
+        if isinstance(version, str):
+            version = float(version)
+        inpfile = file_prefix + '.inp'
+        flow_units = FlowUnits[self._wn.options.hydraulic.inpfile_units.upper()]
+        write_inpfile(self._wn, inpfile, units=flow_units, version=version)
+        if hydfile is None:
+            hydfile = file_prefix + '.hyd'
+
+        enData = wntr.epanet.toolkit.ENepanet(version=version)
+        enData.ENopen(inpfile, file_prefix + '.rpt', '')
+        try:
+            if use_hyd:
+                enData.ENusehydfile(hydfile)
+                logger.debug('Loaded hydraulics')
+            else:
+                enData.ENsolveH()
+                logger.debug('Solved hydraulics')
+                if num_workers > 1:
+                    enData.ENsavehydfile(hydfile)
+                    logger.debug('Saved hydraulics')
+
+            # Source changes use toolkit indices and EPANET units
+            base_sources = {}
+            for name, source in self._wn.sources():
+                base_sources[enData.ENgetnodeindex(source.node_name)] = \
+                    self._toolkit_source(enData, flow_units, source.source_type,
+                                         source.strength_timeseries.base_value,
+                                         source.strength_timeseries.pattern_name)
+            toolkit_scenarios = []
+            for scenario in scenarios:
+                toolkit_scenario = {}
+                for source in scenario:
+                    node_name, source_type, strength = source[0:3]
+                    pattern_name = source[3] if len(source) > 3 else None
+                    toolkit_scenario[enData.ENgetnodeindex(node_name)] = \
+                        self._toolkit_source(enData, flow_units, source_type, strength, pattern_name)
+                toolkit_scenarios.append(toolkit_scenario)
+
+            # Toolkit node order can differ from wn.node_name_list (e.g., nodes added after loading)
+            order = np.array([enData.ENgetnodeindex(name) - 1 for name in self._wn.node_name_list], dtype=int)
+
+            times = self._wn.options.time
+            report = (int(times.report_start), int(times.report_timestep),
+                      int((times.duration - times.report_start) // times.report_timestep) + 1)
+
+            if num_workers > 1 and len(scenarios) > 1:
+                chunks = [list(chunk) for chunk in np.array_split(np.arange(len(scenarios)), num_workers) if len(chunk) > 0]
+                with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                    futures = [executor.submit(_run_quality_scenarios, inpfile, hydfile, 
+                                               file_prefix + '_' + str(i) + '.rpt', version, flow_units,
+                                               base_sources, [toolkit_scenarios[j] for j in chunk], report, order)
+                               for i, chunk in enumerate(chunks)]
+                    quality = np.concatenate([future.result() for future in futures], axis=0)
+            else:
+                quality = _solve_quality_scenarios(enData, flow_units, base_sources, toolkit_scenarios, report,
+                                                   order)
+        finally:
+            enData.ENclose()
+        return quality
+
+    def run_msx_ensemble(self, scenarios, file_prefix='temp', use_hyd=False, hydfile=None, version=2.2):
+        """
+        Run an ensemble of multi-species water quality simulations with EPANET-MSX.
+
+        The INP and MSX files are written and the hydraulics are solved (or 
+        loaded from a hydraulics file) once. A single EPANET-MSX project is 
+        then kept open; each scenario changes constants, parameters, initial 
+        quality, and sources through the toolkit, and species concentrations 
+        are collected at each report time with ``MSXstep`` and ``MSXgetqual``. 
+        Binary and report files are not written or read. Values changed by a 
+        scenario are reset to the values in the MSX model before the next scenario.
+
+        Parameters
+        ----------
+        scenarios : list of dict
+            Changes for each scenario. Each dictionary can include the following keys, 
+            values use the units of the MSX model:
+
+            - ``'constants'``: dict of constant values, keyed by constant name
+            - ``'parameters'``: dict of parameter values, keyed by parameter name (all 
+              pipes and tanks) or by a tuple of (parameter_name, pipe_or_tank_name)
+            - ``'initial_quality'``: dict of initial concentrations, keyed by species name 
+              (all nodes and links) or by a tuple of (species_name, node_name)
+            - ``'sources'``: list of tuples (node_name, species_name, source_type, strength) 
+              or (node_name, species_name, source_type, strength, pattern_name), where the 
+              pattern is defined in the MSX model
+        file_prefix : str
+            Default prefix is "temp". The .inp, .msx, .hyd and .rpt files use this prefix
+        use_hyd : bool
+            Load hydraulics from ``file_prefix + '.hyd'`` or from `hydfile`
+        hydfile : str
+            Optionally specify a filename for the hydraulics file other than the `file_prefix`
+        version : float
+            {2.0, **2.2**} Optionally change the version of the EPANET toolkit libraries.
+
+        Returns
+        -------
+        dict
+            Species concentrations with keys ``'node'`` and ``'link'``, each a dictionary 
+            of numpy arrays keyed by species name. Node arrays have shape 
+            (scenarios, report times, nodes) ordered by ``wn.node_name_list``, link 
+            arrays have shape (scenarios, report times, links) ordered by ``wn.link_name_list``.
+        """
+        if self._wn._msx is None:
+            raise ValueError('The water network model does not include an MSX model')
+        if isinstance(version, str):
+            version = float(version)
+        inpfile = file_prefix + '.inp'
+        write_inpfile(self._wn, inpfile, units=self._wn.options.hydraulic.inpfile_units, version=version)
+        if hydfile is None:
+            hydfile = file_prefix + '.hyd'
+        if not use_hyd:
+            enData = wntr.epanet.toolkit.ENepanet(version=version)
+            enData.ENopen(inpfile, file_prefix + '.rpt', '')
+            enData.ENsolveH()
+            enData.ENsavehydfile(hydfile)
+            enData.ENclose()
+            logger.debug('Solved hydraulics')
+
+        msxfile = file_prefix + '.msx'
+        wntr.epanet.msx.io.MsxFile.write(msxfile, self._wn._msx)
+        msx = wntr.epanet.msx.MSXepanet(inpfile, file_prefix + '.msx-rpt', '', msxfile)
+        msx.ENopen(inpfile, file_prefix + '.msx-rpt', '')
+        try:
+            msx.MSXopen(msxfile)
+            try:
+                msx.MSXusehydfile(hydfile)
+                quality = _solve_msx_scenarios(msx, self._wn, scenarios)
+            finally:
+                msx.MSXclose()
+        finally:
+            msx.ENclose()
+        return quality
+
+    @staticmethod
+    def _toolkit_source(enData, flow_units, source_type, strength, pattern_name):
+        source_type = str(source_type).upper()
+        if source_type == 'MASS':
+            strength = from_si(flow_units, strength, QualParam.SourceMassInject, mass_units=MassUnits.mg)
+        else:
+            strength = from_si(flow_units, strength, QualParam.Concentration, mass_units=MassUnits.mg)
+        pattern = 0 if pattern_name is None else enData.ENgetpatternindex(pattern_name)
+        return (int(EN[source_type]), float(strength), pattern)
+
+
+def _set_toolkit_source(enData, node_index, source):
+    source_type, strength, pattern = source
+    enData.ENsetnodevalue(node_index, EN.SOURCETYPE, source_type)
+    enData.ENsetnodevalue(node_index, EN.SOURCEQUAL, strength)
+    enData.ENsetnodevalue(node_index, EN.SOURCEPAT, pattern)
+
+
+def _solve_quality_scenarios(enData, flow_units, base_sources, scenarios, report, order):
+    """Run water quality scenarios on an open EPANET project with hydraulics, 
+    node quality is reordered from toolkit index order using `order`"""
+    report_start, report_timestep, num_reports = report
+    num_nodes = enData.ENgetcount(EN.NODECOUNT)
+    quality = np.zeros((len(scenarios), num_reports, num_nodes))
+    values = np.zeros(num_nodes)
+    enData.ENopenQ()
+    for i, scenario in enumerate(scenarios):
+        for node_index, source in scenario.items():
+            _set_toolkit_source(enData, node_index, source)
+        enData.ENinitQ(0)
+        while True:
+            t = enData.ENrunQ()
+            if t >= report_start and (t - report_start) % report_timestep == 0:
+                k = (t - report_start) // report_timestep
+                if k < num_reports:
+                    enData.ENgetnodevalues(EN.QUALITY, values)
+                    quality[i, k] = values[order]
+            if enData.ENnextQ() <= 0:
+                break
+        for node_index in scenario.keys():
+            _set_toolkit_source(enData, node_index, base_sources.get(node_index, (int(EN.CONCEN), 0.0, 0)))
+    enData.ENcloseQ()
+    return to_si(flow_units, quality, QualParam.Concentration, mass_units=MassUnits.mg)
+
+
+def _run_quality_scenarios(inpfile, hydfile, rptfile, version, flow_units, base_sources, scenarios, report, order):
+    """Worker process that loads saved hydraulics and runs water quality scenarios"""
+    enData = wntr.epanet.toolkit.ENepanet(version=version)
+    enData.ENopen(inpfile, rptfile, '')
+    try:
+        enData.ENusehydfile(hydfile)
+        return _solve_quality_scenarios(enData, flow_units, base_sources, scenarios, report, order)
+    finally:
+        enData.ENclose()
+
+
+def _solve_msx_scenarios(msx, wn, scenarios):
+    """Run multi-species water quality scenarios on an open EPANET-MSX project"""
+    from wntr.epanet.msx.enums import TkObjectType
+
+    num_species = msx.MSXgetcount(TkObjectType.SPECIES)
+    species = {msx.MSXgetID(TkObjectType.SPECIES, i): i for i in range(1, num_species + 1)}
+    # Toolkit indices can differ from the position in wn.node_name_list and wn.link_name_list
+    node_index = {name: msx.ENgetnodeindex(name) for name in wn.node_name_list}
+    link_index = {name: msx.ENgetlinkindex(name) for name in wn.link_name_list}
+    node_order = list(node_index.values())
+    link_order = list(link_index.values())
+    tank_index = [node_index[name] for name in wn.tank_name_list]
+    pipe_index = [link_index[name] for name in wn.pipe_name_list]
+    num_nodes = len(node_index)
+    num_links = len(link_index)
+
+    times = wn.options.time
+    report_start = int(times.report_start)
+    report_timestep = int(times.report_timestep)
+    num_reports = int((times.duration - report_start) // report_timestep) + 1
+    node_quality = {name: np.zeros((len(scenarios), num_reports, num_nodes)) for name in species}
+    link_quality = {name: np.zeros((len(scenarios), num_reports, num_links)) for name in species}
+
+    # Each change is stored as (getter, setter, args) so the MSX model value can be restored
+    def constant(name):
+        i = msx.MSXgetindex(TkObjectType.CONSTANT, name)
+        return msx.MSXgetconstant, msx.MSXsetconstant, (i,)
+
+    def parameter(name, element=None):
+        i = msx.MSXgetindex(TkObjectType.PARAMETER, name)
+        if element is None:
+            elements = [(TkObjectType.NODE, j) for j in tank_index] + [(TkObjectType.LINK, j) for j in pipe_index]
+        elif element in wn.tank_name_list:
+            elements = [(TkObjectType.NODE, node_index[element])]
+        elif element in wn.pipe_name_list:
+            elements = [(TkObjectType.LINK, link_index[element])]
+        else:
+            raise KeyError('Parameter values can only be set for pipes and tanks, ' + str(element))
+        return [(msx.MSXgetparameter, msx.MSXsetparameter, (t, j, i)) for t, j in elements]
+
+    def initial_quality(name, node=None):
+        i = species[name]
+        if node is None:
+            elements = [(TkObjectType.NODE, j) for j in node_order] + [(TkObjectType.LINK, j) for j in link_order]
+        else:
+            elements = [(TkObjectType.NODE, node_index[node])]
+        return [(msx.MSXgetinitqual, msx.MSXsetinitqual, (t, j, i)) for t, j in elements]
+
+    def source(node, name):
+        getter = lambda j, i: tuple(msx.MSXgetsource(j, i))
+        setter = lambda j, i, value: msx.MSXsetsource(j, i, *value)
+        return getter, setter, (node_index[node], species[name])
+
+    for k, scenario in enumerate(scenarios):
+        changes = []
+        for name, value in scenario.get('constants', {}).items():
+            changes.append((constant(name), value))
+        for key, value in scenario.get('parameters', {}).items():
+            key = key if isinstance(key, tuple) else (key,)
+            changes.extend((change, value) for change in parameter(*key))
+        for key, value in scenario.get('initial_quality', {}).items():
+            key = key if isinstance(key, tuple) else (key,)
+            changes.extend((change, value) for change in initial_quality(*key))
+        for src in scenario.get('sources', []):
+            node, name, source_type, strength = src[0:4]
+            pattern = msx.MSXgetindex(TkObjectType.PATTERN, src[4]) if len(src) > 4 and src[4] is not None else 0
+            changes.append((source(node, name), (source_type, strength, pattern)))
+
+        base_values = []
+        for (getter, setter, args), value in changes:
+            base_values.append(getter(*args))
+            setter(*args, value)
+
+        msx.MSXinit(0)
+        t = 0
+        r = 0
+        while True:
+            while r < num_reports and t >= report_start + r * report_timestep:
+                for name, i in species.items():
+                    node_quality[name][k, r, :] = [msx.MSXgetqual(TkObjectType.NODE, j, i) for j in node_order]
+                    link_quality[name][k, r, :] = [msx.MSXgetqual(TkObjectType.LINK, j, i) for j in link_order]
+                r += 1
+            if r >= num_reports:
+                break
+            t, tleft = msx.MSXstep()
+            if tleft <= 0 and t < report_start + r * report_timestep:
+                break
+
+        for ((getter, setter, args), value), base_value in reversed(list(zip(changes, base_values))):
+            setter(*args, base_value)
+
+    return {'node': node_quality, 'link': link_quality}
+
+
+def leak_emitters(wn, errors='raise'):
+    """
+    Translate junction leaks into EPANET emitter coefficients.
+
+    A leak at a junction, Q = discharge_coeff*area*sqrt(2*g*p), is equivalent
+    to an emitter with exponent 0.5 and coefficient discharge_coeff*area*sqrt(2*g). 
+    The leak start and end times are taken from the initial leak status and the
+    simulation time controls added by :meth:`~wntr.network.elements.Junction.add_leak`.
+    Pressure dependent demands are translated by the INP file writer 
+    (DEMAND MODEL PDA) and do not need to be changed.
+
+    Parameters
+    ----------
+    wn : WaterNetworkModel
+        Water network model
+    errors : str
+        If 'raise' (default), leaks that cannot be translated raise an exception. 
+        If 'warn', a warning is issued and those leaks are not included.
+
+    Returns
+    -------
+    pandas DataFrame
+        Emitter coefficient (m3/s/m^0.5) of each leak, start time (s) and end time (s, 
+        infinite if the leak does not end), indexed by junction name. Junction emitter 
+        coefficients are not included.
+
+    Raises
+    ------
+    NotImplementedError
+        If a tank has a leak or a leak status is changed by a control that is not a simulation time control
+    ValueError
+        If the model has leaks and the emitter exponent is not 0.5
+    """
+    if errors not in ['raise', 'warn']:
+        raise ValueError("errors must be 'raise' or 'warn'")
+
+    def unsupported(exception, msg):
+        if errors == 'raise':
+            raise exception(msg)
+        msg = msg + '. The leak is not modeled by the EpanetSimulator.'
+        logger.warning(msg)
+        warnings.warn(msg)
+
+    events = {}
+    skipped = set()
+    for control_name, control in wn.controls():
+        for action in list(control._then_actions) + list(control._else_actions):
+            node, attribute = action.target()
+            if attribute != 'leak_status':
+                continue
+            condition = control._condition
+            if (not isinstance(node, Junction) or action in control._else_actions or
+                    not isinstance(condition, SimTimeCondition) or condition._relation is not Comparison.eq or
+                    condition._repeat):
+                unsupported(NotImplementedError, 'Only junction leaks that start and end at a simulation time can '
+                                                 'be translated to emitters, control ' + control_name)
+                skipped.add(node.name)
+                continue
+            events.setdefault(node.name, []).append((condition._threshold, bool(action._value)))
+
+    for name, tank in wn.tanks():
+        if tank._leak or tank.leak_status:
+            unsupported(NotImplementedError, 'EPANET does not support tank leaks, tank ' + name)
+
+    leaks = {}
+    for name, junction in wn.junctions():
+        if name in skipped or not (junction._leak or junction.leak_status or name in events):
+            continue
+        coeff = junction.leak_discharge_coeff * junction.leak_area * (2.0 * 9.81) ** 0.5
+        start_times = sorted(t for t, status in events.get(name, []) if status)
+        end_times = sorted(t for t, status in events.get(name, []) if not status)
+        if len(start_times) > 1 or len(end_times) > 1:
+            unsupported(NotImplementedError, 'Leaks can only start and end once when translated to emitters, '
+                                             'junction ' + name)
+            continue
+        if junction.leak_status:
+            start_times = [0.0]
+        if coeff <= 0 or len(start_times) == 0:
+            continue
+        end_time = end_times[0] if len(end_times) > 0 and end_times[0] > start_times[0] else np.inf
+        leaks[name] = (coeff, start_times[0], end_time)
+
+    if len(leaks) > 0 and wn.options.hydraulic.emitter_exponent != 0.5:
+        unsupported(ValueError, 'Leaks can only be translated to emitters when the emitter exponent is 0.5')
+        leaks = {}
+    leaks = pd.DataFrame.from_dict(leaks, orient='index', columns=['emitter_coefficient', 'start_time', 'end_time'],
+                                   dtype=float)
+    return leaks
+
+
+def _leak_demand(leaks, times, pressure):
+    """Leak demand (m3/s) from pressure (m) with a row for each time (s) and a column for each leak"""
+    times = np.asarray(times, dtype=float)[:, np.newaxis]
+    active = (times >= leaks['start_time'].values) & (times < leaks['end_time'].values)
+    pressure = np.asarray(pressure, dtype=float)
+    return active * leaks['emitter_coefficient'].values * np.sign(pressure) * np.abs(pressure) ** 0.5
+
+
+class _LeakEmitterSchedule(object):
+    """Change emitter coefficients on an open EPANET project when leaks start and end"""
+
+    def __init__(self, enData, wn, leaks, flow_units):
+        self.leaks = leaks
+        self.index = [enData.ENgetnodeindex(name) for name in leaks.index]
+        base = [wn.get_node(name).emitter_coefficient or 0.0 for name in leaks.index]
+        self.base = from_si(flow_units, np.array(base, dtype=float), HydParam.EmitterCoeff)
+        self.coeff = from_si(flow_units, leaks['emitter_coefficient'].values, HydParam.EmitterCoeff)
+        self.active = np.zeros(len(leaks), dtype=bool)
+        self.event_times = np.unique(np.concatenate([leaks['start_time'].values, leaks['end_time'].values]))
+
+    def apply(self, enData, t):
+        """Set emitter coefficients for leaks that are active at time t"""
+        active = (t >= self.leaks['start_time'].values) & (t < self.leaks['end_time'].values)
+        for i in np.flatnonzero(active != self.active):
+            # EPANET keeps the last emitter flow of a zero coefficient, a negligible coefficient resets it
+            value = max(self.base[i] + self.coeff[i] * active[i], 1e-8)
+            enData.ENsetnodevalue(self.index[i], EN.EMITTER, value)
+        self.active = active
+
+    def next_step(self, enData, t):
+        """Run ENnextH, shortening the hydraulic timestep to stop at the next leak start or end time"""
+        hydraulic_timestep = enData.ENgettimeparam(EN.HYDSTEP)
+        later = self.event_times[(self.event_times > t) & (self.event_times < t + hydraulic_timestep)]
+        if len(later) == 0:
+            return enData.ENnextH()
+        quality_timestep = enData.ENgettimeparam(EN.QUALSTEP)
+        enData.ENsettimeparam(EN.HYDSTEP, int(later[0] - t))
+        try:
+            return enData.ENnextH()
+        finally:
+            enData.ENsettimeparam(EN.HYDSTEP, hydraulic_timestep)
+            enData.ENsettimeparam(EN.QUALSTEP, quality_timestep)
+
+    def solve_hydraulics(self, enData):
+        """Solve and save the hydraulics, equivalent to ENsolveH"""
+        enData.ENopenH()
+        enData.ENinitH(1)
+        t = 0
+        while True:
+            self.apply(enData, t)
+            t = enData.ENrunH()
+            timestep = self.next_step(enData, t)
+            if timestep <= 0:
+                break
+            t += timestep
+        enData.ENcloseH()
+
+
+def validate_leak_emitters(wn, file_prefix='temp', version=2.2):
+    """
+    Compare EpanetSimulator results using leak emitters to WNTRSimulator results.
+
+    The water network model is copied and simulated with the WNTRSimulator and
+    the EpanetSimulator (with leaks translated by :func:`leak_emitters`). The 
+    differences quantify the error of running leak scenarios in EPANET, for 
+    example, before running a large number of leak scenarios with the EpanetSimulator.
+
+    Parameters
+    ----------
+    wn : WaterNetworkModel
+        Water network model
+    file_prefix : str
+        Default prefix is "temp". The EPANET files use this prefix
+    version : float
+        {2.0, **2.2**} EPANET toolkit version, 2.2 is required for pressure dependent demand
+
+    Returns
+    -------
+    pandas DataFrame
+        Maximum and mean absolute difference of node pressure (m), demand (m3/s), 
+        leak demand (m3/s), and link flowrate (m3/s) at the report times 
+    """
+    epanet_results = EpanetSimulator(wn).run_sim(file_prefix=file_prefix, version=version)
+    wntr_results = WNTRSimulator(copy.deepcopy(wn)).run_sim()
+
+    diff = {}
+    for attribute, node_or_link in [('pressure', 'node'), ('demand', 'node'), ('leak_demand', 'node'),
+                                    ('flowrate', 'link')]:
+        df1 = getattr(wntr_results, node_or_link)[attribute]
+        df2 = getattr(epanet_results, node_or_link).get(attribute)
+        if df2 is None:
+            df2 = pd.DataFrame(0.0, index=df1.index, columns=df1.columns)
+        index = df1.index.intersection(df2.index)
+        error = (df1.loc[index, df2.columns] - df2.loc[index]).abs()
+        diff[attribute] = [error.max().max(), error.stack().mean()]
+    return pd.DataFrame.from_dict(diff, orient='index', columns=['max_abs_diff', 'mean_abs_diff'])
@@ -27,7 +27,7 @@ def create_hydraulic_model(wn, HW_approx='default'):
     mode: str
     HW_approx: str
         Specifies which Hazen-Williams headloss approximation to use. Options are 'default' and 'piecewise'. Please
-        see the WNTR documentation on hydraulics for details.
+        see the WNTR documentation on hydraulics for details. Not used for D-W or C-M headloss.
 
     Returns
     -------
@@ -40,6 +40,7 @@ def create_hydraulic_model(wn, HW_approx='default'):
     # Global constants
     constants.hazen_williams_constants(m)
     constants.head_pump_constants(m)
+    constants.gpv_constants(m)
     constants.leak_constants(m)
     constants.pdd_constants(m)
 
@@ -56,11 +57,15 @@ def create_hydraulic_model(wn, HW_approx='default'):
     param.leak_area_param.build(m, wn, model_updater)
     param.leak_poly_coeffs_param.build(m, wn, model_updater)
     param.elevation_param.build(m, wn, model_updater)
-    if wn.options.hydraulic.headloss == 'C-M':
-        raise NotImplementedError('C-M headloss is not currently supported in the WNTRSimulator')
-    if wn.options.hydraulic.headloss == 'D-W':
-        raise NotImplementedError('D-W headloss is not currently supported in the WNTRSimulator')
-    param.hw_resistance_param.build(m, wn, model_updater)
+    headloss = wn.options.hydraulic.headloss
+    if headloss == 'C-M':
+        constants.chezy_manning_constants(m)
+        param.cm_resistance_param.build(m, wn, model_updater)
+    elif headloss == 'D-W':
+        constants.darcy_weisbach_constants(m)
+        param.dw_resistance_param.build(m, wn, model_updater)
+    else:
+        param.hw_resistance_param.build(m, wn, model_updater)
     param.minor_loss_param.build(m, wn, model_updater)
     param.tcv_resistance_param.build(m, wn, model_updater)
     param.pump_power_param.build(m, wn, model_updater)
@@ -81,7 +86,11 @@ def create_hydraulic_model(wn, HW_approx='default'):
         constraint.pdd_constraint.build(m, wn, model_updater)
     else:
         raise ValueError('mode not recognized: ' + str(mode))
-    if HW_approx == 'default':
+    if headloss == 'C-M':
+        constraint.chezy_manning_headloss_constraint.build(m, wn, model_updater)
+    elif headloss == 'D-W':
+        constraint.darcy_weisbach_headloss_constraint.build(m, wn, model_updater)
+    elif HW_approx == 'default':
         constraint.approx_hazen_williams_headloss_constraint.build(m, wn, model_updater)
     elif HW_approx == 'piecewise':
         constraint.piecewise_hazen_williams_headloss_constraint.build(m, wn, model_updater)
@@ -93,10 +102,8 @@ def create_hydraulic_model(wn, HW_approx='default'):
     constraint.psv_headloss_constraint.build(m, wn, model_updater)
     constraint.tcv_headloss_constraint.build(m, wn, model_updater)
     constraint.fcv_headloss_constraint.build(m, wn, model_updater)
-    if len(wn.pbv_name_list) > 0:
-        raise NotImplementedError('PBV valves are not currently supported in the WNTRSimulator')
-    if len(wn.gpv_name_list) > 0:
-        raise NotImplementedError('GPV valves are not currently supported in the WNTRSimulator')
+    constraint.pbv_headloss_constraint.build(m, wn, model_updater)
+    constraint.gpv_headloss_constraint.build(m, wn, model_updater)
     constraint.leak_constraint.build(m, wn, model_updater)
 
     # TODO: Document that changing a curve with controls does not do anything; you have to change the pump_curve_name attribute on the pump
@@ -289,6 +296,43 @@ def save_results(wn, node_res, link_res):
         link_res['setting'][name].append(link.setting)
 
 
+def get_results_arrays(wn, node_res, link_res):
+    """
+    Convert the saved results to arrays and clear the saved results
+
+    Parameters
+    ----------
+    wn: wntr.network.model.WaterNetworkModel
+    node_res: collections.OrderedDict
+    link_res: collections.OrderedDict
+
+    Returns
+    -------
+    node_names: list of str
+    node_arrays: dict
+        Node results keyed by attribute, each with shape (number of times, number of nodes)
+    link_names: list of str
+    link_arrays: dict
+        Link results keyed by attribute, each with shape (number of times, number of links)
+    """
+    node_names = wn.junction_name_list + wn.tank_name_list + wn.reservoir_name_list
+    link_names = wn.pipe_name_list + wn.head_pump_name_list + wn.power_pump_name_list + wn.valve_name_list
+
+    node_arrays = OrderedDict()
+    for key, value in node_res.items():
+        node_arrays[key] = np.array([value[name] for name in node_names], dtype=float).transpose()
+        for name in node_names:
+            value[name].clear()
+
+    link_arrays = OrderedDict()
+    for key, value in link_res.items():
+        link_arrays[key] = np.array([value[name] for name in link_names], dtype=float).transpose()
+        for name in link_names:
+            value[name].clear()
+
+    return node_names, node_arrays, link_names, link_arrays
+
+
 def get_results(wn, results, node_res, link_res):
     """
     Parameters
@@ -1,6 +1,7 @@
 """Contant values used by WNTRSimulator."""
 
 import logging
+import math
 from wntr.utils.polynomial_interpolation import cubic_spline
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,35 @@ def hazen_williams_constants(m):
 
 
 def darcy_weisbach_constants(m):
-    m.dw_k = 0.0826
+    m.dw_k = 8.0 / (9.81 * math.pi**2)
+    m.dw_viscosity = 1.1e-5 * 0.3048**2  # kinematic viscosity of water used by EPANET (m2/s)
+    m.dw_re1 = 2000.0  # laminar flow below this Reynolds number
+    m.dw_re2 = 4000.0  # Swamee-Jain friction factor above this Reynolds number
+
+
+def chezy_manning_constants(m):
+    # EPANET resistance coefficient, (4*n/(1.49*pi*D**2))**2*(D/4)**(-1.333)*L in US units, converted to SI units
+    m.cm_k = 16.0 * 4.0**1.333 / (1.49 * math.pi)**2 * 0.3048**(-0.667)
+    m.cm_diameter_exp = 5.333
+    m.cm_exp = 2
+    m.cm_minor_exp = 2
+
+    # m*q1 must be below q2**cm_exp so that the smoothing polynomial increases with flow
+    m.cm_q1 = 0.0002
+    m.cm_q2 = 0.0004
+    m.cm_m = 0.0002
+
+    x1 = m.cm_q1
+    x2 = m.cm_q2
+    f1 = m.cm_m * m.cm_q1
+    f2 = m.cm_q2 ** m.cm_exp
+    df1 = m.cm_m
+    df2 = m.cm_exp * m.cm_q2 ** (m.cm_exp - 1)
+    a, b, c, d = cubic_spline(x1, x2, f1, f2, df1, df2)
+    m.cm_a = a
+    m.cm_b = b
+    m.cm_c = c
+    m.cm_d = d
 
 
 def pdd_constants(m):
@@ -43,6 +72,10 @@ def head_pump_constants(m):
     m.pump_slope = -1e-11
 
 
+def gpv_constants(m):
+    m.gpv_q1 = 0.0002
+
+
 def leak_constants(m):
     m.leak_delta = 1e-4
     m.leak_slope = 1e-11
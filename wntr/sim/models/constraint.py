@@ -1,6 +1,8 @@
 """Modeling constraints for the WNTRSimulator."""
 
 import logging
+import math
+import numpy as np
 from wntr.sim import aml
 import wntr.network
 import warnings
@@ -206,6 +208,179 @@ class approx_hazen_williams_headloss_constraint(Definition):
             updater.add(link, '_is_isolated', approx_hazen_williams_headloss_constraint.update)
 
 
+class darcy_weisbach_headloss_constraint(Definition):
+    @classmethod
+    def _family(cls, m):
+        """
+        The Darcy-Weisbach headloss is the same expression for every pipe, so the constraints are members of
+        one ConstraintFamily. The expression is only built and differentiated once per model.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+
+        Returns
+        -------
+        wntr.sim.aml.aml.ConstraintFamily
+        """
+        if not hasattr(m, 'darcy_weisbach_headloss_family'):
+            f = aml.Var()
+            start_h = aml.Var()
+            end_h = aml.Var()
+            k, minor_k, laminar_k, q1, q2, sj_a, sj_b, a, b, c, d = [aml.Param() for i in range(11)]
+            # Swamee-Jain friction factor, 0.25/log10(x)**2
+            friction = 0.25*math.log(10)**2/aml.log(sj_a + sj_b*aml.abs(f)**(-0.9))**2
+
+            expr = aml.ConditionalExpression()
+            expr.add_condition(aml.inequality(body=aml.abs(f), ub=q1), -laminar_k*f - aml.sign(f)*minor_k*f**2 + start_h - end_h)
+            expr.add_condition(aml.inequality(body=aml.abs(f), ub=q2), -(a*f**3 + aml.sign(f)*b*f**2 + c*f + aml.sign(f)*d) - aml.sign(f)*minor_k*f**2 + start_h - end_h)
+            expr.add_final_expr(-aml.sign(f)*k*friction*f**2 - aml.sign(f)*minor_k*f**2 + start_h - end_h)
+            m.darcy_weisbach_headloss_family = aml.ConstraintFamily(expr, [f, start_h, end_h, k, minor_k, laminar_k, q1, q2, sj_a, sj_b, a, b, c, d])
+        return m.darcy_weisbach_headloss_family
+
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Adds a Darcy-Weisbach headloss constraint to the model for the specified pipes.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of pipe names; default is all pipes in wn
+        """
+        if not hasattr(m, 'darcy_weisbach_headloss'):
+            m.darcy_weisbach_headloss = aml.ConstraintDict()
+
+        if index_over is None:
+            index_over = wn.pipe_name_list
+
+        family = darcy_weisbach_headloss_constraint._family(m)
+
+        for link_name in index_over:
+            if link_name in m.darcy_weisbach_headloss:
+                del m.darcy_weisbach_headloss[link_name]
+
+            link = wn.get_link(link_name)
+            f = m.flow[link_name]
+            status = link.status
+
+            if status == LinkStatus.Closed or link._is_isolated:
+                con = aml.Constraint(f)
+            else:
+                start_node_name = link.start_node_name
+                end_node_name = link.end_node_name
+                start_node = wn.get_node(start_node_name)
+                end_node = wn.get_node(end_node_name)
+                if isinstance(start_node, wntr.network.Junction):
+                    start_h = m.head[start_node_name]
+                else:
+                    start_h = m.source_head[start_node_name]
+                if isinstance(end_node, wntr.network.Junction):
+                    end_h = m.head[end_node_name]
+                else:
+                    end_h = m.source_head[end_node_name]
+
+                con = family.member([f, start_h, end_h, m.dw_resistance[link_name], m.minor_loss[link_name],
+                                     m.dw_laminar_resistance[link_name], m.dw_q1[link_name], m.dw_q2[link_name],
+                                     m.dw_sj_a[link_name], m.dw_sj_b[link_name],
+                                     m.dw_poly_coeffs_a[link_name], m.dw_poly_coeffs_b[link_name],
+                                     m.dw_poly_coeffs_c[link_name], m.dw_poly_coeffs_d[link_name]])
+
+            m.darcy_weisbach_headloss[link_name] = con
+
+            updater.add(link, 'status', darcy_weisbach_headloss_constraint.update)
+            updater.add(link, '_is_isolated', darcy_weisbach_headloss_constraint.update)
+
+
+class chezy_manning_headloss_constraint(Definition):
+    @classmethod
+    def _family(cls, m):
+        """
+        The Chezy-Manning headloss is the same expression for every pipe, so the constraints are members of
+        one ConstraintFamily.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+
+        Returns
+        -------
+        wntr.sim.aml.aml.ConstraintFamily
+        """
+        if not hasattr(m, 'chezy_manning_headloss_family'):
+            f = aml.Var()
+            start_h = aml.Var()
+            end_h = aml.Var()
+            k = aml.Param()
+            minor_k = aml.Param()
+            a = m.cm_a
+            b = m.cm_b
+            c = m.cm_c
+            d = m.cm_d
+
+            expr = aml.ConditionalExpression()
+            expr.add_condition(aml.inequality(body=aml.abs(f), ub=m.cm_q1), -k*m.cm_m*f - aml.sign(f)*minor_k*f**m.cm_minor_exp + start_h - end_h)
+            expr.add_condition(aml.inequality(body=aml.abs(f), ub=m.cm_q2), -k*(a*f**3 + aml.sign(f)*b*f**2 + c*f + aml.sign(f)*d) - aml.sign(f)*minor_k*f**m.cm_minor_exp + start_h - end_h)
+            expr.add_final_expr(-aml.sign(f)*k*aml.abs(f)**m.cm_exp - aml.sign(f)*minor_k*f**m.cm_minor_exp + start_h - end_h)
+            m.chezy_manning_headloss_family = aml.ConstraintFamily(expr, [f, start_h, end_h, k, minor_k])
+        return m.chezy_manning_headloss_family
+
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Adds a Chezy-Manning headloss constraint to the model for the specified pipes.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of pipe names; default is all pipes in wn
+        """
+        if not hasattr(m, 'chezy_manning_headloss'):
+            m.chezy_manning_headloss = aml.ConstraintDict()
+
+        if index_over is None:
+            index_over = wn.pipe_name_list
+
+        family = chezy_manning_headloss_constraint._family(m)
+
+        for link_name in index_over:
+            if link_name in m.chezy_manning_headloss:
+                del m.chezy_manning_headloss[link_name]
+
+            link = wn.get_link(link_name)
+            f = m.flow[link_name]
+            status = link.status
+
+            if status == LinkStatus.Closed or link._is_isolated:
+                con = aml.Constraint(f)
+            else:
+                start_node_name = link.start_node_name
+                end_node_name = link.end_node_name
+                start_node = wn.get_node(start_node_name)
+                end_node = wn.get_node(end_node_name)
+                if isinstance(start_node, wntr.network.Junction):
+                    start_h = m.head[start_node_name]
+                else:
+                    start_h = m.source_head[start_node_name]
+                if isinstance(end_node, wntr.network.Junction):
+                    end_h = m.head[end_node_name]
+                else:
+                    end_h = m.source_head[end_node_name]
+
+                con = family.member([f, start_h, end_h, m.cm_resistance[link_name], m.minor_loss[link_name]])
+
+            m.chezy_manning_headloss[link_name] = con
+
+            updater.add(link, 'status', chezy_manning_headloss_constraint.update)
+            updater.add(link, '_is_isolated', chezy_manning_headloss_constraint.update)
+
+
 class pdd_constraint(Definition):
     @classmethod
     def build(cls, m, wn, updater, index_over=None):
@@ -614,6 +789,146 @@ class tcv_headloss_constraint(Definition):
             updater.add(link, '_is_isolated', tcv_headloss_constraint.update)
 
 
+class pbv_headloss_constraint(Definition):
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Adds a headloss constraint to the model for the pressure breaker valves.
+
+        An active PBV forces the head drop across the valve to equal the valve setting. As in EPANET, the valve is
+        treated as an open valve when the setting is 0 or when the minor loss at the current flow exceeds the setting.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of pbv names; default is all pbvs in wn
+        """
+        if not hasattr(m, 'pbv_headloss'):
+            m.pbv_headloss = aml.ConstraintDict()
+
+        if index_over is None:
+            index_over = wn.pbv_name_list
+
+        for link_name in index_over:
+            if link_name in m.pbv_headloss:
+                del m.pbv_headloss[link_name]
+
+            link = wn.get_link(link_name)
+            f = m.flow[link_name]
+            status = link.status
+
+            if status == LinkStatus.Closed or link._is_isolated:
+                con = aml.Constraint(f)
+            else:
+                start_node_name = link.start_node_name
+                end_node_name = link.end_node_name
+                start_node = wn.get_node(start_node_name)
+                end_node = wn.get_node(end_node_name)
+                if isinstance(start_node, wntr.network.Junction):
+                    start_h = m.head[start_node_name]
+                else:
+                    start_h = m.source_head[start_node_name]
+                if isinstance(end_node, wntr.network.Junction):
+                    end_h = m.head[end_node_name]
+                else:
+                    end_h = m.source_head[end_node_name]
+
+                k = m.minor_loss[link_name]
+                if status == LinkStatus.Active and link.setting != 0:
+                    con = aml.ConditionalExpression()
+                    if k.value > 0:
+                        q_open = math.sqrt(abs(link.setting) / k.value)
+                        con.add_condition(aml.inequality(body=f, ub=-q_open), -k * f ** 2 - start_h + end_h)
+                        con.add_condition(aml.inequality(body=f, ub=q_open),
+                                          m.valve_setting[link_name] - start_h + end_h)
+                        con.add_final_expr(k * f ** 2 - start_h + end_h)
+                    else:
+                        con.add_final_expr(m.valve_setting[link_name] - start_h + end_h)
+                    con = aml.Constraint(con)
+                else:
+                    con = aml.ConditionalExpression()
+                    con.add_condition(aml.inequality(f, ub=0), -k * f ** 2 - start_h + end_h)
+                    con.add_final_expr(k * f ** 2 - start_h + end_h)
+                    con = aml.Constraint(con)
+            m.pbv_headloss[link_name] = con
+
+            updater.add(link, 'status', pbv_headloss_constraint.update)
+            updater.add(link, '_is_isolated', pbv_headloss_constraint.update)
+            updater.add(link, 'setting', pbv_headloss_constraint.update)
+            updater.add(link, 'minor_loss', pbv_headloss_constraint.update)
+            updater.add(link, 'diameter', pbv_headloss_constraint.update)
+
+
+class gpv_headloss_constraint(Definition):
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Adds a headloss constraint to the model for the general purpose valves.
+
+        The headloss curve of each GPV is compiled into a table of linear segments (see
+        :func:`get_gpv_curve_table`) and the headloss is an odd function of the flow. As in EPANET, the headloss
+        curve is used unless the valve is closed.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of gpv names; default is all gpvs in wn
+        """
+        if not hasattr(m, 'gpv_headloss'):
+            m.gpv_headloss = aml.ConstraintDict()
+
+        if index_over is None:
+            index_over = wn.gpv_name_list
+
+        for link_name in index_over:
+            if link_name in m.gpv_headloss:
+                del m.gpv_headloss[link_name]
+
+            link = wn.get_link(link_name)
+            f = m.flow[link_name]
+            status = link.status
+
+            if status == LinkStatus.Closed or link._is_isolated:
+                con = aml.Constraint(f)
+            else:
+                start_node_name = link.start_node_name
+                end_node_name = link.end_node_name
+                start_node = wn.get_node(start_node_name)
+                end_node = wn.get_node(end_node_name)
+                if isinstance(start_node, wntr.network.Junction):
+                    start_h = m.head[start_node_name]
+                else:
+                    start_h = m.source_head[start_node_name]
+                if isinstance(end_node, wntr.network.Junction):
+                    end_h = m.head[end_node_name]
+                else:
+                    end_h = m.source_head[end_node_name]
+
+                q_upper, slope, intercept = (arr.tolist() for arr in
+                                             get_gpv_curve_table(link.headloss_curve.points, m))
+                n = len(slope)
+                con = aml.ConditionalExpression()
+                for i in range(n - 1, 0, -1):
+                    con.add_condition(aml.inequality(body=f, ub=-q_upper[i - 1]),
+                                      slope[i] * f - intercept[i] - start_h + end_h)
+                for i in range(n - 1):
+                    con.add_condition(aml.inequality(body=f, ub=q_upper[i]),
+                                      slope[i] * f + intercept[i] - start_h + end_h)
+                con.add_final_expr(slope[n - 1] * f + intercept[n - 1] - start_h + end_h)
+                con = aml.Constraint(con)
+            m.gpv_headloss[link_name] = con
+
+            updater.add(link, 'status', gpv_headloss_constraint.update)
+            updater.add(link, '_is_isolated', gpv_headloss_constraint.update)
+            updater.add(link, 'headloss_curve_name', gpv_headloss_constraint.update)
+
+
 class leak_constraint(Definition):
     @classmethod
     def build(cls, m, wn, updater, index_over=None):
@@ -733,3 +1048,47 @@ def get_pump_line_params(A, B, C, m):
     q_bar = (m.pump_slope/(-B*C))**(1.0/(C-1.0))
     h_bar = A - B*q_bar**C
     return q_bar, h_bar
+
+
+def get_gpv_curve_table(points, m):
+    """
+    Compile a GPV headloss curve into a table of linear segments for flows >= 0.
+
+    As in EPANET, the headloss is linearly interpolated between the curve points and the first and last segments are
+    extrapolated. For flows below m.gpv_q1, the headloss is replaced by a line through the origin so that the
+    headloss (an odd function of the flow) is continuous at zero flow.
+
+    Parameters
+    ----------
+    points: list of tuple
+        The (flow, headloss) points of the headloss curve
+    m: wntr.sim.aml.aml.Model
+
+    Returns
+    -------
+    q_upper: np.ndarray
+        The upper flow bound of every segment except the last (which is unbounded)
+    slope: np.ndarray
+        The slope of each segment
+    intercept: np.ndarray
+        The headloss intercept (at zero flow) of each segment
+    """
+    points = np.array(points, dtype=float)
+    if points.ndim != 2 or points.shape[0] < 2:
+        raise ValueError('GPV headloss curves must have at least two points')
+    x = points[:, 0]
+    y = points[:, 1]
+    if np.any(np.diff(x) <= 0):
+        raise ValueError('The flows of GPV headloss curves must be strictly increasing')
+
+    slope = np.diff(y) / np.diff(x)
+    intercept = y[:-1] - slope * x[:-1]
+    q_upper = x[1:-1]
+
+    q1 = m.gpv_q1
+    i = np.searchsorted(q_upper, q1)
+    h1 = slope[i] * q1 + intercept[i]
+    q_upper = np.concatenate(([q1], q_upper[i:]))
+    slope = np.concatenate(([h1 / q1], slope[i:]))
+    intercept = np.concatenate(([0.0], intercept[i:]))
+    return q_upper, slope, intercept
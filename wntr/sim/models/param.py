@@ -4,6 +4,7 @@ import logging
 from wntr.sim import aml
 from wntr.utils.polynomial_interpolation import cubic_spline
 import math
+import numpy as np
 from wntr.network import LinkStatus
 from wntr.sim.models.utils import ModelUpdater, Definition
 
@@ -372,6 +373,107 @@ class hw_resistance_param(Definition):
             updater.add(link, 'length', hw_resistance_param.update)
 
 
+class dw_resistance_param(Definition):
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Add Darcy-Weisbach resistance coefficient, laminar flow, and transition parameters to the model
+
+        The parameters of all pipes in index_over are computed together as arrays. 
+        Headloss is laminar below a Reynolds number of dw_re1, uses the Swamee-Jain 
+        friction factor above dw_re2, and uses a cubic polynomial in between.
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of pipe names
+        """
+        if not hasattr(m, 'dw_resistance'):
+            m.dw_resistance = aml.ParamDict()
+            m.dw_laminar_resistance = aml.ParamDict()
+            m.dw_q1 = aml.ParamDict()
+            m.dw_q2 = aml.ParamDict()
+            m.dw_sj_a = aml.ParamDict()
+            m.dw_sj_b = aml.ParamDict()
+            m.dw_poly_coeffs_a = aml.ParamDict()
+            m.dw_poly_coeffs_b = aml.ParamDict()
+            m.dw_poly_coeffs_c = aml.ParamDict()
+            m.dw_poly_coeffs_d = aml.ParamDict()
+
+        if index_over is None:
+            index_over = wn.pipe_name_list
+
+        links = [wn.get_link(link_name) for link_name in index_over]
+        length = np.array([link.length for link in links], dtype=float)
+        diameter = np.array([link.diameter for link in links], dtype=float)
+        roughness = np.array([link.roughness for link in links], dtype=float)
+        viscosity = wn.options.hydraulic.viscosity * m.dw_viscosity
+
+        # headloss = k*f*q**2 with the friction factor f = 0.25/log10(sj_a + sj_b*q**(-0.9))**2
+        k = m.dw_k * length / diameter**5
+        laminar_k = 128.0 * viscosity * length / (9.81 * math.pi * diameter**4)
+        q1 = m.dw_re1 * math.pi * diameter * viscosity / 4.0
+        q2 = m.dw_re2 * math.pi * diameter * viscosity / 4.0
+        sj_a = roughness / (3.7 * diameter)
+        sj_b = 5.74 * (math.pi * diameter * viscosity / 4.0)**0.9
+
+        x = sj_a + sj_b * q2**(-0.9)
+        f2 = 0.25 * math.log(10)**2 / np.log(x)**2
+        df2 = -0.5 * math.log(10)**2 / np.log(x)**3 * (-0.9 * sj_b * q2**(-1.9)) / x
+        a, b, c, d = cubic_spline(q1, q2, laminar_k * q1, k * f2 * q2**2, laminar_k, k * (df2 * q2**2 + 2.0 * f2 * q2))
+
+        params = [(m.dw_resistance, k), (m.dw_laminar_resistance, laminar_k), (m.dw_q1, q1), (m.dw_q2, q2),
+                  (m.dw_sj_a, sj_a), (m.dw_sj_b, sj_b), (m.dw_poly_coeffs_a, a), (m.dw_poly_coeffs_b, b),
+                  (m.dw_poly_coeffs_c, c), (m.dw_poly_coeffs_d, d)]
+        for i, link in enumerate(links):
+            link_name = link.name
+            for param_dict, values in params:
+                if link_name in param_dict:
+                    param_dict[link_name].value = float(values[i])
+                else:
+                    param_dict[link_name] = aml.Param(float(values[i]))
+
+            updater.add(link, 'roughness', dw_resistance_param.update)
+            updater.add(link, 'diameter', dw_resistance_param.update)
+            updater.add(link, 'length', dw_resistance_param.update)
+
+
+class cm_resistance_param(Definition):
+    @classmethod
+    def build(cls, m, wn, updater, index_over=None):
+        """
+        Add a Chezy-Manning resistance coefficient parameter to the model
+
+        Parameters
+        ----------
+        m: wntr.sim.aml.aml.Model
+        wn: wntr.network.model.WaterNetworkModel
+        updater: ModelUpdater
+        index_over: list of str
+            list of pipe names
+        """
+        if not hasattr(m, 'cm_resistance'):
+            m.cm_resistance = aml.ParamDict()
+
+        if index_over is None:
+            index_over = wn.pipe_name_list
+
+        for link_name in index_over:
+            link = wn.get_link(link_name)
+            value = m.cm_k * link.roughness**2 * link.diameter**(-m.cm_diameter_exp) * link.length
+            if link_name in m.cm_resistance:
+                m.cm_resistance[link_name].value = value
+            else:
+                m.cm_resistance[link_name] = aml.Param(value)
+
+            updater.add(link, 'roughness', cm_resistance_param.update)
+            updater.add(link, 'diameter', cm_resistance_param.update)
+            updater.add(link, 'length', cm_resistance_param.update)
+
+
 class minor_loss_param(Definition):
     @classmethod
     def build(cls, m, wn, updater, index_over=None):
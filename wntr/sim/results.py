@@ -2,6 +2,11 @@
 
 import datetime
 import enum
+import json
+import os
+
+import numpy as np
+import pandas as pd
 
 
 class ResultsStatus(enum.IntEnum):
@@ -21,3 +26,400 @@ class SimulationResults(object):
         self.network_name = None
         self.link = None
         self.node = None
+
+
+class ResultsStore(object):
+    """
+    On-disk store for simulation results.
+
+    Results are written in time chunks while the simulation runs. Each chunk
+    holds one NumPy ``.npy`` file per attribute, stored in column-major order
+    so that a subset of nodes or links can be read without loading the full
+    chunk. Results are read back lazily through :meth:`to_results`, which
+    returns a :class:`~wntr.sim.results.SimulationResults` object where
+    ``results.node[attribute]`` and ``results.link[attribute]`` are
+    :class:`~wntr.sim.results.StoredResultsFrame` objects.
+
+    Parameters
+    ----------
+    path : str
+        Directory used to store the results
+    mode : str
+        'w' to create a new store (existing chunks in the directory are
+        removed), 'a' to append to an existing store (a new store is created
+        if the directory does not contain one), or 'r' to open an existing
+        store as read-only.
+    chunk_size : int
+        Number of report timesteps per chunk. Ignored if an existing store
+        is opened.
+    """
+    _metadata_file = 'metadata.json'
+
+    def __init__(self, path, mode='w', chunk_size=96):
+        if mode not in ['w', 'a', 'r']:
+            raise ValueError("mode must be 'w', 'a', or 'r'")
+        if int(chunk_size) < 1:
+            raise ValueError('chunk_size must be a positive integer')
+        self.path = path
+        self.mode = mode
+        self._buffer_times = []
+        self._buffer = {'node': {}, 'link': {}}
+
+        metadata_file = os.path.join(path, self._metadata_file)
+        if mode == 'r' and not os.path.exists(metadata_file):
+            raise FileNotFoundError('No results store found in ' + str(path))
+        if mode == 'r' or (mode == 'a' and os.path.exists(metadata_file)):
+            with open(metadata_file, 'r') as fin:
+                self._metadata = json.load(fin)
+        else:
+            if os.path.exists(metadata_file):
+                self._remove_chunks()
+            os.makedirs(path, exist_ok=True)
+            self._metadata = {'chunk_size': int(chunk_size),
+                              'network_name': None,
+                              'error_code': None,
+                              'node_names': None,
+                              'link_names': None,
+                              'node_attributes': [],
+                              'link_attributes': [],
+                              'chunks': []}
+            self._write_metadata()
+
+    @property
+    def chunk_size(self):
+        """int: Number of report timesteps per chunk"""
+        return self._metadata['chunk_size']
+
+    @property
+    def node_names(self):
+        """list of str: Node names (columns of the node results)"""
+        return self._metadata['node_names']
+
+    @property
+    def link_names(self):
+        """list of str: Link names (columns of the link results)"""
+        return self._metadata['link_names']
+
+    @property
+    def time(self):
+        """numpy array: Report times of the stored results (including unflushed results)"""
+        times = [chunk['time'] for chunk in self._metadata['chunks']]
+        times.append(self._buffer_times)
+        return np.concatenate([np.asarray(t, dtype=np.int64) for t in times])
+
+    def _write_metadata(self):
+        with open(os.path.join(self.path, self._metadata_file), 'w') as fout:
+            json.dump(self._metadata, fout)
+
+    def _remove_chunks(self):
+        with open(os.path.join(self.path, self._metadata_file), 'r') as fin:
+            metadata = json.load(fin)
+        for chunk in metadata['chunks']:
+            for element_type in ['node', 'link']:
+                for attr in metadata[element_type + '_attributes']:
+                    filename = self._chunk_filename(chunk['id'], element_type, attr)
+                    if os.path.exists(filename):
+                        os.remove(filename)
+
+    def _chunk_filename(self, chunk_id, element_type, attribute):
+        return os.path.join(self.path, '{0}_{1}_{2:06d}.npy'.format(element_type, attribute, chunk_id))
+
+    def _check_names(self, key, names):
+        names = [str(name) for name in names]
+        if self._metadata[key] is None:
+            self._metadata[key] = names
+        elif self._metadata[key] != names:
+            raise ValueError('The ' + key.replace('_', ' ') + ' do not match the names in the results store')
+
+    def append(self, time, node, link, node_names=None, link_names=None):
+        """
+        Append results to the store.
+
+        Results are buffered and written to disk each time ``chunk_size``
+        report timesteps are available. Call :meth:`flush` to write the
+        remaining results.
+
+        Parameters
+        ----------
+        time : list of int
+            Report times (in seconds), which must be later than the times
+            already in the store
+        node : dict
+            Dictionary of node results, keyed by attribute. Values are arrays
+            or DataFrames with shape (len(time), number of nodes)
+        link : dict
+            Dictionary of link results, keyed by attribute. Values are arrays
+            or DataFrames with shape (len(time), number of links)
+        node_names : list of str (optional)
+            Node names. Taken from the columns of the DataFrames if not provided.
+        link_names : list of str (optional)
+            Link names. Taken from the columns of the DataFrames if not provided.
+        """
+        if self.mode == 'r':
+            raise RuntimeError('The results store was opened as read-only')
+        time = [int(t) for t in time]
+        if len(time) == 0:
+            return
+        stored_time = self.time
+        if len(stored_time) > 0 and time[0] <= stored_time[-1]:
+            raise ValueError('Results can only be appended after the last time in the results store ('
+                             + str(stored_time[-1]) + ' s)')
+
+        for element_type, values, names in [('node', node, node_names), ('link', link, link_names)]:
+            if len(values) == 0:
+                continue
+            if names is None:
+                names = next(iter(values.values())).columns
+            self._check_names(element_type + '_names', names)
+            attributes = self._metadata[element_type + '_attributes']
+            if len(attributes) == 0:
+                attributes.extend(values.keys())
+            elif set(attributes) != set(values.keys()):
+                raise ValueError('The ' + element_type + ' attributes do not match the attributes in the results store')
+            buffer = self._buffer[element_type]
+            for attr in attributes:
+                data = np.asarray(values[attr])
+                if data.shape != (len(time), len(names)):
+                    raise ValueError('The shape of ' + element_type + " results '" + attr + "' does not match the times and names")
+                buffer.setdefault(attr, []).append(data)
+
+        self._buffer_times.extend(time)
+        if len(self._buffer_times) >= self.chunk_size:
+            self.flush(full_chunks_only=True)
+
+    def flush(self, full_chunks_only=False):
+        """
+        Write buffered results to disk.
+
+        Parameters
+        ----------
+        full_chunks_only : bool (optional)
+            If True, only write chunks with ``chunk_size`` timesteps and keep
+            the remaining results in the buffer
+        """
+        if len(self._buffer_times) == 0:
+            return
+        data = {}
+        for element_type, buffer in self._buffer.items():
+            data[element_type] = {attr: np.concatenate(values, axis=0) for attr, values in buffer.items()}
+
+        start = 0
+        ntimes = len(self._buffer_times)
+        while start < ntimes:
+            stop = min(start + self.chunk_size, ntimes)
+            if full_chunks_only and stop - start < self.chunk_size:
+                break
+            chunk_id = len(self._metadata['chunks'])
+            for element_type, values in data.items():
+                for attr, array in values.items():
+                    np.save(self._chunk_filename(chunk_id, element_type, attr),
+                            np.asfortranarray(array[start:stop]))
+            self._metadata['chunks'].append({'id': chunk_id, 'time': self._buffer_times[start:stop]})
+            start = stop
+        self._write_metadata()
+
+        self._buffer_times = self._buffer_times[start:]
+        for element_type, values in data.items():
+            self._buffer[element_type] = {attr: [array[start:]] for attr, array in values.items()} if start < ntimes else {}
+
+    def append_results(self, results):
+        """
+        Append a results object with DataFrame results to the store
+
+        Parameters
+        ----------
+        results : SimulationResults
+            Simulation results, where each attribute in ``results.node`` and
+            ``results.link`` is a DataFrame indexed by time
+        """
+        node = results.node if results.node is not None else {}
+        link = results.link if results.link is not None else {}
+        frames = list(node.values()) + list(link.values())
+        if len(frames) == 0:
+            return
+        time = frames[0].index
+        for start in range(0, len(time), self.chunk_size):
+            stop = start + self.chunk_size
+            self.append(time[start:stop],
+                        {attr: df.iloc[start:stop] for attr, df in node.items()},
+                        {attr: df.iloc[start:stop] for attr, df in link.items()})
+        self.set_info(network_name=results.network_name, error_code=getattr(results, 'error_code', None))
+
+    def set_info(self, network_name=None, error_code=None):
+        """
+        Store the network name and error code of the simulation
+
+        Parameters
+        ----------
+        network_name : str
+            Network name
+        error_code : ResultsStatus or None
+            Simulation error code
+        """
+        if network_name is not None:
+            self._metadata['network_name'] = str(network_name)
+        self._metadata['error_code'] = None if error_code is None else int(error_code)
+        if self.mode != 'r':
+            self._write_metadata()
+
+    def _read(self, element_type, attribute, rows, cols):
+        """Read positional rows and columns of one attribute from the chunks"""
+        chunks = self._metadata['chunks']
+        nrows = np.array([len(chunk['time']) for chunk in chunks], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(nrows)])
+        if len(rows) > 0 and (rows.min() < 0 or rows.max() >= offsets[-1]):
+            raise IndexError('Time index out of range of the flushed results')
+        chunk_ndx = np.searchsorted(offsets, rows, side='right') - 1
+
+        data = None
+        for i in np.unique(chunk_ndx):
+            mask = chunk_ndx == i
+            values = np.load(self._chunk_filename(chunks[i]['id'], element_type, attribute), mmap_mode='r')
+            block = values[:, cols][rows[mask] - offsets[i], :]
+            if data is None:
+                data = np.empty((len(rows), len(cols)), dtype=block.dtype)
+            data[mask, :] = block
+        if data is None:
+            data = np.empty((0, len(cols)))
+        return data
+
+    def to_results(self):
+        """
+        Flush the buffered results and return a results object that loads
+        data from the store on demand
+
+        Returns
+        -------
+        SimulationResults
+        """
+        if self.mode != 'r':
+            self.flush()
+        results = SimulationResults()
+        results.network_name = self._metadata['network_name']
+        error_code = self._metadata['error_code']
+        results.error_code = None if error_code is None else ResultsStatus(error_code)
+        results.node = {attr: StoredResultsFrame(self, 'node', attr) for attr in self._metadata['node_attributes']}
+        results.link = {attr: StoredResultsFrame(self, 'link', attr) for attr in self._metadata['link_attributes']}
+        return results
+
+
+class StoredResultsFrame(object):
+    """
+    Lazily loaded results for one node or link attribute in a
+    :class:`~wntr.sim.results.ResultsStore`.
+
+    The frame supports the DataFrame selection methods ``frame[columns]``,
+    ``frame.loc[times, columns]`` and ``frame.iloc[rows, columns]``, which
+    only read the requested data from disk and return pandas objects.
+    Use :meth:`load` to read the full DataFrame.
+
+    Parameters
+    ----------
+    store : ResultsStore
+        Results store
+    element_type : str
+        'node' or 'link'
+    attribute : str
+        Results attribute, for example 'pressure'
+    """
+    def __init__(self, store, element_type, attribute):
+        self._store = store
+        self._element_type = element_type
+        self._attribute = attribute
+        self._index = pd.Index(np.concatenate([np.asarray(chunk['time'], dtype=np.int64)
+                                               for chunk in store._metadata['chunks']] + [np.array([], dtype=np.int64)]))
+        self._columns = pd.Index(store._metadata[element_type + '_names'])
+
+    def __repr__(self):
+        return '<StoredResultsFrame {0} {1} {2}x{3}>'.format(self._element_type, self._attribute, *self.shape)
+
+    @property
+    def index(self):
+        """pandas Index: Report times"""
+        return self._index
+
+    @property
+    def columns(self):
+        """pandas Index: Node or link names"""
+        return self._columns
+
+    @property
+    def shape(self):
+        """tuple: Number of times and number of columns"""
+        return (len(self._index), len(self._columns))
+
+    @property
+    def loc(self):
+        """Label-based selection, equivalent to ``DataFrame.loc``"""
+        return _StoredResultsIndexer(self, positional=False)
+
+    @property
+    def iloc(self):
+        """Position-based selection, equivalent to ``DataFrame.iloc``"""
+        return _StoredResultsIndexer(self, positional=True)
+
+    def __getitem__(self, key):
+        return self.loc[:, key]
+
+    def __len__(self):
+        return len(self._index)
+
+    def load(self):
+        """
+        Read the full results for the attribute
+
+        Returns
+        -------
+        pandas DataFrame
+        """
+        return self.iloc[:, :]
+
+    def _select(self, rows, cols):
+        data = self._store._read(self._element_type, self._attribute, rows, cols)
+        return pd.DataFrame(data, index=self._index[rows], columns=self._columns[cols])
+
+
+class _StoredResultsIndexer(object):
+    def __init__(self, frame, positional):
+        self._frame = frame
+        self._positional = positional
+
+    def _positions(self, key, labels):
+        """Convert a row or column key to an array of positions; also return True if key is a scalar"""
+        n = len(labels)
+        if self._positional:
+            if isinstance(key, slice):
+                return np.arange(n)[key], False
+            if np.ndim(key) == 0:
+                return np.arange(n)[[key]], True
+            key = np.asarray(key)
+            if key.dtype == bool:
+                return np.flatnonzero(key), False
+            return np.arange(n)[key], False
+        if isinstance(key, slice):
+            return np.arange(n)[labels.slice_indexer(key.start, key.stop, key.step)], False
+        if np.ndim(key) == 0:
+            return np.array([labels.get_loc(key)]), True
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return np.flatnonzero(key), False
+        positions = labels.get_indexer(key)
+        if (positions < 0).any():
+            raise KeyError(str(list(key[positions < 0])) + ' not in index')
+        return positions, False
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            row_key, col_key = key
+        else:
+            row_key, col_key = key, slice(None)
+        rows, row_scalar = self._positions(row_key, self._frame.index)
+        cols, col_scalar = self._positions(col_key, self._frame.columns)
+        df = self._frame._select(rows, cols)
+        if row_scalar and col_scalar:
+            return df.iloc[0, 0]
+        elif row_scalar:
+            return df.iloc[0, :]
+        elif col_scalar:
+            return df.iloc[:, 0]
+        return df
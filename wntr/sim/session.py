@@ -0,0 +1,596 @@
+"""
+The wntr.sim.session module includes classes to run hydraulic simulations
+one timestep at a time, change operations and conditions between timesteps,
+and save and restore the simulation state.
+"""
+import abc
+import logging
+
+import numpy as np
+import six
+
+import wntr.epanet
+from wntr.epanet.util import EN, FlowUnits, HydParam, from_si, to_si
+from wntr.network.base import LinkStatus
+from wntr.network.controls import ControlAction
+from wntr.network.elements import Pipe, Pump, Valve, Tank, Reservoir, TimeSeries
+from wntr.network.io import write_inpfile
+from wntr.sim.core import WNTRSimulator
+from wntr.sim.epanet import _LeakEmitterSchedule, _leak_demand, leak_emitters
+from wntr.sim.solvers import NewtonSolver
+from wntr.utils.ordered_set import OrderedSet
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationSession(six.with_metaclass(abc.ABCMeta, object)):
+    """
+    Base class for step-wise hydraulic simulation sessions.
+
+    A session advances the hydraulic simulation one timestep at a time
+    using :meth:`step`. Between timesteps, measured or planned conditions
+    can be set with the ``set_*`` methods, the hydraulic state can be read with
+    :meth:`get_state`, and the simulation state can be saved with :meth:`snapshot`
+    and returned to with :meth:`restore`, for example, to branch a forecast from
+    the current state.
+
+    Parameters
+    ----------
+    wn : WaterNetworkModel object
+        Water network model
+    """
+
+    def __init__(self, wn):
+        self._wn = wn
+        self._solved = False
+        self._demand_overrides = {}
+        self.node_name_list = list(wn.node_name_list)
+        self.link_name_list = list(wn.link_name_list)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    @abc.abstractmethod
+    def time(self):
+        """Simulation time (s) of the last solved timestep"""
+        pass
+
+    @abc.abstractmethod
+    def step(self):
+        """
+        Advance to and solve the next hydraulic timestep.
+
+        The first call solves the hydraulics at the start time. Intermediate
+        timesteps are added when controls or tanks require them.
+
+        Returns
+        -------
+        int
+            Simulation time (s) of the solved timestep
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_state(self):
+        """
+        Get the hydraulic state at the last solved timestep.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys ``'time'``, ``'node'`` and ``'link'``.
+            Node values (``'head'``, ``'pressure'``, ``'demand'``, ``'leak_demand'``) are arrays ordered by
+            ``node_name_list`` and link values (``'flowrate'``, ``'status'``, ``'setting'``) are
+            arrays ordered by ``link_name_list``, in SI units.
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_tank_level(self, name, level):
+        """
+        Set the water level (m) in a tank at the last solved timestep.
+
+        Parameters
+        ----------
+        name : str
+            Tank name
+        level : float
+            Water level above the tank elevation (m)
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_demand(self, name, demand):
+        """
+        Set a constant demand (m3/s) at a junction, replacing its demand patterns.
+
+        The demand multiplier is still applied.
+
+        Parameters
+        ----------
+        name : str
+            Junction name
+        demand : float or None
+            Demand (m3/s), or None to return to the junction's original demands
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_link_status(self, name, status):
+        """
+        Set the status of a pipe, pump, or valve.
+
+        Parameters
+        ----------
+        name : str
+            Link name
+        status : LinkStatus, int, or str
+            Open, Closed, or Active (valves only)
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_link_setting(self, name, setting):
+        """
+        Set the setting of a valve or the speed of a pump.
+
+        Parameters
+        ----------
+        name : str
+            Link name
+        setting : float
+            Valve setting in SI units (pressure in m, flow in m3/s, or loss coefficient) or relative pump speed
+        """
+        pass
+
+    @abc.abstractmethod
+    def snapshot(self):
+        """
+        Save the simulation state in memory.
+
+        Returns
+        -------
+        dict
+            Simulation state that can be passed to :meth:`restore`
+        """
+        pass
+
+    @abc.abstractmethod
+    def restore(self, snapshot):
+        """
+        Return the simulation to a state saved by :meth:`snapshot`.
+
+        Parameters
+        ----------
+        snapshot : dict
+            Simulation state from :meth:`snapshot`
+        """
+        pass
+
+    def close(self):
+        """Close the session"""
+        pass
+
+    def _link_status(self, name, status):
+        if isinstance(status, str):
+            status = LinkStatus[status.capitalize()]
+        status = LinkStatus(int(status))
+        if status not in [LinkStatus.Open, LinkStatus.Closed, LinkStatus.Active]:
+            raise ValueError('Link status must be Open, Closed, or Active')
+        link = self._wn.get_link(name)
+        if status == LinkStatus.Active and not isinstance(link, Valve):
+            raise ValueError('Only valves can have an Active status, ' + name)
+        return link, status
+
+
+class _SessionControl(object):
+    """Control actions run between timesteps by a WNTRSimulatorSession"""
+
+    def __init__(self, wn):
+        self.status_actions = dict()
+        self.setting_actions = dict()
+        for name, link in wn.links():
+            self.status_actions[name] = ControlAction(link, 'status', link._user_status)
+        for name, valve in wn.valves():
+            self.setting_actions[name] = ControlAction(valve, 'setting', valve.setting)
+
+    def actions(self):
+        return list(self.status_actions.values()) + list(self.setting_actions.values())
+
+
+class WNTRSimulatorSession(SimulationSession):
+    """
+    Step-wise hydraulic simulation session using the WNTRSimulator.
+
+    The hydraulic model is built once, and each call to :meth:`step` runs the
+    controls and solves one timestep, as in :meth:`~wntr.sim.core.WNTRSimulator.run_sim`.
+    Changes made with the ``set_*`` methods are applied through control actions.
+    Snapshots include the network state and solver variable values, so a restored
+    session reproduces the results of the original session.
+
+    The session changes the water network model in the same way as a simulation,
+    use ``wn.reset_initial_values()`` to run a new simulation from time zero.
+
+    Parameters
+    ----------
+    wn : WaterNetworkModel object
+        Water network model
+    solver: object
+        :py:class:`~wntr.sim.solvers.NewtonSolver` or Scipy solver
+    backup_solver: object
+        :py:class:`~wntr.sim.solvers.NewtonSolver` or Scipy solver
+    solver_options: dict
+        See :py:class:`~wntr.sim.solvers.NewtonSolver` for possible options
+    backup_solver_options: dict
+    HW_approx: str
+        Specifies which Hazen-Williams headloss approximation to use. Options are 'default' and 'piecewise'.
+    """
+
+    _node_attributes = ['_head', '_demand', '_pressure', '_leak_demand', '_prev_head', '_is_isolated']
+    _link_attributes = ['_internal_status', '_prev_setting', '_flow']
+
+    def __init__(self, wn, solver=NewtonSolver, backup_solver=None, solver_options=None,
+                 backup_solver_options=None, HW_approx='default'):
+        super(WNTRSimulatorSession, self).__init__(wn)
+        self._nodes = [wn.get_node(name) for name in self.node_name_list]
+        self._links = [wn.get_link(name) for name in self.link_name_list]
+        self._elevation = np.array([0.0 if isinstance(node, Reservoir) else node.elevation for node in self._nodes])
+        self._is_reservoir = np.array([isinstance(node, Reservoir) for node in self._nodes])
+
+        self._sim = WNTRSimulator(wn)
+        self._control = _SessionControl(wn)
+        self._sim._user_control = self._control
+        self._sim._initialize_simulation(solver=solver, backup_solver=backup_solver, solver_options=solver_options,
+                                         backup_solver_options=backup_solver_options, convergence_error=True,
+                                         HW_approx=HW_approx)
+
+    @property
+    def time(self):
+        return int(self._wn.sim_time)
+
+    def step(self):
+        if self._solved:
+            timestep = self._sim._hydraulic_timestep
+            next_time = self._wn.sim_time + timestep
+            next_time -= float(next_time) % timestep
+            if next_time > self._wn.options.time.duration:
+                raise RuntimeError('The simulation has reached the end of the duration')
+            self._sim._advance_time()
+        self._sim._solve_timestep()
+        self._solved = True
+        return int(self._wn.sim_time)
+
+    def get_state(self):
+        head = np.fromiter((node.head for node in self._nodes), dtype=float, count=len(self._nodes))
+        pressure = head - self._elevation
+        pressure[self._is_reservoir] = 0.0
+        isolated = np.fromiter((getattr(node, '_is_isolated', False) for node in self._nodes), dtype=bool,
+                               count=len(self._nodes))
+        pressure[isolated] = 0.0
+        demand = np.fromiter((node.demand for node in self._nodes), dtype=float, count=len(self._nodes))
+        leak_demand = np.fromiter((node.leak_demand or 0.0 for node in self._nodes), dtype=float,
+                                  count=len(self._nodes))
+
+        flowrate = np.fromiter((link.flow for link in self._links), dtype=float, count=len(self._links))
+        status = np.fromiter((link.status for link in self._links), dtype=float, count=len(self._links))
+        setting = np.fromiter((link.roughness if isinstance(link, Pipe) else
+                               1.0 if isinstance(link, Pump) else link.setting for link in self._links),
+                              dtype=float, count=len(self._links))
+        return {'time': self.time,
+                'node': {'head': head, 'pressure': pressure, 'demand': demand, 'leak_demand': leak_demand},
+                'link': {'flowrate': flowrate, 'status': status, 'setting': setting}}
+
+    def set_tank_level(self, name, level):
+        tank = self._wn.get_node(name)
+        if not isinstance(tank, Tank):
+            raise ValueError('Node ' + name + ' is not a tank')
+        tank._head = tank.elevation + level
+        tank._prev_head = tank._head
+
+    def set_demand(self, name, demand):
+        demands = self._wn.get_node(name).demand_timeseries_list
+        if name not in self._demand_overrides:
+            self._demand_overrides[name] = list(demands)
+        if demand is None:
+            self._set_demands(demands, self._demand_overrides.pop(name))
+        else:
+            self._set_demands(demands, [TimeSeries(demands._pattern_reg, float(demand))])
+
+    @staticmethod
+    def _set_demands(demands, timeseries):
+        demands.clear()
+        for ts in timeseries:
+            demands.append(ts)
+
+    def set_link_status(self, name, status):
+        link, status = self._link_status(name, status)
+        action = self._control.status_actions[name]
+        action._value = status
+        action.run_control_action()
+
+    def set_link_setting(self, name, setting):
+        link = self._wn.get_link(name)
+        if isinstance(link, Pump):
+            raise NotImplementedError('Pump speed is not supported in the WNTRSimulator')
+        if not isinstance(link, Valve):
+            raise ValueError('Only valve and pump settings can be changed, ' + name)
+        action = self._control.setting_actions[name]
+        action._value = setting
+        action.run_control_action()
+
+    def snapshot(self):
+        sim = self._sim
+        return {
+            'time': self._wn.sim_time,
+            'prev_time': self._wn._prev_sim_time,
+            'rule_iter': sim._rule_iter,
+            'first_step': sim._first_step,
+            'solved': self._solved,
+            'x': np.array(sim._model.get_x(), dtype=float),
+            'isolated': (OrderedSet(sim._prev_isolated_junctions), OrderedSet(sim._prev_isolated_links)),
+            'nodes': [tuple(getattr(node, attr, None) for attr in self._node_attributes) for node in self._nodes],
+            'links': [(link._user_status, link.setting) + tuple(getattr(link, attr) for attr in self._link_attributes)
+                      for link in self._links],
+            'demands': {name: list(self._wn.get_node(name).demand_timeseries_list)
+                        for name in self._demand_overrides},
+            'demand_overrides': dict(self._demand_overrides),
+        }
+
+    def restore(self, snapshot):
+        sim = self._sim
+        self._wn.sim_time = snapshot['time']
+        self._wn._prev_sim_time = snapshot['prev_time']
+        sim._rule_iter = snapshot['rule_iter']
+        sim._first_step = snapshot['first_step']
+        self._solved = snapshot['solved']
+
+        for node, values in zip(self._nodes, snapshot['nodes']):
+            for attr, value in zip(self._node_attributes, values):
+                if value is not None:
+                    setattr(node, attr, value)
+
+        # Status and setting changes go through control actions so the model is updated at the next timestep
+        for name, link, values in zip(self.link_name_list, self._links, snapshot['links']):
+            user_status, setting = values[0:2]
+            for attr, value in zip(self._link_attributes, values[2:]):
+                setattr(link, attr, value)
+            action = self._control.status_actions[name]
+            action._value = user_status
+            action.run_control_action()
+            if name in self._control.setting_actions and link.setting != setting:
+                action = self._control.setting_actions[name]
+                action._value = setting
+                action.run_control_action()
+
+        isolated_junctions, isolated_links = snapshot['isolated']
+        for name, link in zip(self.link_name_list, self._links):
+            link._is_isolated = name in isolated_links
+        wntr.sim.hydraulics.update_model_for_isolated_junctions_and_links(
+            sim._model, self._wn, sim._model_updater, sim._prev_isolated_junctions, sim._prev_isolated_links,
+            isolated_junctions, isolated_links)
+        sim._prev_isolated_junctions = OrderedSet(isolated_junctions)
+        sim._prev_isolated_links = OrderedSet(isolated_links)
+        sim._model.load_var_values_from_x(snapshot['x'])
+
+        for name in set(self._demand_overrides) | set(snapshot['demands']):
+            timeseries = snapshot['demands'].get(name, self._demand_overrides.get(name))
+            self._set_demands(self._wn.get_node(name).demand_timeseries_list, timeseries)
+        self._demand_overrides = dict(snapshot['demand_overrides'])
+
+
+class EpanetSimulatorSession(SimulationSession):
+    """
+    Step-wise hydraulic simulation session using the EPANET 2.2 toolkit.
+
+    The INP file is written and opened once, and each call to :meth:`step` runs
+    ``ENrunH`` (preceded by ``ENnextH`` after the first step). Changes made with
+    the ``set_*`` methods and states from :meth:`get_state` use toolkit setters and
+    getters. Snapshots store the simulation time, tank levels, link status and settings,
+    and demand changes. Flows are not stored, so the hydraulics are solved again at the
+    snapshot time when the snapshot is restored and the restored session matches the
+    original session within the hydraulic accuracy. Junction leaks are modeled as
+    emitters, see :func:`~wntr.sim.epanet.leak_emitters`; leaks that cannot be translated
+    to emitters are not modeled and a warning is issued.
+
+    Parameters
+    ----------
+    wn : WaterNetworkModel object
+        Water network model
+    file_prefix : str
+        Default prefix is "temp". The .inp and .rpt files use this prefix
+    version : float
+        EPANET toolkit version, only 2.2 is supported
+    """
+
+    def __init__(self, wn, file_prefix='temp', version=2.2):
+        super(EpanetSimulatorSession, self).__init__(wn)
+        if float(version) < 2.2:
+            raise NotImplementedError('Simulation sessions require EPANET version 2.2')
+        self._flow_units = FlowUnits[wn.options.hydraulic.inpfile_units.upper()]
+        self._darcy_weisbach = wn.options.hydraulic.headloss == 'D-W'
+        inpfile = file_prefix + '.inp'
+        write_inpfile(wn, inpfile, units=self._flow_units, version=version)
+
+        self._en = wntr.epanet.toolkit.ENepanet(version=version)
+        self._en.ENopen(inpfile, file_prefix + '.rpt', '')
+        self._en.ENopenH()
+        self._en.ENinitH(0)
+        self._time = 0
+
+        leaks = leak_emitters(wn, errors='warn')
+        self._leaks = None
+        if len(leaks) > 0:
+            self._leaks = _LeakEmitterSchedule(self._en, wn, leaks, self._flow_units)
+            self._leak_nodes = [self.node_name_list.index(name) for name in leaks.index]
+
+        en = self._en
+        self._node_index = {name: en.ENgetnodeindex(name) for name in self.node_name_list}
+        self._link_index = {name: en.ENgetlinkindex(name) for name in self.link_name_list}
+        self._node_order = np.array([self._node_index[name] for name in self.node_name_list]) - 1
+        self._link_order = np.array([self._link_index[name] for name in self.link_name_list]) - 1
+        self._node_values = np.zeros(len(self._node_order))
+        self._link_values = np.zeros(len(self._link_order))
+        self._elevation = en.ENgetnodevalues(EN.ELEVATION)[self._node_order]
+        self._tanks = {name: self._node_index[name] for name in wn.tank_name_list}
+
+        links = [wn.get_link(name) for name in self.link_name_list]
+        self._pipes = np.array([isinstance(link, Pipe) for link in links])
+        self._pressure_valves = np.array([isinstance(link, Valve) and link.valve_type in ['PRV', 'PSV', 'PBV']
+                                          for link in links])
+        self._flow_valves = np.array([isinstance(link, Valve) and link.valve_type == 'FCV' for link in links])
+        self._valve_settings = {name: valve.initial_setting for name, valve in wn.valves()}
+
+    @property
+    def time(self):
+        return self._time
+
+    def step(self):
+        en = self._en
+        t = 0
+        if self._solved:
+            timestep = en.ENnextH() if self._leaks is None else self._leaks.next_step(en, self._time)
+            if timestep <= 0:
+                raise RuntimeError('The simulation has reached the end of the duration')
+            t = self._time + timestep
+        if self._leaks is not None:
+            self._leaks.apply(en, t)
+        self._time = en.ENrunH()
+        self._solved = True
+        return self._time
+
+    def _get_node_values(self, code, param):
+        values = self._en.ENgetnodevalues(code, self._node_values)[self._node_order]
+        return to_si(self._flow_units, values, param)
+
+    def _get_link_values(self, code):
+        return self._en.ENgetlinkvalues(code, self._link_values)[self._link_order]
+
+    def get_state(self):
+        fu = self._flow_units
+        head = self._get_node_values(EN.HEAD, HydParam.HydraulicHead)
+        pressure = self._get_node_values(EN.PRESSURE, HydParam.Pressure)
+        demand = self._get_node_values(EN.DEMAND, HydParam.Demand)
+        leak_demand = np.zeros(len(demand))
+        if self._leaks is not None:
+            leak_demand[self._leak_nodes] = _leak_demand(self._leaks.leaks, [self._time],
+                                                         pressure[np.newaxis, self._leak_nodes])[0]
+            demand -= leak_demand
+
+        flowrate = to_si(fu, self._get_link_values(EN.FLOW), HydParam.Flow)
+        status = self._get_link_values(EN.STATUS)
+        setting = self._get_link_values(EN.SETTING)
+        setting[self._pipes] = to_si(fu, setting[self._pipes], HydParam.RoughnessCoeff,
+                                     darcy_weisbach=self._darcy_weisbach)
+        setting[self._pressure_valves] = to_si(fu, setting[self._pressure_valves], HydParam.Pressure)
+        setting[self._flow_valves] = to_si(fu, setting[self._flow_valves], HydParam.Flow)
+        return {'time': self.time,
+                'node': {'head': head, 'pressure': pressure, 'demand': demand, 'leak_demand': leak_demand},
+                'link': {'flowrate': flowrate, 'status': status, 'setting': setting}}
+
+    def set_tank_level(self, name, level):
+        if name not in self._tanks:
+            raise ValueError('Node ' + name + ' is not a tank')
+        self._en.ENsetnodevalue(self._tanks[name], EN.TANKLEVEL, from_si(self._flow_units, level, HydParam.Length))
+
+    def _set_demands(self, index, demands):
+        en = self._en
+        for i, (base, pattern) in enumerate(demands):
+            en.ENsetbasedemand(index, i + 1, base)
+            en.ENsetdemandpattern(index, i + 1, pattern)
+
+    def set_demand(self, name, demand):
+        en = self._en
+        index = self._node_index[name]
+        if name not in self._demand_overrides:
+            self._demand_overrides[name] = [(en.ENgetbasedemand(index, i), en.ENgetdemandpattern(index, i))
+                                            for i in range(1, en.ENgetnumdemands(index) + 1)]
+        if demand is None:
+            self._set_demands(index, self._demand_overrides.pop(name))
+        else:
+            base = from_si(self._flow_units, demand, HydParam.Demand)
+            num_demands = len(self._demand_overrides[name])
+            self._set_demands(index, [(base, 0)] + [(0.0, 0)] * (num_demands - 1))
+
+    def set_link_status(self, name, status):
+        link, status = self._link_status(name, status)
+        if status == LinkStatus.Active:
+            self.set_link_setting(name, self._valve_settings[name])
+        else:
+            self._en.ENsetlinkvalue(self._link_index[name], EN.STATUS, int(status))
+
+    def _link_setting_from_si(self, link, setting):
+        if isinstance(link, Valve) and link.valve_type in ['PRV', 'PSV', 'PBV']:
+            return from_si(self._flow_units, setting, HydParam.Pressure)
+        elif isinstance(link, Valve) and link.valve_type == 'FCV':
+            return from_si(self._flow_units, setting, HydParam.Flow)
+        return setting
+
+    def set_link_setting(self, name, setting):
+        link = self._wn.get_link(name)
+        if not isinstance(link, (Valve, Pump)):
+            raise ValueError('Only valve and pump settings can be changed, ' + name)
+        if isinstance(link, Valve):
+            self._valve_settings[name] = setting
+        self._en.ENsetlinkvalue(self._link_index[name], EN.SETTING, self._link_setting_from_si(link, setting))
+
+    def snapshot(self):
+        en = self._en
+        level = {name: en.ENgetnodevalue(index, EN.HEAD) - en.ENgetnodevalue(index, EN.ELEVATION)
+                 for name, index in self._tanks.items()}
+        return {
+            'time': self._time,
+            'solved': self._solved,
+            'tank_level': level,
+            'status': self._get_link_values(EN.STATUS).copy(),
+            'setting': self._get_link_values(EN.SETTING).copy(),
+            'valve_settings': dict(self._valve_settings),
+            'demands': {name: [(en.ENgetbasedemand(self._node_index[name], i),
+                                en.ENgetdemandpattern(self._node_index[name], i))
+                               for i in range(1, len(demands) + 1)]
+                        for name, demands in self._demand_overrides.items()},
+            'demand_overrides': dict(self._demand_overrides),
+        }
+
+    def restore(self, snapshot):
+        en = self._en
+        en.ENsettimeparam(EN.HTIME, snapshot['time'])
+        self._time = snapshot['time']
+        self._solved = snapshot['solved']
+        for name, level in snapshot['tank_level'].items():
+            en.ENsetnodevalue(self._tanks[name], EN.TANKLEVEL, level)
+
+        status = snapshot['status']
+        setting = snapshot['setting']
+        for i, name in enumerate(self.link_name_list):
+            index = self._link_index[name]
+            link = self._wn.get_link(name)
+            if isinstance(link, Pump):
+                en.ENsetlinkvalue(index, EN.SETTING, setting[i])
+                en.ENsetlinkvalue(index, EN.STATUS, status[i])
+            elif isinstance(link, Valve) and setting[i] != 0:
+                # valves with a setting are active, the toolkit only reports open or closed
+                en.ENsetlinkvalue(index, EN.SETTING, setting[i])
+            else:
+                en.ENsetlinkvalue(index, EN.STATUS, status[i])
+        self._valve_settings = dict(snapshot['valve_settings'])
+
+        for name in set(self._demand_overrides) | set(snapshot['demands']):
+            demands = snapshot['demands'].get(name, self._demand_overrides.get(name))
+            self._set_demands(self._node_index[name], demands)
+        self._demand_overrides = dict(snapshot['demand_overrides'])
+
+        # Flows are not saved, resolve the hydraulics at the snapshot time so the next step starts from them
+        if self._solved:
+            if self._leaks is not None:
+                self._leaks.apply(en, self._time)
+            en.ENrunH()
+
+    def close(self):
+        if self._en is not None:
+            self._en.ENcloseH()
+            self._en.ENclose()
+            self._en = None
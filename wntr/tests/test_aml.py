@@ -292,6 +292,89 @@ class TestConstraint(unittest.TestCase):
         compare_evaluation(self, m, true_con_values, true_jac)
 
 
+class TestConstraintFamily(unittest.TestCase):
+    @staticmethod
+    def _expr(x, y, p):
+        e = aml.ConditionalExpression()
+        e.add_condition(aml.inequality(body=x, ub=-1), -p * (-x) ** 1.852 - y)
+        e.add_condition(aml.inequality(body=x, ub=1), p * x - aml.exp(y))
+        e.add_final_expr(p * x ** 1.852 + x * y)
+        return e
+
+    def _build(self, use_family):
+        m = aml.Model()
+        m.x = aml.Var()
+        m.y = aml.Var()
+        m.z = aml.Var()
+        m.w = aml.Var()
+        m.p = aml.Param(2.0)
+        m.q = aml.Param(-0.5)
+        x = aml.Var()
+        y = aml.Var()
+        p = aml.Param()
+        family = aml.ConstraintFamily(self._expr(x, y, p), [x, y, p])
+        # the last two members use the same variable twice and a parameter in place of a template Var
+        leaves = [(m.x, m.y, m.p), (m.y, m.z, m.q), (m.z, m.z, m.p), (m.w, m.q, m.q)]
+        for i, (a, b, c) in enumerate(leaves):
+            if use_family:
+                con = family.member([a, b, c])
+            else:
+                con = aml.Constraint(self._expr(a, b, c))
+            setattr(m, 'c{0}'.format(i), con)
+        return m
+
+    def _compare(self, m1, m2):
+        m1.set_structure()
+        m2.set_structure()
+        r1 = m1.evaluate_residuals()
+        r2 = m2.evaluate_residuals()
+        j1 = m1.evaluate_jacobian().toarray()
+        j2 = m2.evaluate_jacobian().toarray()
+        for name in ['c0', 'c1', 'c2', 'c3']:
+            c1 = getattr(m1, name)
+            c2 = getattr(m2, name)
+            self.assertAlmostEqual(r1[c1.index], r2[c2.index], 10)
+            self.assertAlmostEqual(r1[c1.index], c1.evaluate(), 10)
+            ders = c1.reverse_ad()
+            for v in ['x', 'y', 'z', 'w']:
+                self.assertAlmostEqual(j1[c1.index, getattr(m1, v).index], j2[c2.index, getattr(m2, v).index], 10)
+                self.assertAlmostEqual(j1[c1.index, getattr(m1, v).index], ders.get(getattr(m1, v), 0), 10)
+
+    def test_family_evaluation(self):
+        m1 = self._build(True)
+        m2 = self._build(False)
+        for x, y, z in [(-4.5, -3.7, -2.1), (0.5, 0.3, -0.2), (4.5, 3.7, 2.1), (-4.5, 0.3, 2.1)]:
+            for m in [m1, m2]:
+                m.x.value = x
+                m.y.value = y
+                m.z.value = z
+                m.w.value = -y
+            self._compare(m1, m2)
+
+        del m1.c2
+        del m2.c2
+        m1.c2 = aml.Constraint(m1.z - 1)
+        m2.c2 = aml.Constraint(m2.z - 1)
+        self._compare(m1, m2)
+
+    def test_family_exceptions(self):
+        m = aml.Model()
+        m.x = aml.Var()
+        m.p = aml.Param(1.0)
+        x = aml.Var()
+        p = aml.Param()
+        with self.assertRaises(ValueError):
+            aml.ConstraintFamily(x * m.p, [x, p])
+        family = aml.ConstraintFamily(x * p, [x, p])
+        with self.assertRaises(ValueError):
+            family.member([m.x])
+        with self.assertRaises(ValueError):
+            family.member([m.x, m.x])
+        m.c = family.member([m.x, m.p])
+        m.set_structure()
+        self.assertAlmostEqual(m.evaluate_jacobian()[m.c.index, m.x.index], 1.0)
+
+
 class TestCSRJacobian(unittest.TestCase):
     def test_register_and_remove_constraint(self):
         m = aml.Model()
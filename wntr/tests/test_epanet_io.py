@@ -700,6 +700,12 @@ class TestNet3InpUnitsResults(unittest.TestCase):
                 results = sim.run_sim(file_prefix=file_prefix)
                 temp = results.node['pressure'].loc[0,wn.junction_name_list]
                 pressure[headloss+', '+units] = temp
+
+                # The WNTRSimulator supports all headloss formulas
+                sim = self.wntr.sim.WNTRSimulator(wn)
+                results = sim.run_sim()
+                MAE = (results.node['pressure'].loc[0,wn.junction_name_list] - temp).abs().mean()
+                self.assertLessEqual(MAE, 0.01) # m
         
         #import matplotlib.pylab as plt
         #import pandas as pd
@@ -734,11 +740,6 @@ class TestNet3InpUnitsResults(unittest.TestCase):
         with self.assertRaises(AssertionError):
             self.assertLessEqual(MAE, threshold) # m
         
-        ## D-W is not supported by the WNTRSimulator
-        sim = self.wntr.sim.WNTRSimulator(wn)
-        with self.assertRaises(NotImplementedError):
-            results = sim.run_sim()
-        
             
 if __name__ == "__main__":
     unittest.main()
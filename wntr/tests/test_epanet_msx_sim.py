@@ -45,6 +45,59 @@ class TestEpanetMSXSim(unittest.TestCase):
         )
         self.assertLess(error, 0.0001)  # 0.01% error
 
+    def test_msx_ensemble(self):
+        scenarios = [
+            {"constants": {"Ka": 5.0, "Kb": 0.5}},
+            {"sources": [("Source", "NH2CL", "CONCEN", 1.0)]},
+            {},
+        ]
+        wn = wntr.network.WaterNetworkModel(inp_file_name=inp_filename)
+        wn.add_msx_model(msx_filename=msx_filename)
+        sim = wntr.sim.EpanetSimulator(wn)
+        quality = sim.run_msx_ensemble(scenarios)
+        self.assertEqual(quality["node"]["AStot"].shape, (3, 25, wn.num_nodes))
+        self.assertEqual(quality["link"]["AS5s"].shape, (3, 25, wn.num_links))
+
+        for k in range(len(scenarios)):
+            wn = wntr.network.WaterNetworkModel(inp_file_name=inp_filename)
+            wn.add_msx_model(msx_filename=msx_filename)
+            if k == 0:
+                wn.msx.reaction_system.constants["Ka"].value = 5.0
+                wn.msx.reaction_system.constants["Kb"].value = 0.5
+            elif k == 1:
+                wn.msx.network_data.sources["NH2CL"] = {
+                    "Source": {"source_type": "CONCEN", "strength": 1.0, "pattern": None, "note": None}
+                }
+            res = wntr.sim.EpanetSimulator(wn).run_sim()
+            for species in wn.msx.species_name_list:
+                np.testing.assert_allclose(quality["node"][species][k], res.node[species].values, rtol=1e-5, atol=1e-5)
+                # at time 0 the toolkit reports link quality before transport starts
+                np.testing.assert_allclose(quality["link"][species][k, 1:], res.link[species].values[1:], rtol=1e-5, atol=1e-5)
+
+
+    def test_msx_ensemble_node_order(self):
+        # elements added after loading are not in toolkit index order
+        def model():
+            wn = wntr.network.WaterNetworkModel(inp_file_name=inp_filename)
+            wn.add_msx_model(msx_filename=msx_filename)
+            wn.add_junction("NEWNODE", elevation=0)
+            wn.add_pipe("NEWPIPE", "NEWNODE", "C", diameter=0.2)
+            return wn
+
+        wn = model()
+        quality = wntr.sim.EpanetSimulator(wn).run_msx_ensemble([{"sources": [("Source", "NH2CL", "CONCEN", 1.0)]}])
+
+        wn = model()
+        wn.msx.network_data.sources["NH2CL"] = {
+            "Source": {"source_type": "CONCEN", "strength": 1.0, "pattern": None, "note": None}
+        }
+        res = wntr.sim.EpanetSimulator(wn).run_sim()
+        for species in wn.msx.species_name_list:
+            np.testing.assert_allclose(quality["node"][species][0], res.node[species].loc[:, wn.node_name_list].values,
+                                       rtol=1e-5, atol=1e-5)
+            np.testing.assert_allclose(quality["link"][species][0, 1:],
+                                       res.link[species].loc[:, wn.link_name_list].values[1:], rtol=1e-5, atol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -2,6 +2,7 @@ import unittest
 from os.path import abspath, dirname, join, exists
 import sys, platform
 
+import numpy as np
 import wntr.epanet.toolkit
 
 if 'darwin' in sys.platform.lower() and 'arm' in platform.platform().lower():
@@ -88,6 +89,29 @@ class TestEpanetToolkit(unittest.TestCase):
             link_val = enData.ENgetlinkvalue(link_index, 0) # DIAMETER = 0
             assert(link_val == 16.5) 
         
+    def test_ENgetvalues_ENsetvalues(self):
+        for version in [2.0, 2.2,]:
+            if version == 2.0 and skip_v2_tests_on_arm:
+                continue  # skip v2.0 tests on mac silicon processor
+            enData = wntr.epanet.toolkit.ENepanet(version=version)
+            enData.inpfile = join(datadir, "Net1.inp")
+            enData.ENopen(enData.inpfile, "temp.rpt")
+            
+            elevation = enData.ENgetnodevalues(0) # ELEVATION = 0
+            assert(elevation.shape == (11,))
+            assert(elevation[0] == enData.ENgetnodevalue(1, 0))
+            buffer = np.zeros(13)
+            diameter = enData.ENgetlinkvalues(0, buffer) # DIAMETER = 0
+            assert(diameter is buffer)
+            assert(buffer[1] == 14)
+            self.assertRaises(ValueError, enData.ENgetlinkvalues, 0, np.zeros(11))
+            
+            enData.ENsetnodevalues(1, [10.0, 20.0], indices=[2, 3]) # BASEDEMAND = 1
+            assert(enData.ENgetnodevalue(2, 1) == 10.0)
+            assert(enData.ENgetnodevalue(3, 1) == 20.0)
+            enData.ENsetlinkvalues(4, 0, indices=[enData.ENgetlinkindex('11')]) # INITSTATUS = 4
+            assert(enData.ENgetlinkvalue(2, 4) == 0)
+            
     def test_ENsaveinpfile(self):
         for version in [2.0, 2.2,]:
             if version == 2.0 and skip_v2_tests_on_arm:
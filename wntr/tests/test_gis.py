@@ -211,6 +211,11 @@ class TestGIS(unittest.TestCase):
         expected_weighted_mean = (bv*(5/30) + 30*(25/30) + 20*(10/30))/(40/30)
         self.assertAlmostEqual(stats.loc['122','weighted_mean'], expected_weighted_mean, 2)
         
+        # Clipping intersecting pairs in chunks gives the same result
+        stats_chunk = wntr.gis.intersect(self.gis_data.pipes, self.polygons, 'value', True, bv, 
+                                         chunk_size=2)
+        assert_frame_equal(stats_chunk, stats)
+        
     
     def test_intersect_polygons_with_lines(self):
         
@@ -323,6 +328,20 @@ class TestGIS(unittest.TestCase):
         
         assert_frame_equal(pd.DataFrame(snapped_points), expected, check_dtype=False)
 
+    def test_snap_chunk_size(self):
+        
+        for B in [self.gis_data.junctions, self.gis_data.pipes]:
+            snapped_points = wntr.gis.snap(self.points, B, tolerance=5.0)
+            for chunk_size in [1, 2]:
+                snapped_points_chunk = wntr.gis.snap(self.points, B, tolerance=5.0, 
+                                                     chunk_size=chunk_size)
+                assert_frame_equal(snapped_points_chunk, snapped_points)
+        
+        # No points within tolerance
+        snapped_points = wntr.gis.snap(self.points, self.gis_data.pipes, tolerance=0.1)
+        assert snapped_points.shape[0] == 0
+        assert list(snapped_points.columns) == ['link', 'node', 'snap_distance', 'line_position', 'geometry']
+
 
 @unittest.skipIf(not has_geopandas,
                  "Cannot test GIS capabilities: geopandas is missing")
@@ -367,6 +386,32 @@ class TestConnectLines(unittest.TestCase):
         assert nx.is_connected(uG)
         assert nx.number_connected_components(uG) == 1
 
+    def test_connect_lines_chained_endpoints(self):
+        # End points of lines 1, 2, and 3 are within 0.6 of each other 
+        # through line 2, line 4 is not connected
+        lines = gpd.GeoDataFrame({'value': [1, 2, 3, 4]}, index=['1', '2', '3', '4'], 
+            geometry=[LineString([(0, 0), (10, 0)]), LineString([(10.5, 0), (20, 0)]), 
+                      LineString([(11, 0), (11, 10)]), LineString([(30, 0), (40, 0)])],
+            crs="EPSG:2236")
+        
+        pipes, junctions = wntr.gis.connect_lines(lines, 0.6)
+        
+        assert list(pipes.columns) == ['value', 'geometry', 'start_node_name', 'end_node_name']
+        assert list(pipes.index) == ['1', '2', '3', '4']
+        assert junctions.shape[0] == 6
+        assert set(pipes['start_node_name']).union(pipes['end_node_name']) == set(junctions.index)
+        
+        node = pipes.loc['1', 'end_node_name']
+        assert pipes.loc['2', 'start_node_name'] == node
+        assert pipes.loc['3', 'start_node_name'] == node
+        assert list(junctions.loc[node, 'geometry'].coords) == [(10.5, 0)]
+        
+        # Line geometry is extended to the connecting node
+        assert list(pipes.loc['1', 'geometry'].coords) == [(0, 0), (10, 0), (10.5, 0)]
+        assert list(pipes.loc['2', 'geometry'].coords) == [(10.5, 0), (20, 0)]
+        assert list(pipes.loc['3', 'geometry'].coords) == [(10.5, 0), (11, 0), (11, 10)]
+        assert list(pipes.loc['4', 'geometry'].coords) == [(30, 0), (40, 0)]
+
 
 @unittest.skipIf(not has_rasterio,
                  "Cannot test raster capabilities: rasterio is missing")
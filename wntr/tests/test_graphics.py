@@ -117,6 +117,28 @@ class TestGraphics(unittest.TestCase):
 
         self.assertTrue(isfile(filename))
 
+    def test_plot_network_decimate(self):
+        from wntr.graphics.network import _NetworkRenderer
+
+        inp_file = join(ex_datadir, "Net6.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        
+        network = _NetworkRenderer(wn)
+        self.assertEqual(network.node_mask.sum(), wn.num_nodes)
+        self.assertEqual(network.link_mask.sum(), wn.num_links)
+        
+        network = _NetworkRenderer(wn, decimate=50)
+        self.assertLess(network.node_mask.sum(), wn.num_nodes)
+        self.assertLess(network.link_mask.sum(), wn.num_links)
+        
+        plt.figure()
+        ax = wntr.graphics.plot_network(wn, node_attribute="elevation", decimate=50)
+        # attribute values are not decimated
+        elevation = wn.query_node_attribute("elevation")
+        self.assertEqual(ax.collections[1].get_offsets().shape[0], len(elevation))
+        self.assertEqual(len(ax.collections[2].get_segments()), network.link_mask.sum())
+        plt.close()
+
     def test_plot_interactive_network1(self):
 
         filename = abspath(join(testdir, "plot_interactive_network1.html"))
@@ -175,6 +197,35 @@ class TestGraphics(unittest.TestCase):
 
         self.assertTrue(isinstance(anim, FuncAnimation))
 
+    def test_network_animation_results_store(self):
+        import shutil
+        
+        inp_file = join(ex_datadir, "Net1.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        wn.options.time.duration = 4 * 3600
+        
+        store_dir = abspath(join(testdir, "network_animation_store"))
+        if os.path.isdir(store_dir):
+            shutil.rmtree(store_dir)
+        store = wntr.sim.ResultsStore(store_dir, chunk_size=2)
+        sim = wntr.sim.EpanetSimulator(wn)
+        results = sim.run_sim(results_store=store)
+        
+        pressure = results.node["pressure"]
+        flowrate = results.link["flowrate"]
+        filename = abspath(join(testdir, "network_animation.png"))
+        anim = wntr.graphics.network_animation(
+            wn, node_attribute=pressure, link_attribute=flowrate, title="Net1", 
+            filename=filename
+        )
+        plt.close()
+        
+        for n in range(pressure.shape[0]):
+            frame_filename = abspath(join(testdir, "network_animation_{0:06d}.png".format(n)))
+            self.assertTrue(isfile(frame_filename))
+            os.remove(frame_filename)
+        shutil.rmtree(store_dir)
+
     def test_plot_fragility_curve1(self):
         from scipy.stats import lognorm
 
@@ -109,6 +109,31 @@ class TestTankCapacity(unittest.TestCase):
         self.assertLess(tank_capacity.max().max(), 1)
         self.assertGreater(tank_capacity.min().min(), 0.4) # for this example, tanks capcity is > 0.4
     
+    def test_tank_capacity_vol_curve(self):
+        wn = wntr.network.WaterNetworkModel()
+        wn.add_curve('vcurve', 'VOLUME', [(0, 0), (5, 100), (10, 400)])
+        wn.add_tank('T1', max_level=10, vol_curve='vcurve')
+        wn.add_tank('T2', max_level=8, vol_curve='vcurve')
+        wn.add_tank('T3', diameter=2, max_level=4)
+        pressure = pd.DataFrame([[0, 5, 2], [7.5, 8, 4]], index=[0, 3600], 
+                                columns=['T1', 'T2', 'T3'])
+        
+        tank_capacity = wntr.metrics.tank_capacity(pressure, wn)
+        
+        expected = pd.DataFrame([[0, 100/280, 0.5], [250/400, 1, 1]], 
+                                index=[0, 3600], columns=['T1', 'T2', 'T3'])
+        assert_frame_equal(tank_capacity, expected)
+        
+    def test_tank_capacity_scenarios(self):
+        pressure = self.results.node["pressure"].loc[:,self.wn.tank_name_list]
+        scenarios = {'base': pressure, 'low': pressure*0.5}
+        tank_capacity = wntr.metrics.tank_capacity(scenarios, self.wn)
+        
+        assert_frame_equal(tank_capacity.loc['base'], 
+                           wntr.metrics.tank_capacity(pressure, self.wn))
+        assert_frame_equal(tank_capacity.loc['low'], 
+                           wntr.metrics.tank_capacity(pressure*0.5, self.wn))
+    
     
 if __name__ == "__main__":
     unittest.main()
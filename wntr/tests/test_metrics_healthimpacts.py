@@ -2,6 +2,9 @@ import unittest
 from os.path import abspath, dirname, join
 import sys, platform
 
+import numpy as np
+from pandas.testing import assert_series_equal
+
 import wntr
 
 if 'darwin' in sys.platform.lower() and 'arm' in platform.platform().lower():
@@ -136,6 +139,45 @@ class TestHealthImpactsMetric(unittest.TestCase):
         error = abs((EC[12 * 3600] - expected) / expected)
         self.assertLess(error, 0.01)  # 1% error
 
+    def test_contaminant_impact_calculator(self):
+        inp_file = join(netdir, "Net3.inp")
+        
+        results = {}
+        for source in ["121", "161"]:
+            wn = wntr.network.WaterNetworkModel(inp_file)
+            wn.options.time.duration = 24*3600
+            wn.options.quality.parameter = "CHEMICAL"
+            wn.add_source("Source1", source, "SETPOINT", 100)
+            sim = wntr.sim.EpanetSimulator(wn)
+            results[source] = sim.run_sim()
+        
+        calc = wntr.metrics.ContaminantImpactCalculator(wn, detection_limit=5)
+        impact = calc.impact_results(results, chunk_size=5)
+        
+        for source in ["121", "161"]:
+            demand = results[source].node["demand"].loc[:, wn.junction_name_list]
+            quality = results[source].node["quality"]
+            flowrate = results[source].link["flowrate"].loc[:, wn.pipe_name_list]
+            MC = wntr.metrics.mass_contaminant_consumed(demand, quality.loc[:, wn.junction_name_list], 5)
+            VC = wntr.metrics.volume_contaminant_consumed(demand, quality.loc[:, wn.junction_name_list], 5)
+            EC = wntr.metrics.extent_contaminant(quality, flowrate, wn, 5)
+            
+            assert_series_equal(impact["mass_consumed"].loc[source], MC.sum(), 
+                                check_names=False, check_dtype=False)
+            assert_series_equal(impact["volume_consumed"].loc[source], VC.sum(), 
+                                check_names=False, check_dtype=False)
+            self.assertAlmostEqual(impact["extent"][source], EC.iloc[-1], 6)
+        
+        # Array input, scenarios stacked along the first dimension
+        demand = np.stack([results[s].node["demand"].loc[:, calc.node_names].values for s in results])
+        quality = np.stack([results[s].node["quality"].loc[:, calc.node_names].values for s in results])
+        flowrate = np.stack([results[s].link["flowrate"].loc[:, calc.pipe_names].values for s in results])
+        impact_array = calc.impact(demand, quality, flowrate)
+        
+        np.testing.assert_allclose(impact_array["mass_consumed"], impact["mass_consumed"].values)
+        np.testing.assert_allclose(impact_array["volume_consumed"], impact["volume_consumed"].values)
+        np.testing.assert_allclose(impact_array["extent"], impact["extent"].values)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,6 +61,50 @@ class TestPopulationMetrics(unittest.TestCase):
         )
         assert_frame_equal(pop_impacted, expected, check_dtype=False)
 
+    def test_population_model_changes(self):
+        inp_file = join(net3dir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+
+        junction = wn.get_node("101")
+        junction.demand_timeseries_list[0].base_value *= 2
+        pop2 = wntr.metrics.population(wn)
+        self.assertGreater(pop2["101"], 0)
+        self.assertAlmostEqual(pop2["101"], 2*wntr.metrics.population(
+            wntr.network.WaterNetworkModel(inp_file))["101"], delta=1)
+        
+        wn.options.hydraulic.demand_multiplier = 0.5
+        pop3 = wntr.metrics.population(wn)
+        self.assertAlmostEqual(pop3["101"], pop2["101"]/2, delta=1)
+        
+        wn.add_junction("new", base_demand=0.01)
+        pop4 = wntr.metrics.population(wn)
+        self.assertIn("new", pop4.index)
+        
+    def test_population_impacted_scenarios(self):
+        pop = pd.Series([100, 200, 300, 400, 500], index=["J1", "J2", "J3", "J4", "J5"])
+        wsa = np.array([[0.6, 0.7, 0.8, 0.9, 1], 
+                        [0, 1, 0, 1, 0], 
+                        [1, 0, 1, 0, 1]]) # scenario x junction
+        expected = np.array([[100, 200, 0, 0, 0], 
+                             [100, 0, 300, 0, 500], 
+                             [0, 200, 0, 400, 0]])
+        
+        pop_impacted = wntr.metrics.population_impacted(pop, wsa, np.less, 0.8)
+        np.testing.assert_array_equal(pop_impacted, expected)
+        
+        # Boolean mask
+        pop_impacted = wntr.metrics.population_impacted(pop, wsa < 0.8)
+        np.testing.assert_array_equal(pop_impacted, expected)
+        
+        # Threshold per junction
+        threshold = np.array([0.7, 0.8, 0.9, 1, 1.1])
+        pop_impacted = wntr.metrics.population_impacted(pop, wsa, np.less, threshold)
+        np.testing.assert_array_equal(pop_impacted.sum(axis=1), [1500, 900, 1100])
+        
+        wsa = pd.DataFrame(wsa, columns=pop.index)
+        pop_impacted = wntr.metrics.population_impacted(pop, wsa < 0.8)
+        assert_frame_equal(pop_impacted, pd.DataFrame(expected, columns=pop.index))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from os.path import abspath, dirname, join
 
+import numpy as np
 import pandas as pd
 
 testdir = dirname(abspath(str(__file__)))
@@ -77,6 +78,64 @@ class TestPumpNet3(unittest.TestCase):
 
         self.assertLess(error.max().max(), 0.01)
 
+    def test_efficiency_curve_and_price_pattern(self):
+        inp_file = join(ex_datadir, "Net3.inp")
+        wn = self.wntr.network.WaterNetworkModel(inp_file)
+        wn.options.energy.global_price = 3.61e-8
+        wn.add_curve("effic", "EFFICIENCY", [(0.0, 50.0), (0.1, 80.0), (0.5, 60.0)])
+        wn.get_link("10").efficiency = wn.get_curve("effic")
+        wn.add_pattern("price", [1.0, 2.0, 0.5])
+        wn.get_link("335").energy_pattern = "price"
+        wn.get_link("335").energy_price = 5e-8
+
+        times = [0, 3600, 7200, 10800]
+        flowrate = pd.DataFrame([[0.05, 0.2], [0.3, 0.0], [0.6, 0.1], [0.1, 0.4]],
+                                index=times, columns=["10", "335"])
+        head = pd.DataFrame(10.0, index=times, columns=wn.node_name_list)
+        head["10"] = 100.0 # end node of pump 10
+        head["61"] = 50.0 # end node of pump 335
+
+        power = self.wntr.metrics.pump_power(flowrate, head, wn)
+        efficiency = pd.DataFrame([[0.65, 0.75], [0.7, 0.75], [0.6, 0.75], [0.8, 0.75]],
+                                  index=times, columns=["10", "335"])
+        headloss = pd.DataFrame({"10": 90.0, "335": 40.0}, index=times)
+        expected = 1000.0 * 9.81 * headloss * flowrate / efficiency
+        pd.testing.assert_frame_equal(power, expected)
+
+        # head is only needed at the pump start and end nodes
+        pump_nodes = ["Lake", "10", "60", "61"]
+        power = self.wntr.metrics.pump_power(flowrate, head.loc[:, pump_nodes], wn)
+        pd.testing.assert_frame_equal(power, expected)
+
+        energy = self.wntr.metrics.pump_energy(flowrate, head, wn)
+        cost = self.wntr.metrics.pump_cost(energy, wn)
+        multiplier = [wn.get_pattern("price").at(t) for t in times]
+        expected = pd.DataFrame({"10": energy["10"] * 3.61e-8, 
+                                 "335": energy["335"] * 5e-8 * multiplier}, index=times)
+        pd.testing.assert_frame_equal(cost, expected)
+        
+    def test_pump_energy_calculator_batch(self):
+        sim = self.wntr.sim.EpanetSimulator(self.wn)
+        results = sim.run_sim()
+        
+        calc = self.wntr.metrics.PumpEnergyCalculator(self.wn)
+        flowrate = results.link["flowrate"].loc[:, calc.pump_names]
+        head = results.node["head"].loc[:, calc.node_names]
+        schedules = np.stack([flowrate.values, 0.5*flowrate.values, 0*flowrate.values])
+        heads = np.stack([head.values]*3)
+        
+        energy = calc.energy(schedules, heads)
+        cost = calc.cost(energy, flowrate.index)
+        self.assertEqual(cost.shape, (3,) + flowrate.shape)
+        
+        expected = self.wntr.metrics.pump_energy(flowrate, head, self.wn)
+        np.testing.assert_allclose(energy[0], expected.values)
+        expected = self.wntr.metrics.pump_energy(0.5*flowrate, head, self.wn)
+        np.testing.assert_allclose(energy[1], expected.values)
+        expected = self.wntr.metrics.pump_cost(expected, self.wn)
+        np.testing.assert_allclose(cost[1], expected.values)
+        self.assertEqual(np.abs(cost[2]).max(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
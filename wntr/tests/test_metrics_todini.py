@@ -98,6 +98,47 @@ class TestTodiniMetrics(unittest.TestCase):
         # print(todini[0], expected, error)
         self.assertLess(error, 0.03)
 
+    def test_Todini_scenarios(self):
+        inp_file = join(datadir, "Todini_Fig2_solA_CMH.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        sim = wntr.sim.WNTRSimulator(wn)
+        results = sim.run_sim()
+
+        head = results.node["head"]
+        pressure = results.node["pressure"]
+        demand = results.node["demand"]
+        flowrate = results.link["flowrate"]
+        todini = wntr.metrics.todini_index(
+            {"a": head, "b": head}, 
+            {"a": pressure, "b": pressure}, 
+            {"a": demand, "b": 0.5*demand}, 
+            {"a": flowrate, "b": flowrate}, wn, self.h_star
+        )
+        
+        assert_series_equal(todini.loc["a"], wntr.metrics.todini_index(
+            head, pressure, demand, flowrate, wn, self.h_star))
+        assert_series_equal(todini.loc["b"], wntr.metrics.todini_index(
+            head, pressure, 0.5*demand, flowrate, wn, self.h_star))
+
+        # rows are aligned by (scenario, time), not by position
+        todini = wntr.metrics.todini_index(
+            {"a": head, "b": head}, 
+            {"a": pressure, "b": 0.5*pressure}, 
+            {"a": demand, "b": demand}, 
+            {"a": flowrate, "b": flowrate}, wn, self.h_star
+        )
+        self.assertNotAlmostEqual(todini.loc["a"].iloc[0], todini.loc["b"].iloc[0])
+        reordered = wntr.metrics.todini_index(
+            {"a": head, "b": head}, 
+            {"b": 0.5*pressure, "a": pressure}, 
+            {"b": demand, "a": demand}, 
+            {"a": flowrate, "b": flowrate}, wn, self.h_star
+        )
+        assert_series_equal(reordered, todini)
+        
+        with self.assertRaises(ValueError):
+            wntr.metrics.todini_index(head, pressure, demand.iloc[:-1], flowrate, wn, self.h_star)
+
 class TestMRIMetric(unittest.TestCase):
     
     @classmethod
@@ -297,6 +297,153 @@ class TestHeadloss(unittest.TestCase):
                 self.assertTrue(compare_floats(d1, d3, 1e-8, 1e-6))
 
 
+class TestDWCMHeadloss(unittest.TestCase):
+    def _build(self, headloss, roughness):
+        wn = wntr.network.WaterNetworkModel()
+        wn.add_tank("t1", 0, 10, 0, 20, 15)
+        wn.add_junction("j1", 0.01)
+        wn.add_pipe("p1", "t1", "j1", diameter=0.1, roughness=roughness, minor_loss=10.0)
+        m = wntr.sim.aml.Model()
+        updater = ModelUpdater()
+        if headloss == "D-W":
+            wntr.sim.models.constants.darcy_weisbach_constants(m)
+            wntr.sim.models.param.dw_resistance_param.build(m, wn, updater)
+        else:
+            wntr.sim.models.constants.chezy_manning_constants(m)
+            wntr.sim.models.param.cm_resistance_param.build(m, wn, updater)
+        wntr.sim.models.param.minor_loss_param.build(m, wn, updater)
+        wntr.sim.models.param.source_head_param(m, wn)
+        wntr.sim.models.var.flow_var(m, wn)
+        wntr.sim.models.var.head_var(m, wn)
+        if headloss == "D-W":
+            wntr.sim.models.constraint.darcy_weisbach_headloss_constraint.build(m, wn, updater)
+            con = m.darcy_weisbach_headloss["p1"]
+        else:
+            wntr.sim.models.constraint.chezy_manning_headloss_constraint.build(m, wn, updater)
+            con = m.chezy_manning_headloss["p1"]
+        m.source_head["t1"].value = 10
+        m.head["j1"].value = 0
+        return wn, m, con
+
+    def _check_headloss(self, pipe, m, con, flows, abs_headloss):
+        for f in flows + [-i for i in flows]:
+            m.flow["p1"].value = f
+            r1 = con.evaluate()
+            sign = 1 if f > 0 else -1
+            r2 = -sign * (abs_headloss(abs(f)) + abs_minor_loss(pipe, f)) + 10
+            self.assertAlmostEqual(r1, r2, 10)
+            d1 = con.reverse_ad()[m.flow["p1"]]
+            d2 = approximate_derivative(con, m.flow["p1"], 1e-8)
+            self.assertLess(d2, 0)
+            self.assertLess(abs(d1 - d2) / abs(d2) * 100, 0.1)
+
+    def test_DW_headloss(self):
+        wn, m, con = self._build("D-W", 0.0005)
+        pipe = wn.get_link("p1")
+        viscosity = 1.1e-5 * 0.3048 ** 2
+        q1 = 2000 * math.pi * pipe.diameter * viscosity / 4
+        q2 = 4000 * math.pi * pipe.diameter * viscosity / 4
+
+        def abs_dw(f):
+            if f <= q1:
+                # laminar flow, friction factor 64/Re
+                return 128 * viscosity * pipe.length / (9.81 * math.pi * pipe.diameter ** 4) * f
+            re = 4 * f / (math.pi * pipe.diameter * viscosity)
+            friction = 0.25 / math.log10(pipe.roughness / (3.7 * pipe.diameter) + 5.74 / re ** 0.9) ** 2
+            return friction * pipe.length / pipe.diameter * (f / (math.pi / 4 * pipe.diameter ** 2)) ** 2 / (2 * 9.81)
+
+        self._check_headloss(pipe, m, con, [q1 / 2.0, q1, q2, 0.01, 0.1], abs_dw)
+
+        # the transition polynomial matches the laminar and turbulent headloss values
+        for f in [q1, q2]:
+            m.flow["p1"].value = f * (1 + 1e-9)
+            r1 = con.evaluate()
+            m.flow["p1"].value = f * (1 - 1e-9)
+            self.assertAlmostEqual(r1, con.evaluate(), 8)
+
+    def test_CM_headloss(self):
+        wn, m, con = self._build("C-M", 0.011)
+        pipe = wn.get_link("p1")
+
+        def abs_cm(f):
+            k = m.cm_k * pipe.roughness ** 2 * pipe.diameter ** (-5.333) * pipe.length
+            if f >= m.cm_q2:
+                return k * f ** 2
+            elif f >= m.cm_q1:
+                return k * (m.cm_a * f ** 3 + m.cm_b * f ** 2 + m.cm_c * f + m.cm_d)
+            return k * m.cm_m * f
+
+        self._check_headloss(pipe, m, con, [m.cm_q1 / 2.0, m.cm_q1, (m.cm_q1 + m.cm_q2) / 2.0, m.cm_q2, 0.1],
+                             abs_cm)
+        # 10.29*n**2*L*Q**2/D**(16/3) in SI units, EPANET coefficients are within 1%
+        m.flow["p1"].value = 0.1
+        headloss = 10 - con.evaluate() - abs_minor_loss(pipe, 0.1)
+        self.assertLess(abs(headloss / (10.29 * 0.011 ** 2 * pipe.length * 0.1 ** 2 / 0.1 ** (16 / 3)) - 1), 0.01)
+
+
+class TestValveHeadloss(unittest.TestCase):
+    def _build(self):
+        wn = wntr.network.WaterNetworkModel()
+        wn.add_reservoir("r1", base_head=60)
+        wn.add_junction("j1", elevation=10)
+        wn.add_junction("j2", elevation=5)
+        wn.add_junction("j3", elevation=0, base_demand=0.05)
+        wn.add_junction("j4", elevation=0, base_demand=0.01)
+        wn.add_pipe("p1", "r1", "j1", length=500, diameter=0.3, roughness=100)
+        wn.add_pipe("p2", "j2", "j3", length=500, diameter=0.3, roughness=100)
+        wn.add_pipe("p3", "j1", "j4", length=800, diameter=0.2, roughness=100)
+        wn.add_curve("c1", "HEADLOSS", [(0.0, 2.0), (0.02, 4.0), (0.05, 10.0), (0.1, 30.0)])
+        wn.add_valve("pbv", "j1", "j2", diameter=0.3, valve_type="PBV", minor_loss=50.0, initial_setting=5.0)
+        wn.add_valve("gpv", "j4", "j3", diameter=0.2, valve_type="GPV", initial_setting="c1")
+        wn.options.time.duration = 4 * 3600
+        wn.reset_initial_values()
+        pbv = wn.get_link("pbv")
+        gpv = wn.get_link("gpv")
+        act = wntr.network.controls.ControlAction(pbv, "setting", 10.0)
+        wn.add_control("c1", wntr.network.controls.Control._time_control(wn, 3600, "SIM_TIME", False, act))
+        act = wntr.network.controls.ControlAction(gpv, "status", wntr.network.LinkStatus.Closed)
+        wn.add_control("c2", wntr.network.controls.Control._time_control(wn, 7200, "SIM_TIME", False, act))
+        return wn
+
+    def test_gpv_curve_table(self):
+        m = wntr.sim.aml.Model()
+        wntr.sim.models.constants.gpv_constants(m)
+        points = [(0.0, 2.0), (0.02, 4.0), (0.05, 10.0), (0.1, 30.0)]
+        q_upper, slope, intercept = wntr.sim.models.constraint.get_gpv_curve_table(points, m)
+        self.assertEqual(len(q_upper), len(slope) - 1)
+
+        def headloss(f):
+            i = np.searchsorted(q_upper, abs(f))
+            return np.sign(f) * (slope[i] * abs(f) + intercept[i])
+
+        x, y = zip(*points)
+        for f in [m.gpv_q1, 0.01, 0.02, 0.035, 0.05, 0.07, 0.1]:
+            self.assertAlmostEqual(headloss(f), np.interp(f, x, y), 10)
+            self.assertAlmostEqual(headloss(-f), -headloss(f), 10)
+        # linear through the origin below gpv_q1 and extrapolated above the last point
+        self.assertAlmostEqual(headloss(m.gpv_q1 / 2), headloss(m.gpv_q1) / 2, 10)
+        self.assertAlmostEqual(headloss(0.2), 70.0, 8)
+        for q in q_upper:
+            self.assertAlmostEqual(headloss(q * (1 + 1e-9)), headloss(q * (1 - 1e-9)), 6)
+
+        with self.assertRaises(ValueError):
+            wntr.sim.models.constraint.get_gpv_curve_table([(0.0, 2.0)], m)
+        with self.assertRaises(ValueError):
+            wntr.sim.models.constraint.get_gpv_curve_table([(0.02, 2.0), (0.01, 4.0)], m)
+
+    def test_pbv_gpv_headloss(self):
+        epanet_results = wntr.sim.EpanetSimulator(self._build()).run_sim()
+        wn = self._build()
+        results = wntr.sim.WNTRSimulator(wn).run_sim()
+
+        self.assertLess((epanet_results.node["head"] - results.node["head"]).abs().max().max(), 1e-3)
+        self.assertLess((epanet_results.link["flowrate"] - results.link["flowrate"]).abs().max().max(), 1e-5)
+        head = results.node["head"]
+        self.assertAlmostEqual(head.loc[0, "j1"] - head.loc[0, "j2"], 5.0, 6)
+        self.assertAlmostEqual(head.loc[3600, "j1"] - head.loc[3600, "j2"], 10.0, 6)
+        self.assertAlmostEqual(results.link["flowrate"].loc[7200, "gpv"], 0.0)
+
+
 class TestPDD(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -291,6 +291,27 @@ class TestMorph(unittest.TestCase):
                 expected_map_subset["64"] = []
                 self.assertEqual(dict(expected_map_subset, **skel_map), skel_map)
 
+    def test_skeletonize_return_copy(self):
+
+        inp_file = join(datadir, "skeletonize.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        num_nodes = wn.num_nodes
+
+        skel_wn = wntr.morph.skeletonize(wn, 12 * 0.0254, use_epanet=False)
+        self.assertEqual(wn.num_nodes, num_nodes)
+
+        skel_wn2 = wntr.morph.skeletonize(wn, 12 * 0.0254, use_epanet=False,
+                                          return_copy=False)
+        self.assertIs(skel_wn2, wn)
+        self.assertEqual(skel_wn2.node_name_list, skel_wn.node_name_list)
+        self.assertEqual(skel_wn2.link_name_list, skel_wn.link_name_list)
+        for name, pipe in skel_wn.pipes():
+            pipe2 = skel_wn2.get_link(name)
+            self.assertEqual(pipe2.start_node_name, pipe.start_node_name)
+            self.assertEqual(pipe2.end_node_name, pipe.end_node_name)
+            self.assertAlmostEqual(pipe2.length, pipe.length, 6)
+            self.assertAlmostEqual(pipe2.roughness, pipe.roughness, 6)
+
     def test_skeletonize_with_controls(self):
 
         inp_file = join(datadir, "skeletonize.inp")
@@ -479,6 +500,49 @@ class TestMorph(unittest.TestCase):
         self.assertEqual(link.minor_loss, 0)
         self.assertEqual(link.status, 1)  # open
 
+    def test_skeletonize_Net6(self):
+        # Expected values are from the previous skeletonization engine, which
+        # used a networkx graph and modified the model after each merge
+        inp_file = join(netdir, "Net6.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        expected_demand = wntr.metrics.expected_demand(wn).loc[0, :].sum()
+
+        skel_wn, skel_map = wntr.morph.skeletonize(wn, 12 * 0.0254, return_map=True)
+
+        self.assertEqual(skel_wn.num_junctions, 1121)
+        self.assertEqual(skel_wn.num_pipes, 1547)
+        self.assertAlmostEqual(sum(pipe.length for name, pipe in skel_wn.pipes()), 467947.409544, 4)
+        demand = wntr.metrics.expected_demand(skel_wn).loc[0, :].sum()
+        self.assertAlmostEqual(demand, expected_demand, 6)
+        self.assertEqual(sum(1 for nodes in skel_map.values() if len(nodes) > 1), 566)
+        self.assertEqual(len(skel_map["JUNCTION-2796"]), 49)
+        self.assertEqual(skel_map["JUNCTION-2796"][0:6], ["JUNCTION-2796", "JUNCTION-2749", 
+            "JUNCTION-2750", "JUNCTION-2751", "JUNCTION-2770", "JUNCTION-2771"])
+        # merged pipes are added to the end of the model
+        self.assertEqual(skel_wn.link_name_list[-2:], ["LINK-3319", "LINK-155"])
+        pipe = skel_wn.get_link("LINK-3319")
+        self.assertEqual((pipe.start_node_name, pipe.end_node_name), ("JUNCTION-2940", "JUNCTION-2872"))
+        self.assertAlmostEqual(pipe.length, 3498.055488, 6)
+        self.assertAlmostEqual(pipe.roughness, 251.271889994, 6)
+        pipe = skel_wn.get_link("LINK-43")
+        self.assertEqual((pipe.start_node_name, pipe.end_node_name), ("JUNCTION-14", "JUNCTION-46"))
+        self.assertAlmostEqual(pipe.length, 409.821888, 6)
+        self.assertAlmostEqual(pipe.roughness, 129.368758064, 6)
+
+        # A single cycle depends on the order in which junctions are merged
+        skel_wn, skel_map = wntr.morph.skeletonize(wn, 12 * 0.0254, return_map=True, max_cycles=1)
+
+        self.assertEqual(skel_wn.num_junctions, 1204)
+        self.assertEqual(skel_wn.num_pipes, 1636)
+        self.assertEqual(len(skel_map["JUNCTION-775"]), 27)
+        self.assertEqual(skel_map["JUNCTION-67"][0:6], ["JUNCTION-67", "JUNCTION-68", 
+            "JUNCTION-66", "JUNCTION-65", "JUNCTION-64", "JUNCTION-63"])
+        self.assertEqual(skel_wn.link_name_list[-2:], ["LINK-3312", "LINK-3740"])
+        pipe = skel_wn.get_link("LINK-3312")
+        self.assertEqual((pipe.start_node_name, pipe.end_node_name), ("JUNCTION-2869", "JUNCTION-2866"))
+        self.assertAlmostEqual(pipe.length, 2715.350424, 6)
+        self.assertAlmostEqual(pipe.roughness, 266.562553718, 6)
+
     def test_skeletonize_Net3(self):
 
         inp_file = join(netdir, "Net3.inp")
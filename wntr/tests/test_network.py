@@ -558,6 +558,53 @@ class TestNetworkMethods(unittest.TestCase):
         self.assertEqual(l4, ["p5"])
         self.assertEqual(l5, [])
 
+    def test_get_links_for_node_after_modification(self):
+        wn = self.wntr.network.WaterNetworkModel()
+        wn.add_junction("j1")
+        wn.add_junction("j2")
+        wn.add_junction("j3")
+        wn.add_pipe("p1", "j1", "j2")
+        wn.add_pipe("p2", "j2", "j3")
+        wn.add_pump("pump1", "j3", "j1")
+
+        wn.remove_link("p2")
+        self.assertEqual(wn.get_links_for_node("j2", "outlet"), [])
+        self.assertEqual(wn.get_links_for_node("j3", "inlet"), [])
+        self.assertEqual(wn.get_links_for_node("j3"), ["pump1"])
+
+        pipe = wn.get_link("p1")
+        pipe.end_node = wn.get_node("j3")
+        self.assertEqual(wn.get_links_for_node("j2"), [])
+        self.assertEqual(wn.get_links_for_node("j3", "inlet"), ["p1"])
+        wn.remove_node("j2")
+
+        wn.add_valve("v1", "j1", "j3", valve_type="TCV")
+        self.assertEqual(wn.get_links_for_node("j1", "outlet"), ["p1", "v1"])
+        self.assertEqual(wn.get_links_for_node("j1", "inlet"), ["pump1"])
+
+    def test_get_node_link_incidence(self):
+        inp_file = join(ex_datadir, "Net3.inp")
+        wn = self.wntr.network.WaterNetworkModel(inp_file)
+
+        A = wn.get_node_link_incidence()
+        self.assertEqual(A.shape, (wn.num_nodes, wn.num_links))
+        node_names = wn.node_name_list
+        link_names = wn.link_name_list
+        for i, node_name in enumerate(node_names):
+            row = slice(A.indptr[i], A.indptr[i + 1])
+            self.assertEqual([link_names[j] for j in A.indices[row]], wn.get_links_for_node(node_name))
+        # Each link has exactly one start node and one end node
+        self.assertTrue(np.all(np.asarray(A.sum(axis=0)) == 0))
+        self.assertTrue(np.all(np.asarray(abs(A).sum(axis=0)) == 2))
+
+        A_in = wn.get_node_link_incidence("INLET")
+        A_out = wn.get_node_link_incidence("OUTLET")
+        self.assertEqual((A_in + A_out - A).nnz, 0)
+        for link_name, link in wn.links():
+            j = link_names.index(link_name)
+            self.assertEqual(A_in[node_names.index(link.end_node_name), j], 1)
+            self.assertEqual(A_out[node_names.index(link.start_node_name), j], -1)
+
 
 epanet_unit_id = {
     "CFS": 0,
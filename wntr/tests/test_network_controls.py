@@ -368,6 +368,124 @@ class TestValveControls(unittest.TestCase):
         self.assertEqual(flag1, True)
         self.assertEqual(flag2, True)
 
+    def test_internal_status_engine(self):
+        import numpy as np
+        from wntr.network import LinkStatus
+        from wntr.network import controls
+        from wntr.sim.core import _InternalStatusEngine
+
+        inp_file = join(ex_datadir, "Net1.inp")
+        wn = self.wntr.network.WaterNetworkModel(inp_file)
+        wn.get_link("111").check_valve = True
+        wn.get_link("121").check_valve = True
+        wn.add_pump("pump2", "21", "31", pump_type="POWER", pump_parameter=10.0)
+        wn.add_valve("prv", "22", "32", 0.3, "PRV", 0.5, 20.0)
+        wn.add_valve("psv", "23", "31", 0.3, "PSV", 0.5, 30.0)
+        wn.add_valve("fcv", "12", "22", 0.3, "FCV", 0.5, 0.05)
+
+        rules = []  # (link, very low priority conditions, very high priority condition)
+        for name in ["111", "121"]:
+            link = wn.get_link(name)
+            rules.append((link, [(controls._OpenCVCondition(wn, link), LinkStatus.Open)],
+                          controls._CloseCVCondition(wn, link)))
+        link = wn.get_link("9")
+        rules.append((link, [(controls._OpenHeadPumpCondition(wn, link), LinkStatus.Open)],
+                      controls._CloseHeadPumpCondition(wn, link)))
+        link = wn.get_link("pump2")
+        rules.append((link, [(controls._OpenPowerPumpCondition(wn, link), LinkStatus.Open)],
+                      controls._ClosePowerPumpCondition(wn, link)))
+        link = wn.get_link("prv")
+        rules.append((link, [(controls._OpenPRVCondition(wn, link), LinkStatus.Open),
+                             (controls._ActivePRVCondition(wn, link), LinkStatus.Active)],
+                      controls._ClosePRVCondition(wn, link)))
+        link = wn.get_link("psv")
+        rules.append((link, [(controls._OpenPSVCondition(wn, link), LinkStatus.Open),
+                             (controls._ActivePSVCondition(wn, link), LinkStatus.Active)],
+                      controls._ClosePSVCondition(wn, link)))
+        link = wn.get_link("fcv")
+        rules.append((link, [(controls._OpenFCVCondition(wn, link), LinkStatus.Open),
+                             (controls._ActiveFCVCondition(wn, link), LinkStatus.Active)], None))
+
+        engine = _InternalStatusEngine(wn)
+        index = {link.name: i for i, link in enumerate(engine._links)}
+        self.assertEqual(set(index.keys()), set(link.name for link, _, _ in rules))
+
+        rng = np.random.default_rng(12345)
+        for trial in range(500):
+            for node_name, node in wn.nodes():
+                node._head = rng.choice([230.0, 240.0, 250.0, rng.uniform(200, 280)])
+            for link, open_rules, close_rule in rules:
+                link._flow = rng.choice([-1e-3, 0.0, 1e-7, 0.05, rng.uniform(-0.1, 0.1)])
+                link._internal_status = LinkStatus(int(rng.integers(0, 3)))
+
+            expected = dict()
+            for link, open_rules, close_rule in rules:
+                expected[link.name] = link._internal_status
+                for condition, status in open_rules:
+                    if condition.evaluate():
+                        expected[link.name] = status
+                if close_rule is not None and close_rule.evaluate():
+                    expected[link.name] = LinkStatus.Closed
+
+            (open_links, open_status), close_links = engine.check()
+            engine.run_control_actions(open_links, open_status)
+            engine.run_control_actions(close_links, LinkStatus.Closed)
+            for link, open_rules, close_rule in rules:
+                self.assertEqual(int(link._internal_status), int(expected[link.name]))
+
+            # only links whose internal status changes are returned
+            (open_links, open_status), close_links = engine.check()
+            for i, status in zip(open_links, open_status):
+                self.assertNotEqual(int(engine._links[i]._internal_status), int(status))
+
+
+class TestControlChangeTracker(unittest.TestCase):
+    def test_reference_points(self):
+        from wntr.network import LinkStatus
+        from wntr.network.controls import ControlChangeTracker
+
+        wn = wntr.network.WaterNetworkModel(join(ex_datadir, "Net1.inp"))
+        pipe = wn.get_link("10")
+        condition = wntr.network.SimTimeCondition(wn, "==", 0)
+        close_action = wntr.network.ControlAction(pipe, "status", LinkStatus.Closed)
+        open_action = wntr.network.ControlAction(pipe, "status", LinkStatus.Open)
+        close_control = wntr.network.Control(condition, close_action)
+        open_control = wntr.network.Control(condition, open_action)
+        tracker = ControlChangeTracker()
+        tracker.register_control(close_control)
+        tracker.register_control(open_control)
+
+        tracker.set_reference_point("a")
+        tracker.set_reference_point("b")
+        self.assertFalse(tracker.changes_made("a"))
+        close_action.run_control_action()
+        self.assertEqual(list(tracker.get_changes("a")), [(pipe, "status")])
+        self.assertTrue(tracker.changes_made("b"))
+
+        tracker.reset_reference_point("a")
+        self.assertFalse(tracker.changes_made("a"))
+        self.assertTrue(tracker.changes_made("b"))
+        # reference points only store the values of modified attributes
+        self.assertEqual(len(tracker._previous_values["a"]), 0)
+
+        open_action.run_control_action()
+        self.assertTrue(tracker.changes_made("a"))
+        self.assertFalse(tracker.changes_made("b"))
+
+        tracker.remove_reference_point("a")
+        tracker.set_reference_point("c")
+        close_action.run_control_action()
+        self.assertTrue(tracker.changes_made("b"))
+        self.assertTrue(tracker.changes_made("c"))
+        open_action.run_control_action()
+        self.assertFalse(tracker.changes_made("b"))
+        self.assertFalse(tracker.changes_made("c"))
+
+        with self.assertRaises(ValueError):
+            tracker.set_reference_point("b")
+        with self.assertRaises(RuntimeError):
+            tracker.register_control(close_control)
+
 
 class TestControlCombinations(unittest.TestCase):
     @classmethod
@@ -24,6 +24,9 @@ class TestNetworkGraphs(unittest.TestCase):
         self.assertEqual(G.nodes["111"]["weight"], 10 * 0.3048)
         self.assertEqual(G["159"]["161"]["177"]["weight"], 2000 * 0.3048)
 
+        with self.assertRaises(TypeError):
+            wn.to_graph(wn, link_weight=link_weight)
+
     def test_weighted_graph_modify_direction(self):
         inp_file = join(netdir, "Net3.inp")
         wn = wntr.network.WaterNetworkModel(inp_file) 
@@ -125,6 +128,32 @@ class TestNetworkGraphs(unittest.TestCase):
         raise SkipTest
         self.assertLess(error, 0.01)
 
+    def test_sparse_topographic_metrics(self):
+        inp_file = join(netdir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        G = wn.to_graph()
+        uG = G.to_undirected()
+        sparse_G = wn.to_sparse_graph()
+        
+        bet_cen = np.array(list(nx.betweenness_centrality(nx.Graph(uG)).values()))
+        expected = np.sum(bet_cen.max() - bet_cen)/(len(bet_cen)-1)
+        self.assertAlmostEqual(wntr.metrics.central_point_dominance(G), expected, 10)
+        self.assertAlmostEqual(wntr.metrics.central_point_dominance(sparse_G), expected, 10)
+        val = wntr.metrics.central_point_dominance(sparse_G, k=40, seed=1)
+        self.assertLess(abs(val - expected)/expected, 0.25)
+        
+        eig = np.sort(nx.adjacency_spectrum(uG).real)[::-1]
+        self.assertAlmostEqual(wntr.metrics.spectral_gap(G), eig[0] - eig[1], 8)
+        self.assertAlmostEqual(wntr.metrics.spectral_gap(sparse_G), eig[0] - eig[1], 8)
+        
+        eig = np.sort(nx.laplacian_spectrum(uG))
+        self.assertAlmostEqual(wntr.metrics.algebraic_connectivity(G), eig[1], 8)
+        self.assertAlmostEqual(wntr.metrics.algebraic_connectivity(sparse_G), eig[1], 8)
+        
+        A = sparse_G.adjacency_matrix(multigraph=True)
+        self.assertAlmostEqual(wntr.metrics.critical_ratio_defrag(A), 
+                               wntr.metrics.critical_ratio_defrag(G), 10)
+
     def test_Net1_MultiDiGraph(self):
         inp_file = join(netdir, "Net1.inp")
         wn = wntr.network.WaterNetworkModel(inp_file)
@@ -164,5 +193,39 @@ class TestNetworkGraphs(unittest.TestCase):
         # assert_dict_contains_subset(edge, G.adj)
 
 
+    def test_sparse_graph(self):
+        inp_file = join(netdir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        G = wn.to_graph()
+        sG = wn.to_sparse_graph()
+
+        self.assertEqual(sG.node_names, list(G.nodes()))
+        self.assertEqual(sG.num_links, G.number_of_edges())
+
+        A = sG.adjacency_matrix(directed=True, multigraph=True)
+        B = nx.to_scipy_sparse_array(G, nodelist=sG.node_names, weight=None)
+        self.assertEqual(abs(A - B).sum(), 0)
+
+        A = sG.adjacency_matrix()
+        B = nx.to_scipy_sparse_array(nx.Graph(G.to_undirected()), nodelist=sG.node_names, weight=None)
+        self.assertEqual(abs(A - B).sum(), 0)
+
+        length = wn.query_link_attribute("length")
+        A = sG.adjacency_matrix(link_weight=length, directed=True)
+        pipe = wn.get_link("177")
+        i = sG.node_index[pipe.start_node_name]
+        j = sG.node_index[pipe.end_node_name]
+        self.assertAlmostEqual(A[i, j], pipe.length)
+
+        # The array graph is cached until the network structure changes
+        self.assertIs(wn.to_sparse_graph(), sG)
+        wn.add_junction("new_junction")
+        wn.add_pipe("new_pipe", "new_junction", "111")
+        sG2 = wn.to_sparse_graph()
+        self.assertIsNot(sG2, sG)
+        self.assertEqual(sG2.num_links, sG.num_links + 1)
+        self.assertEqual(sG2.incidence_matrix().sum(), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
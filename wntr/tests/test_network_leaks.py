@@ -125,6 +125,52 @@ class TestLeakResults(unittest.TestCase):
                     0.001,
                 )
 
+    def test_leak_emitters(self):
+        inp_file = join(test_datadir, "leaks.inp")
+        wn = self.wntr.network.WaterNetworkModel(inp_file)
+        wn = self.wntr.morph.split_pipe(wn, "pipe2", "pipe2__B", "leak1")
+        area = math.pi / 4.0 * 0.01 ** 2
+        wn.get_node("leak1").add_leak(wn, area=area, discharge_coeff=0.75, start_time=4 * 3600 + 900,
+                                      end_time=8 * 3600)
+
+        leaks = self.wntr.sim.epanet.leak_emitters(wn)
+        self.assertEqual(list(leaks.index), ["leak1"])
+        self.assertAlmostEqual(leaks.at["leak1", "emitter_coefficient"], 0.75 * area * math.sqrt(2 * 9.81))
+        self.assertEqual(leaks.at["leak1", "start_time"], 4 * 3600 + 900)
+        self.assertEqual(leaks.at["leak1", "end_time"], 8 * 3600)
+
+        results = self.wntr.sim.EpanetSimulator(wn).run_sim()
+        for t in results.node["leak_demand"].index:
+            if t < 4 * 3600 + 900 or t >= 8 * 3600:
+                self.assertAlmostEqual(results.node["leak_demand"].at[t, "leak1"], 0.0)
+            else:
+                self.assertAlmostEqual(
+                    results.node["leak_demand"].at[t, "leak1"],
+                    0.75 * area * math.sqrt(2 * 9.81 * results.node["pressure"].loc[t, "leak1"]),
+                )
+
+        for demand_model in ["DD", "PDD"]:
+            wn.options.hydraulic.demand_model = demand_model
+            diff = self.wntr.sim.epanet.validate_leak_emitters(wn)
+            self.assertLess(diff.at["pressure", "max_abs_diff"], 0.001)
+            self.assertLess(diff.at["leak_demand", "max_abs_diff"], 0.00001)
+            self.assertLess(diff.at["flowrate", "max_abs_diff"], 0.00001)
+
+        wn.options.hydraulic.emitter_exponent = 0.6
+        self.assertRaises(ValueError, self.wntr.sim.epanet.leak_emitters, wn)
+        # run_sim warns and does not model leaks that cannot be translated
+        with self.assertWarns(UserWarning):
+            results = self.wntr.sim.EpanetSimulator(wn).run_sim()
+        self.assertNotIn("leak_demand", results.node)
+
+        wn.options.hydraulic.emitter_exponent = 0.5
+        tank = wn.get_node(wn.tank_name_list[0])
+        tank.add_leak(wn, area=area, start_time=3600)
+        self.assertRaises(NotImplementedError, self.wntr.sim.epanet.leak_emitters, wn)
+        with self.assertWarns(UserWarning):
+            leaks = self.wntr.sim.epanet.leak_emitters(wn, errors="warn")
+        self.assertEqual(list(leaks.index), ["leak1"])
+
     # def test_remove_leak_results(self):
     #    inp_file = join(test_datadir. 'net_test_13.inp')
     #    wn = self.wntr.network.WaterNetworkModel(inp_file)
@@ -4,6 +4,7 @@ from os.path import abspath, dirname, join
 import numpy as np
 import pandas as pd
 import wntr
+from pandas.testing import assert_frame_equal
 from scipy.stats import lognorm, norm
 
 testdir = dirname(abspath(str(__file__)))
@@ -54,6 +55,32 @@ class TestFragilityCurveScenario(unittest.TestCase):
         self.assertEqual(states.loc["2"], "Minor")
         self.assertEqual(states.loc["3"], "Major")
 
+    def test_cdf_probability_element_distribution(self):
+        x = pd.Series({"1": 0.5, "2": 1.5, "3": 0.5})
+        Pr = FC2.cdf_probability(x)
+        self.assertEqual(list(Pr.columns), ["Minor", "Major"])
+        self.assertAlmostEqual(Pr.loc["1", "Minor"], lognorm(0.25, loc=0, scale=1).cdf(0.5))
+        self.assertAlmostEqual(Pr.loc["2", "Minor"], lognorm(0.25, loc=0, scale=1).cdf(1.5))
+        self.assertAlmostEqual(Pr.loc["3", "Minor"], lognorm(0.2, loc=0, scale=1).cdf(0.5))
+        self.assertAlmostEqual(Pr.loc["2", "Major"], lognorm(0.25, loc=1, scale=2).cdf(1.5))
+
+    def test_sample_damage_states(self):
+        x = pd.Series({"1": 0, "2": 1, "3": 2, "4": 10})
+        Pr = FC1.cdf_probability(x)
+        states = FC1.sample_damage_states(Pr, 500, seed=45)
+        self.assertEqual(states.shape, (500, 4))
+        self.assertEqual(list(states.columns), ["1", "2", "3", "4"])
+        self.assertTrue(states.isin([0, 1, 2]).all().all())
+        
+        # Fraction of realizations that exceed each damage state
+        self.assertAlmostEqual((states["1"] >= 1).mean(), 0.5, delta=0.1)
+        self.assertAlmostEqual((states["2"] >= 2).mean(), 0.5, delta=0.1)
+        self.assertTrue((states["4"] == 2).all())
+        
+        # Realizations do not depend on the number of realizations
+        states10 = FC1.sample_damage_states(Pr, 10, seed=45)
+        assert_frame_equal(states10, states.iloc[0:10, :])
+
 
 if __name__ == "__main__":
     unittest.main()
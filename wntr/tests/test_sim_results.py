@@ -1,5 +1,9 @@
+import tempfile
 import unittest
 from os.path import abspath, dirname, join
+
+import numpy as np
+import pandas as pd
 #import matplotlib.pylab as plt
 import wntr
 
@@ -47,6 +51,75 @@ class TestSimulationResults(unittest.TestCase):
  
 
 
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assert_results_equal(self, stored, expected):
+        self.assertEqual(set(stored.node.keys()), set(expected.node.keys()))
+        self.assertEqual(set(stored.link.keys()), set(expected.link.keys()))
+        for key, df in expected.node.items():
+            pd.testing.assert_frame_equal(stored.node[key].load(), df, check_dtype=False, check_names=False,
+                                          check_index_type=False)
+        for key, df in expected.link.items():
+            pd.testing.assert_frame_equal(stored.link[key].load(), df, check_dtype=False, check_names=False,
+                                          check_index_type=False)
+
+    def test_epanet_store(self):
+        wn = wntr.network.WaterNetworkModel(join(datadir, "Net3.inp"))
+        sim = wntr.sim.EpanetSimulator(wn)
+        expected = sim.run_sim()
+
+        store = wntr.sim.ResultsStore(self.tmpdir.name, chunk_size=10)
+        results = sim.run_sim(results_store=store)
+        self.assert_results_equal(results, expected)
+
+        # Lazy selection
+        pressure = results.node['pressure']
+        self.assertEqual(pressure.shape, expected.node['pressure'].shape)
+        pd.testing.assert_frame_equal(pressure.loc[3600*5:3600*20, ['10', '121']],
+                                      expected.node['pressure'].loc[3600*5:3600*20, ['10', '121']],
+                                      check_dtype=False, check_names=False)
+        pd.testing.assert_series_equal(results.link['flowrate'].iloc[-1, :],
+                                       expected.link['flowrate'].iloc[-1, :],
+                                       check_dtype=False, check_names=False)
+        pd.testing.assert_series_equal(pressure['10'], expected.node['pressure']['10'],
+                                       check_dtype=False, check_names=False, check_index_type=False)
+        self.assertAlmostEqual(pressure.loc[3600, '10'], expected.node['pressure'].loc[3600, '10'])
+
+        # Reopen the store
+        results = wntr.sim.ResultsStore(self.tmpdir.name, mode='r').to_results()
+        self.assert_results_equal(results, expected)
+
+    def test_wntr_store_append(self):
+        wn = wntr.network.WaterNetworkModel(join(datadir, "Net1.inp"))
+        wn.options.time.duration = 24*3600
+        sim = wntr.sim.WNTRSimulator(wn)
+        expected = sim.run_sim()
+
+        wn.reset_initial_values()
+        wn.options.time.duration = 10*3600
+        store = wntr.sim.ResultsStore(self.tmpdir.name, chunk_size=4)
+        sim = wntr.sim.WNTRSimulator(wn)
+        sim.run_sim(results_store=store)
+        wn.options.time.duration = 24*3600
+        store = wntr.sim.ResultsStore(self.tmpdir.name, mode='a')
+        results = sim.run_sim(results_store=store)
+
+        self.assertEqual(list(results.node['head'].index), expected.time)
+        for key, df in expected.node.items():
+            self.assertLess(np.abs(results.node[key].load().values - df.values).max(), 1e-6)
+        for key, df in expected.link.items():
+            self.assertLess(np.abs(results.link[key].load().values - df.values).max(), 1e-6)
+
+        with self.assertRaises(ValueError):
+            store.append([0], {'head': np.zeros((1, wn.num_nodes))}, {}, node_names=store.node_names)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,117 @@
+import unittest
+from os.path import abspath, dirname, join
+
+from numpy.testing import assert_allclose
+import wntr
+
+testdir = dirname(abspath(str(__file__)))
+ex_datadir = join(testdir, "..", "..", "examples", "networks")
+
+
+def _run_session(session, snapshot_time=None):
+    states = {}
+    snapshot = None
+    while True:
+        try:
+            t = session.step()
+        except RuntimeError:
+            break
+        states[t] = session.get_state()
+        if t == snapshot_time:
+            snapshot = session.snapshot()
+    return states, snapshot
+
+
+class TestSimulationSession(unittest.TestCase):
+    def setUp(self):
+        self.inp_file = join(ex_datadir, "Net3.inp")
+
+    def _wn(self):
+        wn = wntr.network.WaterNetworkModel(self.inp_file)
+        wn.options.time.duration = 24 * 3600
+        return wn
+
+    def _compare_results(self, session, states, results, atol):
+        for t in results.node["head"].index:
+            assert_allclose(states[t]["node"]["head"],
+                            results.node["head"].loc[t, session.node_name_list], atol=atol)
+            assert_allclose(states[t]["node"]["demand"],
+                            results.node["demand"].loc[t, session.node_name_list], atol=atol)
+            assert_allclose(states[t]["link"]["flowrate"],
+                            results.link["flowrate"].loc[t, session.link_name_list], atol=atol)
+
+    def _compare_restore(self, session, states, snapshot, atol):
+        session.restore(snapshot)
+        self.assertEqual(session.time, 10 * 3600)
+        restored, _ = _run_session(session)
+        self.assertEqual(sorted(restored.keys()), [t for t in sorted(states.keys()) if t > 10 * 3600])
+        for t, state in restored.items():
+            assert_allclose(state["node"]["head"], states[t]["node"]["head"], atol=atol)
+            assert_allclose(state["link"]["flowrate"], states[t]["link"]["flowrate"], atol=atol)
+
+    def _check_setters(self, session, snapshot):
+        session.restore(snapshot)
+        session.set_link_status("10", "Closed")
+        session.set_demand("15", 0.01)
+        session.set_tank_level("1", 5.0)
+        t = session.step()
+        self.assertGreater(t, 10 * 3600)
+        state = session.get_state()
+        link = session.link_name_list.index("10")
+        node = session.node_name_list.index("15")
+        self.assertEqual(state["link"]["status"][link], 0)
+        self.assertAlmostEqual(state["link"]["flowrate"][link], 0)
+        self.assertAlmostEqual(state["node"]["demand"][node], 0.01, 6)
+
+        session.restore(snapshot)
+        session.step()
+        state = session.get_state()
+        self.assertEqual(state["link"]["status"][link], 1)
+        self.assertNotAlmostEqual(state["node"]["demand"][node], 0.01, 6)
+
+    def test_wntr_session(self):
+        wn = self._wn()
+        results = wntr.sim.WNTRSimulator(wn).run_sim()
+
+        session = wntr.sim.WNTRSimulatorSession(self._wn())
+        states, snapshot = _run_session(session, 10 * 3600)
+        self._compare_results(session, states, results, 1e-8)
+        self._compare_restore(session, states, snapshot, 1e-8)
+        self._check_setters(session, snapshot)
+
+        with self.assertRaises(TypeError):
+            wntr.sim.SimulationSession(wn)
+        with self.assertRaises(NotImplementedError):
+            session.set_link_setting("10", 0.5)
+        with self.assertRaises(ValueError):
+            session.set_link_setting("20", 0.5)
+
+    def test_epanet_session(self):
+        wn = self._wn()
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+
+        with wntr.sim.EpanetSimulatorSession(self._wn()) as session:
+            states, snapshot = _run_session(session, 10 * 3600)
+            self._compare_results(session, states, results, 1e-4)
+            self._compare_restore(session, states, snapshot, 1e-4)
+            self._check_setters(session, snapshot)
+
+        with self.assertRaises(NotImplementedError):
+            wntr.sim.EpanetSimulatorSession(self._wn(), version=2.0)
+
+    def test_epanet_session_leak(self):
+        wn = self._wn()
+        wn.get_node("123").add_leak(wn, area=0.005, start_time=9000, end_time=12 * 3600)
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+
+        with wntr.sim.EpanetSimulatorSession(wn) as session:
+            states, _ = _run_session(session)
+        self.assertIn(9000, states)
+        self._compare_results(session, states, results, 1e-4)
+        for t in results.node["head"].index:
+            assert_allclose(states[t]["node"]["leak_demand"],
+                            results.node["leak_demand"].loc[t, session.node_name_list], atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 from os.path import abspath, dirname, join
 import sys, platform
+import warnings
 import wntr
+from numpy.testing import assert_allclose
 
 if 'darwin' in sys.platform.lower() and 'arm' in platform.platform().lower():
     skip_v2_tests_on_arm = True
@@ -171,6 +173,221 @@ class TestWaterQualitySimulations(unittest.TestCase):
         self.assertLess(error, 0.0001)  # 0.01% error
 
 
+class TestWaterQualitySimulator(unittest.TestCase):
+    """
+    Compare the WaterQualitySimulator to EPANET using EPANET hydraulics. 
+    Controls are removed from Net1 so that every hydraulic timestep is a 
+    report timestep.
+    """
+    def _compare(self, parameter, setup=None):
+        inp_file = join(datadir, "Net1.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        for name in wn.control_name_list:
+            wn.remove_control(name)
+        wn.options.time.duration = 12*3600
+        wn.options.quality.parameter = parameter
+        if setup is not None:
+            setup(wn)
+
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        wq_results = wntr.sim.WaterQualitySimulator(wn).run_sim(results)
+        return results, wq_results
+
+    def test_age(self):
+        results, wq_results = self._compare("AGE")
+        error = (results.node["quality"] - wq_results.node["quality"]).abs()
+        self.assertLess(error.max().max(), 1.0)  # seconds
+        self.assertGreater(wq_results.node["quality"].max().max(), 6*3600)
+
+    def test_trace(self):
+        def setup(wn):
+            wn.options.quality.trace_node = "9"
+        results, wq_results = self._compare("TRACE", setup)
+        error = (results.node["quality"] - wq_results.node["quality"]).abs()
+        self.assertLess(error.max().max(), 0.01)  # percent
+
+    def test_chemical_decay(self):
+        results, wq_results = self._compare("CHEMICAL")
+        error = (results.node["quality"] - wq_results.node["quality"]).abs()
+        self.assertLess(error.max().max(), 1e-6)  # kg/m3
+        error = (results.link["quality"] - wq_results.link["quality"]).abs()
+        self.assertLess(error.max().max(), 1e-5)
+        # hydraulic results are included in the water quality results
+        self.assertIs(wq_results.link["flowrate"], results.link["flowrate"])
+
+    def test_sources(self):
+        for node_name, source_type, strength in [("9", "CONCEN", 2e-3), 
+                                                 ("10", "SETPOINT", 1.5e-3), 
+                                                 ("10", "MASS", 1e-3/60), 
+                                                 ("22", "FLOWPACED", 0.5e-3)]:
+            def setup(wn):
+                wn.add_pattern("SourcePattern", [1, 0.5, 0, 1])
+                wn.add_source("Source", node_name, source_type, strength, "SourcePattern")
+            results, wq_results = self._compare("CHEMICAL", setup)
+            error = (results.node["quality"] - wq_results.node["quality"]).abs()
+            self.assertLess(error.max().max(), 1e-6, source_type)
+
+    def test_wntr_simulator_results(self):
+        inp_file = join(datadir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        wn.options.time.duration = 24*3600
+        wn.options.hydraulic.demand_model = "PDD"
+        wn.options.quality.parameter = "TRACE"
+        wn.options.quality.trace_node = "River"
+        results = wntr.sim.WNTRSimulator(wn).run_sim()
+
+        sim = wntr.sim.WaterQualitySimulator(wn)
+        # tank level controls change flow between reported times
+        with self.assertWarns(UserWarning):
+            wq_results1 = sim.run_sim(results)
+        with self.assertWarns(UserWarning):
+            wq_results2 = sim.run_sim(results)
+        quality = wq_results1.node["quality"]
+        self.assertEqual(quality.shape, results.node["head"].shape)
+        self.assertTrue((quality.loc[:, "River"] == 100).all())
+        self.assertTrue((quality.values >= 0).all() and (quality.values <= 100 + 1e-8).all())
+        self.assertTrue(quality.equals(wq_results2.node["quality"]))
+
+        # intermediate hydraulic steps are reported
+        wn.reset_initial_values()
+        wn.options.time.report_timestep = "ALL"
+        results = wntr.sim.WNTRSimulator(wn).run_sim()
+        self.assertGreater(len(results.node["head"].index), 25)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            sim.run_sim(results)
+
+    def test_errors(self):
+        inp_file = join(datadir, "Net1.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        sim = wntr.sim.WaterQualitySimulator(wn)
+        wn.options.quality.parameter = "NONE"
+        self.assertRaises(ValueError, sim.run_sim, results)
+        wn.options.quality.parameter = "CHEMICAL"
+        wn.get_node("2").mixing_model = "FIFO"
+        self.assertRaises(NotImplementedError, sim.run_sim, results)
+
+    def test_accuracy_warning(self):
+        inp_file = join(datadir, "Net1.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        wn.options.time.duration = 4*3600
+        wn.options.quality.parameter = "AGE"
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        sim = wntr.sim.WaterQualitySimulator(wn)
+        # Net1 includes controls, but no flow changes between reported times in the first 4 hours
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            sim.run_sim(results)
+
+        # pattern steps between reported times
+        wn.options.time.report_timestep = 2*3600
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        self.assertWarns(UserWarning, sim.run_sim, results)
+        self.assertRaises(RuntimeError, sim.run_sim, results, errors="raise")
+        self.assertRaises(ValueError, sim.run_sim, results, errors="ignore")
+
+        # tank 2 fills between reported times
+        wn.options.time.report_timestep = 3600
+        wn.options.time.duration = 24*3600
+        for name in wn.control_name_list:
+            wn.remove_control(name)
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        with self.assertRaisesRegex(RuntimeError, "tank 2"):
+            sim.run_sim(results, errors="raise")
+
+    def _compare_net3(self, controls, duration, report_timestep=3600):
+        inp_file = join(datadir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        if not controls:
+            for name in wn.control_name_list:
+                wn.remove_control(name)
+        wn.options.time.duration = duration
+        wn.options.time.hydraulic_timestep = report_timestep
+        wn.options.time.report_timestep = report_timestep
+        wn.options.quality.parameter = "TRACE"
+        wn.options.quality.trace_node = "River"
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            wq_results = wntr.sim.WaterQualitySimulator(wn).run_sim(results)
+        error = (results.node["quality"] - wq_results.node["quality"]).abs()
+        return error, [str(i.message) for i in w]
+
+    def test_net3_without_controls(self):
+        # no flow changes between reported times in the first 8 hours
+        error, messages = self._compare_net3(False, 8*3600)
+        self.assertEqual(messages, [])
+        self.assertLess(error.max().max(), 0.01)  # percent
+
+        # tank 1 fills at 30014 s, between reported times
+        error, messages = self._compare_net3(False, 12*3600, 300)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("first after 30000 s", messages[0])
+        self.assertLess(error.loc[:30000].max().max(), 0.01)
+        self.assertGreater(error.loc[30300, "109"], 10)
+
+    def test_net3_with_controls(self):
+        # tank level controls change pump status between reported times
+        error, messages = self._compare_net3(True, 24*3600)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("first after 14400 s", messages[0])
+        self.assertLess(error.loc[:14400].max().max(), 0.01)
+        self.assertGreater(error.max().max(), 10)
+
+
+class TestQualityEnsemble(unittest.TestCase):
+    def _model(self):
+        inp_file = join(datadir, "Net3.inp")
+        wn = wntr.network.WaterNetworkModel(inp_file)
+        wn.options.time.duration = 24 * 3600
+        wn.options.quality.parameter = "CHEMICAL"
+        wn.add_pattern("Inj", [1] * 2 + [0] * 22)
+        return wn
+
+    def test_ensemble(self):
+        scenarios = [
+            [("121", "SETPOINT", 100e-3, "Inj")],
+            [("159", "MASS", 1.0)],
+            [("River", "CONCEN", 2e-3), ("15", "FLOWPACED", 1e-3, "Inj")],
+        ]
+        ensemble_wn = self._model()
+        sim = wntr.sim.EpanetSimulator(ensemble_wn)
+        quality = sim.run_quality_ensemble(scenarios, file_prefix="temp_ensemble")
+        self.assertEqual(quality.shape, (3, 25, ensemble_wn.num_nodes))
+
+        for i, scenario in enumerate(scenarios):
+            wn = self._model()
+            for j, source in enumerate(scenario):
+                wn.add_source("Source" + str(j), *source)
+            results = wntr.sim.EpanetSimulator(wn).run_sim()
+            expected = results.node["quality"].loc[:, wn.node_name_list].values
+            assert_allclose(quality[i], expected, rtol=1e-5, atol=1e-9)
+
+        parallel = sim.run_quality_ensemble(scenarios, file_prefix="temp_ensemble", num_workers=2)
+        assert_allclose(parallel, quality)
+
+        ensemble_wn.options.quality.parameter = "AGE"
+        self.assertRaises(ValueError, sim.run_quality_ensemble, scenarios)
+
+    def test_ensemble_node_order(self):
+        # the junction added by split_pipe is written after the tanks and reservoirs in the INP file
+        def model():
+            wn = self._model()
+            return wntr.morph.split_pipe(wn, "20", "20_B", "20_node")
+
+        scenario = [("20_node", "SETPOINT", 1e-3)]
+        wn = model()
+        self.assertNotEqual(wn.node_name_list, wn.junction_name_list + wn.tank_name_list + wn.reservoir_name_list)
+        quality = wntr.sim.EpanetSimulator(wn).run_quality_ensemble([scenario], file_prefix="temp_ensemble")
+
+        wn = model()
+        wn.add_source("Source", *scenario[0])
+        results = wntr.sim.EpanetSimulator(wn).run_sim()
+        expected = results.node["quality"].loc[:, wn.node_name_list].values
+        assert_allclose(quality[0], expected, rtol=1e-5, atol=1e-9)
+
+
 if __name__ == "__main__":
     unittest.main()
 